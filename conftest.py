@@ -4,6 +4,7 @@ import pathlib
 import shutil
 import datetime
 import traceback
+from functools import partial
 
 import shortuuid
 from _pytest.runner import CallInfo
@@ -17,20 +18,32 @@ from pytest import (
     Collector,
     Config,
     CollectReport,
+    hookimpl,
 )
 from _pytest.terminal import TerminalReporter
-from typing import Optional, Any
+from typing import Generator, Optional, Any
 from pytest_testconfig import config as py_config
 
+from utilities.api_accounting import KubeAPIAccounting
 from utilities.constants import KServeDeploymentType
-from utilities.database import Database
-from utilities.logger import separator, setup_logging
+from utilities.fixture_profiler import FIXTURE_PROFILE_SORT_KEYS, FixtureProfiler
+from utilities.jira import JIRA_CACHE_FILE, JIRA_CACHE_TTL, defer_jira_plugin_checks
+from utilities.lazy_import import lazy_import
+from utilities.logger import (
+    DEFAULT_LOG_MAX_PAYLOAD_LENGTH,
+    TEST_LOG_FILE_NAME,
+    read_test_log,
+    separator,
+    set_log_context,
+    setup_logging,
+)
 from utilities.must_gather_collector import (
     set_must_gather_collector_directory,
     set_must_gather_collector_values,
     get_must_gather_collector_dir,
     collect_rhoai_must_gather,
     get_base_dir,
+    prepare_pytest_item_data_dir,
 )
 from kubernetes.dynamic import DynamicClient
 from utilities.infra import get_operator_distribution, get_dsci_applications_namespace, get_data_science_cluster
@@ -40,6 +53,12 @@ from ocp_resources.resource import get_client
 LOGGER = logging.getLogger(name=__name__)
 BASIC_LOGGER = logging.getLogger(name="basic")
 
+# sqlalchemy is only needed with `--collect-must-gather`
+database = lazy_import(name="utilities.database")
+
+# Tests directories which run against local emulators only, and do not need a cluster
+NO_CLUSTER_TESTS_DIRS: tuple[str, ...] = ("tests/infra",)
+
 
 def pytest_addoption(parser: Parser) -> None:
     aws_group = parser.getgroup(name="AWS")
@@ -49,6 +68,9 @@ def pytest_addoption(parser: Parser) -> None:
     must_gather_group = parser.getgroup(name="MustGather")
     cluster_sanity_group = parser.getgroup(name="ClusterSanity")
     hf_group = parser.getgroup(name="Hugging Face")
+    benchmark_group = parser.getgroup(name="Benchmark")
+    logging_group = parser.getgroup(name="Logging")
+    jira_group = parser.getgroup(name="Jira")
 
     # AWS config and credentials options
     aws_group.addoption(
@@ -96,6 +118,35 @@ def pytest_addoption(parser: Parser) -> None:
         default=os.environ.get("MODELS_S3_BUCKET_ENDPOINT"),
         help="Models S3 bucket endpoint",
     )
+    buckets_group.addoption(
+        "--model-cache",
+        action="store_true",
+        default=bool(os.environ.get("MODEL_CACHE")),
+        help="Mirror the models bucket once per session into a cluster-wide MinIO model cache "
+        "and serve models bucket secrets from it",
+    )
+    buckets_group.addoption(
+        "--model-cache-prefixes",
+        default=os.environ.get("MODEL_CACHE_PREFIXES", ""),
+        help="Coma-separated str; models bucket prefixes (model directories) to mirror into the model cache, "
+        "the whole bucket if not set",
+    )
+    buckets_group.addoption(
+        "--model-cache-pvc-size",
+        default=os.environ.get("MODEL_CACHE_PVC_SIZE", "100Gi"),
+        help="Size of the model cache PVC",
+    )
+    buckets_group.addoption(
+        "--model-cache-storage-class",
+        default=os.environ.get("MODEL_CACHE_STORAGE_CLASS"),
+        help="Storage class of the model cache PVC, the cluster default if not set",
+    )
+    buckets_group.addoption(
+        "--model-cache-keep",
+        action="store_true",
+        default=bool(os.environ.get("MODEL_CACHE_KEEP")),
+        help="Keep the model cache namespace after the session, to reuse it in the next sessions",
+    )
     # Runtime options
     runtime_group.addoption(
         "--supported-accelerator-type",
@@ -161,15 +212,167 @@ def pytest_addoption(parser: Parser) -> None:
     # HuggingFace options
     hf_group.addoption("--hf-access-token", default=os.environ.get("HF_ACCESS_TOKEN"), help="HF access token")
 
+    # Benchmark options
+    benchmark_group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run benchmark tests (marked with `benchmark`); benchmark tests are deselected by default",
+    )
+    benchmark_group.addoption(
+        "--benchmark-results-dir",
+        default=os.environ.get("BENCHMARK_RESULTS_DIR", "benchmark-results"),
+        help="Directory to write benchmark reports (JSON and text table) to",
+    )
+    benchmark_group.addoption(
+        "--trustyai-benchmark-observations",
+        default=os.environ.get("TRUSTYAI_BENCHMARK_OBSERVATIONS", "1000,10000,100000,1000000"),
+        help="Coma-separated str; number of stored observations to measure TrustyAI metrics latency at",
+    )
+    benchmark_group.addoption(
+        "--vllm-benchmark-concurrency",
+        default=os.environ.get("VLLM_BENCHMARK_CONCURRENCY", "1,4,16,32"),
+        help="Coma-separated str; number of concurrent requests to sweep in vLLM serving benchmark",
+    )
+    benchmark_group.addoption(
+        "--vllm-benchmark-num-prompts",
+        type=int,
+        default=int(os.environ.get("VLLM_BENCHMARK_NUM_PROMPTS", 64)),
+        help="Number of requests sent at each concurrency level in vLLM serving benchmark",
+    )
+    benchmark_group.addoption(
+        "--vllm-benchmark-input-len",
+        type=int,
+        default=int(os.environ.get("VLLM_BENCHMARK_INPUT_LEN", 512)),
+        help="Number of words per prompt (roughly the number of input tokens) in vLLM serving benchmark",
+    )
+    benchmark_group.addoption(
+        "--vllm-benchmark-output-len",
+        type=int,
+        default=int(os.environ.get("VLLM_BENCHMARK_OUTPUT_LEN", 128)),
+        help="Number of output tokens generated per request in vLLM serving benchmark",
+    )
+    benchmark_group.addoption(
+        "--cold-start-trials",
+        type=int,
+        default=int(os.environ.get("COLD_START_TRIALS", 5)),
+        help="Number of scale-from-zero trials per case in cold start benchmark",
+    )
+    benchmark_group.addoption(
+        "--autoscaling-benchmark-peak-concurrency",
+        type=int,
+        default=int(os.environ.get("AUTOSCALING_BENCHMARK_PEAK_CONCURRENCY", 8)),
+        help="Peak number of concurrent requests of the load profiles in autoscaling benchmark",
+    )
+    benchmark_group.addoption(
+        "--autoscaling-benchmark-step-duration",
+        type=int,
+        default=int(os.environ.get("AUTOSCALING_BENCHMARK_STEP_DURATION", 120)),
+        help="Duration in seconds of each load step in autoscaling benchmark",
+    )
+    benchmark_group.addoption(
+        "--model-load-trials",
+        type=int,
+        default=int(os.environ.get("MODEL_LOAD_TRIALS", 3)),
+        help="Number of predictor pod (re)starts measured per storage backend in model load benchmark",
+    )
+    benchmark_group.addoption(
+        "--latency-breakdown-requests",
+        type=int,
+        default=int(os.environ.get("LATENCY_BREAKDOWN_REQUESTS", 50)),
+        help="Number of sequential inference requests per case in latency breakdown benchmark",
+    )
+    benchmark_group.addoption(
+        "--mr-scale-benchmark-models",
+        default=os.environ.get("MR_SCALE_BENCHMARK_MODELS", "100,1000,10000"),
+        help="Coma-separated str; number of registered models to measure Model Registry REST API latency at",
+    )
+    benchmark_group.addoption(
+        "--mr-scale-benchmark-versions",
+        type=int,
+        default=int(os.environ.get("MR_SCALE_BENCHMARK_VERSIONS", 3)),
+        help="Number of model versions per registered model in Model Registry scale benchmark",
+    )
+    benchmark_group.addoption(
+        "--mr-scale-benchmark-artifacts",
+        type=int,
+        default=int(os.environ.get("MR_SCALE_BENCHMARK_ARTIFACTS", 1)),
+        help="Number of artifacts per model version in Model Registry scale benchmark",
+    )
+    benchmark_group.addoption(
+        "--mr-scale-benchmark-concurrency",
+        type=int,
+        default=int(os.environ.get("MR_SCALE_BENCHMARK_CONCURRENCY", 16)),
+        help="Number of models registered concurrently in Model Registry scale benchmark",
+    )
+    benchmark_group.addoption(
+        "--kube-api-accounting",
+        action="store_true",
+        default=bool(os.environ.get("KUBE_API_ACCOUNTING")),
+        help="Count Kubernetes API calls, bytes and latency by test, fixture, verb and resource, "
+        "and write per-test and per-fixture reports to the benchmark results directory",
+    )
+    benchmark_group.addoption(
+        "--fixture-profile",
+        action="store_true",
+        default=bool(os.environ.get("FIXTURE_PROFILE")),
+        help="Time fixtures setup / teardown and test phases, split into waits, API calls and subprocesses, "
+        "and write per-fixture and per-class critical path reports and a Chrome trace to the benchmark results dir",
+    )
+    benchmark_group.addoption(
+        "--fixture-profile-sort-by",
+        default=os.environ.get("FIXTURE_PROFILE_SORT_BY", FIXTURE_PROFILE_SORT_KEYS[0]),
+        choices=FIXTURE_PROFILE_SORT_KEYS,
+        help="Fixture profile report sort key",
+    )
+
+    # Logging options
+    logging_group.addoption(
+        "--log-json-file",
+        default=os.environ.get("LOG_JSON_FILE"),
+        help="Write the tests log also as JSON lines, with the current test and phase in each line, to this file",
+    )
+    logging_group.addoption(
+        "--log-max-payload-length",
+        type=int,
+        default=int(os.environ.get("LOG_MAX_PAYLOAD_LENGTH", DEFAULT_LOG_MAX_PAYLOAD_LENGTH)),
+        help="Truncate log messages (e.g. inference responses) longer than this; 0 disables truncation",
+    )
+    logging_group.addoption(
+        "--log-per-test",
+        action="store_true",
+        help="Write each test log also to a test log file, indexed by test phase, in the test must-gather directory",
+    )
+
+    # Jira options
+    jira_group.addoption(
+        "--jira-cache-file",
+        default=os.environ.get("JIRA_CACHE_FILE", JIRA_CACHE_FILE),
+        help="File to cache Jira issues status in, shared between sessions",
+    )
+    jira_group.addoption(
+        "--jira-cache-ttl",
+        type=int,
+        default=int(os.environ.get("JIRA_CACHE_TTL", JIRA_CACHE_TTL)),
+        help="Seconds a cached Jira issue status is valid for; 0 disables the Jira cache file",
+    )
+
+
+@hookimpl(trylast=True)
+def pytest_configure(config: Config) -> None:
+    # After pytest-jira `pytest_configure`, which registers its plugin
+    defer_jira_plugin_checks(config=config)
+
 
 def pytest_cmdline_main(config: Any) -> None:
     config.option.basetemp = py_config["tmp_base_dir"] = f"{config.option.basetemp}-{shortuuid.uuid()}"
 
 
+@hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(session: Session, config: Config, items: list[Item]) -> None:
     """
     Pytest fixture to filter or re-order the items in-place.
 
+    Filters benchmark tests based on '--benchmark' option and marker.
     Filters upgrade tests based on '--pre-upgrade' / '--post-upgrade' option and marker.
     If `--upgrade-deployment-modes` option is set, only tests with the specified deployment modes will be added.
     """
@@ -191,6 +394,11 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
 
         return any([keyword for keyword in _item.keywords if keyword in _upgrade_deployment_modes])
 
+    if not config.getoption(name="benchmark"):
+        if benchmark_tests := [item for item in items if "benchmark" in item.keywords]:
+            items[:] = [item for item in items if "benchmark" not in item.keywords]
+            config.hook.pytest_deselected(items=benchmark_tests)
+
     pre_upgrade_tests: list[Item] = []
     post_upgrade_tests: list[Item] = []
     non_upgrade_tests: list[Item] = []
@@ -241,23 +449,69 @@ def pytest_sessionstart(session: Session) -> None:
     if os.path.exists(tests_log_file):
         pathlib.Path(tests_log_file).unlink()
     if session.config.getoption("--collect-must-gather"):
-        session.config.option.must_gather_db = Database()
+        session.config.option.must_gather_db = database.Database()
+    json_log_file = session.config.getoption("log_json_file")
     session.config.option.log_listener = setup_logging(
         log_file=tests_log_file,
         log_level=session.config.getoption("log_cli_level") or logging.INFO,
+        json_log_file=os.path.join(get_base_dir(), json_log_file) if json_log_file else None,
+        max_payload_length=session.config.getoption("log_max_payload_length"),
+        log_per_test=session.config.getoption("log_per_test"),
     )
+    py_config["jira_cache_file"] = session.config.getoption("jira_cache_file")
+    py_config["jira_cache_ttl"] = session.config.getoption("jira_cache_ttl")
+    session.config.option.api_accounting = None
+    if session.config.getoption("kube_api_accounting"):
+        session.config.option.api_accounting = KubeAPIAccounting()
+        session.config.option.api_accounting.set_test(test="", phase="sessionstart")
+        session.config.option.api_accounting.install()
+
+    if session.config.getoption("fixture_profile"):
+        fixture_profiler = FixtureProfiler(
+            results_dir=os.path.join(get_base_dir(), session.config.getoption("benchmark_results_dir")),
+            sort_by=session.config.getoption("fixture_profile_sort_by"),
+        )
+        fixture_profiler.install()
+        session.config.pluginmanager.register(plugin=fixture_profiler, name="fixture_profiler")
+
     must_gather_dict = set_must_gather_collector_values()
+    config = session.config
+    if config.getoption("--collect-only") or config.getoption("--setup-plan"):
+        # Collection runs (e.g. collection benchmark) must not remove the must-gather of a running session
+        LOGGER.info("Skipping must-gather cleanup and global config update for collect-only or setup-plan")
+        return
+    if is_no_cluster_session(config=config):
+        LOGGER.info(f"Skipping must-gather cleanup and global config update, only {NO_CLUSTER_TESTS_DIRS} tests run")
+        return
     shutil.rmtree(
         path=must_gather_dict["must_gather_base_directory"],
         ignore_errors=True,
     )
-    config = session.config
-    if config.getoption("--collect-only") or config.getoption("--setup-plan"):
-        LOGGER.info("Skipping global config update for collect-only or setup-plan")
-        return
     updated_global_config(admin_client=get_client())
 
 
+def is_no_cluster_session(config: Config) -> bool:
+    """
+    Check if the session only runs tests under `NO_CLUSTER_TESTS_DIRS`, which do not need a cluster.
+
+    The global config is updated from the cluster before the tests are collected (it is used in tests parameters),
+    so the tests paths passed to pytest are checked rather than the collected tests.
+
+    Args:
+        config (Config): pytest config.
+
+    Returns:
+        bool: True if all the tests paths are under `NO_CLUSTER_TESTS_DIRS`.
+
+    """
+    no_cluster_dirs = [(config.rootpath / tests_dir).resolve() for tests_dir in NO_CLUSTER_TESTS_DIRS]
+    tests_paths = [(config.invocation_params.dir / arg.split("::")[0]).resolve() for arg in config.args]
+    return bool(tests_paths) and all(
+        any(tests_path.is_relative_to(no_cluster_dir) for no_cluster_dir in no_cluster_dirs)
+        for tests_path in tests_paths
+    )
+
+
 def updated_global_config(admin_client: DynamicClient) -> None:
     """
     Updates the global config with the distribution, applications namespace, and model registry namespace.
@@ -283,8 +537,28 @@ def updated_global_config(admin_client: DynamicClient) -> None:
     ).instance.spec.components.modelregistry.registriesNamespace
 
 
-def pytest_fixture_setup(fixturedef: FixtureDef[Any], request: FixtureRequest) -> None:
+@hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef: FixtureDef[Any], request: FixtureRequest) -> Generator[None, Any, Any]:
+    """
+    Attributes the fixture setup and teardown Kubernetes API calls to the fixture when `--kube-api-accounting` is set.
+    """
     LOGGER.info(f"Executing {fixturedef.scope} fixture: {fixturedef.argname}")
+    if not (api_accounting := request.config.option.api_accounting):
+        return (yield)
+
+    api_accounting.push_caller(caller=f"{fixturedef.argname} setup")
+    try:
+        return (yield)
+
+    finally:
+        api_accounting.pop_caller(caller=f"{fixturedef.argname} setup")
+        # Finalizers run last-in first-out, this runs before the fixture teardown
+        fixturedef.addfinalizer(partial(api_accounting.push_caller, caller=f"{fixturedef.argname} teardown"))
+
+
+def pytest_fixture_post_finalizer(fixturedef: FixtureDef[Any], request: FixtureRequest) -> None:
+    if api_accounting := request.config.option.api_accounting:
+        api_accounting.pop_caller(caller=f"{fixturedef.argname} teardown")
 
 
 def pytest_runtest_setup(item: Item) -> None:
@@ -294,6 +568,18 @@ def pytest_runtest_setup(item: Item) -> None:
     2. Adds `fail_if_missing_dependent_operators` fixture for Serverless tests.
     3. Adds fixtures to enable KServe/model mesh in DSC for model server tests.
     """
+    test_log_shard = ""
+    if item.config.getoption("log_per_test"):
+        test_log_dir = prepare_pytest_item_data_dir(
+            item=item, output_dir=py_config["must_gather_collector"]["must_gather_base_directory"]
+        )
+        test_log_shard = os.path.join(test_log_dir, TEST_LOG_FILE_NAME)
+        item.user_properties.append(("test_log", test_log_shard))
+
+    set_log_context(test=item.nodeid, phase="setup", log_shard=test_log_shard)
+    if api_accounting := item.config.option.api_accounting:
+        api_accounting.set_test(test=item.nodeid, phase="setup")
+
     BASIC_LOGGER.info(f"\n{separator(symbol_='-', val=item.name)}")
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='SETUP')}")
     if item.config.getoption("--collect-must-gather"):
@@ -326,10 +612,18 @@ def pytest_runtest_setup(item: Item) -> None:
 
 
 def pytest_runtest_call(item: Item) -> None:
+    set_log_context(phase="call")
+    if api_accounting := item.config.option.api_accounting:
+        api_accounting.set_test(test=item.nodeid, phase="call")
+
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
 
 
 def pytest_runtest_teardown(item: Item) -> None:
+    set_log_context(phase="teardown")
+    if api_accounting := item.config.option.api_accounting:
+        api_accounting.set_test(test=item.nodeid, phase="teardown")
+
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='TEARDOWN')}")
     # reset must-gather collector after each tests
     py_config["must_gather_collector"]["collector_directory"] = py_config["must_gather_collector"][
@@ -337,6 +631,29 @@ def pytest_runtest_teardown(item: Item) -> None:
     ]
 
 
+@hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: Item, call: CallInfo[None]) -> Generator[None, TestReport, TestReport]:
+    """
+    Attaches the failed test phase log, read from the test log file, to the report when JUnit XML includes logs.
+    """
+    report = yield
+    if (
+        report.failed
+        and item.config.getoption("log_per_test")
+        and item.config.getini("junit_logging") in ("log", "all")
+        and item.config.option.log_listener.flush()
+    ):
+        test_log_dir = prepare_pytest_item_data_dir(
+            item=item, output_dir=py_config["must_gather_collector"]["must_gather_base_directory"]
+        )
+        report.sections.append((
+            f"Captured log {report.when}",
+            read_test_log(test_log_dir=test_log_dir, phase=report.when),
+        ))
+
+    return report
+
+
 def pytest_report_teststatus(report: CollectReport, config: Config) -> None:
     test_name = report.head_line
     when = report.when
@@ -356,8 +673,20 @@ def pytest_report_teststatus(report: CollectReport, config: Config) -> None:
 
 
 def pytest_sessionfinish(session: Session, exitstatus: int) -> None:
-    session.config.option.log_listener.stop()
-    if session.config.option.setupplan or session.config.option.collectonly:
+    set_log_context(test="", phase="", log_shard="")
+    log_listener = session.config.option.log_listener
+    if api_accounting := session.config.option.api_accounting:
+        api_accounting.uninstall()
+        api_accounting.write_reports(
+            results_dir=os.path.join(get_base_dir(), session.config.getoption("benchmark_results_dir"))
+        )
+
+    tests_ran = not (session.config.option.setupplan or session.config.option.collectonly)
+    if tests_ran:
+        LOGGER.info(f"Logging stats: {log_listener.stats()}")
+
+    log_listener.stop()
+    if not tests_ran:
         return
     if session.config.getoption("--collect-must-gather"):
         db = session.config.option.must_gather_db
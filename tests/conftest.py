@@ -23,7 +23,6 @@ from ocp_resources.secret import Secret
 from ocp_resources.service import Service
 from ocp_resources.subscription import Subscription
 from ocp_utilities.monitoring import Prometheus
-from pyhelper_utils.shell import run_command
 from pytest import FixtureRequest, Config
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.data_science_cluster import DataScienceCluster
@@ -35,11 +34,9 @@ from simple_logger.logger import get_logger
 from ocp_utilities.operators import uninstall_operator, install_operator
 from utilities.certificates_utils import create_ca_bundle_file
 from utilities.data_science_cluster_utils import update_components_in_dsc
-from utilities.exceptions import ClusterLoginError
 from utilities.infra import (
     verify_cluster_sanity,
     create_ns,
-    login_with_user_password,
     get_openshift_token,
     download_oc_console_cli,
 )
@@ -55,7 +52,10 @@ from utilities.constants import (
 from utilities.infra import update_configmap_data
 from utilities.logger import RedactedString
 from utilities.mariadb_utils import wait_for_mariadb_operator_deployments
-from utilities.minio import create_minio_data_connection_secret
+from utilities.minio import create_minio_data_connection_secret, get_minio_service_endpoint
+from utilities.model_cache import MODEL_CACHE_MINIO_REGION, create_model_cache, mirror_models_to_cache
+from utilities.must_gather_collector import get_base_dir
+from utilities.oauth_utils import OAuthTokenBroker, get_oauth_token_broker
 from utilities.operator_utils import get_csv_related_images, get_cluster_service_version
 
 LOGGER = get_logger(name=__name__)
@@ -79,7 +79,9 @@ def tests_tmp_dir(request: FixtureRequest, tmp_path_factory: TempPathFactory) ->
 
 @pytest.fixture(scope="session")
 def current_client_token(admin_client: DynamicClient) -> str:
-    return RedactedString(value=get_openshift_token())
+    # The admin client token, if it authenticates with one, saves an `oc whoami -t` call
+    bearer_token = admin_client.configuration.api_key.get("authorization", "")
+    return RedactedString(value=bearer_token.removeprefix("Bearer ").strip() or get_openshift_token())
 
 
 @pytest.fixture(scope="session")
@@ -210,6 +212,68 @@ def models_s3_bucket_endpoint(pytestconfig: pytest.Config) -> str:
     return models_bucket_endpoint
 
 
+@pytest.fixture(scope="session")
+def model_cache_service(
+    pytestconfig: pytest.Config,
+    admin_client: DynamicClient,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    models_s3_bucket_name: str,
+    models_s3_bucket_endpoint: str,
+) -> Generator[Service, Any, Any]:
+    with create_model_cache(
+        admin_client=admin_client,
+        pvc_size=pytestconfig.option.model_cache_pvc_size,
+        storage_class=pytestconfig.option.model_cache_storage_class,
+        teardown=not pytestconfig.option.model_cache_keep,
+    ) as service:
+        mirror_models_to_cache(
+            admin_client=admin_client,
+            cache_service=service,
+            bucket_name=models_s3_bucket_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_endpoint_url=models_s3_bucket_endpoint,
+            prefixes=[
+                prefix.strip() for prefix in pytestconfig.option.model_cache_prefixes.split(",") if prefix.strip()
+            ],
+        )
+        yield service
+
+
+@pytest.fixture(scope="session")
+def models_s3_endpoint_config(
+    request: FixtureRequest,
+    pytestconfig: pytest.Config,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    models_s3_bucket_name: str,
+    models_s3_bucket_region: str,
+    models_s3_bucket_endpoint: str,
+) -> dict[str, str]:
+    """
+    S3 endpoint secret values of the models bucket: the cluster model cache (`--model-cache`) or the bucket itself.
+    """
+    if pytestconfig.option.model_cache:
+        return {
+            "aws_access_key": MinIo.Credentials.ACCESS_KEY_VALUE,
+            "aws_secret_access_key": MinIo.Credentials.SECRET_KEY_VALUE,
+            "aws_s3_bucket": models_s3_bucket_name,
+            "aws_s3_endpoint": get_minio_service_endpoint(
+                minio_service=request.getfixturevalue(argname="model_cache_service")
+            ),
+            "aws_s3_region": MODEL_CACHE_MINIO_REGION,
+        }
+
+    return {
+        "aws_access_key": aws_access_key_id,
+        "aws_secret_access_key": aws_secret_access_key,
+        "aws_s3_bucket": models_s3_bucket_name,
+        "aws_s3_endpoint": models_s3_bucket_endpoint,
+        "aws_s3_region": models_s3_bucket_region,
+    }
+
+
 @pytest.fixture(scope="session")
 def supported_accelerator_type(pytestconfig: pytest.Config) -> str | None:
     accelerator_type = pytestconfig.option.supported_accelerator_type
@@ -292,25 +356,21 @@ def non_admin_user_password(admin_client: DynamicClient, use_unprivileged_client
 
 
 @pytest.fixture(scope="session")
-def kubconfig_filepath() -> str:
-    kubeconfig_path = os.path.join(os.path.expanduser("~"), ".kube/config")
-    kubeconfig_path_from_env = os.getenv("KUBECONFIG", "")
-
-    if os.path.isfile(kubeconfig_path_from_env):
-        return kubeconfig_path_from_env
-
-    return kubeconfig_path
+def oauth_token_broker(admin_client: DynamicClient) -> OAuthTokenBroker:
+    return get_oauth_token_broker(api_server_url=admin_client.configuration.host)
 
 
 @pytest.fixture(scope="session")
 def unprivileged_client(
     admin_client: DynamicClient,
     use_unprivileged_client: bool,
-    kubconfig_filepath: str,
+    oauth_token_broker: OAuthTokenBroker,
     non_admin_user_password: tuple[str, str],
 ) -> Generator[DynamicClient, Any, Any]:
     """
     Provides none privileged API client. If non_admin_user_password is None, then it will raise.
+
+    The user logs in through the OAuth server in process; the kubeconfig current context stays the admin one.
     """
     if not use_unprivileged_client:
         LOGGER.warning("Unprivileged client is not enabled, using admin client")
@@ -320,30 +380,7 @@ def unprivileged_client(
         raise ValueError("Unprivileged user not provisioned")
 
     else:
-        current_user = run_command(command=["oc", "whoami"])[1].strip()
-        non_admin_user_name = non_admin_user_password[0]
-
-        if login_with_user_password(
-            api_address=admin_client.configuration.host,
-            user=non_admin_user_name,
-            password=non_admin_user_password[1],
-        ):
-            with open(kubconfig_filepath) as fd:
-                kubeconfig_content = yaml.safe_load(fd)
-
-            unprivileged_context = kubeconfig_content["current-context"]
-
-            unprivileged_client = get_client(config_file=kubconfig_filepath, context=unprivileged_context)
-
-            # Get back to admin account
-            login_with_user_password(
-                api_address=admin_client.configuration.host,
-                user=current_user.strip(),
-            )
-            yield unprivileged_client
-
-        else:
-            raise ClusterLoginError(user=non_admin_user_name)
+        yield oauth_token_broker.get_client(user=non_admin_user_password[0], password=non_admin_user_password[1])
 
 
 @pytest.fixture(scope="session")
@@ -556,6 +593,11 @@ def related_images_refs(admin_client: DynamicClient) -> set[str]:
     return related_images_refs
 
 
+@pytest.fixture(scope="session")
+def benchmark_results_dir(pytestconfig: pytest.Config) -> str:
+    return os.path.join(get_base_dir(), pytestconfig.option.benchmark_results_dir)
+
+
 @pytest.fixture(scope="session")
 def os_path_environment() -> str:
     return os.environ["PATH"]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.inference_service import InferenceService
+from ocp_resources.namespace import Namespace
+
+from tests.infra.utils import EMULATED_MODEL_NAME, INFRA_BENCHMARK_NAMESPACE, create_emulated_isvc
+from utilities.api_accounting import KubeAPIAccounting
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.emulators.kube_api_emulator import KubeAPIEmulator
+from utilities.emulators.openai_emulator import OpenAIEmulator
+from utilities.infra import create_ns
+from utilities.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from utilities.emulators.kserve_v2_emulator import KServeV2Emulator
+    from utilities.emulators.tgis_grpc_emulator import TGISGRPCEmulator
+
+kserve_v2_emulator = lazy_import(name="utilities.emulators.kserve_v2_emulator")
+tgis_grpc_emulator = lazy_import(name="utilities.emulators.tgis_grpc_emulator")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def autouse_fixtures() -> None:
+    """Overrides the tests session autouse fixtures, which need a cluster; infra tests run against local emulators"""
+    return
+
+
+@pytest.fixture(scope="class")
+def kube_api_emulator() -> Generator[KubeAPIEmulator, Any, Any]:
+    with KubeAPIEmulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture(scope="class")
+def kube_api_emulator_client(kube_api_emulator: KubeAPIEmulator) -> DynamicClient:
+    return kube_api_emulator.dynamic_client()
+
+
+@pytest.fixture(scope="class")
+def emulated_namespace(kube_api_emulator_client: DynamicClient) -> Generator[Namespace, Any, Any]:
+    with create_ns(admin_client=kube_api_emulator_client, name=INFRA_BENCHMARK_NAMESPACE) as ns:
+        yield ns
+
+
+@pytest.fixture()
+def emulated_isvc(
+    request: FixtureRequest,
+    kube_api_emulator: KubeAPIEmulator,
+    kube_api_emulator_client: DynamicClient,
+    emulated_namespace: Namespace,
+) -> InferenceService:
+    create_emulated_isvc(
+        emulator=kube_api_emulator,
+        name=request.param["name"],
+        namespace=emulated_namespace.name,
+        num_pods=request.param.get("num-pods", 1),
+        ready_delay=request.param.get("ready-delay", 0),
+    )
+    return InferenceService(
+        client=kube_api_emulator_client, name=request.param["name"], namespace=emulated_namespace.name
+    )
+
+
+@pytest.fixture(scope="class")
+def openai_emulator() -> Generator[OpenAIEmulator, Any, Any]:
+    with OpenAIEmulator(model_name=EMULATED_MODEL_NAME) as emulator:
+        yield emulator
+
+
+@pytest.fixture(scope="class")
+def kserve_v2_emulator_server() -> Generator[KServeV2Emulator, Any, Any]:
+    with kserve_v2_emulator.KServeV2Emulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture(scope="class")
+def tgis_grpc_emulator_server(request: FixtureRequest) -> Generator[TGISGRPCEmulator, Any, Any]:
+    with tgis_grpc_emulator.TGISGRPCEmulator(
+        model_name=EMULATED_MODEL_NAME,
+        first_token_delay=request.param.get("first-token-delay", 0.0),
+        max_concurrent_requests=request.param.get("max-concurrent-requests", 0),
+    ) as emulator:
+        yield emulator
+
+
+@pytest.fixture()
+def kube_api_accounting() -> Generator[KubeAPIAccounting, Any, Any]:
+    accounting = KubeAPIAccounting()
+    accounting.install()
+    yield accounting
+    accounting.uninstall()
+
+
+@pytest.fixture(scope="session")
+def infra_helpers_benchmark_report(benchmark_results_dir: str) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(name="infra-helpers", results_dir=benchmark_results_dir)
+    yield report
+    report.write()
+
+
+@pytest.fixture(scope="session")
+def collection_benchmark_report(benchmark_results_dir: str) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(name="collection", results_dir=benchmark_results_dir)
+    yield report
+    report.write()
@@ -0,0 +1,24 @@
+import time
+
+WATCH_TIMEOUT: int = 10
+
+
+class TestKubeAPIAccounting:
+    """
+    Verifies Kubernetes API calls accounting against a local Kubernetes API emulator.
+    """
+
+    def test_accounted_watch_streams_events(self, kube_api_accounting, kube_api_emulator_client, emulated_namespace):
+        """Verify an accounted watch gets its events as they are streamed, the response body is not read"""
+        start_time = time.perf_counter()
+        for event in kube_api_emulator_client.resources.get(api_version="v1", kind="Namespace").watch(
+            timeout=WATCH_TIMEOUT
+        ):
+            assert event["object"].metadata.name == emulated_namespace.name
+            break
+
+        else:
+            raise AssertionError("Watch ended without events")
+
+        assert time.perf_counter() - start_time < WATCH_TIMEOUT / 2, "Watch waited for the response end"
+        assert [call for call in kube_api_accounting.calls if call[2:] == ("watch", "namespaces")]
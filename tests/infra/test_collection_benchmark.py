@@ -0,0 +1,32 @@
+import pytest
+
+from tests.infra.utils import measure_collection
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestCollectionBenchmark:
+    """
+    Measures how long collecting the whole tests tree and single subtrees takes in a new pytest process,
+    as `--collect-only` and `--setup-plan` runs do.
+
+    Fails if collection imports client libraries only needed when tests run (`COLLECTION_LAZY_MODULES`).
+    """
+
+    @pytest.mark.parametrize(
+        "tests_path",
+        [
+            pytest.param("tests", id="all"),
+            pytest.param("tests/model_serving/model_server", id="model-server"),
+            pytest.param("tests/model_serving/model_runtime", id="model-runtime"),
+            pytest.param("tests/model_registry", id="model-registry"),
+            pytest.param("tests/model_explainability", id="model-explainability"),
+        ],
+    )
+    def test_collection_benchmark(self, pytestconfig, tmp_path, tests_path, collection_benchmark_report):
+        measure_collection(
+            report=collection_benchmark_report,
+            tests_path=tests_path,
+            rootdir=str(pytestconfig.rootpath),
+            log_file=str(tmp_path / "collection.log"),
+        )
@@ -0,0 +1,86 @@
+import pytest
+
+from tests.infra.utils import create_and_delete_namespace, measure_infra_helper
+from utilities.infra import get_pods_by_isvc_label, verify_no_failed_pods, wait_for_inference_deployment_replicas
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestInfraHelpersBenchmark:
+    """
+    Measures the duration and API server calls of the `utilities.infra` wait and list helpers
+    against a local Kubernetes API emulator, with scripted readiness transitions.
+
+    Fails if a helper makes more API calls than `API_CALLS_BUDGET` plus `MAX_API_CALLS_PER_SECOND` per waited second.
+    """
+
+    def test_create_ns_benchmark(self, kube_api_emulator, kube_api_emulator_client, infra_helpers_benchmark_report):
+        measure_infra_helper(
+            emulator=kube_api_emulator,
+            report=infra_helpers_benchmark_report,
+            case="active-namespace",
+            helper=create_and_delete_namespace,
+            client=kube_api_emulator_client,
+            name="infra-helpers-benchmark-ns",
+        )
+
+    @pytest.mark.parametrize(
+        "emulated_isvc",
+        [
+            pytest.param({"name": "deployment-ready", "ready-delay": 0}, id="deployment-ready"),
+            pytest.param({"name": "deployment-ready-after-10s", "ready-delay": 10}, id="deployment-ready-after-10s"),
+            pytest.param(
+                {"name": "deployment-ready-after-30s", "num-pods": 3, "ready-delay": 30},
+                id="deployment-ready-after-30s",
+            ),
+        ],
+        indirect=True,
+    )
+    def test_wait_for_inference_deployment_replicas_benchmark(
+        self, kube_api_emulator, kube_api_emulator_client, emulated_isvc, infra_helpers_benchmark_report
+    ):
+        measure_infra_helper(
+            emulator=kube_api_emulator,
+            report=infra_helpers_benchmark_report,
+            case=emulated_isvc.name,
+            helper=wait_for_inference_deployment_replicas,
+            client=kube_api_emulator_client,
+            isvc=emulated_isvc,
+        )
+
+    @pytest.mark.parametrize(
+        "emulated_isvc",
+        [
+            pytest.param({"name": "pods-ready", "ready-delay": 0}, id="pods-ready"),
+            pytest.param({"name": "pods-ready-after-30s", "num-pods": 3, "ready-delay": 30}, id="pods-ready-after-30s"),
+        ],
+        indirect=True,
+    )
+    def test_verify_no_failed_pods_benchmark(
+        self, kube_api_emulator, kube_api_emulator_client, emulated_isvc, infra_helpers_benchmark_report
+    ):
+        measure_infra_helper(
+            emulator=kube_api_emulator,
+            report=infra_helpers_benchmark_report,
+            case=emulated_isvc.name,
+            helper=verify_no_failed_pods,
+            client=kube_api_emulator_client,
+            isvc=emulated_isvc,
+        )
+
+    @pytest.mark.parametrize(
+        "emulated_isvc",
+        [pytest.param({"name": "many-pods", "num-pods": 200}, id="many-pods")],
+        indirect=True,
+    )
+    def test_get_pods_by_isvc_label_benchmark(
+        self, kube_api_emulator, kube_api_emulator_client, emulated_isvc, infra_helpers_benchmark_report
+    ):
+        measure_infra_helper(
+            emulator=kube_api_emulator,
+            report=infra_helpers_benchmark_report,
+            case=emulated_isvc.name,
+            helper=get_pods_by_isvc_label,
+            client=kube_api_emulator_client,
+            isvc=emulated_isvc,
+        )
@@ -0,0 +1,100 @@
+import struct
+
+import pytest
+import requests
+
+from tests.infra.utils import EMULATED_MODEL_NAME, EMULATOR_SOCKET_TIMEOUT, grpc, send_kserve_v2_grpc_request
+
+FP32_INPUT: dict[str, object] = {"name": "input-0", "datatype": "FP32", "shape": [1, 3], "data": [1.0, 2.5, -3.0]}
+
+
+class TestKServeV2Emulator:
+    """
+    Verifies KServe V2 REST and gRPC inference against the local KServe V2 emulator, without a cluster.
+    """
+
+    def test_rest_infer(self, kserve_v2_emulator_server):
+        """Verify REST inference of the identity model returns its inputs"""
+        response = requests.post(
+            url=f"{kserve_v2_emulator_server.url}/v2/models/{EMULATED_MODEL_NAME}/infer",
+            json={"id": "rest-infer", "inputs": [FP32_INPUT]},
+            timeout=EMULATOR_SOCKET_TIMEOUT,
+        )
+        response.raise_for_status()
+        response_data = response.json()
+
+        assert response_data["id"] == "rest-infer"
+        assert response_data["outputs"] == [{**FP32_INPUT, "name": "output-0"}]
+
+    def test_rest_infer_unknown_model(self, kserve_v2_emulator_server):
+        """Verify REST inference of an unknown model returns 404"""
+        response = requests.post(
+            url=f"{kserve_v2_emulator_server.url}/v2/models/unknown-model/infer",
+            json={"inputs": [FP32_INPUT]},
+            timeout=EMULATOR_SOCKET_TIMEOUT,
+        )
+        assert response.status_code == 404
+
+    def test_grpc_infer(self, kserve_v2_emulator_server):
+        """Verify gRPC inference with typed contents returns its inputs"""
+        response = send_kserve_v2_grpc_request(
+            url=kserve_v2_emulator_server.grpc_url, model_name=EMULATED_MODEL_NAME, inputs=[FP32_INPUT]
+        )
+        output = response.outputs[0]
+
+        assert (output.name, output.datatype, list(output.shape)) == ("output-0", "FP32", [1, 3])
+        assert list(output.contents.fp32_contents) == FP32_INPUT["data"]
+
+    def test_grpc_infer_raw_input_contents(self, kserve_v2_emulator_server):
+        """Verify gRPC inference decodes raw input contents"""
+        response = send_kserve_v2_grpc_request(
+            url=kserve_v2_emulator_server.grpc_url,
+            model_name=EMULATED_MODEL_NAME,
+            inputs=[{"name": "input-0", "datatype": "INT32", "shape": [3]}],
+            raw_input_contents=[struct.pack("<3i", 1, -2, 3)],
+        )
+        assert list(response.outputs[0].contents.int_contents) == [1, -2, 3]
+
+    @pytest.mark.parametrize(
+        "inputs, raw_input_contents, status_code",
+        [
+            pytest.param(
+                [{"name": "input-0", "datatype": "FP32", "shape": [2]}],
+                [b"\x00" * 5],
+                "INVALID_ARGUMENT",
+                id="misaligned-raw-input-contents",
+            ),
+            pytest.param(
+                [{"name": "input-0", "datatype": "BYTES", "shape": [1]}],
+                [b"\x05\x00\x00\x00ab"],
+                "INVALID_ARGUMENT",
+                id="truncated-raw-bytes",
+            ),
+            pytest.param(
+                [{"name": "input-0", "datatype": "FP16", "shape": [1]}],
+                [b"\x00\x00"],
+                "INVALID_ARGUMENT",
+                id="unsupported-datatype",
+            ),
+        ],
+    )
+    def test_grpc_infer_invalid_input(self, kserve_v2_emulator_server, inputs, raw_input_contents, status_code):
+        """Verify invalid gRPC inputs are rejected with a gRPC status code instead of an internal error"""
+        with pytest.raises(grpc.RpcError) as exc_info:
+            send_kserve_v2_grpc_request(
+                url=kserve_v2_emulator_server.grpc_url,
+                model_name=EMULATED_MODEL_NAME,
+                inputs=inputs,
+                raw_input_contents=raw_input_contents,
+            )
+
+        assert exc_info.value.code().name == status_code
+
+    def test_grpc_infer_unknown_model(self, kserve_v2_emulator_server):
+        """Verify gRPC inference of an unknown model fails with NOT_FOUND"""
+        with pytest.raises(grpc.RpcError) as exc_info:
+            send_kserve_v2_grpc_request(
+                url=kserve_v2_emulator_server.grpc_url, model_name="unknown-model", inputs=[FP32_INPUT]
+            )
+
+        assert exc_info.value.code().name == "NOT_FOUND"
@@ -0,0 +1,75 @@
+import pytest
+
+from tests.infra.utils import EMULATED_MODEL_NAME, send_raw_http_request
+from utilities.emulators.openai_emulator import DEFAULT_EMULATOR_RESPONSE
+from utilities.plugins.constant import OpenAIEnpoints
+from utilities.plugins.openai_plugin import OpenAIClient
+
+EMULATED_TOKENS: list[str] = [f" {word}" for word in DEFAULT_EMULATOR_RESPONSE.split()]
+
+
+class TestOpenAIEmulator:
+    """
+    Verifies `OpenAIClient` against the local OpenAI compatible API emulator, without a cluster.
+    """
+
+    @pytest.mark.parametrize(
+        "endpoint, query",
+        [
+            pytest.param(OpenAIEnpoints.COMPLETIONS, {"text": "Hello"}, id="completions"),
+            pytest.param(
+                OpenAIEnpoints.CHAT_COMPLETIONS, [{"role": "user", "content": "Hello"}], id="chat-completions"
+            ),
+        ],
+    )
+    def test_openai_client_streaming_matches_completion(self, openai_emulator, endpoint, query):
+        """Verify streamed tokens add up to the non-streamed completion, with the requested number of tokens"""
+        extra_param = {"max_tokens": 5, "ignore_eos": True}
+        choice = OpenAIClient(host=openai_emulator.url, model_name=EMULATED_MODEL_NAME).request_http(
+            endpoint=endpoint, query=query, extra_param=extra_param
+        )
+        streamed_text = OpenAIClient(
+            host=openai_emulator.url, model_name=EMULATED_MODEL_NAME, streaming=True
+        ).streaming_request_http(endpoint=endpoint, query=query, extra_param=extra_param)
+
+        text = choice["message"]["content"] if endpoint == OpenAIEnpoints.CHAT_COMPLETIONS else choice["text"]
+        assert text == "".join(EMULATED_TOKENS[:5])
+        assert choice["finish_reason"] == "length"
+        assert streamed_text == text
+
+    def test_openai_client_completion_stops_at_eos(self, openai_emulator):
+        """Verify a completion without `ignore_eos` stops at the end of the emulated response"""
+        choice = OpenAIClient(host=openai_emulator.url, model_name=EMULATED_MODEL_NAME).request_http(
+            endpoint=OpenAIEnpoints.COMPLETIONS, query={"text": "Hello"}, extra_param={"max_tokens": 1000}
+        )
+        assert choice["text"] == "".join(EMULATED_TOKENS)
+        assert choice["finish_reason"] == "stop"
+
+    def test_openai_client_completion_zero_max_tokens(self, openai_emulator):
+        """Verify `max_tokens=0` generates no tokens instead of falling back to the default"""
+        choice = OpenAIClient(host=openai_emulator.url, model_name=EMULATED_MODEL_NAME).request_http(
+            endpoint=OpenAIEnpoints.COMPLETIONS, query={"text": "Hello"}, extra_param={"max_tokens": 0}
+        )
+        assert choice["text"] == ""
+        assert choice["finish_reason"] == "length"
+
+    def test_openai_client_models(self, openai_emulator):
+        """Verify the served model is listed"""
+        models = OpenAIClient.get_request_http(host=openai_emulator.url, endpoint=OpenAIEnpoints.MODELS_INFO)
+        assert [model["id"] for model in models] == [EMULATED_MODEL_NAME]
+
+    @pytest.mark.parametrize(
+        "raw_request",
+        [
+            pytest.param(b"BROKEN\r\n\r\n", id="malformed-request-line"),
+            pytest.param(b"GET /v1/models HTTP/1.1\r\nbroken-header\r\n\r\n", id="malformed-header"),
+            pytest.param(
+                b"POST /v1/completions HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{x",
+                id="invalid-json-body",
+            ),
+        ],
+    )
+    def test_emulator_invalid_request(self, openai_emulator, raw_request):
+        """Verify invalid requests get a 400 response instead of dropping the connection"""
+        response = send_raw_http_request(url=openai_emulator.url, request=raw_request)
+        assert response.startswith(b"HTTP/1.1 400 "), response
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.infra.utils import EMULATED_MODEL_NAME
+from utilities.emulators.openai_emulator import DEFAULT_EMULATOR_RESPONSE
+from utilities.lazy_import import lazy_import
+
+tgis_grpc_plugin = lazy_import(name="utilities.plugins.tgis_grpc_plugin")
+
+CONCURRENT_REQUESTS: int = 16
+EMULATED_TEXT: str = "".join(f" {word}" for word in DEFAULT_EMULATOR_RESPONSE.split())
+
+
+def send_concurrent_tgis_requests(url: str, streaming: bool) -> list[dict[str, object] | None]:
+    client = tgis_grpc_plugin.TGISGRPCPlugin(host=url, model_name=EMULATED_MODEL_NAME, streaming=streaming)
+    with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as executor:
+        return list(
+            executor.map(
+                lambda index: client.request_func(query={"text": f"Request {index}"}), range(CONCURRENT_REQUESTS)
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "tgis_grpc_emulator_server",
+    [pytest.param({"first-token-delay": 0.5})],
+    indirect=True,
+)
+class TestTGISGRPCPluginConcurrency:
+    """
+    Verifies `TGISGRPCPlugin` concurrent requests against the local TGIS gRPC emulator, without a cluster.
+    """
+
+    @pytest.mark.parametrize("streaming", [pytest.param(False, id="generate"), pytest.param(True, id="stream")])
+    def test_tgis_grpc_plugin_concurrent_requests(self, tgis_grpc_emulator_server, streaming):
+        """Verify every concurrent request gets the full generated text while requests are decoded together"""
+        results = send_concurrent_tgis_requests(url=tgis_grpc_emulator_server.url, streaming=streaming)
+
+        assert [result["output_text"] for result in results] == [EMULATED_TEXT] * CONCURRENT_REQUESTS
+        assert tgis_grpc_emulator_server.peak_active_sequences > 1
+        assert tgis_grpc_emulator_server.active_requests == 0
+
+
+@pytest.mark.parametrize(
+    "tgis_grpc_emulator_server",
+    [pytest.param({"first-token-delay": 1.0, "max-concurrent-requests": 4})],
+    indirect=True,
+)
+class TestTGISGRPCPluginOverload:
+    """
+    Verifies `TGISGRPCPlugin` requests rejected by a saturated TGIS gRPC emulator.
+    """
+
+    def test_tgis_grpc_plugin_overloaded_requests(self, tgis_grpc_emulator_server):
+        """Verify requests above the server concurrency limit are rejected and the others succeed"""
+        results = send_concurrent_tgis_requests(url=tgis_grpc_emulator_server.url, streaming=False)
+        succeeded = [result for result in results if result]
+
+        assert 0 < len(succeeded) < CONCURRENT_REQUESTS
+        assert all(result["output_text"] == EMULATED_TEXT for result in succeeded)
+        assert tgis_grpc_emulator_server.peak_active_sequences <= 4
@@ -0,0 +1,329 @@
+import os
+import re
+import socket
+import sys
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from kubernetes.dynamic import DynamicClient
+from pyhelper_utils.shell import run_command
+from simple_logger.logger import get_logger
+
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.constants import Annotations, ApiGroups, KServeDeploymentType
+from utilities.emulators.kube_api_emulator import KubeAPIEmulator
+from utilities.infra import create_ns
+from utilities.lazy_import import lazy_import
+
+LOGGER = get_logger(name=__name__)
+
+grpc = lazy_import(name="grpc")
+kserve_v2_emulator = lazy_import(name="utilities.emulators.kserve_v2_emulator")
+grpc_predict_v2_pb2 = lazy_import(name="utilities.plugins.kserve_v2_grpc.grpc_predict_v2_pb2")
+grpc_predict_v2_pb2_grpc = lazy_import(name="utilities.plugins.kserve_v2_grpc.grpc_predict_v2_pb2_grpc")
+
+INFRA_BENCHMARK_NAMESPACE: str = "infra-helpers-benchmark"
+# Helpers may make API_CALLS_BUDGET calls, plus MAX_API_CALLS_PER_SECOND calls per second they wait
+API_CALLS_BUDGET: int = 20
+MAX_API_CALLS_PER_SECOND: float = 2.0
+# Client libraries only needed when tests run (see `utilities.lazy_import`), must not be imported by collection
+COLLECTION_LAZY_MODULES: tuple[str, ...] = (
+    "grpc",
+    "llama_stack_client",
+    "model_registry",
+    "mr_openapi",
+    "pandas",
+    "sqlalchemy",
+)
+COLLECTION_BENCHMARK_TRIALS: int = 3
+EMULATED_MODEL_NAME: str = "emulated-model"
+EMULATOR_SOCKET_TIMEOUT: int = 10
+
+
+def create_emulated_isvc(
+    emulator: KubeAPIEmulator,
+    name: str,
+    namespace: str,
+    num_pods: int,
+    ready_delay: float,
+    deployment_mode: str = KServeDeploymentType.RAW_DEPLOYMENT,
+) -> None:
+    """
+    Create an InferenceService with its predictor deployment and pods in the emulator,
+    and schedule the deployment and pods to become ready.
+
+    Args:
+        emulator (KubeAPIEmulator): Kubernetes API emulator.
+        name (str): InferenceService name.
+        namespace (str): Namespace.
+        num_pods (int): Number of predictor pods and deployment replicas.
+        ready_delay (float): Time until the deployment and pods are ready, in seconds.
+        deployment_mode (str): KServe deployment mode.
+
+    """
+    labels = {f"{ApiGroups.KSERVE}/inferenceservice": name}
+    emulator.create_object(
+        body={
+            "kind": "InferenceService",
+            "metadata": {
+                "name": name,
+                "namespace": namespace,
+                "annotations": {Annotations.KserveIo.DEPLOYMENT_MODE: deployment_mode},
+            },
+            "spec": {"predictor": {"minReplicas": num_pods, "model": {"modelFormat": {"name": "vLLM"}}}},
+        }
+    )
+    emulator.create_object(
+        body={
+            "kind": "Deployment",
+            "metadata": {"name": f"{name}-predictor", "namespace": namespace, "labels": labels},
+            "spec": {"replicas": num_pods},
+        }
+    )
+    emulator.schedule(
+        delay=ready_delay,
+        action=emulator.patch_object,
+        kind="Deployment",
+        name=f"{name}-predictor",
+        namespace=namespace,
+        patch={
+            "status": {
+                "replicas": num_pods,
+                "updatedReplicas": num_pods,
+                "availableReplicas": num_pods,
+                "readyReplicas": num_pods,
+            }
+        },
+    )
+
+    for index in range(num_pods):
+        pod_name = f"{name}-predictor-{index}"
+        emulator.create_object(
+            body={
+                "kind": "Pod",
+                "metadata": {
+                    "name": pod_name,
+                    "namespace": namespace,
+                    "labels": labels,
+                    "annotations": {Annotations.KserveIo.DEPLOYMENT_MODE: deployment_mode},
+                },
+                "status": {"phase": "Pending", "conditions": [{"type": "Ready", "status": "False"}]},
+            }
+        )
+        emulator.schedule(
+            delay=ready_delay,
+            action=emulator.patch_object,
+            kind="Pod",
+            name=pod_name,
+            namespace=namespace,
+            patch={"status": {"phase": "Running", "conditions": [{"type": "Ready", "status": "True"}]}},
+        )
+
+
+def create_and_delete_namespace(client: DynamicClient, name: str) -> None:
+    with create_ns(admin_client=client, name=name):
+        LOGGER.info(f"Namespace {name} is active")
+
+
+def measure_infra_helper(
+    emulator: KubeAPIEmulator,
+    report: BenchmarkReport,
+    case: str,
+    helper: Callable[..., Any],
+    **kwargs: Any,
+) -> None:
+    """
+    Call an infra helper against the emulator and add its duration and API calls to the report.
+
+    Args:
+        emulator (KubeAPIEmulator): Kubernetes API emulator.
+        report (BenchmarkReport): Report to add the results to.
+        case (str): Benchmark case, e.g. the scripted InferenceService name.
+        helper (Callable[..., Any]): Measured helper.
+        **kwargs: Helper arguments.
+
+    Raises:
+        AssertionError: If the helper makes more API calls than `API_CALLS_BUDGET` plus `MAX_API_CALLS_PER_SECOND`
+            per second of its duration.
+
+    """
+    emulator.reset_api_calls()
+    start_time = time.perf_counter()
+    helper(**kwargs)
+    duration = time.perf_counter() - start_time
+
+    api_calls = dict(emulator.api_calls)
+    total_api_calls = sum(api_calls.values())
+    api_calls_per_second = total_api_calls / duration
+    LOGGER.info(f"{helper.__name__} took {duration:.2f} seconds, API calls: {api_calls}")
+    report.add_result(
+        helper=helper.__name__,
+        case=case,
+        duration=round(duration, 3),
+        api_calls=total_api_calls,
+        api_calls_per_second=round(api_calls_per_second, 2),
+        **{f"{verb}_{kind or 'api'}": count for (verb, kind), count in sorted(api_calls.items())},
+    )
+
+    assert total_api_calls <= API_CALLS_BUDGET + MAX_API_CALLS_PER_SECOND * duration, (
+        f"{helper.__name__} made {total_api_calls} API calls in {duration:.2f} seconds: {api_calls}"
+    )
+
+
+def get_no_cluster_env() -> dict[str, str]:
+    """
+    Get the environment of a collection process, without a cluster or Jira to connect to,
+    so collection fails if it needs one.
+
+    Returns:
+        dict[str, str]: Environment variables.
+
+    """
+    env = {key: value for key, value in os.environ.items() if not key.startswith("KUBERNETES_SERVICE_")}
+    # Without Jira URL, pytest-jira is not enabled
+    return {**env, "KUBECONFIG": os.devnull, "PYTEST_JIRA_URL": ""}
+
+
+def collect_tests(tests_path: str, rootdir: str, log_file: str) -> tuple[float, int, set[str]]:
+    """
+    Collect tests in a new pytest process, as `--collect-only` / `--setup-plan` runs do.
+
+    Args:
+        tests_path (str): Tests file or directory, relative to `rootdir`.
+        rootdir (str): pytest rootdir.
+        log_file (str): Tests log file of the collection process.
+
+    Returns:
+        tuple[float, int, set[str]]: Collection duration in seconds, number of collected tests
+            and top-level packages imported by the collection.
+
+    Raises:
+        AssertionError: If collection fails.
+
+    """
+    start_time = time.perf_counter()
+    success, out, err = run_command(
+        command=[
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            f"--log-file={log_file}",
+            tests_path,
+        ],
+        verify_stderr=False,
+        check=False,
+        cwd=rootdir,
+        env=get_no_cluster_env(),
+    )
+    duration = time.perf_counter() - start_time
+    assert success, f"Failed to collect {tests_path}: {out}"
+
+    collected = re.search(r"(\d+)(?:/\d+)? tests? collected", out)
+    # `-X importtime` lines: "import time: <self us> | <cumulative us> | <indentation><module>"
+    imported_packages = {
+        line.split("|")[2].strip().split(".")[0] for line in err.splitlines() if line.startswith("import time:")
+    }
+    return duration, int(collected.group(1)) if collected else 0, imported_packages
+
+
+def measure_collection(report: BenchmarkReport, tests_path: str, rootdir: str, log_file: str) -> None:
+    """
+    Collect tests `COLLECTION_BENCHMARK_TRIALS` times and add the collection duration to the report.
+
+    Args:
+        report (BenchmarkReport): Report to add the results to.
+        tests_path (str): Tests file or directory, relative to `rootdir`.
+        rootdir (str): pytest rootdir.
+        log_file (str): Tests log file of the collection processes.
+
+    Raises:
+        AssertionError: If collection imports any of `COLLECTION_LAZY_MODULES`.
+
+    """
+    durations: list[float] = []
+    num_tests = 0
+    imported_packages: set[str] = set()
+    for _ in range(COLLECTION_BENCHMARK_TRIALS):
+        duration, num_tests, imported_packages = collect_tests(
+            tests_path=tests_path, rootdir=rootdir, log_file=log_file
+        )
+        durations.append(duration)
+
+    lazy_modules_imported = sorted(imported_packages.intersection(COLLECTION_LAZY_MODULES))
+    LOGGER.info(f"Collecting {tests_path} ({num_tests} tests) took {min(durations):.2f} seconds at best")
+    report.add_result(
+        tests_path=tests_path,
+        tests=num_tests,
+        imported_packages=len(imported_packages),
+        lazy_modules_imported=",".join(lazy_modules_imported),
+        **summarize_durations(durations=durations, prefix="collection_"),
+    )
+
+    assert not lazy_modules_imported, (
+        f"Collecting {tests_path} imported {lazy_modules_imported}, import them with `utilities.lazy_import`"
+    )
+
+
+def send_raw_http_request(url: str, request: bytes) -> bytes:
+    """
+    Send raw bytes to an emulator HTTP server, e.g. a malformed request, and read the response until it closes
+    the connection.
+
+    Args:
+        url (str): Emulator URL.
+        request (bytes): Raw request.
+
+    Returns:
+        bytes: Raw response.
+
+    """
+    split_url = urlsplit(url=url)
+    with socket.create_connection(
+        address=(split_url.hostname, split_url.port), timeout=EMULATOR_SOCKET_TIMEOUT
+    ) as sock:
+        sock.sendall(request)
+        response = b""
+        while chunk := sock.recv(65536):
+            response += chunk
+
+    return response
+
+
+def send_kserve_v2_grpc_request(
+    url: str, model_name: str, inputs: list[dict[str, Any]], raw_input_contents: list[bytes] | None = None
+) -> Any:
+    """
+    Send a KServe V2 `ModelInfer` request with the generated gRPC stub.
+
+    Args:
+        url (str): gRPC server `host:port`.
+        model_name (str): Model name.
+        inputs (list[dict[str, Any]]): V2 input tensors (`name`, `datatype`, `shape` and `data`); `data` is sent in
+            the tensor typed contents, unless `raw_input_contents` is set.
+        raw_input_contents (list[bytes] | None): Raw input tensors contents, in the `inputs` order.
+
+    Returns:
+        ModelInferResponse: gRPC inference response.
+
+    Raises:
+        grpc.RpcError: If the request fails.
+
+    """
+    request = grpc_predict_v2_pb2.ModelInferRequest(model_name=model_name, raw_input_contents=raw_input_contents or [])
+    for tensor in inputs:
+        infer_input = request.inputs.add(name=tensor["name"], datatype=tensor["datatype"], shape=tensor["shape"])
+        if not raw_input_contents:
+            contents_field, _ = kserve_v2_emulator.V2_DATATYPES[tensor["datatype"]]
+            getattr(infer_input.contents, contents_field).extend(tensor["data"])
+
+    with grpc.insecure_channel(target=url) as channel:
+        return grpc_predict_v2_pb2_grpc.GRPCInferenceServiceStub(channel=channel).ModelInfer(
+            request=request, timeout=EMULATOR_SOCKET_TIMEOUT
+        )
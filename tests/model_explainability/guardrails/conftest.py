@@ -1,9 +1,10 @@
-from typing import Generator, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generator, Any
 
 import pytest
 import yaml
 from kubernetes.dynamic import DynamicClient
-from llama_stack_client import LlamaStackClient
 from ocp_resources.config_map import ConfigMap
 from ocp_resources.deployment import Deployment
 from ocp_resources.guardrails_orchestrator import GuardrailsOrchestrator
@@ -25,8 +26,14 @@ from utilities.constants import (
     RuntimeTemplates,
 )
 from utilities.inference_utils import create_isvc
+from utilities.lazy_import import lazy_import
 from utilities.serving_runtime import ServingRuntimeFromTemplate
 
+if TYPE_CHECKING:
+    from llama_stack_client import LlamaStackClient
+
+llama_stack_client = lazy_import(name="llama_stack_client")
+
 ORCHESTRATOR_CONFIGMAP_NAME = "fms-orchestr8-config-nlp"
 
 QWEN_ISVC_NAME = "qwen-isvc"
@@ -471,7 +478,7 @@ def lls_client(
     lls_dist_gorch_with_builtin_detectors: LlamaStackDistribution,
     lls_dist_gorch_with_builtin_detectors_route: Route,
 ) -> LlamaStackClient:
-    return LlamaStackClient(base_url=f"http://{lls_dist_gorch_with_builtin_detectors_route.host}")
+    return llama_stack_client.LlamaStackClient(base_url=f"http://{lls_dist_gorch_with_builtin_detectors_route.host}")
 
 
 # Other
@@ -15,7 +15,7 @@ from ocp_resources.service import Service
 from pytest import Config, FixtureRequest
 from pytest_testconfig import py_config
 
-from tests.model_explainability.lm_eval.utils import get_lmevaljob_pod
+from tests.model_explainability.lm_eval.utils import get_lmeval_tasks, get_lmevaljob_pod
 from utilities.constants import Annotations, Labels, MinIo, Protocols, Timeout
 from utilities.exceptions import MissingParameter
 
@@ -32,13 +32,17 @@ def lmevaljob_hf(
     patched_trustyai_operator_configmap_allow_online: ConfigMap,
     lmeval_hf_access_token: Secret,
 ) -> Generator[LMEvalJob, None, None]:
+    task_list = request.param.get("task_list")
+    if min_downloads := request.param.get("tasks-min-downloads"):
+        task_list = {"taskNames": get_lmeval_tasks(min_downloads=min_downloads)}
+
     with LMEvalJob(
         client=admin_client,
         name=LMEVALJOB_NAME,
         namespace=model_namespace.name,
         model="hf",
         model_args=[{"name": "pretrained", "value": "rgeada/tiny-untrained-granite"}],
-        task_list=request.param.get("task_list"),
+        task_list=task_list,
         log_samples=True,
         allow_online=True,
         allow_code_execution=True,
@@ -312,8 +316,7 @@ def lmeval_minio_deployment(
                 "containers": [
                     {
                         "name": MinIo.Metadata.NAME,
-                        "image": "quay.io/minio/minio"
-                        "@sha256:46b3009bf7041eefbd90bd0d2b38c6ddc24d20a35d609551a1802c558c1c958f",
+                        "image": MinIo.PodConfig.MINIO_IMAGE,
                         "args": ["server", "/data", "--console-address", ":9001"],
                         "env": [
                             {"name": "MINIO_ROOT_USER", "value": MinIo.Credentials.ACCESS_KEY_VALUE},
@@ -355,7 +358,7 @@ def lmeval_minio_copy_pod(
         containers=[
             {
                 "name": "minio-uploader",
-                "image": "quay.io/minio/mc@sha256:470f5546b596e16c7816b9c3fa7a78ce4076bb73c2c73f7faeec0c8043923123",
+                "image": MinIo.PodConfig.MINIO_CLIENT_IMAGE,
                 "command": ["/bin/sh", "-c"],
                 "args": [
                     f"mc alias set myminio http://{minio_service.name}:{MinIo.Metadata.DEFAULT_PORT} "
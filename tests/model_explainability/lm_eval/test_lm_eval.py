@@ -1,23 +1,19 @@
 import pytest
-from typing import List
 
 from utilities.constants import Timeout
 
 from tests.model_explainability.utils import validate_tai_component_images
 
-from tests.model_explainability.lm_eval.utils import get_lmeval_tasks
-
 LMEVALJOB_COMPLETE_STATE: str = "Complete"
 
-LMEVAL_TASKS: List[str] = get_lmeval_tasks(min_downloads=10000)
-
 
 @pytest.mark.parametrize(
     "model_namespace, lmevaljob_hf",
     [
         pytest.param(
             {"name": "test-lmeval-hf"},
-            {"task_list": {"taskNames": LMEVAL_TASKS}},
+            # Tasks are read from the LMEval tasks file when the job is created, see `get_lmeval_tasks`
+            {"tasks-min-downloads": 10000},
         ),
         pytest.param(
             {"name": "test-lmeval-hf-custom-task"},
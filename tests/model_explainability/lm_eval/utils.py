@@ -1,3 +1,6 @@
+import csv
+import os
+from functools import cache
 from typing import List
 
 from kubernetes.dynamic import DynamicClient
@@ -7,11 +10,11 @@ from ocp_resources.pod import Pod
 from utilities.constants import Timeout
 from simple_logger.logger import get_logger
 
-import pandas as pd
-
 
 LOGGER = get_logger(name=__name__)
 
+LMEVAL_TASKS_FILE: str = os.path.join(os.path.dirname(__file__), "data", "new_task_list.csv")
+
 
 def get_lmevaljob_pod(client: DynamicClient, lmevaljob: LMEvalJob, timeout: int = Timeout.TIMEOUT_10MIN) -> Pod:
     """
@@ -36,9 +39,11 @@ def get_lmevaljob_pod(client: DynamicClient, lmevaljob: LMEvalJob, timeout: int
     return lmeval_pod
 
 
+@cache
 def get_lmeval_tasks(min_downloads: int = 10000) -> List[str]:
     """
     Gets the list of supported LM-Eval tasks that have above a certain number of minimum downloads on HuggingFace.
+    The tasks file is only read when a test needs the tasks, not when the tests are collected.
 
     Args:
         min_downloads: The minimum number of downloads
@@ -49,21 +54,24 @@ def get_lmeval_tasks(min_downloads: int = 10000) -> List[str]:
     if min_downloads < 1:
         raise ValueError("Minimum downloads must be greater than 0")
 
-    lmeval_tasks = pd.read_csv(filepath_or_buffer="tests/model_explainability/lm_eval/data/new_task_list.csv")
-
-    # filter for tasks that either exceed (min_downloads OR exist on the OpenLLM leaderboard)
-    # AND exist on LMEval AND do not include image data
-
-    filtered_df = lmeval_tasks[
-        lmeval_tasks["Exists"]
-        & (lmeval_tasks["Dataset"] != "MMMU/MMMU")
-        & ((lmeval_tasks["HF dataset downloads"] >= min_downloads) | (lmeval_tasks["OpenLLM leaderboard"]))
-    ]
-
-    # group tasks by dataset and extract the task with shortest name in the group
-    unique_tasks = filtered_df.loc[filtered_df.groupby("Dataset")["Name"].apply(lambda x: x.str.len().idxmin())]
-
-    unique_tasks = unique_tasks["Name"].tolist()
+    # dataset to the task with the shortest name (the first one on ties)
+    dataset_tasks: dict[str, str] = {}
+    with open(LMEVAL_TASKS_FILE, newline="") as fd:
+        for task in csv.DictReader(fd):
+            # filter for tasks that either exceed (min_downloads OR exist on the OpenLLM leaderboard)
+            # AND exist on LMEval AND do not include image data
+            if (
+                task["Exists"] != "true"
+                or task["Dataset"] == "MMMU/MMMU"
+                or (int(task["HF dataset downloads"]) < min_downloads and task["OpenLLM leaderboard"] != "true")
+            ):
+                continue
+
+            shortest_task = dataset_tasks.get(task["Dataset"])
+            if shortest_task is None or len(task["Name"]) < len(shortest_task):
+                dataset_tasks[task["Dataset"]] = task["Name"]
+
+    unique_tasks = [dataset_tasks[dataset] for dataset in sorted(dataset_tasks)]
 
     LOGGER.info(f"Number of unique LMEval tasks with more than {min_downloads} downloads: {len(unique_tasks)}")
 
@@ -0,0 +1,24 @@
+from typing import Any, Generator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from utilities.benchmark_utils import BenchmarkReport
+
+
+@pytest.fixture(scope="session")
+def trustyai_benchmark_observation_steps(pytestconfig: pytest.Config) -> list[int]:
+    return sorted(int(step) for step in pytestconfig.option.trustyai_benchmark_observations.split(","))
+
+
+@pytest.fixture(scope="class")
+def trustyai_metrics_benchmark_report(
+    request: FixtureRequest, benchmark_results_dir: str
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name=f"trustyai-metrics-latency-{request.param['storage']}",
+        results_dir=benchmark_results_dir,
+        metadata={"storage": request.param["storage"]},
+    )
+    yield report
+    report.write()
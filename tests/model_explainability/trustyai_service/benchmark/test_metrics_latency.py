@@ -0,0 +1,87 @@
+import pytest
+
+from tests.model_explainability.trustyai_service.benchmark.utils import run_trustyai_metrics_benchmark
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "model_namespace, trustyai_metrics_benchmark_report",
+    [
+        pytest.param(
+            {"name": "test-trustyai-benchmark-pvc"},
+            {"storage": "pvc"},
+        )
+    ],
+    indirect=True,
+)
+class TestTrustyAIMetricsLatencyWithPVCStorage:
+    """
+    Measures fairness (spd, dir) and drift (meanshift, kstest, approxkstest, fouriermmd) metrics latency
+    in TrustyAI, using PVC storage.
+
+    1. Upload a synthetic TRAINING reference set.
+    2. For each observations step, upload synthetic observations until the step count is stored.
+    3. Send metric requests and record their latency.
+    4. Schedule each metric and record the time until its first value is published in Prometheus.
+    5. Write the results table and JSON report to the benchmark results directory.
+    """
+
+    def test_trustyai_metrics_latency_with_pvc_storage(
+        self,
+        admin_client,
+        current_client_token,
+        trustyai_service_with_pvc_storage,
+        prometheus,
+        trustyai_benchmark_observation_steps,
+        trustyai_metrics_benchmark_report,
+    ):
+        run_trustyai_metrics_benchmark(
+            client=admin_client,
+            token=current_client_token,
+            trustyai_service=trustyai_service_with_pvc_storage,
+            prometheus=prometheus,
+            observation_steps=trustyai_benchmark_observation_steps,
+            report=trustyai_metrics_benchmark_report,
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "model_namespace, trustyai_metrics_benchmark_report",
+    [
+        pytest.param(
+            {"name": "test-trustyai-benchmark-db"},
+            {"storage": "db"},
+        )
+    ],
+    indirect=True,
+)
+class TestTrustyAIMetricsLatencyWithDBStorage:
+    """
+    Measures fairness (spd, dir) and drift (meanshift, kstest, approxkstest, fouriermmd) metrics latency
+    in TrustyAI, using MariaDB storage.
+
+    1. Upload a synthetic TRAINING reference set.
+    2. For each observations step, upload synthetic observations until the step count is stored.
+    3. Send metric requests and record their latency.
+    4. Schedule each metric and record the time until its first value is published in Prometheus.
+    5. Write the results table and JSON report to the benchmark results directory.
+    """
+
+    def test_trustyai_metrics_latency_with_db_storage(
+        self,
+        admin_client,
+        current_client_token,
+        trustyai_service_with_db_storage,
+        prometheus,
+        trustyai_benchmark_observation_steps,
+        trustyai_metrics_benchmark_report,
+    ):
+        run_trustyai_metrics_benchmark(
+            client=admin_client,
+            token=current_client_token,
+            trustyai_service=trustyai_service_with_db_storage,
+            prometheus=prometheus,
+            observation_steps=trustyai_benchmark_observation_steps,
+            report=trustyai_metrics_benchmark_report,
+        )
@@ -0,0 +1,248 @@
+import random
+import time
+from http import HTTPStatus
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.prometheus import Prometheus
+from ocp_resources.trustyai_service import TrustyAIService
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutSampler
+
+from tests.model_explainability.trustyai_service.trustyai_service_utils import (
+    TrustyAIServiceClient,
+    TrustyAIServiceMetrics,
+)
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations, timed_call
+from utilities.constants import Timeout
+
+LOGGER = get_logger(name=__name__)
+
+BENCHMARK_MODEL_NAME: str = "trustyai-benchmark-model"
+BENCHMARK_INPUT_NAME: str = "benchmark_inputs"
+BENCHMARK_OUTPUT_NAME: str = "predict"
+BENCHMARK_PROTECTED_ATTRIBUTE: str = f"{BENCHMARK_INPUT_NAME}-3"
+TRAINING_DATA_TAG: str = "TRAINING"
+TRAINING_OBSERVATIONS: int = 1000
+UPLOAD_BATCH_SIZE: int = 50000
+METRIC_REQUEST_REPETITIONS: int = 5
+BENCHMARK_METRICS: list[str] = [
+    TrustyAIServiceMetrics.Fairness.SPD,
+    TrustyAIServiceMetrics.Fairness.DIR,
+    TrustyAIServiceMetrics.Drift.MEANSHIFT,
+    TrustyAIServiceMetrics.Drift.KSTEST,
+    TrustyAIServiceMetrics.Drift.APPROXKSTEST,
+    TrustyAIServiceMetrics.Drift.FOURIERMMD,
+]
+
+
+def generate_benchmark_upload_payload(num_observations: int, seed: int, data_tag: str | None = None) -> dict[str, Any]:
+    """Generates a synthetic TrustyAIService upload payload.
+
+    Each observation has three gaussian features, one binary protected attribute and a binary outcome,
+    so the same data can be used for both fairness and drift metrics.
+
+    Args:
+        num_observations (int): Number of observations to generate.
+        seed (int): Random seed, to keep the generated data reproducible.
+        data_tag (str | None): Data tag to set on the observations, e.g. TRAINING.
+
+    Returns:
+        dict[str, Any]: Upload payload.
+    """
+    rng = random.Random(x=seed)
+    inputs = [
+        [
+            rng.gauss(mu=50, sigma=5),
+            rng.gauss(mu=500, sigma=50),
+            rng.gauss(mu=13, sigma=2),
+            float(rng.randint(a=0, b=1)),
+        ]
+        for _ in range(num_observations)
+    ]
+    outputs = [float(rng.randint(a=0, b=1)) for _ in range(num_observations)]
+
+    payload: dict[str, Any] = {
+        "model_name": BENCHMARK_MODEL_NAME,
+        "request": {
+            "inputs": [
+                {"name": BENCHMARK_INPUT_NAME, "shape": [num_observations, 4], "datatype": "FP64", "data": inputs}
+            ]
+        },
+        "response": {
+            "model_name": BENCHMARK_MODEL_NAME,
+            "model_version": "1",
+            "outputs": [
+                {"name": BENCHMARK_OUTPUT_NAME, "datatype": "FP32", "shape": [num_observations, 1], "data": outputs}
+            ],
+        },
+    }
+    if data_tag:
+        payload["data_tag"] = data_tag
+
+    return payload
+
+
+def upload_benchmark_observations(
+    tas_client: TrustyAIServiceClient, num_observations: int, seed: int, data_tag: str | None = None
+) -> None:
+    """Uploads synthetic observations to TrustyAIService in batches of `UPLOAD_BATCH_SIZE`.
+
+    Args:
+        tas_client (TrustyAIServiceClient): TrustyAIService client.
+        num_observations (int): Number of observations to upload.
+        seed (int): Random seed of the first batch.
+        data_tag (str | None): Data tag to set on the observations.
+
+    Raises:
+        AssertionError: If an upload request fails.
+    """
+    uploaded_observations = 0
+    while uploaded_observations < num_observations:
+        batch_size = min(UPLOAD_BATCH_SIZE, num_observations - uploaded_observations)
+        response = tas_client.upload_json_data(
+            payload=generate_benchmark_upload_payload(
+                num_observations=batch_size, seed=seed + uploaded_observations, data_tag=data_tag
+            )
+        )
+        assert response.status_code == HTTPStatus.OK, f"Data upload failed: {response.status_code} {response.text}"
+        uploaded_observations += batch_size
+
+
+def get_benchmark_metric_payload(metric_name: str, batch_size: int) -> dict[str, Any]:
+    """Builds a metric request payload for the synthetic benchmark model.
+
+    Args:
+        metric_name (str): Fairness or drift metric name.
+        batch_size (int): Number of most recent observations the metric is calculated over.
+
+    Returns:
+        dict[str, Any]: Metric request payload.
+    """
+    if hasattr(TrustyAIServiceMetrics.Fairness, metric_name.upper()):
+        return {
+            "modelId": BENCHMARK_MODEL_NAME,
+            "protectedAttribute": BENCHMARK_PROTECTED_ATTRIBUTE,
+            "privilegedAttribute": 1.0,
+            "unprivilegedAttribute": 0.0,
+            "outcomeName": BENCHMARK_OUTPUT_NAME,
+            "favorableOutcome": 0,
+            "batchSize": batch_size,
+        }
+
+    return {"modelId": BENCHMARK_MODEL_NAME, "referenceTag": TRAINING_DATA_TAG, "batchSize": batch_size}
+
+
+def measure_scheduled_metric_evaluation(
+    tas_client: TrustyAIServiceClient,
+    prometheus: Prometheus,
+    namespace: str,
+    metric_name: str,
+    payload: dict[str, Any],
+    timeout: int = Timeout.TIMEOUT_5MIN,
+) -> tuple[float, float]:
+    """Schedules a metric and measures how long it takes until its first evaluation is published.
+
+    The scheduled metric is deleted once measured.
+
+    Args:
+        tas_client (TrustyAIServiceClient): TrustyAIService client.
+        prometheus (Prometheus): Prometheus object.
+        namespace (str): TrustyAIService namespace.
+        metric_name (str): Metric name.
+        payload (dict[str, Any]): Metric request payload.
+        timeout (int): Time to wait for the first evaluation to be published.
+
+    Returns:
+        tuple[float, float]: Scheduling request duration and time until the first value is published, in seconds.
+
+    Raises:
+        TimeoutExpiredError: If no value is published before timeout.
+    """
+    start_time = time.perf_counter()
+    response, schedule_duration = timed_call(
+        func=tas_client.request_metric, metric_name=metric_name, json=payload, schedule=True
+    )
+    assert response.status_code == HTTPStatus.OK, f"Metric scheduling failed: {response.status_code} {response.text}"
+    request_id = response.json()["requestId"]
+
+    try:
+        for sample in TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=1,
+            func=prometheus.query,
+            query=f'trustyai_{metric_name}{{namespace="{namespace}", request="{request_id}"}}',
+        ):
+            if sample.get("data", {}).get("result"):
+                return schedule_duration, time.perf_counter() - start_time
+
+    finally:
+        tas_client.delete_metric(metric_name=metric_name, request_id=request_id)
+
+    raise AssertionError(f"Scheduled metric {metric_name} {request_id} was not published")
+
+
+def run_trustyai_metrics_benchmark(
+    client: DynamicClient,
+    token: str,
+    trustyai_service: TrustyAIService,
+    prometheus: Prometheus,
+    observation_steps: list[int],
+    report: BenchmarkReport,
+) -> None:
+    """Measures fairness and drift metrics latency while growing the number of stored observations.
+
+    A TRAINING reference set is uploaded once; then, for each step, observations are added until the step count
+    is reached, and every metric is requested `METRIC_REQUEST_REPETITIONS` times and scheduled once.
+
+    Args:
+        client (DynamicClient): The client instance for interacting with the cluster.
+        token (str): Authentication token for the service.
+        trustyai_service (TrustyAIService): The TrustyAI service instance to benchmark.
+        prometheus (Prometheus): Prometheus object, used to detect scheduled metric evaluations.
+        observation_steps (list[int]): Ascending number of stored observations to measure at.
+        report (BenchmarkReport): Report to add the results to.
+
+    Raises:
+        AssertionError: If a data upload or metric request fails.
+    """
+    tas_client = TrustyAIServiceClient(token=token, service=trustyai_service, client=client)
+    upload_benchmark_observations(
+        tas_client=tas_client, num_observations=TRAINING_OBSERVATIONS, seed=0, data_tag=TRAINING_DATA_TAG
+    )
+
+    stored_observations = 0
+    for observations in observation_steps:
+        LOGGER.info(f"Loading TrustyAIService up to {observations} observations")
+        upload_benchmark_observations(
+            tas_client=tas_client,
+            num_observations=observations - stored_observations,
+            seed=TRAINING_OBSERVATIONS + stored_observations,
+        )
+        stored_observations = observations
+
+        for metric_name in BENCHMARK_METRICS:
+            payload = get_benchmark_metric_payload(metric_name=metric_name, batch_size=observations)
+            request_durations: list[float] = []
+            for _ in range(METRIC_REQUEST_REPETITIONS):
+                response, duration = timed_call(func=tas_client.request_metric, metric_name=metric_name, json=payload)
+                assert response.status_code == HTTPStatus.OK, (
+                    f"Metric {metric_name} request failed: {response.status_code} {response.text}"
+                )
+                request_durations.append(duration)
+
+            schedule_duration, first_evaluation_duration = measure_scheduled_metric_evaluation(
+                tas_client=tas_client,
+                prometheus=prometheus,
+                namespace=trustyai_service.namespace,
+                metric_name=metric_name,
+                payload=payload,
+            )
+            report.add_result(
+                storage=report.metadata["storage"],
+                metric=metric_name,
+                observations=observations,
+                **summarize_durations(durations=request_durations, prefix="request_"),
+                schedule_request=round(schedule_duration, 4),
+                scheduled_first_evaluation=round(first_evaluation_duration, 4),
+            )
@@ -147,6 +147,18 @@ class TrustyAIServiceClient:
         LOGGER.info(f"Uploading data to TrustyAIService: {data_path}")
         return self._send_request(endpoint=self.Endpoints.DATA_UPLOAD, method="POST", data=data)
 
+    def upload_json_data(self, payload: dict[str, Any]) -> requests.Response:
+        """Uploads an in-memory data payload to TrustyAIService.
+
+        Args:
+            payload (dict[str, Any]): Upload payload, in the same format as an upload data file.
+
+        Returns:
+            requests.Response: Response from upload request.
+        """
+        LOGGER.info(f"Uploading {payload['request']['inputs'][0]['shape'][0]} observations to TrustyAIService")
+        return self._send_request(endpoint=self.Endpoints.DATA_UPLOAD, method="POST", json=payload)
+
     def apply_name_mappings(
         self, model_name: str, input_mappings: dict[str, str], output_mappings: dict[str, str]
     ) -> requests.Response:
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import pytest
 from pytest import Config
-from typing import Generator, Any
+from typing import TYPE_CHECKING, Generator, Any
 
 from ocp_resources.infrastructure import Infrastructure
 from ocp_resources.pod import Pod
@@ -18,7 +20,6 @@ from pytest import FixtureRequest
 from simple_logger.logger import get_logger
 from kubernetes.dynamic import DynamicClient
 from pytest_testconfig import config as py_config
-from model_registry.types import RegisteredModel
 import uuid
 
 from tests.model_registry.constants import (
@@ -41,9 +42,15 @@ from tests.model_registry.utils import (
     wait_for_pods_running,
 )
 from utilities.constants import DscComponents
-from model_registry import ModelRegistry as ModelRegistryClient
 from semver import Version
 from utilities.general import wait_for_pods_by_labels
+from utilities.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from model_registry import ModelRegistry as ModelRegistryClient
+    from model_registry.types import RegisteredModel
+
+model_registry = lazy_import(name="model_registry")
 
 LOGGER = get_logger(name=__name__)
 
@@ -393,7 +400,7 @@ def model_registry_client(
         ModelRegistryClient: A client for the model registry instance
     """
     server, port = model_registry_instance_rest_endpoint.split(":")
-    return ModelRegistryClient(
+    return model_registry.ModelRegistry(
         server_address=f"{Protocols.HTTPS}://{server}",
         port=int(port),
         author="opendatahub-test",
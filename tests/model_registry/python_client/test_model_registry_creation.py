@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 import pytest
-from typing import Self, Any
+from typing import TYPE_CHECKING, Self, Any
 from simple_logger.logger import get_logger
 from pytest_testconfig import config as py_config
 
@@ -13,8 +15,10 @@ from tests.model_registry.utils import (
 )
 from utilities.constants import DscComponents
 from tests.model_registry.constants import MODEL_NAME, MODEL_DICT
-from model_registry import ModelRegistry as ModelRegistryClient
-from model_registry.types import RegisteredModel
+
+if TYPE_CHECKING:
+    from model_registry import ModelRegistry as ModelRegistryClient
+    from model_registry.types import RegisteredModel
 
 
 LOGGER = get_logger(name=__name__)
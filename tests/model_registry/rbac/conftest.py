@@ -17,10 +17,23 @@ from ocp_resources.resource import ResourceEditor
 from kubernetes.dynamic import DynamicClient
 from pyhelper_utils.shell import run_command
 
-from tests.model_registry.rbac.utils import wait_for_oauth_openshift_deployment, create_role_binding
+import requests
+from ocp_resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
+
+from tests.model_registry.rbac.matrix_utils import RBAC_MATRIX_CONCURRENCY, get_user_tokens
+from tests.model_registry.rbac.utils import (
+    add_htpasswd_identity_provider,
+    create_role_binding,
+    wait_for_oauth_openshift_deployment,
+)
+from tests.model_registry.rest_api.constants import MODEL_REGISTRY_BASE_URI, STATE_ARCHIVED
+from tests.model_registry.rest_api.utils import create_model_registry_session, execute_model_registry_patch_command
+from tests.model_registry.utils import get_endpoint_from_mr_service, get_mr_service_by_label
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.constants import Protocols
 from utilities.general import generate_random_name
 from tests.model_registry.utils import generate_namespace_name
-from utilities.infra import login_with_user_password
+from utilities.infra import get_user_token
 from utilities.user_utils import UserTestSession, create_htpasswd_file, wait_for_user_creation
 from tests.model_registry.rbac.group_utils import create_group
 from tests.model_registry.constants import MR_INSTANCE_NAME
@@ -173,17 +186,8 @@ def user_credentials_rbac() -> dict[str, str]:
     }
 
 
-@pytest.fixture(scope="session")
-def original_user() -> str:
-    current_user = run_command(command=["oc", "whoami"])[1].strip()
-    LOGGER.info(f"Original user: {current_user}")
-    return current_user
-
-
 @pytest.fixture(scope="module")
-def created_htpasswd_secret(
-    original_user: str, user_credentials_rbac: dict[str, str]
-) -> Generator[UserTestSession, None, None]:
+def created_htpasswd_secret(user_credentials_rbac: dict[str, str]) -> Generator[UserTestSession, None, None]:
     """
     Session-scoped fixture that creates a test IDP user and cleans it up after all tests.
     Returns a UserTestSession object that contains all necessary credentials and contexts.
@@ -209,7 +213,7 @@ def created_htpasswd_secret(
 
 @pytest.fixture(scope="module")
 def updated_oauth_config(
-    admin_client: DynamicClient, original_user: str, user_credentials_rbac: dict[str, str]
+    admin_client: DynamicClient, user_credentials_rbac: dict[str, str]
 ) -> Generator[Any, None, None]:
     # Get current providers and add the new one
     oauth = OAuth(name="cluster")
@@ -236,7 +240,6 @@ def updated_oauth_config(
 
 @pytest.fixture(scope="module")
 def test_idp_user(
-    original_user: str,
     user_credentials_rbac: dict[str, str],
     created_htpasswd_secret: Generator[UserTestSession, None, None],
     updated_oauth_config: Generator[Any, None, None],
@@ -248,21 +251,18 @@ def test_idp_user(
     """
     idp_session = None
     try:
-        if wait_for_user_creation(
+        # The login goes through the OAuth server in process, the current kubeconfig context is kept
+        wait_for_user_creation(
             username=user_credentials_rbac["username"],
             password=user_credentials_rbac["password"],
             cluster_url=api_server_url,
-        ):
-            # undo the login as test user if we were successful in logging in as test user
-            LOGGER.info(f"Undoing login as test user and logging in as {original_user}")
-            login_with_user_password(api_address=api_server_url, user=original_user)
+        )
 
         idp_session = UserTestSession(
             idp_name=user_credentials_rbac["idp_name"],
             secret_name=user_credentials_rbac["secret_name"],
             username=user_credentials_rbac["username"],
             password=user_credentials_rbac["password"],
-            original_user=original_user,
             api_server_url=api_server_url,
         )
         LOGGER.info(f"Created session test IDP user: {idp_session.username}")
@@ -355,21 +355,9 @@ def mr_access_role_binding(
 
 
 @pytest.fixture()
-def login_as_test_user(
-    api_server_url: str, original_user: str, test_idp_user: UserTestSession
-) -> Generator[None, None, None]:
-    LOGGER.info(f"Logging in as {test_idp_user.username}")
-    login_with_user_password(
-        api_address=api_server_url,
-        user=test_idp_user.username,
-        password=test_idp_user.password,
-    )
-    yield
-    LOGGER.info(f"Logging in as {original_user}")
-    login_with_user_password(
-        api_address=api_server_url,
-        user=original_user,
-    )
+def test_user_token(api_server_url: str, test_idp_user: UserTestSession) -> str:
+    # The login goes through the OAuth server in process, the current kubeconfig context is kept
+    return get_user_token(api_address=api_server_url, user=test_idp_user.username, password=test_idp_user.password)
 
 
 @pytest.fixture(scope="function")
@@ -405,3 +393,102 @@ def created_role_binding_user(
         subjects_kind="User",
         subjects_name=test_idp_user.username,
     )
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_users(request: pytest.FixtureRequest) -> dict[str, str]:
+    random_str = generate_random_name()
+    return {
+        f"test-matrix-user-{index}-{random_str}": f"test-password-{index}-{random_str}"
+        for index in range(request.param["num-users"])
+    }
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_identity_provider(
+    admin_client: DynamicClient, rbac_matrix_users: dict[str, str]
+) -> Generator[str, None, None]:
+    random_str = generate_random_name()
+    idp_name = f"test-matrix-htpasswd-idp-{random_str}"
+    with add_htpasswd_identity_provider(
+        admin_client=admin_client,
+        idp_name=idp_name,
+        secret_name=f"test-matrix-htpasswd-secret-{random_str}",
+        users=rbac_matrix_users,
+    ):
+        yield idp_name
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_user_tokens(
+    api_server_url: str, rbac_matrix_users: dict[str, str], rbac_matrix_identity_provider: str
+) -> dict[str, str]:
+    """
+    Logs in each matrix user once and caches their tokens, without changing the current kubeconfig context.
+    """
+    return get_user_tokens(api_server_url=api_server_url, users=rbac_matrix_users)
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_group(admin_client: DynamicClient, rbac_matrix_users: dict[str, str]) -> Generator[Group, None, None]:
+    """
+    Creates a group with the first half of the matrix users.
+    """
+    users = list(rbac_matrix_users)
+    with create_group(
+        admin_client=admin_client,
+        group_name=f"test-mr-matrix-group-{generate_random_name()}",
+        users=users[: len(users) // 2],
+    ) as group_name:
+        yield Group(client=admin_client, name=group_name)
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_registries(
+    admin_client: DynamicClient,
+    model_registry_namespace: str,
+    model_registry_instance_1: ModelRegistry,
+    model_registry_instance_2: ModelRegistry,
+) -> dict[str, str]:
+    return {
+        mr_instance.name: f"{Protocols.HTTPS}://"
+        + get_endpoint_from_mr_service(
+            svc=get_mr_service_by_label(
+                client=admin_client, namespace_name=model_registry_namespace, mr_instance=mr_instance
+            ),
+            protocol=Protocols.REST,
+        )
+        for mr_instance in (model_registry_instance_1, model_registry_instance_2)
+    }
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_session() -> Generator[requests.Session, None, None]:
+    session = create_model_registry_session(pool_size=RBAC_MATRIX_CONCURRENCY)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="class")
+def rbac_matrix_registered_models(
+    model_registry_rest_headers: dict[str, str],
+) -> Generator[list[tuple[str, str]], None, None]:
+    """
+    Collects the (REST URL, id) of the models registered by the matrix `create` cases, and archives them,
+    the Model Registry REST API has no delete operation.
+    """
+    registered_models: list[tuple[str, str]] = []
+    yield registered_models
+    for rest_url, model_id in registered_models:
+        execute_model_registry_patch_command(
+            url=f"{rest_url}{MODEL_REGISTRY_BASE_URI}registered_models/{model_id}",
+            headers=model_registry_rest_headers,
+            data_json=STATE_ARCHIVED,
+        )
+
+
+@pytest.fixture(scope="session")
+def mr_rbac_propagation_benchmark_report(benchmark_results_dir: str) -> Generator[BenchmarkReport, None, None]:
+    report = BenchmarkReport(name="model-registry-rbac-propagation", results_dir=benchmark_results_dir)
+    yield report
+    report.write()
@@ -0,0 +1,314 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler, retry
+
+from tests.model_registry.rest_api.constants import MODEL_REGISTER, MODEL_REGISTRY_BASE_URI
+from tests.model_registry.rest_api.utils import MODEL_REGISTRY_REST_TIMEOUT
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.constants import Timeout
+from utilities.exceptions import ClusterLoginError
+from utilities.general import generate_random_name
+from utilities.infra import get_user_token
+
+LOGGER = get_logger(name=__name__)
+
+RBAC_MATRIX_CONCURRENCY: int = 16
+# Model Registry REST operations evaluated for each user and registry
+MR_RBAC_VERBS: dict[str, str] = {"get": "GET", "create": "POST"}
+FORBIDDEN_STATUS_CODES: tuple[int, ...] = (401, 403)
+
+
+@retry(
+    wait_timeout=Timeout.TIMEOUT_4MIN,
+    sleep=10,
+    exceptions_dict={ClusterLoginError: []},
+)
+def wait_for_user_token(api_server_url: str, user: str, password: str) -> str:
+    """
+    Get a user token, retrying until the user's identity provider accepts the login.
+
+    Args:
+        api_server_url (str): The API address of the OpenShift cluster.
+        user (str): Username.
+        password (str): Password.
+
+    Returns:
+        str: The user token.
+
+    """
+    return get_user_token(api_address=api_server_url, user=user, password=password)
+
+
+def get_user_tokens(
+    api_server_url: str, users: dict[str, str], concurrency: int = RBAC_MATRIX_CONCURRENCY
+) -> dict[str, str]:
+    """
+    Log in each user once, concurrently, without changing the current kubeconfig context.
+
+    Args:
+        api_server_url (str): The API address of the OpenShift cluster.
+        users (dict[str, str]): Usernames to their passwords.
+        concurrency (int): Number of concurrent logins.
+
+    Returns:
+        dict[str, str]: Usernames to their tokens.
+
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            user: executor.submit(wait_for_user_token, api_server_url=api_server_url, user=user, password=password)
+            for user, password in users.items()
+        }
+        return {user: future.result() for user, future in futures.items()}
+
+
+def is_mr_access_allowed(
+    session: requests.Session,
+    rest_url: str,
+    token: str,
+    verb: str,
+    registered_models: list[tuple[str, str]],
+) -> bool:
+    """
+    Check whether a Model Registry REST operation is allowed for a token.
+
+    Args:
+        session (requests.Session): Session to send the request with.
+        rest_url (str): Model Registry REST URL.
+        token (str): User token.
+        verb (str): `MR_RBAC_VERBS` operation, `get` lists registered models and `create` registers a model.
+        registered_models (list[tuple[str, str]]): (REST URL, id) of the models registered by `create`
+            are appended to it, to be archived after the test.
+
+    Returns:
+        bool: True if the operation succeeds, False if it is forbidden.
+
+    Raises:
+        AssertionError: If the response is neither a success nor a forbidden response.
+
+    """
+    method = MR_RBAC_VERBS[verb]
+    resp = session.request(
+        method=method,
+        url=f"{rest_url}{MODEL_REGISTRY_BASE_URI}registered_models",
+        headers={"Authorization": f"Bearer {token}", "accept": "application/json", "Content-Type": "application/json"},
+        json={**MODEL_REGISTER, "name": generate_random_name(prefix="rbac-matrix")} if method == "POST" else None,
+        timeout=MODEL_REGISTRY_REST_TIMEOUT,
+    )
+    if resp.status_code in FORBIDDEN_STATUS_CODES:
+        return False
+
+    if resp.status_code in [200, 201]:
+        if method == "POST":
+            registered_models.append((rest_url, resp.json()["id"]))
+
+        return True
+
+    raise AssertionError(f"Unexpected {method} {rest_url} response: {resp.status_code}: {resp.text}")
+
+
+def build_mr_rbac_matrix(
+    users: list[str], registries: dict[str, str], grants: dict[tuple[str, str], str]
+) -> list[dict[str, Any]]:
+    """
+    Build the (user x registry x verb) permission cases.
+
+    Args:
+        users (list[str]): Usernames.
+        registries (dict[str, str]): Model Registry names to their REST URLs.
+        grants (dict[tuple[str, str], str]): (username, registry name) to how access is granted, e.g. `group <name>`;
+            users are expected to be forbidden on registries without a grant.
+
+    Returns:
+        list[dict[str, Any]]: `user`, `registry`, `rest_url`, `verb`, `granted_by` and `expected` (allowed)
+            of each case.
+
+    """
+    return [
+        {
+            "user": user,
+            "registry": registry,
+            "rest_url": rest_url,
+            "verb": verb,
+            "granted_by": grants.get((user, registry)),
+            "expected": (user, registry) in grants,
+        }
+        for user in users
+        for registry, rest_url in registries.items()
+        for verb in MR_RBAC_VERBS
+    ]
+
+
+def evaluate_mr_rbac_case(
+    session: requests.Session, case: dict[str, Any], token: str, registered_models: list[tuple[str, str]]
+) -> dict[str, Any]:
+    start_time = time.perf_counter()
+    allowed = is_mr_access_allowed(
+        session=session,
+        rest_url=case["rest_url"],
+        token=token,
+        verb=case["verb"],
+        registered_models=registered_models,
+    )
+    return {**case, "allowed": allowed, "seconds": round(time.perf_counter() - start_time, 3)}
+
+
+def evaluate_mr_rbac_matrix(
+    session: requests.Session,
+    cases: list[dict[str, Any]],
+    tokens: dict[str, str],
+    registered_models: list[tuple[str, str]],
+    concurrency: int = RBAC_MATRIX_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Evaluate the permission cases concurrently, with the cached user tokens.
+
+    Args:
+        session (requests.Session): Session to send the requests with, pooling at least `concurrency` connections.
+        cases (list[dict[str, Any]]): `build_mr_rbac_matrix` cases.
+        tokens (dict[str, str]): Usernames to their tokens.
+        registered_models (list[tuple[str, str]]): (REST URL, id) of the models registered by allowed `create` cases.
+        concurrency (int): Number of cases evaluated at a time.
+
+    Returns:
+        list[dict[str, Any]]: The cases with whether the operation was `allowed` and its duration in `seconds`.
+
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                evaluate_mr_rbac_case,
+                session=session,
+                case=case,
+                token=tokens[case["user"]],
+                registered_models=registered_models,
+            )
+            for case in cases
+        ]
+        return [future.result() for future in futures]
+
+
+def assert_mr_rbac_matrix(results: list[dict[str, Any]]) -> None:
+    """
+    Assert that every evaluated case is allowed or forbidden as expected.
+
+    Args:
+        results (list[dict[str, Any]]): `evaluate_mr_rbac_matrix` results.
+
+    Raises:
+        AssertionError: If a case is not allowed (or forbidden) as expected.
+
+    """
+    mismatches = [
+        {key: result[key] for key in ("user", "registry", "verb", "granted_by", "expected", "allowed")}
+        for result in results
+        if result["allowed"] != result["expected"]
+    ]
+    assert not mismatches, f"Unexpected Model Registry permissions: {mismatches}"
+    LOGGER.info(f"Validated {len(results)} Model Registry permission cases")
+
+
+def wait_for_mr_rbac_case(
+    session: requests.Session,
+    case: dict[str, Any],
+    token: str,
+    start_time: float,
+    registered_models: list[tuple[str, str]],
+    timeout: int = Timeout.TIMEOUT_4MIN,
+) -> dict[str, Any]:
+    """
+    Wait for a permission case to be allowed (or forbidden) as expected.
+
+    Args:
+        session (requests.Session): Session to send the requests with.
+        case (dict[str, Any]): `build_mr_rbac_matrix` case.
+        token (str): User token.
+        start_time (float): `time.perf_counter()` when the role bindings were changed.
+        registered_models (list[tuple[str, str]]): (REST URL, id) of the models registered by allowed `create` cases.
+        timeout (int): Time to wait for the change to propagate.
+
+    Returns:
+        dict[str, Any]: The case with its `propagation_seconds` since `start_time`.
+
+    Raises:
+        TimeoutExpiredError: If the case is not allowed (or forbidden) as expected within the timeout.
+
+    """
+    for allowed in TimeoutSampler(
+        wait_timeout=timeout,
+        sleep=1,
+        func=is_mr_access_allowed,
+        session=session,
+        rest_url=case["rest_url"],
+        token=token,
+        verb=case["verb"],
+        registered_models=registered_models,
+    ):
+        if allowed == case["expected"]:
+            return {**case, "propagation_seconds": round(time.perf_counter() - start_time, 3)}
+
+    raise TimeoutExpiredError(value=f"{case['user']} {case['verb']} access to {case['registry']} did not propagate")
+
+
+def measure_mr_rbac_propagation(
+    session: requests.Session,
+    cases: list[dict[str, Any]],
+    tokens: dict[str, str],
+    start_time: float,
+    registered_models: list[tuple[str, str]],
+    report: BenchmarkReport,
+    change: str,
+    concurrency: int = RBAC_MATRIX_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Measure how long role binding changes take to be enforced, waiting for all the cases concurrently.
+
+    A result is added to the report for each case, and the propagation time summary to its metadata,
+    as `<change>_propagation_seconds`.
+
+    Args:
+        session (requests.Session): Session to send the requests with, pooling at least `concurrency` connections.
+        cases (list[dict[str, Any]]): `build_mr_rbac_matrix` cases affected by the role binding changes.
+        tokens (dict[str, str]): Usernames to their tokens.
+        start_time (float): `time.perf_counter()` when the role bindings were changed.
+        registered_models (list[tuple[str, str]]): (REST URL, id) of the models registered by allowed `create` cases.
+        report (BenchmarkReport): Report to record the propagation times in.
+        change (str): Role binding change, e.g. `grant` or `revoke`.
+        concurrency (int): Number of cases waited for at a time.
+
+    Returns:
+        list[dict[str, Any]]: The cases with their `propagation_seconds`.
+
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                wait_for_mr_rbac_case,
+                session=session,
+                case=case,
+                token=tokens[case["user"]],
+                start_time=start_time,
+                registered_models=registered_models,
+            )
+            for case in cases
+        ]
+        results = [future.result() for future in futures]
+
+    for result in results:
+        report.add_result(
+            change=change,
+            user=result["user"],
+            registry=result["registry"],
+            verb=result["verb"],
+            expected=result["expected"],
+            propagation_seconds=result["propagation_seconds"],
+        )
+
+    report.metadata[f"{change}_propagation_seconds"] = summarize_durations(
+        durations=[result["propagation_seconds"] for result in results]
+    )
+    return results
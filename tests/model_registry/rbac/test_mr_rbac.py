@@ -10,10 +10,9 @@ This suite tests various RBAC scenarios including:
 
 import pytest
 from pytest_testconfig import config as py_config
-from typing import Self, Generator
+from typing import Self
 from simple_logger.logger import get_logger
 
-from model_registry import ModelRegistry as ModelRegistryClient
 from timeout_sampler import TimeoutSampler
 
 from ocp_resources.group import Group
@@ -23,15 +22,17 @@ from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
 from ocp_resources.service import Service
 from ocp_resources.deployment import Deployment
 from tests.model_registry.rbac.utils import build_mr_client_args, assert_positive_mr_registry, assert_forbidden_access
-from utilities.infra import get_openshift_token
 from utilities.constants import DscComponents
-from mr_openapi.exceptions import ForbiddenException
 from utilities.user_utils import UserTestSession
 from kubernetes.dynamic import DynamicClient
+from utilities.lazy_import import lazy_import
 from ocp_resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
 
+model_registry = lazy_import(name="model_registry")
+mr_openapi_exceptions = lazy_import(name="mr_openapi.exceptions")
+
 LOGGER = get_logger(name=__name__)
-pytestmark = [pytest.mark.usefixtures("original_user", "test_idp_user")]
+pytestmark = [pytest.mark.usefixtures("test_idp_user")]
 
 
 @pytest.mark.parametrize(
@@ -60,16 +61,14 @@ class TestUserPermission:
         self: Self,
         test_idp_user,
         model_registry_instance_rest_endpoint: str,
-        login_as_test_user: None,
+        test_user_token: str,
     ):
         """
         This test verifies that non-admin users cannot access the Model Registry (403 Forbidden)
         """
-        client_args = build_mr_client_args(
-            rest_endpoint=model_registry_instance_rest_endpoint, token=get_openshift_token()
-        )
-        with pytest.raises(ForbiddenException) as exc_info:
-            ModelRegistryClient(**client_args)
+        client_args = build_mr_client_args(rest_endpoint=model_registry_instance_rest_endpoint, token=test_user_token)
+        with pytest.raises(mr_openapi_exceptions.ForbiddenException) as exc_info:
+            model_registry.ModelRegistry(**client_args)
         assert exc_info.value.status == 403, f"Expected HTTP 403 Forbidden, but got {exc_info.value.status}"
         LOGGER.info("Successfully received expected HTTP 403 status code")
 
@@ -79,7 +78,7 @@ class TestUserPermission:
         model_registry_instance_rest_endpoint: str,
         test_idp_user: UserTestSession,
         model_registry_group_with_user: Group,
-        login_as_test_user: Generator[UserTestSession, None, None],
+        test_user_token: str,
     ):
         """
         This test verifies that:
@@ -91,7 +90,7 @@ class TestUserPermission:
             sleep=5,
             func=assert_positive_mr_registry,
             model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint,
-            token=get_openshift_token(),
+            token=test_user_token,
         )
         for _ in sampler:
             break  # Break after first successful iteration
@@ -103,7 +102,7 @@ class TestUserPermission:
         test_idp_user: UserTestSession,
         model_registry_instance_rest_endpoint: str,
         created_role_binding_group: RoleBinding,
-        login_as_test_user: None,
+        test_user_token: str,
     ):
         """
         Test creating a new group and granting it Model Registry access.
@@ -115,6 +114,7 @@ class TestUserPermission:
         """
         assert_positive_mr_registry(
             model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint,
+            token=test_user_token,
         )
 
     @pytest.mark.sanity
@@ -123,7 +123,7 @@ class TestUserPermission:
         test_idp_user: UserTestSession,
         model_registry_instance_rest_endpoint: str,
         created_role_binding_user: RoleBinding,
-        login_as_test_user: None,
+        test_user_token: str,
     ):
         """
         Test granting Model Registry access to a single user.
@@ -134,6 +134,7 @@ class TestUserPermission:
         """
         assert_positive_mr_registry(
             model_registry_instance_rest_endpoint=model_registry_instance_rest_endpoint,
+            token=test_user_token,
         )
 
 
@@ -172,7 +173,7 @@ class TestUserMultiProjectPermission:
         db_service_2: Service,
         db_deployment_2: Deployment,
         model_registry_instance_2: ModelRegistry,
-        login_as_test_user: None,
+        test_user_token: str,
     ):
         """
         Verify that a user can be granted access to one MR instance at a time.
@@ -208,12 +209,12 @@ class TestUserMultiProjectPermission:
             sleep=5,
             func=assert_positive_mr_registry,
             model_registry_instance_rest_endpoint=endpoint1,
-            token=get_openshift_token(),
+            token=test_user_token,
         )
         for _ in sampler:
             break
-        with pytest.raises(ForbiddenException):
-            ModelRegistryClient(**build_mr_client_args(rest_endpoint=endpoint2, token=get_openshift_token()))
+        with pytest.raises(mr_openapi_exceptions.ForbiddenException):
+            model_registry.ModelRegistry(**build_mr_client_args(rest_endpoint=endpoint2, token=test_user_token))
 
         LOGGER.info(f"User has access to {model_registry_instance_1.name}, but not {model_registry_instance_2.name}")
 
@@ -236,7 +237,7 @@ class TestUserMultiProjectPermission:
             sleep=5,
             func=assert_positive_mr_registry,
             model_registry_instance_rest_endpoint=endpoint2,
-            token=get_openshift_token(),
+            token=test_user_token,
         )
         for _ in sampler:
             break
@@ -246,7 +247,7 @@ class TestUserMultiProjectPermission:
             sleep=5,
             func=assert_forbidden_access,
             endpoint=endpoint1,
-            token=get_openshift_token(),
+            token=test_user_token,
         )
         for _ in sampler:
             break
@@ -0,0 +1,156 @@
+import time
+from contextlib import ExitStack
+from typing import Self
+
+import pytest
+import requests
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.group import Group
+from pytest_testconfig import config as py_config
+from simple_logger.logger import get_logger
+
+from tests.model_registry.rbac.matrix_utils import (
+    assert_mr_rbac_matrix,
+    build_mr_rbac_matrix,
+    evaluate_mr_rbac_matrix,
+    measure_mr_rbac_propagation,
+)
+from tests.model_registry.rbac.utils import granted_mr_access
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.constants import DscComponents
+
+LOGGER = get_logger(name=__name__)
+
+pytestmark = [pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize(
+    "updated_dsc_component_state_scope_class, rbac_matrix_users",
+    [
+        pytest.param(
+            {
+                "component_patch": {
+                    DscComponents.MODELREGISTRY: {
+                        "managementState": DscComponents.ManagementState.MANAGED,
+                        "registriesNamespace": py_config["model_registry_namespace"],
+                    },
+                }
+            },
+            {"num-users": 4},
+        ),
+    ],
+    indirect=True,
+)
+@pytest.mark.usefixtures(
+    "updated_dsc_component_state_scope_class",
+    "db_secret_1",
+    "db_pvc_1",
+    "db_service_1",
+    "db_deployment_1",
+    "db_secret_2",
+    "db_pvc_2",
+    "db_service_2",
+    "db_deployment_2",
+)
+class TestUserPermissionMatrix:
+    """
+    Verifies Model Registry permissions of several users, groups and registries at once.
+
+    Users are logged in once and their tokens cached; every (user x registry x verb) case is evaluated concurrently.
+    The time role binding changes take to be enforced is written to the `model-registry-rbac-propagation` report.
+    """
+
+    def test_user_permission_matrix(
+        self: Self,
+        admin_client: DynamicClient,
+        model_registry_namespace: str,
+        rbac_matrix_users: dict[str, str],
+        rbac_matrix_user_tokens: dict[str, str],
+        rbac_matrix_group: Group,
+        rbac_matrix_registries: dict[str, str],
+        rbac_matrix_session: requests.Session,
+        rbac_matrix_registered_models: list[tuple[str, str]],
+        mr_rbac_propagation_benchmark_report: BenchmarkReport,
+    ):
+        """
+        1. Verify no matrix user has access to any registry
+        2. Grant the group access to the first registry and the last user access to the second registry,
+           measure the time until the access is enforced and verify the whole matrix
+        3. Revoke the access, measure the time until it is forbidden again and verify the whole matrix
+        """
+        users = list(rbac_matrix_users)
+        registry_1, registry_2 = rbac_matrix_registries
+        assert_mr_rbac_matrix(
+            results=evaluate_mr_rbac_matrix(
+                session=rbac_matrix_session,
+                cases=build_mr_rbac_matrix(users=users, registries=rbac_matrix_registries, grants={}),
+                tokens=rbac_matrix_user_tokens,
+                registered_models=rbac_matrix_registered_models,
+            )
+        )
+
+        grants = {(user, registry_1): f"group {rbac_matrix_group.name}" for user in rbac_matrix_group.instance.users}
+        grants[(users[-1], registry_2)] = "user"
+        granted_cases = [
+            case
+            for case in build_mr_rbac_matrix(users=users, registries=rbac_matrix_registries, grants=grants)
+            if case["expected"]
+        ]
+        # Access is revoked when the stack is closed, also when the test fails
+        with ExitStack() as mr_access_stack:
+            start_time = time.perf_counter()
+            mr_access_stack.enter_context(
+                granted_mr_access(
+                    admin_client=admin_client,
+                    user=rbac_matrix_group.name,
+                    mr_instance_name=registry_1,
+                    model_registry_namespace=model_registry_namespace,
+                    subjects_kind="Group",
+                )
+            )
+            mr_access_stack.enter_context(
+                granted_mr_access(
+                    admin_client=admin_client,
+                    user=users[-1],
+                    mr_instance_name=registry_2,
+                    model_registry_namespace=model_registry_namespace,
+                )
+            )
+            measure_mr_rbac_propagation(
+                session=rbac_matrix_session,
+                cases=granted_cases,
+                tokens=rbac_matrix_user_tokens,
+                start_time=start_time,
+                registered_models=rbac_matrix_registered_models,
+                report=mr_rbac_propagation_benchmark_report,
+                change="grant",
+            )
+            assert_mr_rbac_matrix(
+                results=evaluate_mr_rbac_matrix(
+                    session=rbac_matrix_session,
+                    cases=build_mr_rbac_matrix(users=users, registries=rbac_matrix_registries, grants=grants),
+                    tokens=rbac_matrix_user_tokens,
+                    registered_models=rbac_matrix_registered_models,
+                )
+            )
+
+            start_time = time.perf_counter()
+            mr_access_stack.close()
+
+        measure_mr_rbac_propagation(
+            session=rbac_matrix_session,
+            cases=[{**case, "expected": False} for case in granted_cases],
+            tokens=rbac_matrix_user_tokens,
+            start_time=start_time,
+            registered_models=rbac_matrix_registered_models,
+            report=mr_rbac_propagation_benchmark_report,
+            change="revoke",
+        )
+        assert_mr_rbac_matrix(
+            results=evaluate_mr_rbac_matrix(
+                session=rbac_matrix_session,
+                cases=build_mr_rbac_matrix(users=users, registries=rbac_matrix_registries, grants={}),
+                tokens=rbac_matrix_user_tokens,
+                registered_models=rbac_matrix_registered_models,
+            )
+        )
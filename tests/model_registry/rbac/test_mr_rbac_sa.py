@@ -3,10 +3,12 @@ import pytest
 from pytest_testconfig import config as py_config
 from typing import Self
 from simple_logger.logger import get_logger
-from model_registry import ModelRegistry as ModelRegistryClient
 from tests.model_registry.rbac.utils import build_mr_client_args
 from utilities.constants import DscComponents
-from mr_openapi.exceptions import ForbiddenException
+from utilities.lazy_import import lazy_import
+
+model_registry = lazy_import(name="model_registry")
+mr_openapi_exceptions = lazy_import(name="mr_openapi.exceptions")
 
 LOGGER = get_logger(name=__name__)
 
@@ -59,8 +61,8 @@ class TestModelRegistryRBAC:
         LOGGER.debug(f"Attempting client connection with args: {client_args}")
 
         # Expect an exception related to HTTP 403
-        with pytest.raises(ForbiddenException) as exc_info:
-            _ = ModelRegistryClient(**client_args)
+        with pytest.raises(mr_openapi_exceptions.ForbiddenException) as exc_info:
+            _ = model_registry.ModelRegistry(**client_args)
 
         # Verify the status code from the caught exception
         http_error = exc_info.value
@@ -88,7 +90,7 @@ class TestModelRegistryRBAC:
                 rest_endpoint=model_registry_instance_rest_endpoint, token=sa_token, author="rbac-test-granted"
             )
             LOGGER.debug(f"Attempting client connection with args: {client_args}")
-            mr_client_success = ModelRegistryClient(**client_args)
+            mr_client_success = model_registry.ModelRegistry(**client_args)
             assert mr_client_success is not None, "Client initialization failed after granting permissions"
             LOGGER.info("Client instantiated successfully after granting permissions.")
 
@@ -1,16 +1,23 @@
+from contextlib import contextmanager
 from typing import Any, Dict, Generator, List
 
 from kubernetes.dynamic import DynamicClient
 from timeout_sampler import TimeoutSampler
 
 from ocp_resources.deployment import Deployment
+from ocp_resources.oauth import OAuth
+from ocp_resources.resource import ResourceEditor
+from ocp_resources.secret import Secret
+from ocp_resources.user import User
 from ocp_resources.role import Role
 from ocp_resources.role_binding import RoleBinding
 from utilities.constants import Protocols
 import logging
-from model_registry import ModelRegistry as ModelRegistryClient
-from utilities.infra import get_openshift_token
-from mr_openapi.exceptions import ForbiddenException
+from utilities.user_utils import create_users_htpasswd_file
+from utilities.lazy_import import lazy_import
+
+model_registry = lazy_import(name="model_registry")
+mr_openapi_exceptions = lazy_import(name="mr_openapi.exceptions")
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +48,7 @@ def build_mr_client_args(rest_endpoint: str, token: str, author: str = "rbac-tes
 
 def assert_positive_mr_registry(
     model_registry_instance_rest_endpoint: str,
-    token: str = "",
+    token: str,
 ) -> None:
     """
     Assert that a user has access to the Model Registry.
@@ -53,17 +60,13 @@ def assert_positive_mr_registry(
     Raises:
         AssertionError: If client initialization fails
         Exception: If any other error occurs during the check
-
-    Note:
-        This function should be called within the appropriate context (admin or user)
-        as it uses the current context to get the token.
     """
     client_args = build_mr_client_args(
         rest_endpoint=model_registry_instance_rest_endpoint,
-        token=token or get_openshift_token(),
+        token=token,
         author="rbac-test-user-granted",
     )
-    mr_client = ModelRegistryClient(**client_args)
+    mr_client = model_registry.ModelRegistry(**client_args)
     assert mr_client is not None, "Client initialization failed after granting permissions"
     LOGGER.info("Client instantiated successfully after granting permissions.")
 
@@ -89,6 +92,64 @@ def wait_for_oauth_openshift_deployment() -> None:
         _wait_sampler(_reason=reason)
 
 
+@contextmanager
+def add_htpasswd_identity_provider(
+    admin_client: DynamicClient, idp_name: str, secret_name: str, users: dict[str, str]
+) -> Generator[None, None, None]:
+    """
+    Add an htpasswd identity provider with several users to the cluster OAuth, waiting once for the OAuth server
+    rollout whatever the number of users. The identity provider and the users are removed on exit.
+
+    Args:
+        admin_client: The admin client
+        idp_name: The identity provider name
+        secret_name: The name of the htpasswd secret in openshift-config namespace
+        users: Usernames to their passwords
+    """
+    temp_path, htpasswd_b64 = create_users_htpasswd_file(users=users)
+    try:
+        with Secret(
+            client=admin_client,
+            name=secret_name,
+            namespace="openshift-config",
+            htpasswd=htpasswd_b64,
+            type="Opaque",
+            wait_for_resource=True,
+        ):
+            oauth = OAuth(client=admin_client, name="cluster")
+            identity_providers_patch = ResourceEditor(
+                patches={
+                    oauth: {
+                        "spec": {
+                            "identityProviders": oauth.instance.spec.identityProviders
+                            + [
+                                {
+                                    "name": idp_name,
+                                    "mappingMethod": "claim",
+                                    "type": "HTPasswd",
+                                    "htpasswd": {"fileData": {"name": secret_name}},
+                                }
+                            ]
+                        }
+                    }
+                }
+            )
+            identity_providers_patch.update(backup_resources=True)
+            wait_for_oauth_openshift_deployment()
+            LOGGER.info(f"Added IDP {idp_name} with {len(users)} users to OAuth configuration")
+            try:
+                yield
+            finally:
+                identity_providers_patch.restore()
+                wait_for_oauth_openshift_deployment()
+                for username in users:
+                    user = User(client=admin_client, name=username)
+                    if user.exists:
+                        user.delete()
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
 def create_role_binding(
     admin_client: DynamicClient,
     model_registry_namespace: str,
@@ -110,9 +171,13 @@ def create_role_binding(
 
 
 def grant_mr_access(
-    admin_client: DynamicClient, user: str, mr_instance_name: str, model_registry_namespace: str
+    admin_client: DynamicClient,
+    user: str,
+    mr_instance_name: str,
+    model_registry_namespace: str,
+    subjects_kind: str = "User",
 ) -> tuple[Role, RoleBinding]:
-    """Grant a user access to a Model Registry instance."""
+    """Grant a user (or a group, with `subjects_kind="Group"`) access to a Model Registry instance."""
     role_rules: List[Dict[str, Any]] = [
         {
             "apiGroups": [""],
@@ -139,7 +204,7 @@ def grant_mr_access(
         name=f"{user}-{mr_instance_name}-access",
         role_ref_name=f"{user}-{mr_instance_name}-role",
         role_ref_kind="Role",
-        subjects_kind="User",
+        subjects_kind=subjects_kind,
         subjects_name=user,
         wait_for_resource=True,
     )
@@ -169,12 +234,41 @@ def revoke_mr_access(
     LOGGER.info(f"RoleBinding {rb.name} deleted successfully.")
 
 
+@contextmanager
+def granted_mr_access(
+    admin_client: DynamicClient,
+    user: str,
+    mr_instance_name: str,
+    model_registry_namespace: str,
+    subjects_kind: str = "User",
+) -> Generator[tuple[Role, RoleBinding], None, None]:
+    """
+    Grant a user (or a group, with `subjects_kind="Group"`) access to a Model Registry instance,
+    and revoke it on exit, also when granting or the test fails.
+    """
+    try:
+        yield grant_mr_access(
+            admin_client=admin_client,
+            user=user,
+            mr_instance_name=mr_instance_name,
+            model_registry_namespace=model_registry_namespace,
+            subjects_kind=subjects_kind,
+        )
+    finally:
+        revoke_mr_access(
+            admin_client=admin_client,
+            user=user,
+            mr_instance_name=mr_instance_name,
+            model_registry_namespace=model_registry_namespace,
+        )
+
+
 def assert_forbidden_access(endpoint: str, token: str) -> None:
     """Helper function to assert that access is properly forbidden"""
     try:
-        ModelRegistryClient(**build_mr_client_args(rest_endpoint=endpoint, token=token))
+        model_registry.ModelRegistry(**build_mr_client_args(rest_endpoint=endpoint, token=token))
         # If no exception is raised, the access is still granted - raise an error to continue retrying
         raise AssertionError("Access should be forbidden but client creation succeeded")
-    except ForbiddenException:
+    except mr_openapi_exceptions.ForbiddenException:
         # This is what we want - access is properly forbidden
         pass
@@ -0,0 +1,61 @@
+import pytest
+from pytest_testconfig import py_config
+
+from tests.model_registry.rest_api.benchmark.utils import run_model_registry_scale_benchmark
+from utilities.constants import DscComponents
+from utilities.general import generate_random_name
+
+pytestmark = [pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize(
+    "updated_dsc_component_state_scope_class, is_model_registry_oauth, model_registry_scale_benchmark_database",
+    [
+        pytest.param(
+            {
+                "component_patch": {
+                    DscComponents.MODELREGISTRY: {
+                        "managementState": DscComponents.ManagementState.MANAGED,
+                        "registriesNamespace": py_config["model_registry_namespace"],
+                    },
+                },
+            },
+            {},
+            {"database": database},
+            id=database,
+        )
+        for database in ("mysql", "mariadb")
+    ],
+    indirect=True,
+)
+@pytest.mark.usefixtures(
+    "updated_dsc_component_state_scope_class",
+    "is_model_registry_oauth",
+    "model_registry_scale_benchmark_instance",
+)
+class TestModelRegistryScaleBenchmark:
+    """
+    Measures Model Registry REST API latency, with a MySQL or a MariaDB database, while growing the number of
+    registered models.
+
+    1. For each models step, register models (each with versions and artifacts) concurrently until
+       the step count is reached, and record the create throughput.
+    2. Measure get by id / name, paged list (page sizes and orderBy) and custom property filter latency.
+    3. Write the results and how each operation scales with the number of models to the benchmark results directory.
+    """
+
+    def test_model_registry_scale(
+        self,
+        pytestconfig,
+        model_registry_rest_client,
+        model_registry_scale_benchmark_model_steps,
+        model_registry_scale_benchmark_report,
+    ):
+        run_model_registry_scale_benchmark(
+            client=model_registry_rest_client,
+            model_steps=model_registry_scale_benchmark_model_steps,
+            num_versions=pytestconfig.option.mr_scale_benchmark_versions,
+            num_artifacts=pytestconfig.option.mr_scale_benchmark_artifacts,
+            name_prefix=generate_random_name(prefix="mr-scale", length=4),
+            report=model_registry_scale_benchmark_report,
+        )
@@ -0,0 +1,258 @@
+import random
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from tests.model_registry.rest_api.constants import MODEL_ARTIFACT, MODEL_REGISTER, MODEL_VERSION
+from tests.model_registry.rest_api.utils import ModelRegistryRestClient
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations, timed_call
+
+LOGGER = get_logger(name=__name__)
+
+# Models are spread over custom property groups, filter queries select one group (a tenth of the models)
+SCALE_GROUPS: int = 10
+SCALE_GROUP_PROPERTY: str = "scale_group"
+SCALE_FILTER_QUERY: str = f'{SCALE_GROUP_PROPERTY}.string_value = "group-0"'
+REQUEST_REPETITIONS: int = 20
+LIST_PAGE_SIZES: tuple[int, ...] = (10, 100, 1000)
+LIST_ORDER_BY: tuple[str, ...] = ("ID", "CREATE_TIME", "LAST_UPDATE_TIME")
+
+
+def generate_scale_model_data(name_prefix: str, index: int, num_versions: int, num_artifacts: int) -> dict[str, Any]:
+    """
+    Generate the `ModelRegistryRestClient.register_model` data of a benchmark model.
+
+    Args:
+        name_prefix (str): Prefix of the model name, unique to the benchmark run.
+        index (int): Model index, used in its name and to assign its custom property group.
+        num_versions (int): Number of model versions.
+        num_artifacts (int): Number of artifacts per model version.
+
+    Returns:
+        dict[str, Any]: Registered model data and its model versions with their artifacts.
+
+    """
+    group_property = {
+        SCALE_GROUP_PROPERTY: {"string_value": f"group-{index % SCALE_GROUPS}", "metadataType": "MetadataStringValue"}
+    }
+    return {
+        "register_model_data": {
+            **MODEL_REGISTER,
+            "name": f"{name_prefix}-{index:06d}",
+            "customProperties": {**MODEL_REGISTER["customProperties"], **group_property},
+        },
+        "model_versions": [
+            {
+                **MODEL_VERSION,
+                "name": f"v{version}",
+                "customProperties": {**MODEL_VERSION["customProperties"], **group_property},
+                "model_artifacts_data": [
+                    {**MODEL_ARTIFACT, "name": f"{name_prefix}-{index:06d}-v{version}-{artifact}"}
+                    for artifact in range(num_artifacts)
+                ],
+            }
+            for version in range(num_versions)
+        ],
+    }
+
+
+def measure_requests(client: ModelRegistryRestClient, requests_args: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Send GET requests one at a time and summarize their latency.
+
+    Args:
+        client (ModelRegistryRestClient): Model Registry REST client.
+        requests_args (list[dict[str, Any]]): `path` and `params` of each request.
+
+    Returns:
+        dict[str, Any]: Number of requests, mean number of returned items (for list requests) and latency summary.
+
+    """
+    durations: list[float] = []
+    items: list[int] = []
+    for request_args in requests_args:
+        response, duration = timed_call(func=client.get, **request_args)
+        durations.append(duration)
+        if "items" in response:
+            items.append(len(response["items"]))
+
+    return {
+        "requests": len(durations),
+        "mean_items": round(sum(items) / len(items), 1) if items else None,
+        **summarize_durations(durations=durations, prefix="latency_seconds_"),
+    }
+
+
+def measure_read_operations(
+    client: ModelRegistryRestClient, registered_models: list[dict[str, Any]], rng: random.Random
+) -> list[dict[str, Any]]:
+    """
+    Measure get by id / name, paged list and custom property filter latency of the registered models and versions.
+
+    Args:
+        client (ModelRegistryRestClient): Model Registry REST client.
+        registered_models (list[dict[str, Any]]): `register_model` results of the seeded models.
+        rng (random.Random): Random generator to sample the models to get.
+
+    Returns:
+        list[dict[str, Any]]: Operation, page size, order by and `measure_requests` summary of each measurement.
+
+    """
+    sampled_models = [rng.choice(registered_models) for _ in range(REQUEST_REPETITIONS)]
+    measurements: list[dict[str, Any]] = [
+        {
+            "operation": "get_registered_model_by_id",
+            **measure_requests(
+                client=client,
+                requests_args=[
+                    {"path": f"registered_models/{model['register_model']['id']}"} for model in sampled_models
+                ],
+            ),
+        },
+        {
+            "operation": "get_registered_model_by_name",
+            **measure_requests(
+                client=client,
+                requests_args=[
+                    {"path": "registered_model", "params": {"name": model["register_model"]["name"]}}
+                    for model in sampled_models
+                ],
+            ),
+        },
+        {
+            "operation": "get_model_version_by_id",
+            **measure_requests(
+                client=client,
+                requests_args=[
+                    {"path": f"model_versions/{rng.choice(model['model_versions'])['id']}"} for model in sampled_models
+                ],
+            ),
+        },
+    ]
+    for path in ("registered_models", "model_versions"):
+        for page_size in LIST_PAGE_SIZES:
+            for order_by in LIST_ORDER_BY:
+                measurements.append({
+                    "operation": f"list_{path}",
+                    "page_size": page_size,
+                    "order_by": order_by,
+                    **measure_requests(
+                        client=client,
+                        requests_args=[
+                            {
+                                "path": path,
+                                "params": {"pageSize": page_size, "orderBy": order_by, "sortOrder": "DESC"},
+                            }
+                        ]
+                        * REQUEST_REPETITIONS,
+                    ),
+                })
+
+        measurements.append({
+            "operation": f"filter_{path}_by_custom_property",
+            "page_size": LIST_PAGE_SIZES[1],
+            **measure_requests(
+                client=client,
+                requests_args=[
+                    {"path": path, "params": {"pageSize": LIST_PAGE_SIZES[1], "filterQuery": SCALE_FILTER_QUERY}}
+                ]
+                * REQUEST_REPETITIONS,
+            ),
+        })
+
+    return measurements
+
+
+def run_model_registry_scale_benchmark(
+    client: ModelRegistryRestClient,
+    model_steps: list[int],
+    num_versions: int,
+    num_artifacts: int,
+    name_prefix: str,
+    report: BenchmarkReport,
+) -> None:
+    """
+    Measure Model Registry REST API latency while growing the number of registered models.
+
+    For each step, models (each with `num_versions` versions of `num_artifacts` artifacts) are registered
+    concurrently until the step count is reached, then every read operation is measured.
+
+    Args:
+        client (ModelRegistryRestClient): Model Registry REST client.
+        model_steps (list[int]): Number of registered models to measure at, in ascending order.
+        num_versions (int): Number of model versions per registered model.
+        num_artifacts (int): Number of artifacts per model version.
+        name_prefix (str): Prefix of the models names, unique to the benchmark run.
+        report (BenchmarkReport): Report to add the results to.
+
+    Raises:
+        AssertionError: If a model registration fails.
+
+    """
+    rng = random.Random(x=0)
+    registered_models: list[dict[str, Any]] = []
+    for num_models in model_steps:
+        client.reset_timings()
+        result = client.register_models(
+            data_dicts=[
+                generate_scale_model_data(
+                    name_prefix=name_prefix, index=index, num_versions=num_versions, num_artifacts=num_artifacts
+                )
+                for index in range(len(registered_models), num_models)
+            ]
+        )
+        assert not result["errors"], f"Failed to register models: {result['errors'][:10]}"
+        registered_models.extend(result["models"])
+
+        step_fields = {
+            "models": num_models,
+            "model_versions": num_models * num_versions,
+            "artifacts": num_models * num_versions * num_artifacts,
+        }
+        create_latencies = [timing["seconds"] for timing in client.timings]
+        report.add_result(
+            **step_fields,
+            operation="create",
+            requests=len(create_latencies),
+            models_per_second=result["models_per_second"],
+            requests_per_second=result["requests_per_second"],
+            **summarize_durations(durations=create_latencies, prefix="latency_seconds_"),
+        )
+        for measurement in measure_read_operations(client=client, registered_models=registered_models, rng=rng):
+            report.add_result(**step_fields, **measurement)
+
+
+def summarize_scaling(report: BenchmarkReport) -> list[dict[str, Any]]:
+    """
+    Summarize how the latency of each operation scales with the number of registered models.
+
+    Args:
+        report (BenchmarkReport): Model Registry scale benchmark report.
+
+    Returns:
+        list[dict[str, Any]]: Operation, page size and order by, p50 latency at each step and its growth factor
+            between the first and last steps, sorted from the fastest growing.
+
+    """
+    scaling: list[dict[str, Any]] = []
+    for operation_key in dict.fromkeys(
+        (result["operation"], result.get("page_size"), result.get("order_by")) for result in report.results
+    ):
+        operation_results = [
+            result
+            for result in report.results
+            if (result["operation"], result.get("page_size"), result.get("order_by")) == operation_key
+        ]
+        first_p50 = operation_results[0]["latency_seconds_p50"]
+        last_p50 = operation_results[-1]["latency_seconds_p50"]
+        scaling.append({
+            "operation": operation_key[0],
+            "page_size": operation_key[1],
+            "order_by": operation_key[2],
+            "latency_seconds_p50_by_models": {
+                result["models"]: result["latency_seconds_p50"] for result in operation_results
+            },
+            "p50_growth": round(last_p50 / first_p50, 2) if first_p50 else None,
+        })
+
+    return sorted(scaling, key=lambda operation: -(operation["p50_growth"] or 0))
@@ -5,10 +5,13 @@ import pytest
 import copy
 
 from tests.model_registry.rest_api.constants import MODEL_REGISTRY_BASE_URI, MODEL_REGISTER_DATA
+from tests.model_registry.rest_api.benchmark.utils import summarize_scaling
 from tests.model_registry.rest_api.utils import (
+    ModelRegistryRestClient,
     register_model_rest_api,
     execute_model_registry_patch_command,
 )
+from utilities.benchmark_utils import BenchmarkReport
 from utilities.general import generate_random_name
 from ocp_resources.deployment import Deployment
 from tests.model_registry.utils import (
@@ -25,6 +28,7 @@ from tests.model_registry.constants import (
     CA_CONFIGMAP_NAME,
     OAUTH_PROXY_CONFIG_DICT,
     MODEL_REGISTRY_STANDARD_LABELS,
+    MR_INSTANCE_NAME,
     SECURE_MR_NAME,
 )
 from ocp_resources.resource import ResourceEditor
@@ -37,9 +41,21 @@ from utilities.exceptions import MissingParameter
 import tempfile
 from tests.model_registry.rest_api.utils import generate_ca_and_server_cert
 from utilities.certificates_utils import create_k8s_secret, create_ca_bundle_with_router_cert
+from ocp_resources.maria_db import MariaDB
+from ocp_resources.mariadb_operator import MariadbOperator
+from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
+from tests.model_registry.rest_api.mariadb.utils import get_mariadb_dict
+from utilities.constants import OPENSHIFT_OPERATORS, MARIADB
+from utilities.mariadb_utils import wait_for_mariadb_pods
 
 LOGGER = get_logger(name=__name__)
 
+# Scale benchmark database to the fixtures deploying it and a Model Registry instance using it, in setup order
+MR_SCALE_BENCHMARK_FIXTURES: dict[str, tuple[str, str]] = {
+    "mysql": ("model_registry_mysql_metadata_db", "model_registry_instance_mysql"),
+    "mariadb": ("deployed_mariadb", "model_registry_with_mariadb"),
+}
+
 
 @pytest.fixture(scope="class")
 def registered_model_rest_api(
@@ -347,3 +363,136 @@ def model_data_for_test() -> Generator[dict[str, Any], None, None]:
     model_data = copy.deepcopy(MODEL_REGISTER_DATA)
     model_data["register_model_data"]["name"] = model_name
     yield model_data
+
+
+@pytest.fixture(scope="class")
+def model_registry_rest_client(
+    pytestconfig: pytest.Config,
+    model_registry_rest_url: str,
+    model_registry_rest_headers: dict[str, str],
+) -> Generator[ModelRegistryRestClient, Any, Any]:
+    client = ModelRegistryRestClient(
+        base_url=model_registry_rest_url,
+        headers=model_registry_rest_headers,
+        concurrency=pytestconfig.option.mr_scale_benchmark_concurrency,
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def model_registry_scale_benchmark_model_steps(pytestconfig: pytest.Config) -> list[int]:
+    return sorted(int(step) for step in pytestconfig.option.mr_scale_benchmark_models.split(","))
+
+
+@pytest.fixture(scope="class")
+def model_registry_scale_benchmark_database(request: pytest.FixtureRequest) -> str:
+    return request.param["database"]
+
+
+@pytest.fixture(scope="class")
+def model_registry_scale_benchmark_instance(
+    request: pytest.FixtureRequest, model_registry_scale_benchmark_database: str
+) -> ModelRegistry:
+    # Only the parametrized database and its Model Registry instance are deployed
+    database_fixture, instance_fixture = MR_SCALE_BENCHMARK_FIXTURES[model_registry_scale_benchmark_database]
+    request.getfixturevalue(argname=database_fixture)
+    return request.getfixturevalue(argname=instance_fixture)
+
+
+@pytest.fixture(scope="class")
+def model_registry_scale_benchmark_report(
+    pytestconfig: pytest.Config, benchmark_results_dir: str, model_registry_scale_benchmark_database: str
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name=f"model-registry-scale-{model_registry_scale_benchmark_database}",
+        results_dir=benchmark_results_dir,
+        metadata={
+            "database": model_registry_scale_benchmark_database,
+            "versions_per_model": pytestconfig.option.mr_scale_benchmark_versions,
+            "artifacts_per_version": pytestconfig.option.mr_scale_benchmark_artifacts,
+            "concurrency": pytestconfig.option.mr_scale_benchmark_concurrency,
+        },
+    )
+    yield report
+    report.metadata["scaling"] = summarize_scaling(report=report)
+    report.write()
+
+
+@pytest.fixture(scope="class")
+def deployed_mariadb(
+    admin_client: DynamicClient,
+    mariadb_operator_cr: MariadbOperator,
+) -> Generator[MariaDB, Any, Any]:
+    mariadb_str = generate_random_name(prefix=MARIADB, length=4)
+    mariadb_dict = get_mariadb_dict(base_name=mariadb_str)
+    with MariaDB(name=f"{mariadb_str}", namespace=OPENSHIFT_OPERATORS, **mariadb_dict) as mariadb:
+        wait_for_mariadb_pods(client=admin_client, mariadb=mariadb)
+        yield mariadb
+    for secret_name in [
+        f"{mariadb_str}-root",
+        f"{mariadb_str}-password",
+        "mariadb-operator-webhook-ca",
+        "mariadb-operator-webhook-cert",
+    ]:
+        secret = Secret(name=secret_name, namespace=OPENSHIFT_OPERATORS)
+        if secret.exists:
+            secret.clean_up()
+        for pvc in PersistentVolumeClaim.get(dyn_client=admin_client):
+            if mariadb_str in pvc.name:
+                LOGGER.warning(f"Deleting pvc: {pvc.name}")
+                pvc.clean_up()
+
+
+@pytest.fixture(scope="class")
+def mariadb_secret(deployed_mariadb: MariaDB, model_registry_namespace: str) -> Generator[Secret, Any, Any]:
+    mariadb_spec = deployed_mariadb.instance.spec
+    secret_name = mariadb_spec.passwordSecretKeyRef.name
+    secret_data = Secret(name=secret_name, namespace=OPENSHIFT_OPERATORS, ensure_exists=True).instance.data[
+        mariadb_spec.passwordSecretKeyRef.key
+    ]
+    with Secret(
+        name=secret_name,
+        namespace=model_registry_namespace,
+        data_dict={mariadb_spec.passwordSecretKeyRef.key: secret_data},
+    ) as mr_secret:
+        yield mr_secret
+
+
+@pytest.fixture(scope="class")
+def model_registry_with_mariadb(
+    admin_client: DynamicClient,
+    model_registry_namespace: str,
+    mariadb_mysql_config: dict[str, Any],
+    is_model_registry_oauth: bool,
+) -> Generator[ModelRegistry, Any, Any]:
+    with ModelRegistry(
+        name=MR_INSTANCE_NAME,
+        namespace=model_registry_namespace,
+        label=MODEL_REGISTRY_STANDARD_LABELS,
+        grpc={},
+        rest={},
+        oauth_proxy=OAUTH_PROXY_CONFIG_DICT,
+        mysql=mariadb_mysql_config,
+        wait_for_resource=True,
+        teardown=True,
+    ) as mr:
+        mr.wait_for_condition(condition="Available", status="True")
+        mr.wait_for_condition(condition="OAuthProxyAvailable", status="True")
+        wait_for_pods_running(
+            admin_client=admin_client, namespace_name=model_registry_namespace, number_of_consecutive_checks=3
+        )
+        yield mr
+
+
+@pytest.fixture(scope="class")
+def mariadb_mysql_config(deployed_mariadb: MariaDB, mariadb_secret: Secret) -> dict[str, Any]:
+    mariadb_spec = deployed_mariadb.instance.spec
+    return {
+        "host": f"{deployed_mariadb.name}.{deployed_mariadb.namespace}.svc.cluster.local",
+        "database": mariadb_spec.database,
+        "passwordSecret": {"key": mariadb_spec.passwordSecretKeyRef.key, "name": mariadb_secret.name},
+        "port": 3306,
+        "skipDBCreation": False,
+        "username": mariadb_spec.username,
+    }
@@ -17,7 +17,11 @@ from tests.model_registry.rest_api.constants import (
     CUSTOM_PROPERTY,
     REGISTERED_MODEL_DESCRIPTION,
 )
-from tests.model_registry.rest_api.utils import validate_resource_attributes, ModelRegistryV1Alpha1
+from tests.model_registry.rest_api.utils import (
+    ModelRegistryRestClient,
+    ModelRegistryV1Alpha1,
+    validate_resource_attributes,
+)
 from simple_logger.logger import get_logger
 
 from utilities.constants import DscComponents
@@ -100,6 +104,38 @@ class TestModelRegistryCreationRest:
             resource_name=data_key,
         )
 
+    def test_iterate_model_registry_resources(
+        self: Self,
+        registered_model_rest_api: dict[str, Any],
+        model_registry_rest_client: ModelRegistryRestClient,
+    ):
+        """
+        Walk registered models, model versions and artifacts list endpoints page by page (one item per page)
+        and ensure the registered model, its version and artifact are listed
+        """
+        registered_model_id = registered_model_rest_api["register_model"]["id"]
+        model_version_id = registered_model_rest_api["model_version"]["id"]
+        assert registered_model_id in [
+            registered_model["id"]
+            for registered_model in model_registry_rest_client.iterate(
+                path="registered_models",
+                params={"filterQuery": f'name = "{MODEL_REGISTER["name"]}"'},
+                page_size=1,
+            )
+        ]
+        assert model_version_id in [
+            model_version["id"]
+            for model_version in model_registry_rest_client.iterate(
+                path=f"registered_models/{registered_model_id}/versions", page_size=1
+            )
+        ]
+        assert registered_model_rest_api["model_artifact"]["id"] in [
+            artifact["id"]
+            for artifact in model_registry_rest_client.iterate(
+                path=f"model_versions/{model_version_id}/artifacts", page_size=1
+            )
+        ]
+
     def test_model_registry_validate_api_version(self: Self, model_registry_instance_mysql):
         api_version = ModelRegistry(
             name=model_registry_instance_mysql.name,
@@ -1,26 +1,99 @@
-from typing import Any, Dict
+import copy
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import cache
+from typing import Any, Dict, Generator
 import requests
 import json
 import os
 
+from requests.adapters import HTTPAdapter
 from simple_logger.logger import get_logger
+from urllib3.util.retry import Retry
 from tests.model_registry.exceptions import (
     ModelRegistryResourceNotCreated,
+    ModelRegistryResourceNotFoundError,
     ModelRegistryResourceNotUpdated,
 )
 from tests.model_registry.rest_api.constants import MODEL_REGISTRY_BASE_URI
 from pyhelper_utils.shell import run_command
+from utilities.benchmark_utils import summarize_durations
 from utilities.exceptions import ResourceValueMismatch
 from ocp_resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
 
 
 LOGGER = get_logger(name=__name__)
 
+MODEL_REGISTRY_REST_TIMEOUT: int = 60
+MODEL_REGISTRY_REST_RETRIES: int = 3
+MODEL_REGISTRY_REST_POOL_SIZE: int = 10
+MODEL_REGISTRY_LIST_PAGE_SIZE: int = 100
+MODEL_REGISTRY_RETRY_STATUS_CODES: tuple[int, ...] = (500, 502, 503, 504)
+# Resource ids in REST paths, replaced to group the request timings by endpoint
+RESOURCE_ID_PATH_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def create_model_registry_session(
+    verify: bool | str = False,
+    pool_size: int = MODEL_REGISTRY_REST_POOL_SIZE,
+    retries: int = MODEL_REGISTRY_REST_RETRIES,
+    retry_non_idempotent: bool = False,
+) -> requests.Session:
+    """
+    Create a requests session keeping a pool of connections to the Model Registry REST endpoint,
+    retrying idempotent requests which fail with a 5xx status code or a connection error.
+
+    Args:
+        verify (bool | str): TLS verification, or the path of the CA bundle to verify the server certificate with.
+        pool_size (int): Maximum number of connections kept open, should be at least the number of concurrent callers.
+        retries (int): Number of retries, with an exponential backoff (0.5s, 1s, 2s, ...).
+        retry_non_idempotent (bool): Retry POST and PATCH requests as well; a retried create which was committed
+            before the 5xx response fails with a conflict. Only for seeding, where this is preferred to a flaky
+            failure of the whole seeding.
+
+    Returns:
+        requests.Session: Session object.
+
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=MODEL_REGISTRY_RETRY_STATUS_CODES,
+        allowed_methods=None if retry_non_idempotent else Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount(prefix="https://", adapter=adapter)
+    session.mount(prefix="http://", adapter=adapter)
+    session.verify = verify
+    return session
+
+
+@cache
+def get_model_registry_session(verify: bool | str = False) -> requests.Session:
+    """
+    Get the session shared by the `execute_model_registry_*_command` helpers, so that successive calls reuse
+    their connections instead of opening a new TLS connection each.
+
+    Args:
+        verify (bool | str): TLS verification, or the path of the CA bundle to verify the server certificate with.
+
+    Returns:
+        requests.Session: Session object.
+
+    """
+    return create_model_registry_session(verify=verify)
+
 
 def execute_model_registry_patch_command(
     url: str, headers: dict[str, str], data_json: dict[str, Any]
 ) -> dict[Any, Any]:
-    resp = requests.patch(url=url, json=data_json, headers=headers, verify=False, timeout=60)
+    resp = get_model_registry_session().patch(
+        url=url, json=data_json, headers=headers, timeout=MODEL_REGISTRY_REST_TIMEOUT
+    )
     LOGGER.info(f"url: {url}, status code: {resp.status_code}, rep: {resp.text}")
 
     if resp.status_code != 200:
@@ -37,7 +110,9 @@ def execute_model_registry_patch_command(
 def execute_model_registry_post_command(
     url: str, headers: dict[str, str], data_json: dict[str, Any], verify: bool | str = False
 ) -> dict[Any, Any]:
-    resp = requests.post(url=url, json=data_json, headers=headers, verify=verify, timeout=60)
+    resp = get_model_registry_session(verify=verify).post(
+        url=url, json=data_json, headers=headers, timeout=MODEL_REGISTRY_REST_TIMEOUT
+    )
     LOGGER.info(f"url: {url}, status code: {resp.status_code}, rep: {resp.text}")
 
     if resp.status_code not in [200, 201]:
@@ -87,6 +162,273 @@ def register_model_rest_api(
     return {"register_model": register_model, "model_version": model_version, "model_artifact": model_artifact}
 
 
+class ModelRegistryRestClient:
+    """
+    Model Registry REST client for seeding and load testing registries.
+
+    Requests go through a session pooling up to `concurrency` connections and retrying on 5xx status codes,
+    including non-idempotent (create and update) requests.
+    Models are registered concurrently, each by its own chain of dependent calls
+    (registered model -> model version -> model artifact), and every request is timed.
+
+    Eg:
+        client = ModelRegistryRestClient(base_url=model_registry_rest_url, headers=model_registry_rest_headers)
+        result = client.register_models(data_dicts=[MODEL_REGISTER_DATA], concurrency=32)
+        client.summarize_timings()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        verify: bool | str = False,
+        concurrency: int = MODEL_REGISTRY_REST_POOL_SIZE,
+        retries: int = MODEL_REGISTRY_REST_RETRIES,
+        timeout: int = MODEL_REGISTRY_REST_TIMEOUT,
+    ) -> None:
+        self.api_url = f"{base_url.rstrip('/')}{MODEL_REGISTRY_BASE_URI}"
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.session = create_model_registry_session(
+            verify=verify, pool_size=concurrency, retries=retries, retry_non_idempotent=True
+        )
+        self.session.headers.update(headers)
+        self.timings: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        data_json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send a request to the Model Registry REST API and record its duration.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path relative to the API base URI, e.g. `registered_models/1/versions`.
+            data_json (dict[str, Any] | None): Request body.
+            params (dict[str, Any] | None): Query parameters.
+
+        Returns:
+            dict[str, Any]: Response body.
+
+        Raises:
+            ModelRegistryResourceNotFoundError: If a GET request fails.
+            ModelRegistryResourceNotCreated: If a POST request fails.
+            ModelRegistryResourceNotUpdated: If a PATCH request fails.
+
+        """
+        start_time = time.perf_counter()
+        resp = self.session.request(
+            method=method, url=f"{self.api_url}{path}", json=data_json, params=params, timeout=self.timeout
+        )
+        seconds = time.perf_counter() - start_time
+        with self._lock:
+            self.timings.append({
+                "method": method,
+                "endpoint": RESOURCE_ID_PATH_SEGMENT.sub(repl="/{id}", string=path),
+                "status_code": resp.status_code,
+                "seconds": seconds,
+            })
+
+        LOGGER.debug(f"{method} {path}, status code: {resp.status_code}, seconds: {seconds:.3f}")
+        if resp.status_code not in [200, 201]:
+            exception_class: type[Exception] = {
+                "POST": ModelRegistryResourceNotCreated,
+                "PATCH": ModelRegistryResourceNotUpdated,
+            }.get(method, ModelRegistryResourceNotFoundError)
+            raise exception_class(f"Failed {method} of ModelRegistry resource: {path}, {resp.status_code}: {resp.text}")
+
+        return resp.json()
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        return self.request(method="GET", path=path, params=params)
+
+    def iterate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = MODEL_REGISTRY_LIST_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Generator[dict[str, Any], Any, Any]:
+        """
+        Iterate over the items of a list endpoint, following its `nextPageToken` page by page.
+
+        The next page is fetched while the caller consumes the current one, so at most two pages are kept in memory
+        whatever the number of items; filter on the server side (`filterQuery`) rather than on the returned items.
+
+        Eg:
+            for registered_model in client.iterate(
+                path="registered_models", params={"filterQuery": 'name LIKE "model-%"', "orderBy": "ID"}
+            ):
+                ...
+
+        Args:
+            path (str): List endpoint path, e.g. `registered_models`, `model_versions` or
+                `model_versions/<id>/artifacts`.
+            params (dict[str, Any] | None): Query parameters, e.g. `filterQuery`, `orderBy` or `sortOrder`.
+            page_size (int): Number of items per page.
+            prefetch (bool): Whether to fetch the next page while the current page is consumed.
+
+        Yields:
+            dict[str, Any]: List endpoint items.
+
+        """
+        page_params: dict[str, Any] = {**(params or {}), "pageSize": page_size}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page: Future[dict[str, Any]] | None = executor.submit(self.get, path=path, params=page_params)
+            while next_page:
+                page = next_page.result()
+                items = page.get("items") or []
+                next_page_token = page.get("nextPageToken")
+                next_page = None
+                # A page without items, or returning the token it was requested with, is the last one
+                has_next_page = bool(items and next_page_token and next_page_token != page_params.get("nextPageToken"))
+                if has_next_page:
+                    page_params = {**page_params, "nextPageToken": next_page_token}
+                    if prefetch:
+                        next_page = executor.submit(self.get, path=path, params=page_params)
+
+                del page
+                yield from items
+                if has_next_page and not prefetch:
+                    next_page = executor.submit(self.get, path=path, params=page_params)
+
+    def post(self, path: str, data_json: dict[str, Any]) -> dict[str, Any]:
+        return self.request(method="POST", path=path, data_json=data_json)
+
+    def patch(self, path: str, data_json: dict[str, Any]) -> dict[str, Any]:
+        return self.request(method="PATCH", path=path, data_json=data_json)
+
+    def register_model(self, data_dict: dict[str, Any]) -> dict[str, Any]:
+        """
+        Register a model, then create its model versions and their artifacts.
+
+        Args:
+            data_dict (dict[str, Any]): `register_model_data`, and either `model_version_data` and
+                `model_artifact_data` (as in `MODEL_REGISTER_DATA`) or `model_versions`, a list of
+                `model_version_data` dicts each with its `model_artifacts_data` list.
+
+        Returns:
+            dict[str, Any]: `register_model`, `model_versions` (each with its `model_artifacts`) and the `seconds`
+                taken by the whole chain; `model_version` and `model_artifact` are the first version and artifact.
+
+        """
+        start_time = time.perf_counter()
+        versions_data = data_dict.get("model_versions") or [
+            {**data_dict["model_version_data"], "model_artifacts_data": [data_dict["model_artifact_data"]]}
+        ]
+        register_model = self.post(path="registered_models", data_json=data_dict["register_model_data"])
+        model_versions: list[dict[str, Any]] = []
+        for version_data in versions_data:
+            model_version_data = copy.deepcopy(version_data)
+            artifacts_data = model_version_data.pop("model_artifacts_data", [])
+            model_version = self.post(
+                path="model_versions", data_json={**model_version_data, "registeredModelId": register_model["id"]}
+            )
+            model_version["model_artifacts"] = [
+                self.post(path=f"model_versions/{model_version['id']}/artifacts", data_json=artifact_data)
+                for artifact_data in artifacts_data
+            ]
+            model_versions.append(model_version)
+
+        return {
+            "register_model": register_model,
+            "model_version": model_versions[0] if model_versions else None,
+            "model_artifact": model_versions[0]["model_artifacts"][0]
+            if model_versions and model_versions[0]["model_artifacts"]
+            else None,
+            "model_versions": model_versions,
+            "seconds": time.perf_counter() - start_time,
+        }
+
+    def register_models(self, data_dicts: list[dict[str, Any]], concurrency: int | None = None) -> dict[str, Any]:
+        """
+        Register models concurrently, see `register_model`.
+
+        A model whose registration fails does not stop the others; its error is returned instead.
+
+        Args:
+            data_dicts (list[dict[str, Any]]): `register_model` data of each model, with unique model names.
+            concurrency (int | None): Number of models registered at a time, the client concurrency if not set.
+
+        Returns:
+            dict[str, Any]: `models` (registered models results, in completion order), `errors`
+                (model name and error of the failed registrations), `seconds` (wall-clock time),
+                `models_per_second` and `requests_per_second`.
+
+        """
+        concurrency = concurrency or self.concurrency
+        requests_before = len(self.timings)
+        models: list[dict[str, Any]] = []
+        errors: list[dict[str, str]] = []
+        LOGGER.info(f"Registering {len(data_dicts)} models with concurrency {concurrency}")
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self.register_model, data_dict=data_dict): data_dict["register_model_data"]["name"]
+                for data_dict in data_dicts
+            }
+            for future in as_completed(fs=futures):
+                try:
+                    models.append(future.result())
+                except (requests.RequestException, ModelRegistryResourceNotCreated) as exc:
+                    errors.append({"name": futures[future], "error": str(exc)})
+
+        seconds = time.perf_counter() - start_time
+        result = {
+            "models": models,
+            "errors": errors,
+            "seconds": round(seconds, 3),
+            "models_per_second": round(len(models) / seconds, 3) if seconds else 0.0,
+            "requests_per_second": round((len(self.timings) - requests_before) / seconds, 3) if seconds else 0.0,
+        }
+        LOGGER.info(
+            f"Registered {len(models)}/{len(data_dicts)} models in {result['seconds']}s "
+            f"({result['models_per_second']} models/s), {len(errors)} failed"
+        )
+        return result
+
+    def summarize_timings(self) -> list[dict[str, Any]]:
+        """
+        Summarize the recorded request durations by method and endpoint.
+
+        Returns:
+            list[dict[str, Any]]: Method, endpoint, number of requests and errors, and durations summary of
+                each endpoint.
+
+        """
+        with self._lock:
+            timings = list(self.timings)
+
+        summaries: list[dict[str, Any]] = []
+        for method, endpoint in dict.fromkeys((timing["method"], timing["endpoint"]) for timing in timings):
+            endpoint_timings = [
+                timing for timing in timings if timing["method"] == method and timing["endpoint"] == endpoint
+            ]
+            summaries.append({
+                "method": method,
+                "endpoint": endpoint,
+                "requests": len(endpoint_timings),
+                "errors": len([timing for timing in endpoint_timings if timing["status_code"] not in [200, 201]]),
+                **summarize_durations(
+                    durations=[timing["seconds"] for timing in endpoint_timings], prefix="latency_seconds_"
+                ),
+            })
+
+        return summaries
+
+    def reset_timings(self) -> None:
+        with self._lock:
+            self.timings.clear()
+
+    def close(self) -> None:
+        self.session.close()
+
+
 def validate_resource_attributes(
     expected_params: dict[str, Any], actual_resource_data: dict[str, Any], resource_name: str
 ) -> None:
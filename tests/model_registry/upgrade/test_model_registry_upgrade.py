@@ -1,10 +1,10 @@
+from __future__ import annotations
+
 import pytest
-from typing import Self, Any
+from typing import TYPE_CHECKING, Self, Any
 
 from ocp_resources.pod import Pod
 from tests.model_registry.constants import MODEL_NAME, MODEL_DICT
-from model_registry.types import RegisteredModel
-from model_registry import ModelRegistry as ModelRegistryClient
 from ocp_resources.model_registry_modelregistry_opendatahub_io import ModelRegistry
 from simple_logger.logger import get_logger
 from tests.model_registry.rest_api.utils import ModelRegistryV1Alpha1
@@ -14,6 +14,10 @@ from tests.model_registry.utils import (
     validate_mlmd_removal_in_model_registry_pod_log,
 )
 
+if TYPE_CHECKING:
+    from model_registry import ModelRegistry as ModelRegistryClient
+    from model_registry.types import RegisteredModel
+
 LOGGER = get_logger(name=__name__)
 
 
@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 import json
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-import requests
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.pod import Pod
 from ocp_resources.service import Service
@@ -12,10 +13,13 @@ from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 from kubernetes.dynamic.exceptions import NotFoundError
 from tests.model_registry.constants import MR_DB_IMAGE_DIGEST
 from tests.model_registry.exceptions import ModelRegistryResourceNotFoundError
+from tests.model_registry.rest_api.utils import MODEL_REGISTRY_REST_TIMEOUT, get_model_registry_session
 from utilities.exceptions import ProtocolNotSupportedError, TooManyServicesError
 from utilities.constants import Protocols, Annotations
-from model_registry import ModelRegistry as ModelRegistryClient
-from model_registry.types import RegisteredModel
+
+if TYPE_CHECKING:
+    from model_registry import ModelRegistry as ModelRegistryClient
+    from model_registry.types import RegisteredModel
 
 ADDRESS_ANNOTATION_PREFIX: str = "routing.opendatahub.io/external-address-"
 
@@ -348,7 +352,7 @@ def execute_model_registry_get_command(url: str, headers: dict[str, str], json_o
 
     Returns: json output or dict of raw output.
     """
-    resp = requests.get(url=url, headers=headers, verify=False)
+    resp = get_model_registry_session().get(url=url, headers=headers, timeout=MODEL_REGISTRY_REST_TIMEOUT)
     LOGGER.info(f"url: {url}, status code: {resp.status_code}, rep: {resp.text}")
     if resp.status_code not in [200, 201]:
         raise ModelRegistryResourceNotFoundError(
@@ -45,10 +45,7 @@ def s3_models_storage_uri(request: FixtureRequest, models_s3_bucket_name: str) -
 def kserve_s3_secret(
     admin_client: DynamicClient,
     model_namespace: Namespace,
-    aws_access_key_id: str,
-    aws_secret_access_key: str,
-    models_s3_bucket_region: str,
-    models_s3_bucket_endpoint: str,
+    models_s3_endpoint_config: dict[str, str],
 ) -> Secret:
     """
     Creates and yields a Kubernetes Secret configured for S3 access in KServe.
@@ -56,10 +53,8 @@ def kserve_s3_secret(
     Args:
         admin_client (DynamicClient): Kubernetes dynamic client.
         model_namespace (Namespace): Namespace where the secret will be created.
-        aws_access_key_id (str): AWS access key ID.
-        aws_secret_access_key (str): AWS secret access key.
-        models_s3_bucket_region (str): AWS S3 bucket region.
-        models_s3_bucket_endpoint (str): AWS S3 bucket endpoint URL.
+        models_s3_endpoint_config (dict[str, str]): Models bucket, or model cache with `--model-cache`, credentials,
+            endpoint URL and region.
 
     Yields:
         Secret: A Kubernetes Secret configured with the provided AWS credentials and S3 endpoint.
@@ -68,10 +63,10 @@ def kserve_s3_secret(
         admin_client=admin_client,
         name="mlserver-models-bucket-secret",
         namespace=model_namespace.name,
-        aws_access_key=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        aws_s3_region=models_s3_bucket_region,
-        aws_s3_endpoint=models_s3_bucket_endpoint,
+        aws_access_key=models_s3_endpoint_config["aws_access_key"],
+        aws_secret_access_key=models_s3_endpoint_config["aws_secret_access_key"],
+        aws_s3_region=models_s3_endpoint_config["aws_s3_region"],
+        aws_s3_endpoint=models_s3_endpoint_config["aws_s3_endpoint"],
     ) as secret:
         yield secret
 
@@ -111,7 +106,7 @@ def kserve_s3_endpoint_secret(
             "serving.kserve.io/s3-region": aws_s3_region,
             "serving.kserve.io/s3-useanoncredential": "false",
             "serving.kserve.io/s3-verifyssl": "0",
-            "serving.kserve.io/s3-usehttps": "1",
+            "serving.kserve.io/s3-usehttps": "1" if aws_s3_endpoint.startswith("https://") else "0",
         },
         string_data={
             "AWS_ACCESS_KEY_ID": aws_access_key,
@@ -0,0 +1,60 @@
+from typing import Any, Generator
+
+import portforward
+import pytest
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.inference_service import InferenceService
+
+from tests.model_serving.model_runtime.vllm.benchmark.utils import (
+    build_benchmark_prompts,
+    compare_vllm_benchmark_variants,
+)
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.constants import Ports
+from utilities.infra import get_pods_by_isvc_label
+
+
+@pytest.fixture(scope="session")
+def vllm_benchmark_concurrency_levels(pytestconfig: pytest.Config) -> list[int]:
+    return sorted(int(level) for level in pytestconfig.option.vllm_benchmark_concurrency.split(","))
+
+
+@pytest.fixture(scope="session")
+def vllm_benchmark_prompts(pytestconfig: pytest.Config) -> list[str]:
+    return build_benchmark_prompts(
+        num_prompts=pytestconfig.option.vllm_benchmark_num_prompts,
+        input_len=pytestconfig.option.vllm_benchmark_input_len,
+    )
+
+
+@pytest.fixture(scope="session")
+def vllm_serving_benchmark_report(
+    pytestconfig: pytest.Config, benchmark_results_dir: str
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name="vllm-serving",
+        results_dir=benchmark_results_dir,
+        metadata={
+            "concurrency": pytestconfig.option.vllm_benchmark_concurrency,
+            "num_prompts": pytestconfig.option.vllm_benchmark_num_prompts,
+            "input_len": pytestconfig.option.vllm_benchmark_input_len,
+            "output_len": pytestconfig.option.vllm_benchmark_output_len,
+        },
+    )
+    yield report
+    report.metadata["comparisons"] = compare_vllm_benchmark_variants(report=report)
+    report.write()
+
+
+@pytest.fixture(scope="class")
+def vllm_benchmark_url(
+    admin_client: DynamicClient, vllm_inference_service: InferenceService
+) -> Generator[str, Any, Any]:
+    pod = get_pods_by_isvc_label(client=admin_client, isvc=vllm_inference_service)[0]
+    with portforward.forward(
+        pod_or_service=pod.name,
+        namespace=vllm_inference_service.namespace,
+        from_port=Ports.REST_PORT,
+        to_port=Ports.REST_PORT,
+    ):
+        yield f"http://localhost:{Ports.REST_PORT}"
@@ -0,0 +1,123 @@
+import pytest
+
+from tests.model_serving.model_runtime.vllm.benchmark.utils import run_vllm_benchmark_sweep
+from utilities.constants import KServeDeploymentType
+
+GRANITE_MODEL_PATH: str = "granite-7b-lab"
+OPENHERMES_AWQ_MODEL_PATH: str = "TheBloke/OpenHermes-2.5-Mistral-7B-AWQ"
+OPENHERMES_FP16_MODEL_PATH: str = "teknium/OpenHermes-2.5-Mistral-7B"
+
+FP16_SERVING_ARGUMENT: list[str] = [
+    "--model=/mnt/models",
+    "--dtype=float16",
+]
+SPECULATIVE_NGRAM_SERVING_ARGUMENT: list[str] = [
+    "--model=/mnt/models",
+    "--dtype=float16",
+    "--speculative_config",
+    '{"model": "ngram", "num_speculative_tokens": 5, "prompt_lookup_max": 4}',
+    "--use-v2-block-manager",
+]
+AWQ_SERVING_ARGUMENT: list[str] = [
+    "--model=/mnt/models",
+]
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.rawdeployment,
+    pytest.mark.usefixtures("skip_if_no_supported_accelerator_type", "valid_aws_config"),
+]
+
+
+@pytest.mark.parametrize(
+    "model_namespace, s3_models_storage_uri, serving_runtime, vllm_inference_service, variant",
+    [
+        # Speculative decoding comparison: granite-7b-lab FP16 baseline, then with ngram speculative decoding
+        pytest.param(
+            {"name": "vllm-benchmark-granite-fp16"},
+            {"model-dir": GRANITE_MODEL_PATH},
+            {"deployment_type": KServeDeploymentType.RAW_DEPLOYMENT},
+            {
+                "deployment_mode": KServeDeploymentType.RAW_DEPLOYMENT,
+                "runtime_argument": FP16_SERVING_ARGUMENT,
+                "gpu_count": 1,
+                "name": "granite-7b",
+                "min-replicas": 1,
+            },
+            "granite-7b-lab-fp16",
+            id="granite-7b-lab-fp16",
+        ),
+        pytest.param(
+            {"name": "vllm-benchmark-granite-ngram"},
+            {"model-dir": GRANITE_MODEL_PATH},
+            {"deployment_type": KServeDeploymentType.RAW_DEPLOYMENT},
+            {
+                "deployment_mode": KServeDeploymentType.RAW_DEPLOYMENT,
+                "runtime_argument": SPECULATIVE_NGRAM_SERVING_ARGUMENT,
+                "gpu_count": 1,
+                "name": "granite-7b",
+                "min-replicas": 1,
+            },
+            "granite-7b-lab-speculative-ngram",
+            id="granite-7b-lab-speculative-ngram",
+        ),
+        # Quantization comparison: OpenHermes-2.5-Mistral-7B FP16 baseline, then AWQ quantized
+        pytest.param(
+            {"name": "vllm-benchmark-mistral-fp16"},
+            {"model-dir": OPENHERMES_FP16_MODEL_PATH},
+            {"deployment_type": KServeDeploymentType.RAW_DEPLOYMENT},
+            {
+                "deployment_mode": KServeDeploymentType.RAW_DEPLOYMENT,
+                "runtime_argument": FP16_SERVING_ARGUMENT,
+                "gpu_count": 1,
+                "name": "mistral-fp16",
+                "min-replicas": 1,
+            },
+            "openhermes-mistral-7b-fp16",
+            id="openhermes-mistral-7b-fp16",
+        ),
+        pytest.param(
+            {"name": "vllm-benchmark-mistral-awq"},
+            {"model-dir": OPENHERMES_AWQ_MODEL_PATH},
+            {"deployment_type": KServeDeploymentType.RAW_DEPLOYMENT},
+            {
+                "deployment_mode": KServeDeploymentType.RAW_DEPLOYMENT,
+                "runtime_argument": AWQ_SERVING_ARGUMENT,
+                "gpu_count": 1,
+                "name": "mistral-awq",
+                "min-replicas": 1,
+            },
+            "openhermes-mistral-7b-awq",
+            id="openhermes-mistral-7b-awq",
+        ),
+    ],
+    indirect=["model_namespace", "s3_models_storage_uri", "serving_runtime", "vllm_inference_service"],
+)
+class TestVLLMServingBenchmark:
+    """
+    Serves each model variant (granite-7b-lab FP16 and ngram speculative decoding,
+    OpenHermes-2.5-Mistral-7B FP16 and AWQ) and compares each variant to its FP16 baseline.
+
+    Sends the benchmark prompts at each concurrency level and records request and output token throughput,
+    TTFT, ITL, TPOT and end-to-end latency percentiles.
+    """
+
+    def test_vllm_serving_benchmark(
+        self,
+        pytestconfig,
+        vllm_inference_service,
+        vllm_benchmark_url,
+        vllm_benchmark_prompts,
+        vllm_benchmark_concurrency_levels,
+        vllm_serving_benchmark_report,
+        variant,
+    ):
+        run_vllm_benchmark_sweep(
+            url=vllm_benchmark_url,
+            model_name=vllm_inference_service.name,
+            variant=variant,
+            prompts=vllm_benchmark_prompts,
+            output_len=pytestconfig.option.vllm_benchmark_output_len,
+            concurrency_levels=vllm_benchmark_concurrency_levels,
+            report=vllm_serving_benchmark_report,
+        )
@@ -0,0 +1,216 @@
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+from simple_logger.logger import get_logger
+
+from tests.model_serving.model_runtime.vllm.constant import COMPLETION_QUERY
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.model_server_metrics import MODEL_SERVER_METRICS, ModelServerMetricsScraper, summarize_server_metrics
+from utilities.plugins.constant import OpenAIEnpoints, RestHeader
+
+LOGGER = get_logger(name=__name__)
+
+BENCHMARK_PROMPT_WORDS: list[str] = sorted({word for query in COMPLETION_QUERY for word in query["text"].split()})
+BENCHMARK_REQUEST_TIMEOUT: int = 600
+# (candidate variant, reference variant) pairs compared in the report
+VLLM_BENCHMARK_COMPARISONS: list[tuple[str, str]] = [
+    ("granite-7b-lab-speculative-ngram", "granite-7b-lab-fp16"),
+    ("openhermes-mistral-7b-awq", "openhermes-mistral-7b-fp16"),
+]
+
+
+def build_benchmark_prompts(num_prompts: int, input_len: int, seed: int = 0) -> list[str]:
+    """
+    Build prompts of a controlled length from the completion queries vocabulary.
+
+    Args:
+        num_prompts (int): Number of prompts.
+        input_len (int): Number of words per prompt, roughly the number of prompt tokens.
+        seed (int): Random seed, to send the same prompts to all benchmarked models.
+
+    Returns:
+        list[str]: Prompts.
+
+    """
+    rng = random.Random(x=seed)
+    return [" ".join(rng.choices(population=BENCHMARK_PROMPT_WORDS, k=input_len)) for _ in range(num_prompts)]
+
+
+def send_streaming_completion(url: str, model_name: str, prompt: str, output_len: int) -> dict[str, Any]:
+    """
+    Send a streaming completion request and measure its token timings.
+
+    EOS is ignored and `min_tokens` is set, so every request generates exactly `output_len` tokens.
+
+    Args:
+        url (str): vLLM server base URL.
+        model_name (str): Served model name.
+        prompt (str): Prompt.
+        output_len (int): Number of tokens to generate.
+
+    Returns:
+        dict[str, Any]: `ttft`, `itls` (gaps between streamed chunks), `tpot` (time per output token after the
+            first one), `latency`, `prompt_tokens` and `output_tokens`.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+
+    """
+    request_data = {
+        "model": model_name,
+        "prompt": prompt,
+        "max_tokens": output_len,
+        "min_tokens": output_len,
+        "ignore_eos": True,
+        "stream": True,
+        "stream_options": {"include_usage": True},
+    }
+    chunk_times: list[float] = []
+    usage: dict[str, int] = {}
+
+    start_time = time.perf_counter()
+    with requests.post(
+        url=f"{url}{OpenAIEnpoints.COMPLETIONS}",
+        headers=RestHeader.HEADERS,
+        json=request_data,
+        stream=True,
+        verify=False,
+        timeout=BENCHMARK_REQUEST_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith(b"data: ") or line == b"data: [DONE]":
+                continue
+
+            chunk = json.loads(line.removeprefix(b"data: "))
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+            if chunk.get("choices") and chunk["choices"][0].get("text"):
+                chunk_times.append(time.perf_counter())
+
+    latency = time.perf_counter() - start_time
+    output_tokens = usage.get("completion_tokens", len(chunk_times))
+    ttft = chunk_times[0] - start_time if chunk_times else latency
+
+    return {
+        "ttft": ttft,
+        "itls": [current - previous for previous, current in zip(chunk_times, chunk_times[1:])],
+        "tpot": (latency - ttft) / (output_tokens - 1) if output_tokens > 1 else 0.0,
+        "latency": latency,
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "output_tokens": output_tokens,
+    }
+
+
+def run_vllm_benchmark_sweep(
+    url: str,
+    model_name: str,
+    variant: str,
+    prompts: list[str],
+    output_len: int,
+    concurrency_levels: list[int],
+    report: BenchmarkReport,
+) -> None:
+    """
+    Send all prompts at each concurrency level and add the serving metrics to the report.
+
+    The server metrics endpoint is scraped around each concurrency level, so the client-side timings are reported
+    next to the server-side ones (`server_` prefixed).
+
+    Args:
+        url (str): vLLM server base URL.
+        model_name (str): Served model name.
+        variant (str): Benchmarked variant name, e.g. `granite-7b-lab-fp16`.
+        prompts (list[str]): Prompts to send at each concurrency level.
+        output_len (int): Number of tokens to generate per request.
+        concurrency_levels (list[int]): Number of concurrent requests to sweep.
+        report (BenchmarkReport): Report to add the results to.
+
+    Raises:
+        AssertionError: If all requests of a concurrency level failed.
+
+    """
+    LOGGER.info(f"Warming up {variant}")
+    send_streaming_completion(url=url, model_name=model_name, prompt=prompts[0], output_len=output_len)
+    metrics_scraper = ModelServerMetricsScraper(
+        url=f"{url}{OpenAIEnpoints.METRICS}", prefixes=MODEL_SERVER_METRICS["vllm"]["prefixes"]
+    )
+
+    for concurrency in concurrency_levels:
+        LOGGER.info(f"Benchmarking {variant} with {len(prompts)} requests, concurrency {concurrency}")
+        results: list[dict[str, Any]] = []
+        failed_requests = 0
+
+        start_time = time.perf_counter()
+        with metrics_scraper.measure() as server_metrics, ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    send_streaming_completion, url=url, model_name=model_name, prompt=prompt, output_len=output_len
+                )
+                for prompt in prompts
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except requests.exceptions.RequestException as exc:
+                    LOGGER.error(f"Benchmark request failed: {exc}")
+                    failed_requests += 1
+
+        duration = time.perf_counter() - start_time
+        assert results, f"All {variant} benchmark requests failed with concurrency {concurrency}"
+
+        report.add_result(
+            variant=variant,
+            concurrency=concurrency,
+            requests=len(results),
+            failed_requests=failed_requests,
+            duration=round(duration, 2),
+            mean_prompt_tokens=round(sum(result["prompt_tokens"] for result in results) / len(results), 1),
+            request_throughput=round(len(results) / duration, 3),
+            output_token_throughput=round(sum(result["output_tokens"] for result in results) / duration, 2),
+            **summarize_durations(durations=[result["ttft"] for result in results], prefix="ttft_"),
+            **summarize_durations(durations=[itl for result in results for itl in result["itls"]], prefix="itl_"),
+            **summarize_durations(durations=[result["tpot"] for result in results], prefix="tpot_"),
+            **summarize_durations(durations=[result["latency"] for result in results], prefix="latency_"),
+            **summarize_server_metrics(delta=server_metrics, runtime="vllm", duration=duration, model_name=model_name),
+        )
+
+
+def compare_vllm_benchmark_variants(report: BenchmarkReport) -> list[dict[str, Any]]:
+    """
+    Compare `VLLM_BENCHMARK_COMPARISONS` variants at each concurrency level.
+
+    Ratios above 1 mean the candidate variant has a higher value than the reference variant.
+
+    Args:
+        report (BenchmarkReport): Report with the benchmarked variants results.
+
+    Returns:
+        list[dict[str, Any]]: Comparisons of variants benchmarked at the same concurrency level.
+
+    """
+    results = {(result["variant"], result["concurrency"]): result for result in report.results}
+    comparisons: list[dict[str, Any]] = []
+
+    for candidate, reference in VLLM_BENCHMARK_COMPARISONS:
+        for (variant, concurrency), candidate_result in results.items():
+            if variant != candidate or not (reference_result := results.get((reference, concurrency))):
+                continue
+
+            comparisons.append({
+                "candidate": candidate,
+                "reference": reference,
+                "concurrency": concurrency,
+                **{
+                    f"{metric}_ratio": round(candidate_result[metric] / reference_result[metric], 3)
+                    if reference_result[metric]
+                    else None
+                    for metric in ("output_token_throughput", "request_throughput", "ttft_p50", "tpot_p50")
+                },
+            })
+
+    return comparisons
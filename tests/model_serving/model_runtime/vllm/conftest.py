@@ -120,19 +120,16 @@ def vllm_model_service_account(admin_client: DynamicClient, kserve_endpoint_s3_s
 def kserve_endpoint_s3_secret(
     admin_client: DynamicClient,
     model_namespace: Namespace,
-    aws_access_key_id: str,
-    aws_secret_access_key: str,
-    models_s3_bucket_region: str,
-    models_s3_bucket_endpoint: str,
+    models_s3_endpoint_config: dict[str, str],
 ) -> Secret:
     with kserve_s3_endpoint_secret(
         admin_client=admin_client,
         name="models-bucket-secret",
         namespace=model_namespace.name,
-        aws_access_key=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        aws_s3_region=models_s3_bucket_region,
-        aws_s3_endpoint=models_s3_bucket_endpoint,
+        aws_access_key=models_s3_endpoint_config["aws_access_key"],
+        aws_secret_access_key=models_s3_endpoint_config["aws_secret_access_key"],
+        aws_s3_region=models_s3_endpoint_config["aws_s3_region"],
+        aws_s3_endpoint=models_s3_endpoint_config["aws_s3_endpoint"],
     ) as secret:
         yield secret
 
@@ -11,7 +11,7 @@ from utilities.constants import Ports
 from utilities.exceptions import NotSupportedError
 from utilities.plugins.constant import OpenAIEnpoints
 from utilities.plugins.openai_plugin import OpenAIClient
-from utilities.plugins.tgis_grpc_plugin import TGISGRPCPlugin
+from utilities.lazy_import import lazy_import
 from tests.model_serving.model_runtime.vllm.constant import VLLM_SUPPORTED_QUANTIZATION
 from tests.model_serving.model_runtime.vllm.constant import (
     OPENAI_ENDPOINT_NAME,
@@ -22,6 +22,8 @@ import pytest
 
 LOGGER = get_logger(name=__name__)
 
+tgis_grpc_plugin = lazy_import(name="utilities.plugins.tgis_grpc_plugin")
+
 
 @contextmanager
 def kserve_s3_endpoint_secret(
@@ -38,11 +40,11 @@ def kserve_s3_endpoint_secret(
         name=name,
         namespace=namespace,
         annotations={
-            "serving.kserve.io/s3-endpoint": aws_s3_endpoint.replace("https://", ""),
+            "serving.kserve.io/s3-endpoint": aws_s3_endpoint.replace("https://", "").replace("http://", ""),
             "serving.kserve.io/s3-region": aws_s3_region,
             "serving.kserve.io/s3-useanoncredential": "false",
             "serving.kserve.io/s3-verifyssl": "0",
-            "serving.kserve.io/s3-usehttps": "1",
+            "serving.kserve.io/s3-usehttps": "1" if aws_s3_endpoint.startswith("https://") else "0",
         },
         string_data={
             "AWS_ACCESS_KEY_ID": aws_access_key,
@@ -87,7 +89,7 @@ def fetch_tgis_response(  # type: ignore
 ) -> tuple[Any, list[Any], list[Any]]:
     completion_responses = []
     stream_completion_responses = []
-    inference_client = TGISGRPCPlugin(host=url, model_name=model_name, streaming=True)
+    inference_client = tgis_grpc_plugin.TGISGRPCPlugin(host=url, model_name=model_name, streaming=True)
     model_info = inference_client.get_model_info()
     if completion_query:
         for query in COMPLETION_QUERY:
@@ -0,0 +1,25 @@
+from typing import Any, Generator
+
+import pytest
+
+from tests.model_serving.model_server.authentication.benchmark.utils import reconcile_latency_breakdown
+from utilities.benchmark_utils import BenchmarkReport
+
+
+@pytest.fixture(scope="session")
+def latency_breakdown_requests(pytestconfig: pytest.Config) -> int:
+    return pytestconfig.option.latency_breakdown_requests
+
+
+@pytest.fixture(scope="session")
+def latency_breakdown_report(
+    benchmark_results_dir: str, latency_breakdown_requests: int
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name="latency-breakdown",
+        results_dir=benchmark_results_dir,
+        metadata={"requests": latency_breakdown_requests},
+    )
+    yield report
+    report.metadata["reconciliation"] = reconcile_latency_breakdown(report=report)
+    report.write()
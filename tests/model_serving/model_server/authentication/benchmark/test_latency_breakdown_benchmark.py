@@ -0,0 +1,193 @@
+import pytest
+
+from tests.model_serving.model_server.authentication.benchmark.utils import run_latency_breakdown
+from utilities.constants import ModelFormat, ModelStoragePath
+from utilities.inference_utils import Inference
+from utilities.manifests.caikit_tgis import CAIKIT_TGIS_INFERENCE_CONFIG
+from utilities.manifests.openvino import OPENVINO_INFERENCE_CONFIG
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.usefixtures("valid_aws_config")]
+
+
+@pytest.mark.rawdeployment
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, s3_models_storage_uri",
+    [
+        pytest.param(
+            {"name": "raw-latency-breakdown"},
+            {"model-dir": ModelStoragePath.FLAN_T5_SMALL_CAIKIT},
+        )
+    ],
+    indirect=True,
+)
+class TestRawLatencyBreakdown:
+    """
+    Breaks down the latency of a RawDeployment Caikit-TGIS model into client hops (DNS, TCP, TLS, request wait,
+    response transfer), TGIS queue and inference time, and route/authorization proxy overhead,
+    with authentication enabled, then disabled.
+    """
+
+    def test_raw_latency_breakdown_auth_enabled(
+        self,
+        unprivileged_client,
+        http_s3_caikit_raw_inference_service,
+        http_raw_inference_token,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=http_s3_caikit_raw_inference_service,
+            runtime="tgis",
+            inference_config=CAIKIT_TGIS_INFERENCE_CONFIG,
+            inference_type=Inference.ALL_TOKENS,
+            model_name=ModelFormat.CAIKIT,
+            auth=True,
+            token=http_raw_inference_token,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+        )
+
+    def test_raw_latency_breakdown_auth_disabled(
+        self,
+        unprivileged_client,
+        patched_remove_raw_authentication_isvc,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=patched_remove_raw_authentication_isvc,
+            runtime="tgis",
+            inference_config=CAIKIT_TGIS_INFERENCE_CONFIG,
+            inference_type=Inference.ALL_TOKENS,
+            model_name=ModelFormat.CAIKIT,
+            auth=False,
+            token=None,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+        )
+
+
+@pytest.mark.serverless
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, s3_models_storage_uri",
+    [
+        pytest.param(
+            {"name": "serverless-latency-breakdown"},
+            {"model-dir": ModelStoragePath.FLAN_T5_SMALL_CAIKIT},
+        )
+    ],
+    indirect=True,
+)
+class TestServerlessLatencyBreakdown:
+    """
+    Breaks down the latency of a Serverless Caikit-TGIS model into client hops, TGIS queue and inference time,
+    and route/Istio/Knative/authorization proxy overhead, with authentication enabled, then disabled.
+    """
+
+    def test_serverless_latency_breakdown_auth_enabled(
+        self,
+        unprivileged_client,
+        http_s3_caikit_serverless_inference_service,
+        http_inference_token,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=http_s3_caikit_serverless_inference_service,
+            runtime="tgis",
+            inference_config=CAIKIT_TGIS_INFERENCE_CONFIG,
+            inference_type=Inference.ALL_TOKENS,
+            model_name=ModelFormat.CAIKIT,
+            auth=True,
+            token=http_inference_token,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+        )
+
+    def test_serverless_latency_breakdown_auth_disabled(
+        self,
+        unprivileged_client,
+        patched_remove_authentication_isvc,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=patched_remove_authentication_isvc,
+            runtime="tgis",
+            inference_config=CAIKIT_TGIS_INFERENCE_CONFIG,
+            inference_type=Inference.ALL_TOKENS,
+            model_name=ModelFormat.CAIKIT,
+            auth=False,
+            token=None,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+        )
+
+
+@pytest.mark.modelmesh
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, http_s3_ovms_model_mesh_serving_runtime, "
+    "http_s3_openvino_model_mesh_inference_service",
+    [
+        pytest.param(
+            {"name": "model-mesh-latency-breakdown", "modelmesh-enabled": True},
+            {"enable-auth": True, "enable-external-route": True},
+            {"model-path": ModelStoragePath.OPENVINO_EXAMPLE_MODEL},
+        )
+    ],
+    indirect=True,
+)
+class TestModelMeshLatencyBreakdown:
+    """
+    Breaks down the latency of a ModelMesh OpenVINO model into client hops, ModelMesh queue and model server
+    invocation time, and route/authorization proxy overhead, with authentication enabled, then disabled.
+    """
+
+    def test_model_mesh_latency_breakdown_auth_enabled(
+        self,
+        unprivileged_client,
+        http_s3_ovms_model_mesh_serving_runtime,
+        http_s3_openvino_model_mesh_inference_service,
+        http_model_mesh_inference_token,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=http_s3_openvino_model_mesh_inference_service,
+            runtime="modelmesh",
+            inference_config=OPENVINO_INFERENCE_CONFIG,
+            inference_type=Inference.INFER,
+            model_name=None,
+            auth=True,
+            token=http_model_mesh_inference_token,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+            runtime_name=http_s3_ovms_model_mesh_serving_runtime.name,
+        )
+
+    def test_model_mesh_latency_breakdown_auth_disabled(
+        self,
+        unprivileged_client,
+        patched_remove_authentication_model_mesh_runtime,
+        http_s3_openvino_model_mesh_inference_service,
+        latency_breakdown_requests,
+        latency_breakdown_report,
+    ):
+        run_latency_breakdown(
+            client=unprivileged_client,
+            isvc=http_s3_openvino_model_mesh_inference_service,
+            runtime="modelmesh",
+            inference_config=OPENVINO_INFERENCE_CONFIG,
+            inference_type=Inference.INFER,
+            model_name=None,
+            auth=False,
+            token=None,
+            num_requests=latency_breakdown_requests,
+            report=latency_breakdown_report,
+            runtime_name=patched_remove_authentication_model_mesh_runtime.name,
+        )
@@ -0,0 +1,212 @@
+import time
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.inference_service import InferenceService
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutSampler
+
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.constants import Annotations, KServeDeploymentType, Protocols, Timeout
+from utilities.exceptions import InferenceResponseError
+from utilities.inference_utils import UserInference
+from utilities.infra import get_pods_by_isvc_label
+from utilities.model_server_metrics import forward_model_server_metrics, summarize_server_metrics
+
+LOGGER = get_logger(name=__name__)
+
+# Client-side hops, from curl phases timings
+CLIENT_HOPS: tuple[str, ...] = ("dns", "tcp_connect", "tls_handshake", "request_wait", "response_transfer", "total")
+
+
+def get_client_hops(timings: dict[str, float]) -> dict[str, float]:
+    """
+    Split curl cumulative phases timings into the duration of each client-side hop.
+
+    `request_wait` is the time from the request being sent to the first response byte, spent in the route,
+    the service mesh (Istio, Knative activator and queue-proxy), the authorization proxy and the model server.
+
+    Args:
+        timings (dict[str, float]): `UserInference.run_timed_inference` timings.
+
+    Returns:
+        dict[str, float]: `CLIENT_HOPS` durations in seconds.
+
+    """
+    return {
+        "dns": timings["time_namelookup"],
+        "tcp_connect": timings["time_connect"] - timings["time_namelookup"],
+        # time_appconnect is 0 without TLS
+        "tls_handshake": max(timings["time_appconnect"] - timings["time_connect"], 0.0),
+        "request_wait": timings["time_starttransfer"] - timings["time_pretransfer"],
+        "response_transfer": timings["time_total"] - timings["time_starttransfer"],
+        "total": timings["time_total"],
+    }
+
+
+def wait_for_timed_inference(inference: UserInference, model_name: str, token: str | None) -> None:
+    """
+    Send inference requests until one succeeds, e.g. after authentication was enabled or disabled.
+
+    Raises:
+        TimeoutExpiredError: If no inference succeeds within 5 minutes.
+
+    """
+    for _ in TimeoutSampler(
+        wait_timeout=Timeout.TIMEOUT_5MIN,
+        sleep=5,
+        exceptions_dict={InferenceResponseError: [], ValueError: []},
+        func=inference.run_timed_inference,
+        model_name=model_name,
+        use_default_query=True,
+        insecure=True,
+        token=token,
+    ):
+        return
+
+
+def run_latency_breakdown(
+    client: DynamicClient,
+    isvc: InferenceService,
+    runtime: str,
+    inference_config: dict[str, Any],
+    inference_type: str,
+    model_name: str | None,
+    auth: bool,
+    token: str | None,
+    num_requests: int,
+    report: BenchmarkReport,
+    runtime_name: str | None = None,
+) -> None:
+    """
+    Send sequential inference requests and reconcile their client-side timings with the model server metrics.
+
+    The metrics endpoint of the model server pod is scraped directly before and after the requests. The `proxy_overhead`
+    is the part of the client `request_wait` not spent in the model server: route, service mesh and
+    authorization proxy, and for runtimes with a transformer (e.g. Caikit), the transformer.
+
+    Args:
+        client (DynamicClient): DynamicClient object, to get the model server pod.
+        isvc (InferenceService): InferenceService to send the requests to, exposed with a route.
+        runtime (str): `MODEL_SERVER_METRICS` runtime of the model server, e.g. `tgis`.
+        inference_config (dict[str, Any]): Inference config, e.g. `CAIKIT_TGIS_INFERENCE_CONFIG`.
+        inference_type (str): Inference type, e.g. `Inference.ALL_TOKENS`.
+        model_name (str | None): Inference model name, defaults to the InferenceService name.
+        auth (bool): Whether authentication is enabled on the InferenceService.
+        token (str | None): Inference token, when authentication is enabled.
+        num_requests (int): Number of measured requests.
+        report (BenchmarkReport): Report to add the results to.
+        runtime_name (str | None): ServingRuntime name, to get the pod of a ModelMesh InferenceService.
+
+    Raises:
+        AssertionError: If a measured request fails.
+
+    """
+    deployment_mode = isvc.instance.metadata.annotations.get(Annotations.KserveIo.DEPLOYMENT_MODE)
+    model_name = model_name or isvc.name
+    inference = UserInference(
+        inference_service=isvc,
+        inference_config=inference_config,
+        inference_type=inference_type,
+        protocol=Protocols.HTTPS,
+    )
+    LOGGER.info(f"Warming up {deployment_mode} {isvc.name}, authentication {'enabled' if auth else 'disabled'}")
+    wait_for_timed_inference(inference=inference, model_name=model_name, token=token)
+    # Pods may still be terminating after authentication was enabled or disabled
+    pod = [
+        pod
+        for pod in get_pods_by_isvc_label(client=client, isvc=isvc, runtime_name=runtime_name)
+        if not pod.instance.metadata.deletionTimestamp
+    ][0]
+
+    client_hops: list[dict[str, float]] = []
+    with forward_model_server_metrics(pod=pod, runtime=runtime) as scraper:
+        start_time = time.perf_counter()
+        with scraper.measure() as server_metrics:
+            for _ in range(num_requests):
+                try:
+                    timings = inference.run_timed_inference(
+                        model_name=model_name, use_default_query=True, insecure=True, token=token
+                    )
+                except InferenceResponseError as exc:
+                    raise AssertionError(f"Latency breakdown request failed: {exc}") from exc
+
+                client_hops.append(get_client_hops(timings=timings))
+
+        duration = time.perf_counter() - start_time
+
+    client_summary: dict[str, float] = {}
+    for hop in CLIENT_HOPS:
+        client_summary.update(
+            summarize_durations(durations=[hops[hop] for hops in client_hops], prefix=f"client_{hop}_")
+        )
+
+    server_summary = summarize_server_metrics(delta=server_metrics, runtime=runtime, duration=duration)
+    server_latency = server_summary.get("server_latency_mean")
+    report.add_result(
+        deployment_mode=deployment_mode,
+        auth=auth,
+        runtime=runtime,
+        requests=num_requests,
+        **client_summary,
+        **server_summary,
+        proxy_overhead_mean=round(client_summary["client_request_wait_mean"] - server_latency, 4)
+        if server_latency is not None
+        else None,
+    )
+
+
+def _get_difference(candidate: dict[str, Any], reference: dict[str, Any], metric: str) -> float | None:
+    if candidate.get(metric) is None or reference.get(metric) is None:
+        return None
+
+    return round(candidate[metric] - reference[metric], 4)
+
+
+def reconcile_latency_breakdown(report: BenchmarkReport) -> list[dict[str, Any]]:
+    """
+    Attribute latency to authentication and to deployment modes, from the per-case results.
+
+    `auth_overhead` compares the same deployment mode with authentication enabled and disabled;
+    `mode_overhead` compares each deployment mode to RawDeployment with the same authentication setting.
+    Both are differences of mean client `request_wait` (and of `proxy_overhead`) in seconds.
+
+    Args:
+        report (BenchmarkReport): Report with the latency breakdown results.
+
+    Returns:
+        list[dict[str, Any]]: Reconciliations of the cases benchmarked with both settings.
+
+    """
+    results = {(result["deployment_mode"], result["auth"]): result for result in report.results}
+    reconciliations: list[dict[str, Any]] = []
+
+    for (deployment_mode, auth), result in results.items():
+        if auth and (no_auth_result := results.get((deployment_mode, False))):
+            reconciliations.append({
+                "overhead": "auth_overhead",
+                "deployment_mode": deployment_mode,
+                "request_wait_mean": _get_difference(
+                    candidate=result, reference=no_auth_result, metric="client_request_wait_mean"
+                ),
+                "proxy_overhead_mean": _get_difference(
+                    candidate=result, reference=no_auth_result, metric="proxy_overhead_mean"
+                ),
+            })
+
+        if deployment_mode != KServeDeploymentType.RAW_DEPLOYMENT and (
+            raw_result := results.get((KServeDeploymentType.RAW_DEPLOYMENT, auth))
+        ):
+            reconciliations.append({
+                "overhead": "mode_overhead",
+                "deployment_mode": deployment_mode,
+                "auth": auth,
+                "request_wait_mean": _get_difference(
+                    candidate=result, reference=raw_result, metric="client_request_wait_mean"
+                ),
+                "proxy_overhead_mean": _get_difference(
+                    candidate=result, reference=raw_result, metric="proxy_overhead_mean"
+                ),
+            })
+
+    return reconciliations
@@ -0,0 +1,23 @@
+from typing import Any, Generator
+
+import pytest
+
+from tests.model_serving.model_server.autoscaling.utils import compare_autoscaling_cases
+from utilities.benchmark_utils import BenchmarkReport
+
+
+@pytest.fixture(scope="session")
+def autoscaling_benchmark_report(
+    pytestconfig: pytest.Config, benchmark_results_dir: str
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name="autoscaling",
+        results_dir=benchmark_results_dir,
+        metadata={
+            "peak_concurrency": pytestconfig.option.autoscaling_benchmark_peak_concurrency,
+            "step_duration": pytestconfig.option.autoscaling_benchmark_step_duration,
+        },
+    )
+    yield report
+    report.metadata["comparisons"] = compare_autoscaling_cases(report=report)
+    report.write()
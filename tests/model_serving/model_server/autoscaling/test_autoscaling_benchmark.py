@@ -0,0 +1,107 @@
+import pytest
+
+from tests.model_serving.model_server.autoscaling.utils import AUTOSCALING_LOAD_PROFILES, run_autoscaling_benchmark
+from tests.model_serving.model_server.serverless.constants import ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG
+from utilities.constants import ModelFormat, ModelVersion, Protocols, RunTimeConfigs, Timeout
+from utilities.inference_utils import Inference
+from utilities.manifests.onnx import ONNX_INFERENCE_CONFIG
+
+MIN_REPLICAS: int = 1
+MAX_REPLICAS: int = 5
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.usefixtures("valid_aws_config")]
+
+
+@pytest.mark.serverless
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_kserve_inference_service",
+    [
+        pytest.param(
+            {"name": "autoscaling-kpa"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {
+                **ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG,
+                "min-replicas": MIN_REPLICAS,
+                "max-replicas": MAX_REPLICAS,
+                "scale-metric": "concurrency",
+                "scale-target": 1,
+            },
+        )
+    ],
+    indirect=True,
+)
+class TestServerlessKPAAutoscalingBenchmark:
+    """
+    Drives constant, step and spike load against a Serverless model autoscaled by Knative (KPA) on concurrency,
+    and records the ready replicas timeline, time to scale up / down and request latency per load step.
+    """
+
+    @pytest.mark.parametrize("load_profile", AUTOSCALING_LOAD_PROFILES)
+    def test_serverless_kpa_autoscaling_benchmark(
+        self,
+        pytestconfig,
+        unprivileged_client,
+        ovms_kserve_inference_service,
+        autoscaling_benchmark_report,
+        load_profile,
+    ):
+        run_autoscaling_benchmark(
+            client=unprivileged_client,
+            isvc=ovms_kserve_inference_service,
+            report=autoscaling_benchmark_report,
+            case="serverless-kpa",
+            profile=load_profile,
+            peak_concurrency=pytestconfig.option.autoscaling_benchmark_peak_concurrency,
+            step_duration=pytestconfig.option.autoscaling_benchmark_step_duration,
+            min_replicas=MIN_REPLICAS,
+            scale_down_timeout=Timeout.TIMEOUT_10MIN,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            inference_type=Inference.INFER,
+            protocol=Protocols.HTTPS,
+        )
+
+
+@pytest.mark.rawdeployment
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_raw_inference_service",
+    [
+        pytest.param(
+            {"name": "autoscaling-hpa"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {
+                "name": ModelFormat.ONNX,
+                "model-version": ModelVersion.OPSET13,
+                "model-dir": "test-dir",
+                "min-replicas": MIN_REPLICAS,
+                "max-replicas": MAX_REPLICAS,
+                "scale-metric": "cpu",
+                "scale-target": 50,
+            },
+        )
+    ],
+    indirect=True,
+)
+class TestRawHPAAutoscalingBenchmark:
+    """
+    Drives the same load profiles against the same model in RawDeployment mode, autoscaled by HPA on CPU utilization
+    (HPA does not support the concurrency metric), to compare with Knative (KPA) autoscaling.
+    """
+
+    @pytest.mark.parametrize("load_profile", AUTOSCALING_LOAD_PROFILES)
+    def test_raw_hpa_autoscaling_benchmark(
+        self, pytestconfig, unprivileged_client, ovms_raw_inference_service, autoscaling_benchmark_report, load_profile
+    ):
+        run_autoscaling_benchmark(
+            client=unprivileged_client,
+            isvc=ovms_raw_inference_service,
+            report=autoscaling_benchmark_report,
+            case="raw-hpa",
+            profile=load_profile,
+            peak_concurrency=pytestconfig.option.autoscaling_benchmark_peak_concurrency,
+            step_duration=pytestconfig.option.autoscaling_benchmark_step_duration,
+            min_replicas=MIN_REPLICAS,
+            scale_down_timeout=Timeout.TIMEOUT_10MIN,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            inference_type=Inference.INFER,
+            protocol=Protocols.HTTPS,
+        )
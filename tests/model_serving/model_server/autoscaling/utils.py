@@ -0,0 +1,271 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from ocp_resources.inference_service import InferenceService
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+
+from tests.model_serving.model_server.utils import verify_inference_response
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.exceptions import InferenceResponseError
+from utilities.infra import get_pods_by_isvc_label
+
+LOGGER = get_logger(name=__name__)
+
+AUTOSCALING_LOAD_PROFILES: tuple[str, ...] = ("constant", "step", "spike")
+# Number of steps the `step` profile ramps the load to the peak concurrency in
+AUTOSCALING_RAMP_STEPS: int = 4
+REPLICAS_SAMPLE_INTERVAL: int = 5
+# Autoscaler (case) compared to the reference autoscaler in the report
+AUTOSCALING_COMPARISONS: list[tuple[str, str]] = [("serverless-kpa", "raw-hpa")]
+
+
+def build_load_steps(profile: str, peak_concurrency: int) -> list[int]:
+    """
+    Build the concurrency of each step of a load profile.
+
+    Args:
+        profile (str): Load profile, one of `AUTOSCALING_LOAD_PROFILES`:
+            `constant` keeps the peak concurrency, `step` ramps up to it and `spike` jumps to it from 1 and back.
+        peak_concurrency (int): Peak number of concurrent requests.
+
+    Returns:
+        list[int]: Number of concurrent requests of each step.
+
+    Raises:
+        ValueError: If the profile is not supported.
+
+    """
+    if profile == "constant":
+        return [peak_concurrency] * AUTOSCALING_RAMP_STEPS
+
+    if profile == "step":
+        return sorted({
+            max(1, peak_concurrency * step // AUTOSCALING_RAMP_STEPS) for step in range(1, AUTOSCALING_RAMP_STEPS + 1)
+        })
+
+    if profile == "spike":
+        return [1, peak_concurrency, 1]
+
+    raise ValueError(f"Unsupported load profile {profile}, supported profiles: {AUTOSCALING_LOAD_PROFILES}")
+
+
+def get_ready_replicas(client: DynamicClient, isvc: InferenceService) -> int:
+    """
+    Get the number of ready predictor pods of an InferenceService.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): InferenceService object.
+
+    Returns:
+        int: Number of pods with a true `Ready` condition.
+
+    """
+    try:
+        pods = get_pods_by_isvc_label(client=client, isvc=isvc)
+    except ResourceNotFoundError:
+        return 0
+
+    return sum(
+        any(
+            condition.type == pod.Condition.READY and condition.status == pod.Condition.Status.TRUE
+            for condition in pod.instance.status.get("conditions") or []
+        )
+        for pod in pods
+    )
+
+
+def send_inference_requests_until(deadline: float, **kwargs: Any) -> list[tuple[float, bool]]:
+    """
+    Send inference requests, one at a time, until the deadline.
+
+    Args:
+        deadline (float): `time.monotonic()` time to stop sending requests at.
+        **kwargs: `verify_inference_response` arguments.
+
+    Returns:
+        list[tuple[float, bool]]: Latency in seconds and success of each request.
+
+    """
+    requests: list[tuple[float, bool]] = []
+    while time.monotonic() < deadline:
+        start_time = time.perf_counter()
+        try:
+            verify_inference_response(**kwargs)
+            succeeded = True
+
+        except (InferenceResponseError, ValueError, AssertionError) as exc:
+            LOGGER.warning(f"Autoscaling benchmark request failed: {exc}")
+            succeeded = False
+
+        requests.append((time.perf_counter() - start_time, succeeded))
+
+    return requests
+
+
+def run_autoscaling_benchmark(
+    client: DynamicClient,
+    isvc: InferenceService,
+    report: BenchmarkReport,
+    case: str,
+    profile: str,
+    peak_concurrency: int,
+    step_duration: int,
+    min_replicas: int,
+    scale_down_timeout: int,
+    **kwargs: Any,
+) -> None:
+    """
+    Drive a load profile against an InferenceService, sampling its ready replicas,
+    then wait for it to scale back down.
+
+    Adds a row per load step, with the request latency and throughput, replicas and time to the first scale up,
+    and a scale-down row to the report; the ready replicas timeline is added to the report metadata.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): InferenceService object, with `scaleMetric` / `scaleTarget` autoscaling.
+        report (BenchmarkReport): Report to add the results to.
+        case (str): Benchmark case, e.g. `serverless-kpa`.
+        profile (str): Load profile, one of `AUTOSCALING_LOAD_PROFILES`.
+        peak_concurrency (int): Peak number of concurrent requests.
+        step_duration (int): Duration of each load step in seconds.
+        min_replicas (int): InferenceService minimum replicas, the replicas to scale down to.
+        scale_down_timeout (int): Time to wait for the scale down in seconds.
+        **kwargs: `verify_inference_response` arguments, e.g. `inference_config`.
+
+    """
+    steps = build_load_steps(profile=profile, peak_concurrency=peak_concurrency)
+    timeline: list[dict[str, Any]] = []
+    start_time = time.monotonic()
+
+    LOGGER.info(f"Running {profile} load profile against {case} {isvc.name}, steps concurrency: {steps}")
+    with ThreadPoolExecutor(max_workers=max(steps)) as executor:
+        for step, concurrency in enumerate(steps):
+            step_start_time = time.monotonic()
+            deadline = step_start_time + step_duration
+            start_replicas = max_replicas = get_ready_replicas(client=client, isvc=isvc)
+            time_to_scale_up = None
+
+            futures = [
+                executor.submit(
+                    send_inference_requests_until,
+                    deadline=deadline,
+                    inference_service=isvc,
+                    use_default_query=True,
+                    **kwargs,
+                )
+                for _ in range(concurrency)
+            ]
+            while time.monotonic() < deadline:
+                replicas = get_ready_replicas(client=client, isvc=isvc)
+                now = time.monotonic()
+                timeline.append({
+                    "seconds": round(now - start_time, 1),
+                    "step": step,
+                    "concurrency": concurrency,
+                    "ready_replicas": replicas,
+                })
+                if replicas > start_replicas and time_to_scale_up is None:
+                    time_to_scale_up = round(now - step_start_time, 1)
+
+                max_replicas = max(max_replicas, replicas)
+                time.sleep(REPLICAS_SAMPLE_INTERVAL)
+
+            requests = [request for future in futures for request in future.result()]
+            latencies = [latency for latency, succeeded in requests if succeeded]
+            report.add_result(
+                case=case,
+                profile=profile,
+                step=step,
+                concurrency=concurrency,
+                requests=len(requests),
+                failed_requests=len(requests) - len(latencies),
+                request_throughput=round(len(latencies) / step_duration, 3),
+                start_replicas=start_replicas,
+                max_replicas=max_replicas,
+                time_to_scale_up=time_to_scale_up,
+                **summarize_durations(durations=latencies, prefix="latency_"),
+            )
+
+    load_end_time = time.monotonic()
+    start_replicas = get_ready_replicas(client=client, isvc=isvc)
+    time_to_scale_down = None
+    try:
+        for replicas in TimeoutSampler(
+            wait_timeout=scale_down_timeout,
+            sleep=REPLICAS_SAMPLE_INTERVAL,
+            func=get_ready_replicas,
+            client=client,
+            isvc=isvc,
+        ):
+            now = time.monotonic()
+            timeline.append({"seconds": round(now - start_time, 1), "step": "scale-down", "ready_replicas": replicas})
+            if replicas <= min_replicas:
+                time_to_scale_down = round(now - load_end_time, 1)
+                break
+
+    except TimeoutExpiredError:
+        LOGGER.warning(f"{isvc.name} did not scale down to {min_replicas} replicas in {scale_down_timeout} seconds")
+
+    report.add_result(
+        case=case,
+        profile=profile,
+        step="scale-down",
+        start_replicas=start_replicas,
+        time_to_scale_down=time_to_scale_down,
+    )
+    report.metadata.setdefault("timelines", {})[f"{case}-{profile}"] = timeline
+
+
+def compare_autoscaling_cases(report: BenchmarkReport) -> list[dict[str, Any]]:
+    """
+    Compare `AUTOSCALING_COMPARISONS` autoscalers under each load profile.
+
+    Ratios below 1 mean the autoscaler reacts faster (or serves with a lower latency) than the reference autoscaler.
+
+    Args:
+        report (BenchmarkReport): Report with the benchmarked autoscalers results.
+
+    Returns:
+        list[dict[str, Any]]: Comparisons of autoscalers benchmarked with the same load profile.
+
+    """
+    summaries: dict[tuple[str, str], dict[str, float | None]] = {}
+    for result in report.results:
+        summary = summaries.setdefault(
+            (result["case"], result["profile"]), {"time_to_scale_up": None, "time_to_scale_down": None}
+        )
+        if result["step"] == "scale-down":
+            summary["time_to_scale_down"] = result["time_to_scale_down"]
+            continue
+
+        if summary["time_to_scale_up"] is None:
+            summary["time_to_scale_up"] = result["time_to_scale_up"]
+
+        summary["latency_p95"] = max(summary.get("latency_p95") or 0.0, result["latency_p95"])
+
+    comparisons: list[dict[str, Any]] = []
+    for candidate, reference in AUTOSCALING_COMPARISONS:
+        for (case, profile), candidate_summary in summaries.items():
+            if case != candidate or not (reference_summary := summaries.get((reference, profile))):
+                continue
+
+            comparisons.append({
+                "candidate": candidate,
+                "reference": reference,
+                "profile": profile,
+                **{
+                    f"{metric}_ratio": round(candidate_value / reference_value, 3)
+                    if (candidate_value := candidate_summary.get(metric)) is not None
+                    and (reference_value := reference_summary.get(metric))
+                    else None
+                    for metric in ("time_to_scale_up", "time_to_scale_down", "latency_p95")
+                },
+            })
+
+    return comparisons
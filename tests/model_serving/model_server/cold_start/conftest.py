@@ -0,0 +1,25 @@
+from typing import Any, Generator
+
+import pytest
+
+from tests.model_serving.model_server.cold_start.utils import write_cold_start_summary
+from utilities.benchmark_utils import BenchmarkReport
+
+
+@pytest.fixture(scope="session")
+def cold_start_trials(pytestconfig: pytest.Config) -> int:
+    return pytestconfig.option.cold_start_trials
+
+
+@pytest.fixture(scope="session")
+def cold_start_benchmark_report(
+    benchmark_results_dir: str, cold_start_trials: int
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name="cold-start",
+        results_dir=benchmark_results_dir,
+        metadata={"trials": cold_start_trials},
+    )
+    yield report
+    report.write()
+    write_cold_start_summary(report=report)
@@ -0,0 +1,149 @@
+import pytest
+
+from tests.model_serving.model_server.cold_start.utils import (
+    prepare_scale_to_zero,
+    prepare_stop,
+    prepare_zero_initial_scale,
+    run_cold_start_trials,
+    trigger_resume,
+)
+from tests.model_serving.model_server.serverless.constants import ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG
+from utilities.constants import ModelFormat, ModelVersion, RunTimeConfigs
+from utilities.manifests.onnx import ONNX_INFERENCE_CONFIG
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.usefixtures("valid_aws_config")]
+
+
+@pytest.mark.serverless
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_kserve_inference_service",
+    [
+        pytest.param(
+            {"name": "cold-start-scale-to-zero"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {**ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG, "min-replicas": 0},
+        )
+    ],
+    indirect=True,
+)
+class TestServerlessScaleToZeroColdStart:
+    """
+    Measures the cold start of a Serverless model scaled to zero, from the first request to the first response,
+    broken down into pod created, scheduled, image pulled, storage initialized, container ready and route ready.
+    """
+
+    def test_serverless_scale_to_zero_cold_start(
+        self, unprivileged_client, ovms_kserve_inference_service, cold_start_trials, cold_start_benchmark_report
+    ):
+        run_cold_start_trials(
+            client=unprivileged_client,
+            isvc=ovms_kserve_inference_service,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            report=cold_start_benchmark_report,
+            case="serverless-scale-to-zero",
+            trials=cold_start_trials,
+            prepare=prepare_scale_to_zero,
+        )
+
+
+@pytest.mark.serverless
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_kserve_inference_service",
+    [
+        pytest.param(
+            {"name": "cold-start-zero-initial-scale"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {**ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG, "min-replicas": 0},
+        )
+    ],
+    indirect=True,
+)
+class TestServerlessZeroInitialScaleColdStart:
+    """
+    Measures the cold start of new revisions of a Serverless model with zero initial scale,
+    from the first request to the first response.
+    """
+
+    def test_serverless_zero_initial_scale_cold_start(
+        self, unprivileged_client, ovms_kserve_inference_service, cold_start_trials, cold_start_benchmark_report
+    ):
+        run_cold_start_trials(
+            client=unprivileged_client,
+            isvc=ovms_kserve_inference_service,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            report=cold_start_benchmark_report,
+            case="serverless-zero-initial-scale",
+            trials=cold_start_trials,
+            prepare=prepare_zero_initial_scale,
+        )
+
+
+@pytest.mark.serverless
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_kserve_inference_service",
+    [
+        pytest.param(
+            {"name": "cold-start-serverless-resume"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {**ONNX_SERVERLESS_INFERENCE_SERVICE_CONFIG, "stop": False},
+        )
+    ],
+    indirect=True,
+)
+class TestServerlessStopResumeColdStart:
+    """
+    Measures the cold start of a stopped Serverless model, from setting the stop annotation to false
+    to the first response.
+    """
+
+    def test_serverless_stop_resume_cold_start(
+        self, unprivileged_client, ovms_kserve_inference_service, cold_start_trials, cold_start_benchmark_report
+    ):
+        run_cold_start_trials(
+            client=unprivileged_client,
+            isvc=ovms_kserve_inference_service,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            report=cold_start_benchmark_report,
+            case="serverless-stop-resume",
+            trials=cold_start_trials,
+            prepare=prepare_stop,
+            trigger=trigger_resume,
+        )
+
+
+@pytest.mark.rawdeployment
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, ovms_kserve_serving_runtime, ovms_raw_inference_service",
+    [
+        pytest.param(
+            {"name": "cold-start-raw-resume"},
+            RunTimeConfigs.ONNX_OPSET13_RUNTIME_CONFIG,
+            {
+                "name": ModelFormat.ONNX,
+                "model-version": ModelVersion.OPSET13,
+                "model-dir": "test-dir",
+                "stop": False,
+            },
+        )
+    ],
+    indirect=True,
+)
+class TestRawStopResumeColdStart:
+    """
+    Measures the cold start of a stopped RawDeployment model, from setting the stop annotation to false
+    to the first response.
+    """
+
+    def test_raw_stop_resume_cold_start(
+        self, unprivileged_client, ovms_raw_inference_service, cold_start_trials, cold_start_benchmark_report
+    ):
+        run_cold_start_trials(
+            client=unprivileged_client,
+            isvc=ovms_raw_inference_service,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            report=cold_start_benchmark_report,
+            case="raw-stop-resume",
+            trials=cold_start_trials,
+            prepare=prepare_stop,
+            trigger=trigger_resume,
+        )
@@ -0,0 +1,268 @@
+import time
+from typing import Any, Callable
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from ocp_resources.event import Event
+from ocp_resources.inference_service import InferenceService
+from ocp_resources.pod import Pod
+from ocp_resources.resource import ResourceEditor
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutSampler
+
+from tests.model_serving.model_server.serverless.utils import verify_no_inference_pods
+from tests.model_serving.model_server.utils import verify_inference_response
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+from utilities.constants import Annotations, Containers, Protocols, Timeout
+from utilities.exceptions import InferenceResponseError
+from utilities.general import get_kube_timestamp
+from utilities.inference_utils import Inference
+from utilities.infra import get_pods_by_isvc_label
+
+LOGGER = get_logger(name=__name__)
+
+# Cold start phases, in order; each is measured in seconds from the scale-up trigger
+COLD_START_PHASES: tuple[str, ...] = (
+    "pod_created",
+    "pod_scheduled",
+    "image_pulled",
+    "storage_initialized",
+    "container_ready",
+    "route_ready",
+)
+COLD_START_TRIGGER_ANNOTATION: str = "opendatahub.io/cold-start-trial"
+
+
+def get_pod_cold_start_timestamps(client: DynamicClient, pod: Pod) -> dict[str, float | None]:
+    """
+    Get the cold start phases timestamps of a pod, from its conditions, init container status and events.
+
+    Kubernetes timestamps have a one-second resolution.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        pod (Pod): Predictor pod.
+
+    Returns:
+        dict[str, float | None]: Phase (`pod_created`, `pod_scheduled`, `image_pulled`, `storage_initialized`
+            and `container_ready`) to epoch seconds, None if the phase was not reached or not reported.
+
+    """
+    pod_instance = pod.instance
+    conditions = {condition.type: condition for condition in pod_instance.status.get("conditions") or []}
+    storage_initialized = None
+    for container_status in pod_instance.status.get("initContainerStatuses") or []:
+        if container_status.name == Containers.STORAGE_INITIALIZER_CONTAINER_NAME and container_status.state.terminated:
+            storage_initialized = get_kube_timestamp(timestamp=container_status.state.terminated.finishedAt)
+
+    image_pulled_timestamps = [
+        get_kube_timestamp(timestamp=event["object"].lastTimestamp or event["object"].eventTime)
+        for event in Event.get(
+            client=client,
+            namespace=pod.namespace,
+            field_selector=f"involvedObject.name={pod.name},reason=Pulled",
+            timeout=5,
+        )
+        if Containers.KSERVE_CONTAINER_NAME in (event["object"].involvedObject.fieldPath or "")
+    ]
+
+    return {
+        "pod_created": get_kube_timestamp(timestamp=pod_instance.metadata.creationTimestamp),
+        "pod_scheduled": get_kube_timestamp(
+            timestamp=conditions["PodScheduled"].lastTransitionTime if "PodScheduled" in conditions else None
+        ),
+        "image_pulled": max([timestamp for timestamp in image_pulled_timestamps if timestamp], default=None),
+        "storage_initialized": storage_initialized,
+        "container_ready": get_kube_timestamp(
+            timestamp=conditions["ContainersReady"].lastTransitionTime if "ContainersReady" in conditions else None
+        ),
+    }
+
+
+def wait_for_first_inference(
+    isvc: InferenceService, inference_config: dict[str, Any], wait_timeout: int = Timeout.TIMEOUT_10MIN
+) -> float:
+    """
+    Send inference requests until the first successful response.
+
+    Args:
+        isvc (InferenceService): InferenceService object.
+        inference_config (dict[str, Any]): Inference config, e.g. `ONNX_INFERENCE_CONFIG`.
+        wait_timeout (int): Timeout in seconds.
+
+    Returns:
+        float: Epoch seconds of the first successful response.
+
+    Raises:
+        TimeoutExpiredError: If no inference succeeds within the timeout.
+
+    """
+    for _ in TimeoutSampler(
+        wait_timeout=wait_timeout,
+        sleep=1,
+        exceptions_dict={InferenceResponseError: [], ValueError: [], AssertionError: []},
+        func=verify_inference_response,
+        inference_service=isvc,
+        inference_config=inference_config,
+        inference_type=Inference.INFER,
+        protocol=Protocols.HTTPS,
+        use_default_query=True,
+    ):
+        break
+
+    return time.time()
+
+
+def wait_for_no_inference_pods(client: DynamicClient, isvc: InferenceService) -> None:
+    """
+    Wait for the InferenceService to be scaled to zero.
+
+    Raises:
+        AssertionError: If inference pods still exist after 10 minutes.
+
+    """
+    assert verify_no_inference_pods(client=client, isvc=isvc, wait_timeout=Timeout.TIMEOUT_10MIN), (
+        f"{isvc.name} was not scaled to zero"
+    )
+
+
+def prepare_scale_to_zero(client: DynamicClient, isvc: InferenceService, trial: int) -> None:
+    """
+    Wait for a min-replicas 0 Serverless InferenceService to scale to zero, after the previous trial traffic stops.
+    """
+    wait_for_no_inference_pods(client=client, isvc=isvc)
+
+
+def prepare_zero_initial_scale(client: DynamicClient, isvc: InferenceService, trial: int) -> None:
+    """
+    Roll out a new revision of a min-replicas 0 Serverless InferenceService, which starts with zero replicas,
+    and wait for the previous revision to scale to zero.
+    """
+    ResourceEditor(
+        patches={isvc: {"spec": {"predictor": {"annotations": {COLD_START_TRIGGER_ANNOTATION: str(trial)}}}}}
+    ).update()
+    isvc.wait_for_condition(
+        condition=isvc.Condition.READY, status=isvc.Condition.Status.TRUE, timeout=Timeout.TIMEOUT_5MIN
+    )
+    wait_for_no_inference_pods(client=client, isvc=isvc)
+
+
+def prepare_stop(client: DynamicClient, isvc: InferenceService, trial: int) -> None:
+    """
+    Stop the InferenceService (`serving.kserve.io/stop` annotation) and wait for its pods to be deleted.
+    """
+    ResourceEditor(
+        patches={isvc: {"metadata": {"annotations": {Annotations.KserveIo.FORCE_STOP_RUNTIME: "true"}}}}
+    ).update()
+    wait_for_no_inference_pods(client=client, isvc=isvc)
+
+
+def trigger_resume(isvc: InferenceService) -> None:
+    ResourceEditor(
+        patches={isvc: {"metadata": {"annotations": {Annotations.KserveIo.FORCE_STOP_RUNTIME: "false"}}}}
+    ).update()
+
+
+def measure_cold_start(
+    client: DynamicClient,
+    isvc: InferenceService,
+    inference_config: dict[str, Any],
+    trigger: Callable[..., None] | None = None,
+) -> dict[str, float | None]:
+    """
+    Measure a cold start, from the scale-up trigger (or the first request, if there is no trigger)
+    to the first successful response.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): Scaled to zero InferenceService.
+        inference_config (dict[str, Any]): Inference config.
+        trigger (Callable[..., None] | None): Scale-up trigger, e.g. `trigger_resume`, called with the InferenceService.
+
+    Returns:
+        dict[str, float | None]: Phase (`COLD_START_PHASES`) to seconds from the trigger, None if not reported.
+
+    """
+    trigger_time = time.time()
+    if trigger:
+        trigger(isvc=isvc)
+
+    route_ready = wait_for_first_inference(isvc=isvc, inference_config=inference_config)
+
+    timestamps: dict[str, float | None] = dict.fromkeys(COLD_START_PHASES[:-1])
+    try:
+        pods = get_pods_by_isvc_label(client=client, isvc=isvc)
+    except ResourceNotFoundError:
+        LOGGER.warning(f"{isvc.name} has no pods after the first successful inference")
+        pods = []
+
+    # Kubernetes timestamps are truncated to seconds
+    if new_pods := [
+        pod
+        for pod in pods
+        if (get_kube_timestamp(timestamp=pod.instance.metadata.creationTimestamp) or 0) >= int(trigger_time)
+    ]:
+        first_pod = min(new_pods, key=lambda pod: pod.instance.metadata.creationTimestamp)
+        timestamps = get_pod_cold_start_timestamps(client=client, pod=first_pod)
+
+    timestamps["route_ready"] = route_ready
+    return {
+        phase: round(timestamp - trigger_time, 3) if timestamp is not None else None
+        for phase, timestamp in timestamps.items()
+    }
+
+
+def run_cold_start_trials(
+    client: DynamicClient,
+    isvc: InferenceService,
+    inference_config: dict[str, Any],
+    report: BenchmarkReport,
+    case: str,
+    trials: int,
+    prepare: Callable[..., None],
+    trigger: Callable[..., None] | None = None,
+) -> None:
+    """
+    Repeatedly scale the InferenceService to zero and measure its cold start.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): InferenceService object.
+        inference_config (dict[str, Any]): Inference config.
+        report (BenchmarkReport): Report to add a row per trial to.
+        case (str): Benchmark case, e.g. `serverless-scale-to-zero`.
+        trials (int): Number of trials.
+        prepare (Callable[..., None]): Scales the InferenceService to zero, called with the client,
+            InferenceService and trial number, e.g. `prepare_stop`.
+        trigger (Callable[..., None] | None): Scale-up trigger; if None, the first request triggers the scale-up.
+
+    """
+    for trial in range(1, trials + 1):
+        prepare(client=client, isvc=isvc, trial=trial)
+        phases = measure_cold_start(client=client, isvc=isvc, inference_config=inference_config, trigger=trigger)
+        LOGGER.info(f"{case} cold start trial {trial}/{trials}: {phases}")
+        report.add_result(case=case, trial=trial, **{f"{phase}_seconds": value for phase, value in phases.items()})
+
+
+def write_cold_start_summary(report: BenchmarkReport) -> None:
+    """
+    Write the cold start phases percentiles of each case, from the per-trial report, as `cold-start-summary` report.
+
+    Args:
+        report (BenchmarkReport): Per-trial cold start report.
+
+    """
+    summary_report = BenchmarkReport(
+        name="cold-start-summary", results_dir=report.results_dir, metadata=report.metadata
+    )
+    for case in dict.fromkeys(result["case"] for result in report.results):
+        case_results = [result for result in report.results if result["case"] == case]
+        for phase in COLD_START_PHASES:
+            if durations := [
+                result[f"{phase}_seconds"] for result in case_results if result[f"{phase}_seconds"] is not None
+            ]:
+                summary_report.add_result(
+                    case=case, phase=phase, trials=len(durations), **summarize_durations(durations=durations)
+                )
+
+    summary_report.write()
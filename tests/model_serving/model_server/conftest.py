@@ -45,21 +45,13 @@ LOGGER = get_logger(name=__name__)
 def models_endpoint_s3_secret(
     unprivileged_client: DynamicClient,
     unprivileged_model_namespace: Namespace,
-    aws_access_key_id: str,
-    aws_secret_access_key: str,
-    models_s3_bucket_name: str,
-    models_s3_bucket_region: str,
-    models_s3_bucket_endpoint: str,
+    models_s3_endpoint_config: dict[str, str],
 ) -> Generator[Secret, Any, Any]:
     with s3_endpoint_secret(
         client=unprivileged_client,
         name="models-bucket-secret",
         namespace=unprivileged_model_namespace.name,
-        aws_access_key=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        aws_s3_region=models_s3_bucket_region,
-        aws_s3_bucket=models_s3_bucket_name,
-        aws_s3_endpoint=models_s3_bucket_endpoint,
+        **models_s3_endpoint_config,
     ) as secret:
         yield secret
 
@@ -385,6 +377,10 @@ def ovms_raw_inference_service(
         deployment_mode=KServeDeploymentType.RAW_DEPLOYMENT,
         model_version=request.param["model-version"],
         stop_resume=request.param.get("stop", False),
+        min_replicas=request.param.get("min-replicas"),
+        max_replicas=request.param.get("max-replicas"),
+        scale_metric=request.param.get("scale-metric"),
+        scale_target=request.param.get("scale-target"),
     ) as isvc:
         yield isvc
 
@@ -540,21 +536,13 @@ def unprivileged_s3_caikit_serving_runtime(
 def unprivileged_models_endpoint_s3_secret(
     unprivileged_client: DynamicClient,
     unprivileged_model_namespace: Namespace,
-    aws_access_key_id: str,
-    aws_secret_access_key: str,
-    models_s3_bucket_name: str,
-    models_s3_bucket_region: str,
-    models_s3_bucket_endpoint: str,
+    models_s3_endpoint_config: dict[str, str],
 ) -> Generator[Secret, Any, Any]:
     with s3_endpoint_secret(
         client=unprivileged_client,
         name="models-bucket-secret",
         namespace=unprivileged_model_namespace.name,
-        aws_access_key=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        aws_s3_region=models_s3_bucket_region,
-        aws_s3_bucket=models_s3_bucket_name,
-        aws_s3_endpoint=models_s3_bucket_endpoint,
+        **models_s3_endpoint_config,
     ) as secret:
         yield secret
 
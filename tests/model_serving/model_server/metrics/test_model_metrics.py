@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from tests.model_serving.model_server.utils import (
@@ -14,7 +16,7 @@ from utilities.constants import (
 )
 from utilities.inference_utils import Inference
 from utilities.manifests.caikit_tgis import CAIKIT_TGIS_INFERENCE_CONFIG
-from utilities.monitoring import get_metrics_value, validate_metrics_field
+from utilities.monitoring import get_metrics_value, validate_metrics_field, validate_metrics_series
 
 pytestmark = [
     pytest.mark.serverless,
@@ -84,6 +86,29 @@ class TestModelMetrics:
             expected_value=str(total_runs + 1),
         )
 
+    @pytest.mark.polarion("ODS-2555")
+    def test_model_metrics_num_total_requests_series(self, s3_models_inference_service, prometheus):
+        """Verify the total model requests counter increases by at least the number of requests sent by this test"""
+        total_runs = 3
+        start_time = time.time()
+
+        run_inference_multiple_times(
+            isvc=s3_models_inference_service,
+            inference_config=CAIKIT_TGIS_INFERENCE_CONFIG,
+            inference_type=Inference.ALL_TOKENS,
+            protocol=Protocols.HTTPS,
+            model_name=ModelFormat.CAIKIT,
+            iterations=total_runs,
+            run_in_parallel=True,
+        )
+        validate_metrics_series(
+            prometheus=prometheus,
+            metrics_query=f"tgi_request_count{{namespace='{s3_models_inference_service.namespace}'}}",
+            start=start_time,
+            min_value=0,
+            min_increase=total_runs,
+        )
+
     @pytest.mark.smoke
     @pytest.mark.polarion("ODS-2555")
     def test_model_metrics_cpu_utilization(self, s3_models_inference_service, prometheus):
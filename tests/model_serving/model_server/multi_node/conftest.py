@@ -44,22 +44,18 @@ def models_bucket_downloaded_model_data(
     request: FixtureRequest,
     admin_client: DynamicClient,
     unprivileged_model_namespace: Namespace,
-    models_s3_bucket_name: str,
     model_pvc: PersistentVolumeClaim,
-    aws_secret_access_key: str,
-    aws_access_key_id: str,
-    models_s3_bucket_endpoint: str,
-    models_s3_bucket_region: str,
+    models_s3_endpoint_config: dict[str, str],
 ) -> str:
     return download_model_data(
         client=admin_client,
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
+        aws_access_key_id=models_s3_endpoint_config["aws_access_key"],
+        aws_secret_access_key=models_s3_endpoint_config["aws_secret_access_key"],
         model_namespace=unprivileged_model_namespace.name,
         model_pvc_name=model_pvc.name,
-        bucket_name=models_s3_bucket_name,
-        aws_endpoint_url=models_s3_bucket_endpoint,
-        aws_default_region=models_s3_bucket_region,
+        bucket_name=models_s3_endpoint_config["aws_s3_bucket"],
+        aws_endpoint_url=models_s3_endpoint_config["aws_s3_endpoint"],
+        aws_default_region=models_s3_endpoint_config["aws_s3_region"],
         model_path=request.param["model-dir"],
     )
 
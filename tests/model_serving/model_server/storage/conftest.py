@@ -0,0 +1,26 @@
+from typing import Any, Generator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.namespace import Namespace
+from ocp_resources.secret import Secret
+from ocp_resources.service import Service
+
+from utilities.minio import create_minio_data_connection_secret
+
+
+@pytest.fixture(scope="class")
+def unprivileged_minio_data_connection(
+    request: FixtureRequest,
+    unprivileged_client: DynamicClient,
+    unprivileged_model_namespace: Namespace,
+    minio_service: Service,
+) -> Generator[Secret, Any, Any]:
+    with create_minio_data_connection_secret(
+        minio_service=minio_service,
+        model_namespace=unprivileged_model_namespace.name,
+        aws_s3_bucket=request.param["bucket"],
+        client=unprivileged_client,
+    ) as secret:
+        yield secret
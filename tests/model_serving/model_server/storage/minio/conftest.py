@@ -6,13 +6,11 @@ from kubernetes.dynamic import DynamicClient
 from ocp_resources.inference_service import InferenceService
 from ocp_resources.namespace import Namespace
 from ocp_resources.secret import Secret
-from ocp_resources.service import Service
 from ocp_resources.service_account import ServiceAccount
 from ocp_resources.serving_runtime import ServingRuntime
 
 from utilities.constants import KServeDeploymentType
 from utilities.inference_utils import create_isvc
-from utilities.minio import create_minio_data_connection_secret
 
 
 @pytest.fixture(scope="class")
@@ -73,19 +71,3 @@ def model_mesh_ovms_minio_inference_service(
         model_version=request.param["model-version"],
     ) as isvc:
         yield isvc
-
-
-@pytest.fixture(scope="class")
-def unprivileged_minio_data_connection(
-    request: FixtureRequest,
-    unprivileged_client: DynamicClient,
-    unprivileged_model_namespace: Namespace,
-    minio_service: Service,
-) -> Generator[Secret, Any, Any]:
-    with create_minio_data_connection_secret(
-        minio_service=minio_service,
-        model_namespace=unprivileged_model_namespace.name,
-        aws_s3_bucket=request.param["bucket"],
-        client=unprivileged_client,
-    ) as secret:
-        yield secret
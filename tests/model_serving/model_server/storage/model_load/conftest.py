@@ -0,0 +1,104 @@
+import time
+from typing import Any, Generator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.inference_service import InferenceService
+from ocp_resources.namespace import Namespace
+from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
+from ocp_resources.serving_runtime import ServingRuntime
+
+from tests.model_serving.model_server.storage.model_load.utils import compare_storage_backends
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.constants import KServeDeploymentType
+from utilities.general import download_model_data
+from utilities.inference_utils import create_isvc
+
+
+@pytest.fixture(scope="session")
+def model_load_trials(pytestconfig: pytest.Config) -> int:
+    return pytestconfig.option.model_load_trials
+
+
+@pytest.fixture(scope="session")
+def model_load_benchmark_report(
+    benchmark_results_dir: str, model_load_trials: int
+) -> Generator[BenchmarkReport, Any, Any]:
+    report = BenchmarkReport(
+        name="model-load",
+        results_dir=benchmark_results_dir,
+        metadata={"trials": model_load_trials},
+    )
+    yield report
+    report.metadata["comparisons"] = compare_storage_backends(report=report)
+    report.write()
+
+
+@pytest.fixture(scope="class")
+def pvc_model_storage_uri(
+    request: FixtureRequest,
+    admin_client: DynamicClient,
+    unprivileged_model_namespace: Namespace,
+    model_pvc: PersistentVolumeClaim,
+    aws_secret_access_key: str,
+    aws_access_key_id: str,
+    ci_s3_bucket_name: str,
+    ci_s3_bucket_endpoint: str,
+    ci_s3_bucket_region: str,
+    model_load_benchmark_report: BenchmarkReport,
+) -> str:
+    start_time = time.perf_counter()
+    model_path = download_model_data(
+        client=admin_client,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        model_namespace=unprivileged_model_namespace.name,
+        model_pvc_name=model_pvc.name,
+        bucket_name=ci_s3_bucket_name,
+        aws_endpoint_url=ci_s3_bucket_endpoint,
+        aws_default_region=ci_s3_bucket_region,
+        model_path=request.param["model-dir"],
+        use_sub_path=True,
+    )
+    # Staging the model into the PVC is paid once, before the InferenceService is created
+    model_load_benchmark_report.metadata.setdefault("pvc_staging_seconds", {})[request.param["model-dir"]] = round(
+        time.perf_counter() - start_time, 3
+    )
+    return f"pvc://{model_pvc.name}/{model_path}"
+
+
+@pytest.fixture(scope="class")
+def model_load_inference_service(
+    request: FixtureRequest,
+    unprivileged_client: DynamicClient,
+    unprivileged_model_namespace: Namespace,
+    serving_runtime_from_template: ServingRuntime,
+) -> Generator[InferenceService, Any, Any]:
+    isvc_kwargs = {
+        "client": unprivileged_client,
+        "name": request.param["name"],
+        "namespace": unprivileged_model_namespace.name,
+        "runtime": serving_runtime_from_template.name,
+        "model_format": serving_runtime_from_template.instance.spec.supportedModelFormats[0].name,
+        "deployment_mode": request.param.get("deployment-mode", KServeDeploymentType.RAW_DEPLOYMENT),
+        # Model load is measured from the predictor pods, which may restart until the modelcar image is pulled
+        "wait_for_predictor_pods": False,
+    }
+
+    # Storage secret (`storage_key`) and storage URI fixtures depend on the storage backend
+    if storage_key_fixture_name := request.param.get("storage-key-fixture-name"):
+        isvc_kwargs["storage_key"] = request.getfixturevalue(argname=storage_key_fixture_name).name
+        isvc_kwargs["storage_path"] = request.param["model-dir"]
+
+    elif storage_uri_fixture_name := request.param.get("storage-uri-fixture-name"):
+        isvc_kwargs["storage_uri"] = request.getfixturevalue(argname=storage_uri_fixture_name)
+
+    else:
+        isvc_kwargs["storage_uri"] = request.param["storage-uri"]
+
+    if model_version := request.param.get("model-version"):
+        isvc_kwargs["model_version"] = model_version
+
+    with create_isvc(**isvc_kwargs) as isvc:
+        yield isvc
@@ -0,0 +1,150 @@
+import pytest
+
+from tests.model_serving.model_server.storage.constants import KSERVE_OVMS_SERVING_RUNTIME_PARAMS
+from tests.model_serving.model_server.storage.minio.constants import (
+    MINIO_DATA_CONNECTION_CONFIG,
+    MINIO_INFERENCE_CONFIG,
+)
+from tests.model_serving.model_server.storage.model_load.utils import run_model_load_trials
+from utilities.constants import MinIo, ModelAndFormat, ModelCarImage, RuntimeTemplates
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.rawdeployment, pytest.mark.usefixtures("valid_aws_config")]
+
+CI_BUCKET_MODEL_DIR: str = "test-dir"
+
+
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, serving_runtime_from_template, model_load_inference_service",
+    [
+        pytest.param(
+            {"name": "model-load-s3"},
+            KSERVE_OVMS_SERVING_RUNTIME_PARAMS,
+            {
+                "name": "model-load-s3",
+                "storage-key-fixture-name": "ci_endpoint_s3_secret",
+                "model-dir": CI_BUCKET_MODEL_DIR,
+            },
+        )
+    ],
+    indirect=True,
+)
+class TestS3ModelLoadBenchmark:
+    """
+    Measures the storage initializer download from S3 and the model server load of a RawDeployment model.
+    """
+
+    def test_s3_model_load(
+        self, unprivileged_client, model_load_inference_service, model_load_trials, model_load_benchmark_report
+    ):
+        run_model_load_trials(
+            client=unprivileged_client,
+            isvc=model_load_inference_service,
+            report=model_load_benchmark_report,
+            backend="s3",
+            trials=model_load_trials,
+        )
+
+
+@pytest.mark.minio
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, minio_pod, unprivileged_minio_data_connection, serving_runtime_from_template, "
+    "model_load_inference_service",
+    [
+        pytest.param(
+            {"name": "model-load-minio"},
+            MinIo.PodConfig.KSERVE_MINIO_CONFIG,
+            MINIO_DATA_CONNECTION_CONFIG,
+            {
+                "name": "model-load-minio-ovms",
+                "template-name": RuntimeTemplates.OVMS_KSERVE,
+                "multi-model": False,
+                "supported-model-formats": [{"name": ModelAndFormat.OPENVINO_IR, "version": "1"}],
+            },
+            {
+                "name": "model-load-minio",
+                "storage-key-fixture-name": "unprivileged_minio_data_connection",
+                "model-dir": MINIO_INFERENCE_CONFIG["model-dir"],
+                "model-version": MINIO_INFERENCE_CONFIG["model-version"],
+            },
+        )
+    ],
+    indirect=True,
+)
+@pytest.mark.usefixtures("minio_pod", "unprivileged_minio_data_connection")
+class TestMinioModelLoadBenchmark:
+    """
+    Measures the storage initializer download from an in-cluster MinIO and the model server load
+    of a RawDeployment model.
+    """
+
+    def test_minio_model_load(
+        self, unprivileged_client, model_load_inference_service, model_load_trials, model_load_benchmark_report
+    ):
+        run_model_load_trials(
+            client=unprivileged_client,
+            isvc=model_load_inference_service,
+            report=model_load_benchmark_report,
+            backend="minio",
+            trials=model_load_trials,
+        )
+
+
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, model_pvc, pvc_model_storage_uri, serving_runtime_from_template, "
+    "model_load_inference_service",
+    [
+        pytest.param(
+            {"name": "model-load-pvc"},
+            {"access-modes": "ReadWriteOnce", "pvc-size": "4Gi"},
+            {"model-dir": CI_BUCKET_MODEL_DIR},
+            KSERVE_OVMS_SERVING_RUNTIME_PARAMS,
+            {"name": "model-load-pvc", "storage-uri-fixture-name": "pvc_model_storage_uri"},
+        )
+    ],
+    indirect=True,
+)
+@pytest.mark.usefixtures("pvc_model_storage_uri")
+class TestPVCModelLoadBenchmark:
+    """
+    Measures the model server load of a RawDeployment model mounted from a PVC (no storage initializer);
+    the model staging time into the PVC is added to the report metadata.
+    """
+
+    def test_pvc_model_load(
+        self, unprivileged_client, model_load_inference_service, model_load_trials, model_load_benchmark_report
+    ):
+        run_model_load_trials(
+            client=unprivileged_client,
+            isvc=model_load_inference_service,
+            report=model_load_benchmark_report,
+            backend="pvc",
+            trials=model_load_trials,
+        )
+
+
+@pytest.mark.parametrize(
+    "unprivileged_model_namespace, serving_runtime_from_template, model_load_inference_service",
+    [
+        pytest.param(
+            {"name": "model-load-oci"},
+            KSERVE_OVMS_SERVING_RUNTIME_PARAMS,
+            {"name": "model-load-oci", "storage-uri": ModelCarImage.MNIST_8_1},
+        )
+    ],
+    indirect=True,
+)
+class TestOCIModelCarLoadBenchmark:
+    """
+    Measures the modelcar image pull and the model server load of a RawDeployment model from an OCI image.
+    """
+
+    def test_oci_model_car_load(
+        self, unprivileged_client, model_load_inference_service, model_load_trials, model_load_benchmark_report
+    ):
+        run_model_load_trials(
+            client=unprivileged_client,
+            isvc=model_load_inference_service,
+            report=model_load_benchmark_report,
+            backend="oci-modelcar",
+            trials=model_load_trials,
+        )
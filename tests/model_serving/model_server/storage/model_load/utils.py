@@ -0,0 +1,212 @@
+import shlex
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from ocp_resources.inference_service import InferenceService
+from ocp_resources.pod import ExecOnPodError, Pod
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+
+from utilities.benchmark_utils import BenchmarkReport
+from utilities.constants import Containers, Timeout
+from utilities.general import get_kube_timestamp
+from utilities.infra import get_pods_by_isvc_label
+
+LOGGER = get_logger(name=__name__)
+
+# Init containers fetching the model before the model server starts; modelcar images are pulled by `modelcar-init`
+MODEL_FETCH_INIT_CONTAINER_NAMES: tuple[str, ...] = (Containers.STORAGE_INITIALIZER_CONTAINER_NAME, "modelcar-init")
+# `-L` follows the modelcar `/mnt/models` symlink to the model image filesystem
+MODEL_SIZE_COMMAND: list[str] = shlex.split("du -sbL /mnt/models/")
+MODEL_LOAD_METRICS: tuple[str, ...] = ("storage_initializer_seconds", "model_server_load_seconds", "total_seconds")
+
+
+def get_model_size_bytes(pod: Pod) -> int | None:
+    """
+    Get the size of the model files mounted in the model server container.
+
+    Args:
+        pod (Pod): Predictor pod.
+
+    Returns:
+        int | None: Model size in bytes, None if the container image has no `du`.
+
+    """
+    try:
+        return int(pod.execute(command=MODEL_SIZE_COMMAND, container=Containers.KSERVE_CONTAINER_NAME).split()[0])
+
+    except (ExecOnPodError, ValueError, IndexError) as exc:
+        LOGGER.warning(f"Failed to get {pod.name} model size: {exc}")
+        return None
+
+
+def get_pod_model_load_timestamps(pod: Pod) -> dict[str, float | None]:
+    """
+    Get the model fetch and load timestamps of a predictor pod, from its containers statuses and conditions.
+
+    Kubernetes timestamps have a one-second resolution.
+
+    Args:
+        pod (Pod): Predictor pod.
+
+    Returns:
+        dict[str, float | None]: `pod_created`, `storage_initializer_started`, `storage_initializer_finished`,
+            `model_server_started` and `model_server_ready` epoch seconds, None if not reported.
+
+    """
+    pod_status = pod.instance.status
+    timestamps: dict[str, float | None] = {
+        "pod_created": get_kube_timestamp(timestamp=pod.instance.metadata.creationTimestamp),
+        "storage_initializer_started": None,
+        "storage_initializer_finished": None,
+        "model_server_started": None,
+        "model_server_ready": None,
+    }
+    for container_status in pod_status.get("initContainerStatuses") or []:
+        if container_status.name in MODEL_FETCH_INIT_CONTAINER_NAMES and (
+            terminated := container_status.state.terminated
+        ):
+            timestamps["storage_initializer_started"] = get_kube_timestamp(timestamp=terminated.startedAt)
+            timestamps["storage_initializer_finished"] = get_kube_timestamp(timestamp=terminated.finishedAt)
+
+    for container_status in pod_status.get("containerStatuses") or []:
+        if container_status.name == Containers.KSERVE_CONTAINER_NAME and (running := container_status.state.running):
+            timestamps["model_server_started"] = get_kube_timestamp(timestamp=running.startedAt)
+
+    for condition in pod_status.get("conditions") or []:
+        if condition.type == "ContainersReady" and condition.status == pod.Condition.Status.TRUE:
+            timestamps["model_server_ready"] = get_kube_timestamp(timestamp=condition.lastTransitionTime)
+
+    return timestamps
+
+
+def get_duration(start: float | None, end: float | None) -> float | None:
+    return round(end - start, 3) if start is not None and end is not None else None
+
+
+def get_ready_predictor_pod(
+    client: DynamicClient, isvc: InferenceService, previous_pod_name: str | None = None
+) -> Pod | None:
+    try:
+        pods = get_pods_by_isvc_label(client=client, isvc=isvc)
+    except ResourceNotFoundError:
+        return None
+
+    for pod in pods:
+        if pod.name != previous_pod_name and get_pod_model_load_timestamps(pod=pod)["model_server_ready"]:
+            return pod
+
+    return None
+
+
+def wait_for_ready_predictor_pod(
+    client: DynamicClient, isvc: InferenceService, previous_pod_name: str | None = None
+) -> Pod:
+    """
+    Wait for a ready predictor pod, other than a previous (deleted) pod.
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): InferenceService object.
+        previous_pod_name (str | None): Name of a pod to ignore.
+
+    Returns:
+        Pod: Ready predictor pod.
+
+    Raises:
+        TimeoutExpiredError: If no pod is ready within 15 minutes.
+
+    """
+    for pod in TimeoutSampler(
+        wait_timeout=Timeout.TIMEOUT_15MIN,
+        sleep=5,
+        func=get_ready_predictor_pod,
+        client=client,
+        isvc=isvc,
+        previous_pod_name=previous_pod_name,
+    ):
+        if pod:
+            return pod
+
+    raise TimeoutExpiredError(value=f"{isvc.name} has no ready predictor pod")
+
+
+def run_model_load_trials(
+    client: DynamicClient,
+    isvc: InferenceService,
+    report: BenchmarkReport,
+    backend: str,
+    trials: int,
+) -> None:
+    """
+    Measure the model fetch and load of the InferenceService predictor pod, deleting the pod between trials
+    so that each trial fetches the model from the storage backend again.
+
+    Adds a row per trial to the report, with the model size, storage initializer (or modelcar image pull) duration,
+    effective throughput and model server load time (container start to ready).
+
+    Args:
+        client (DynamicClient): DynamicClient object.
+        isvc (InferenceService): InferenceService object.
+        report (BenchmarkReport): Report to add the results to.
+        backend (str): Storage backend, e.g. `s3`.
+        trials (int): Number of trials.
+
+    """
+    pod = wait_for_ready_predictor_pod(client=client, isvc=isvc)
+    for trial in range(1, trials + 1):
+        if trial > 1:
+            previous_pod_name = pod.name
+            pod.delete(wait=True)
+            pod = wait_for_ready_predictor_pod(client=client, isvc=isvc, previous_pod_name=previous_pod_name)
+
+        timestamps = get_pod_model_load_timestamps(pod=pod)
+        model_bytes = get_model_size_bytes(pod=pod)
+        storage_initializer_seconds = get_duration(
+            start=timestamps["storage_initializer_started"], end=timestamps["storage_initializer_finished"]
+        )
+        result = {
+            "model_bytes": model_bytes,
+            "storage_initializer_seconds": storage_initializer_seconds,
+            "throughput_mb_per_second": round(model_bytes / 1e6 / storage_initializer_seconds, 3)
+            if model_bytes and storage_initializer_seconds
+            else None,
+            "model_server_load_seconds": get_duration(
+                start=timestamps["model_server_started"], end=timestamps["model_server_ready"]
+            ),
+            "total_seconds": get_duration(start=timestamps["pod_created"], end=timestamps["model_server_ready"]),
+        }
+        LOGGER.info(f"{backend} model load trial {trial}/{trials}: {result}")
+        report.add_result(backend=backend, trial=trial, **result)
+
+
+def compare_storage_backends(report: BenchmarkReport) -> list[dict[str, Any]]:
+    """
+    Compare the storage backends model fetch and load, from the fastest to the slowest.
+
+    Args:
+        report (BenchmarkReport): Per-trial model load report.
+
+    Returns:
+        list[dict[str, Any]]: Mean model size, throughput and `MODEL_LOAD_METRICS` of each backend,
+            sorted by mean total time.
+
+    """
+    comparisons: list[dict[str, Any]] = []
+    for backend in dict.fromkeys(result["backend"] for result in report.results):
+        backend_results = [result for result in report.results if result["backend"] == backend]
+        comparison: dict[str, Any] = {"backend": backend, "trials": len(backend_results)}
+        for metric in ("model_bytes", "throughput_mb_per_second", *MODEL_LOAD_METRICS):
+            values = [result[metric] for result in backend_results if result[metric] is not None]
+            comparison[f"mean_{metric}"] = round(sum(values) / len(values), 3) if values else None
+
+        comparisons.append(comparison)
+
+    return sorted(
+        comparisons,
+        key=lambda comparison: (
+            comparison["mean_total_seconds"] is None,
+            comparison["mean_total_seconds"] or 0,
+        ),
+    )
@@ -57,11 +57,7 @@ def models_endpoint_s3_secret_scope_session(
     pytestconfig: pytest.Config,
     admin_client: DynamicClient,
     model_namespace_scope_session: Namespace,
-    aws_access_key_id: str,
-    aws_secret_access_key: str,
-    models_s3_bucket_name: str,
-    models_s3_bucket_region: str,
-    models_s3_bucket_endpoint: str,
+    models_s3_endpoint_config: dict[str, str],
     teardown_resources: bool,
 ) -> Generator[Secret, Any, Any]:
     secret_kwargs = {
@@ -79,11 +75,7 @@ def models_endpoint_s3_secret_scope_session(
     else:
         with s3_endpoint_secret(
             **secret_kwargs,
-            aws_access_key=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_s3_region=models_s3_bucket_region,
-            aws_s3_bucket=models_s3_bucket_name,
-            aws_s3_endpoint=models_s3_bucket_endpoint,
+            **models_s3_endpoint_config,
             teardown=teardown_resources,
         ) as secret:
             yield secret
@@ -0,0 +1,246 @@
+import functools
+import json
+import re
+import threading
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from kubernetes.client.rest import RESTClientObject, RESTResponse
+from simple_logger.logger import get_logger
+
+from utilities.benchmark_utils import BenchmarkReport, summarize_durations
+
+LOGGER = get_logger(name=__name__)
+
+KUBE_API_RESOURCE_PATH_REGEX: re.Pattern[str] = re.compile(
+    r"^/(api|apis/[^/]+)/[^/]+(/namespaces/[^/]+)?/(?P<resource>[^/]+)(/(?P<name>[^/]+))?(/(?P<subresource>[^/]+))?$"
+)
+HTTP_METHOD_VERBS: dict[str, str] = {
+    "POST": "create",
+    "PUT": "update",
+    "PATCH": "patch",
+    "DELETE": "delete",
+}
+API_ACCOUNTING_TOP_CALLERS: int = 10
+
+
+def get_kube_api_call_type(method: str, url: str, query_params: Any = None) -> tuple[str, str]:
+    """
+    Get the Kubernetes API verb and resource of a request.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL, without query string.
+        query_params (Any): Request query parameters, as a list of (name, value) tuples or a dict.
+
+    Returns:
+        tuple[str, str]: Verb (get, list, watch, create, update, patch, delete or discovery) and resource,
+            e.g. `pods` or `pods/status`; the resource is the request path for discovery requests.
+
+    """
+    path = urlsplit(url=url).path
+    if not (path_match := KUBE_API_RESOURCE_PATH_REGEX.match(path)):
+        return "discovery", path
+
+    resource = path_match.group("resource")
+    if subresource := path_match.group("subresource"):
+        resource = f"{resource}/{subresource}"
+
+    if verb := HTTP_METHOD_VERBS.get(method.upper()):
+        return verb, resource
+
+    if path_match.group("name"):
+        return "get", resource
+
+    query = dict(query_params or {})
+    return "watch" if str(query.get("watch", "")).lower() in ("true", "1") else "list", resource
+
+
+class KubeAPIAccounting:
+    """
+    Counts the Kubernetes API server calls, request and response bytes and latency of every client, by verb, resource,
+    test and caller (fixture setup / teardown or test phase), by wrapping the kubernetes client REST request path.
+
+    Eg:
+        api_accounting = KubeAPIAccounting()
+        api_accounting.install()
+        api_accounting.set_test(test="tests/test_x.py::test_x", phase="call")
+        ...
+        api_accounting.write_reports(results_dir="kube-api-accounting")
+    """
+
+    def __init__(self) -> None:
+        self.test = ""
+        self.phase = "session"
+        # (test, caller, verb, resource) to call durations, request bytes, response bytes and errors
+        self.calls: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+        self._callers: list[str] = []
+        self._lock = threading.Lock()
+        self._original_request: Callable[..., Any] | None = None
+
+    @property
+    def caller(self) -> str:
+        return self._callers[-1] if self._callers else self.phase
+
+    def install(self) -> None:
+        """
+        Wrap `RESTClientObject.request`, used by all kubernetes clients, to account API calls.
+        """
+        if self._original_request:
+            return
+
+        original_request = self._original_request = RESTClientObject.request
+        accounting = self
+
+        @functools.wraps(original_request)
+        def _accounted_request(rest_client: RESTClientObject, method: str, url: str, **kwargs: Any) -> Any:
+            start_time = time.perf_counter()
+            response, error = None, False
+            try:
+                response = original_request(rest_client, method, url, **kwargs)
+                return response
+
+            except Exception:
+                # API server error statuses, and connection errors or timeouts
+                error = True
+                raise
+
+            finally:
+                accounting.record(
+                    method=method,
+                    url=url,
+                    query_params=kwargs.get("query_params"),
+                    body=kwargs.get("body"),
+                    response=response,
+                    duration=time.perf_counter() - start_time,
+                    error=error,
+                )
+
+        RESTClientObject.request = _accounted_request
+
+    def uninstall(self) -> None:
+        if self._original_request:
+            RESTClientObject.request = self._original_request
+            self._original_request = None
+
+    def set_test(self, test: str, phase: str) -> None:
+        self.test, self.phase = test, phase
+
+    def push_caller(self, caller: str) -> None:
+        self._callers.append(caller)
+
+    def pop_caller(self, caller: str) -> None:
+        if caller in self._callers:
+            self._callers.reverse()
+            self._callers.remove(caller)
+            self._callers.reverse()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        query_params: Any,
+        body: Any,
+        response: Any,
+        duration: float,
+        error: bool = False,
+    ) -> None:
+        """
+        Account an API call.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            query_params (Any): Request query parameters.
+            body (Any): Request body.
+            response (Any): `RESTResponse`, or the raw response of streamed (e.g. watch) requests, whose body is not
+                read and whose `Content-Length` is counted if set; None on errors.
+            duration (float): Time until the response (headers for streamed responses) was received, in seconds.
+            error (bool): True if the API server returned an error status or the request failed.
+
+        """
+        verb, resource = get_kube_api_call_type(method=method, url=url, query_params=query_params)
+        request_bytes = 0
+        if body is not None:
+            request_bytes = len(body) if isinstance(body, (str, bytes)) else len(json.dumps(body, default=str))
+
+        response_bytes = 0
+        if isinstance(response, RESTResponse):
+            response_bytes = len(response.data) if isinstance(response.data, (str, bytes)) else 0
+
+        elif response is not None:
+            # Reading the body of a streamed response would drain it, e.g. a watch would get no events
+            response_bytes = int(getattr(response, "headers", {}).get("Content-Length") or 0)
+
+        with self._lock:
+            call = self.calls.setdefault(
+                (self.test, self.caller, verb, resource),
+                {"durations": [], "request_bytes": 0, "response_bytes": 0, "errors": 0},
+            )
+            call["durations"].append(duration)
+            call["request_bytes"] += request_bytes
+            call["response_bytes"] += response_bytes
+            call["errors"] += int(error)
+
+    def aggregate(self, key_fields: tuple[str, ...]) -> dict[tuple[str, ...], dict[str, Any]]:
+        """
+        Aggregate the accounted calls by some of `test`, `caller`, `verb` and `resource`.
+
+        Args:
+            key_fields (tuple[str, ...]): Aggregation fields.
+
+        Returns:
+            dict[tuple[str, ...], dict[str, Any]]: Aggregation key to call durations, bytes and errors,
+                sorted by number of calls, descending.
+
+        """
+        fields = ("test", "caller", "verb", "resource")
+        aggregated: dict[tuple[str, ...], dict[str, Any]] = {}
+        with self._lock:
+            for call_key, call in self.calls.items():
+                key_values = dict(zip(fields, call_key))
+                entry = aggregated.setdefault(
+                    tuple(key_values[field] for field in key_fields),
+                    {"durations": [], "request_bytes": 0, "response_bytes": 0, "errors": 0},
+                )
+                entry["durations"].extend(call["durations"])
+                for counter in ("request_bytes", "response_bytes", "errors"):
+                    entry[counter] += call[counter]
+
+        return dict(sorted(aggregated.items(), key=lambda item: len(item[1]["durations"]), reverse=True))
+
+    def write_reports(self, results_dir: str) -> None:
+        """
+        Write the per-test and per-caller (fixture setup / teardown and test phase) API calls reports,
+        and log the callers making the most API calls.
+
+        Args:
+            results_dir (str): Directory to write the reports to.
+
+        """
+        for name, key_fields in (
+            ("kube-api-calls-per-test", ("test", "verb", "resource")),
+            ("kube-api-calls-per-caller", ("caller", "verb", "resource")),
+        ):
+            report = BenchmarkReport(name=name, results_dir=results_dir)
+            for key, entry in self.aggregate(key_fields=key_fields).items():
+                report.add_result(
+                    **dict(zip(key_fields, key)),
+                    calls=len(entry["durations"]),
+                    errors=entry["errors"],
+                    request_bytes=entry["request_bytes"],
+                    response_bytes=entry["response_bytes"],
+                    total_seconds=round(sum(entry["durations"]), 3),
+                    **summarize_durations(durations=entry["durations"], prefix="latency_"),
+                )
+            report.write()
+
+        top_callers = list(self.aggregate(key_fields=("caller",)).items())[:API_ACCOUNTING_TOP_CALLERS]
+        LOGGER.info(
+            "Kubernetes API calls by top callers: "
+            + ", ".join(
+                f"{caller}: {len(entry['durations'])} calls, {sum(entry['durations']):.1f}s"
+                for (caller,), entry in top_callers
+            )
+        )
@@ -0,0 +1,148 @@
+import datetime
+import json
+import os
+import statistics
+import time
+from typing import Any, Callable
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+
+
+def calculate_percentiles(values: list[float], percentiles: tuple[int, ...] = DEFAULT_PERCENTILES) -> dict[str, float]:
+    """
+    Calculate percentiles of a list of measurements.
+
+    Args:
+        values (list[float]): Measured values.
+        percentiles (tuple[int, ...]): Percentiles to calculate, between 1 and 99.
+
+    Returns:
+        dict[str, float]: Percentile name (e.g. `p50`) to value. Values are 0 if no measurements were taken.
+
+    """
+    if len(values) < 2:
+        single_value = values[0] if values else 0.0
+        return {f"p{percentile}": single_value for percentile in percentiles}
+
+    quantiles = statistics.quantiles(values, n=100, method="inclusive")  # noqa: FCN001
+    return {f"p{percentile}": quantiles[percentile - 1] for percentile in percentiles}
+
+
+def summarize_durations(durations: list[float], prefix: str = "") -> dict[str, float]:
+    """
+    Summarize a list of durations into mean, min, max and percentiles.
+
+    Args:
+        durations (list[float]): Durations in seconds.
+        prefix (str): Prefix for the summary keys, e.g. `ttft_`.
+
+    Returns:
+        dict[str, float]: Summary of the durations, rounded to milliseconds.
+
+    """
+    summary: dict[str, float] = {
+        "mean": statistics.fmean(durations) if durations else 0.0,  # noqa: FCN001
+        "min": min(durations, default=0.0),
+        "max": max(durations, default=0.0),
+        **calculate_percentiles(values=durations),
+    }
+    return {f"{prefix}{key}": round(value, 4) for key, value in summary.items()}
+
+
+def timed_call(func: Callable[..., Any], **kwargs: Any) -> tuple[Any, float]:
+    """
+    Call a function and measure its wall-clock duration.
+
+    Args:
+        func (Callable): Function to call.
+        **kwargs: Keyword arguments passed to `func`.
+
+    Returns:
+        tuple[Any, float]: Function result and duration in seconds.
+
+    """
+    start_time = time.perf_counter()
+    result = func(**kwargs)
+    return result, time.perf_counter() - start_time
+
+
+class BenchmarkReport:
+    """
+    Collects benchmark measurements and writes them as a text table and a JSON file for regression tracking.
+    """
+
+    def __init__(self, name: str, results_dir: str, metadata: dict[str, Any] | None = None) -> None:
+        """
+        Args:
+            name (str): Benchmark name, used as the report file name.
+            results_dir (str): Directory to write the report files to.
+            metadata (dict[str, Any]): Benchmark-wide information, e.g. storage backend or model name.
+        """
+        self.name = name
+        self.results_dir = results_dir
+        self.metadata = metadata or {}
+        self.results: list[dict[str, Any]] = []
+
+    def add_result(self, **fields: Any) -> None:
+        """
+        Add a result row to the report.
+
+        Args:
+            **fields: Result columns and values.
+
+        """
+        LOGGER.info(f"Benchmark {self.name} result: {fields}")
+        self.results.append(fields)
+
+    def format_table(self) -> str:
+        """
+        Format the results as a text table.
+
+        Returns:
+            str: Results table, one row per result.
+
+        """
+        columns = list(dict.fromkeys(column for result in self.results for column in result))
+        rows = [[str(result.get(column, "")) for column in columns] for result in self.results]
+        widths = [max([len(column), *[len(row[index]) for row in rows]]) for index, column in enumerate(columns)]
+
+        lines = [
+            " | ".join(column.ljust(width) for column, width in zip(columns, widths)),
+            "-+-".join("-" * width for width in widths),
+        ]
+        lines.extend(" | ".join(value.ljust(width) for value, width in zip(row, widths)) for row in rows)
+        return "\n".join(lines)
+
+    def write(self) -> str:
+        """
+        Write the report as `<name>.json` and `<name>.txt` under the results directory.
+
+        Returns:
+            str: Path to the JSON report.
+
+        """
+        os.makedirs(self.results_dir, exist_ok=True)
+        json_report_path = os.path.join(self.results_dir, f"{self.name}.json")
+        table = self.format_table()
+
+        with open(json_report_path, "w") as report_file:
+            json.dump(
+                {
+                    "name": self.name,
+                    "created": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+                    "metadata": self.metadata,
+                    "results": self.results,
+                },
+                report_file,
+                indent=2,
+            )
+
+        with open(os.path.join(self.results_dir, f"{self.name}.txt"), "w") as table_file:
+            table_file.write(f"{table}\n")
+
+        LOGGER.info(f"Benchmark {self.name} report written to {json_report_path}:\n{table}")
+        return json_report_path
@@ -112,6 +112,13 @@ class HTTPRequest:
     # Use string formatting to set the token value when using this constant
     AUTH_HEADER: str = "-H 'Authorization: Bearer {token}'"
     CONTENT_JSON: str = "-H 'Content-Type: application/json'"
+    # Discards the response and writes the request status and per-phase timings (seconds since start) as JSON
+    CURL_TIMINGS: str = (
+        '-o /dev/null -w \'{"http_code": %{http_code}, "time_namelookup": %{time_namelookup}, '
+        '"time_connect": %{time_connect}, "time_appconnect": %{time_appconnect}, '
+        '"time_pretransfer": %{time_pretransfer}, "time_starttransfer": %{time_starttransfer}, '
+        '"time_total": %{time_total}}\''
+    )
 
 
 class AcceleratorType:
@@ -231,6 +238,7 @@ class OpenshiftRouteTimeout:
 
 class Containers:
     KSERVE_CONTAINER_NAME: str = "kserve-container"
+    STORAGE_INITIALIZER_CONTAINER_NAME: str = "storage-initializer"
 
 
 class RunTimeConfigs:
@@ -265,6 +273,10 @@ class MinIo:
         MODELMESH_EXAMPLE_MODELS: str = f"modelmesh-{EXAMPLE_MODELS}"
 
     class PodConfig:
+        MINIO_IMAGE: str = "quay.io/minio/minio@sha256:46b3009bf7041eefbd90bd0d2b38c6ddc24d20a35d609551a1802c558c1c958f"
+        MINIO_CLIENT_IMAGE: str = (
+            "quay.io/minio/mc@sha256:470f5546b596e16c7816b9c3fa7a78ce4076bb73c2c73f7faeec0c8043923123"
+        )
         KSERVE_MINIO_IMAGE: str = (
             "quay.io/jooholee/model-minio@sha256:b50aa0fbfea740debb314ece8e925b3e8e761979f345b6cd12a6833efd04e2c2"
             # noqa: E501
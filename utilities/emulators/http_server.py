@@ -0,0 +1,277 @@
+import abc
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+from typing import Any, AsyncIterator
+from urllib.parse import parse_qs, urlsplit
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+SERVER_START_TIMEOUT: int = 10
+
+
+class EmulatorRequest:
+    """
+    HTTP request received by an emulator server.
+    """
+
+    def __init__(self, method: str, target: str, headers: dict[str, str], body: bytes) -> None:
+        """
+        Args:
+            method (str): HTTP method.
+            target (str): Request target, path and query string.
+            headers (dict[str, str]): Request headers, with lower-case names.
+            body (bytes): Request body.
+        """
+        split_target = urlsplit(url=target)
+        self.method = method
+        self.path = split_target.path
+        self.query = parse_qs(qs=split_target.query)
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body or b"{}")
+
+
+class EmulatorResponse:
+    """
+    HTTP response returned by an emulator server; either a JSON body or a stream of server-sent events.
+    """
+
+    def __init__(
+        self,
+        status: int = HTTPStatus.OK,
+        body: Any = None,
+        stream: AsyncIterator[bytes] | None = None,
+        content_type: str = "application/json",
+    ) -> None:
+        """
+        Args:
+            status (int): HTTP status code.
+            body (Any): JSON-serializable body, or raw bytes.
+            stream (AsyncIterator[bytes] | None): Body chunks, sent with chunked transfer encoding.
+            content_type (str): Response content type.
+        """
+        self.status = status
+        self.body = body
+        self.stream = stream
+        self.content_type = content_type
+
+
+class EmulatorHTTPServer(abc.ABC):
+    """
+    Minimal asyncio HTTP/1.1 server, running its event loop in a background thread.
+
+    Used as a local stand-in for model servers, to exercise inference clients without a cluster.
+    Subclasses implement `handle_request`.
+
+    Eg:
+        with OpenAIEmulator(model_name="my-model") as emulator:
+            OpenAIClient(host=emulator.url, model_name="my-model").request_http(...)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 selects a free port.
+        """
+        self.host = host
+        self.port = port
+        self.requests_count: dict[str, int] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "EmulatorHTTPServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start the server event loop in a background thread and wait until the server listens.
+
+        Raises:
+            TimeoutError: If the server does not start listening in time.
+
+        """
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, kwargs={"started": started}, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        if not started.wait(timeout=SERVER_START_TIMEOUT):
+            raise TimeoutError(f"{type(self).__name__} did not start in {SERVER_START_TIMEOUT} seconds")
+
+        LOGGER.info(f"{type(self).__name__} listening on {self.url}")
+
+    def stop(self) -> None:
+        """
+        Stop the server and its event loop.
+        """
+        if not (self._loop and self._thread):
+            return
+
+        asyncio.run_coroutine_threadsafe(coro=self._shutdown(), loop=self._loop).result(timeout=SERVER_START_TIMEOUT)
+        self._loop.call_soon_threadsafe(self._loop.stop)  # noqa: FCN001
+        self._thread.join(timeout=SERVER_START_TIMEOUT)
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def _run_loop(self, started: threading.Event) -> None:
+        assert self._loop
+        asyncio.set_event_loop(loop=self._loop)
+        self._server = self._loop.run_until_complete(
+            future=asyncio.start_server(client_connected_cb=self._handle_connection, host=self.host, port=self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        started.set()
+        self._loop.run_forever()
+
+    async def _shutdown(self) -> None:
+        if self._server:
+            self._server.close()
+            # keep-alive connections are closed by cancelling their handlers, otherwise wait_closed waits for clients
+            for connection in self._connections:
+                connection.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+
+    @abc.abstractmethod
+    async def handle_request(self, request: EmulatorRequest) -> EmulatorResponse:
+        """
+        Handle a request.
+
+        Args:
+            request (EmulatorRequest): Received request.
+
+        Returns:
+            EmulatorResponse: Response to send.
+
+        """
+
+    async def _get_response(self, request: EmulatorRequest) -> EmulatorResponse:
+        """
+        Handle a request, turning handler errors into error responses instead of dropping the connection.
+
+        Invalid requests (e.g. a non-JSON body) get a 400 response, other handler errors a 500 response.
+
+        """
+        try:
+            return await self.handle_request(request=request)
+
+        except ValueError as exc:
+            LOGGER.warning(f"{type(self).__name__}: invalid {request.method} {request.path} request: {exc}")
+            return EmulatorResponse(status=HTTPStatus.BAD_REQUEST, body={"error": str(exc)})
+
+        except Exception as exc:
+            LOGGER.exception(f"{type(self).__name__}: failed to handle {request.method} {request.path} request")
+            return EmulatorResponse(status=HTTPStatus.INTERNAL_SERVER_ERROR, body={"error": str(exc)})
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        assert connection
+        self._connections.add(connection)
+        try:
+            while request_line := await reader.readline():
+                # Empty lines before a request line are ignored, like RFC 9112 recommends
+                if not request_line.strip():
+                    continue
+
+                try:
+                    request = await self._read_request(reader=reader, request_line=request_line)
+
+                except ValueError as exc:
+                    # The end of a malformed request is unknown, the connection cannot be reused
+                    LOGGER.warning(f"{type(self).__name__}: malformed request {request_line!r}: {exc}")
+                    await self._write_response(
+                        writer=writer,
+                        response=EmulatorResponse(
+                            status=HTTPStatus.BAD_REQUEST, body={"error": f"Malformed request: {exc}"}
+                        ),
+                    )
+                    break
+
+                self.requests_count[request.path] = self.requests_count.get(request.path, 0) + 1
+                await self._write_response(writer=writer, response=await self._get_response(request=request))
+
+                if request.headers.get("connection", "").lower() == "close":
+                    break
+
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader, request_line: bytes) -> EmulatorRequest:
+        """
+        Read a request headers and body, after its request line.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader.
+            request_line (bytes): Request line, e.g. `GET /v1/models HTTP/1.1`.
+
+        Returns:
+            EmulatorRequest: Received request.
+
+        Raises:
+            ValueError: If the request line, a header or the content length is malformed.
+
+        """
+        method, target, version = request_line.decode().split()
+        if not version.startswith("HTTP/"):
+            raise ValueError(f"Invalid HTTP version {version}")
+
+        headers: dict[str, str] = {}
+        while (header_line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, separator, value = header_line.decode().partition(":")
+            if not separator:
+                raise ValueError(f"Invalid header {header_line!r}")
+
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = int(headers.get("content-length", 0))
+        if content_length < 0:
+            raise ValueError(f"Invalid content length {content_length}")
+
+        return EmulatorRequest(
+            method=method, target=target, headers=headers, body=await reader.readexactly(n=content_length)
+        )
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, response: EmulatorResponse) -> None:
+        status_line = f"HTTP/1.1 {response.status} {HTTPStatus(value=response.status).phrase}\r\n"
+        if response.stream:
+            writer.write(
+                f"{status_line}Content-Type: {response.content_type}\r\nTransfer-Encoding: chunked\r\n\r\n".encode()
+            )
+            async for chunk in response.stream:
+                writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                await writer.drain()
+
+            writer.write(b"0\r\n\r\n")
+
+        else:
+            body = response.body if isinstance(response.body, bytes) else json.dumps(response.body).encode()
+            writer.write(
+                f"{status_line}Content-Type: {response.content_type}\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+
+        await writer.drain()
@@ -0,0 +1,370 @@
+import asyncio
+import random
+import re
+import struct
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable
+
+import grpc
+
+from utilities.emulators.http_server import EmulatorHTTPServer, EmulatorRequest, EmulatorResponse
+from utilities.plugins.kserve_v2_grpc import grpc_predict_v2_pb2, grpc_predict_v2_pb2_grpc
+
+ModelCallable = Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+
+V2_MODEL_PATH_REGEX: re.Pattern[str] = re.compile(
+    r"^/v2/models/(?P<name>[^/]+)(/versions/(?P<version>[^/]+))?(?P<action>/infer|/ready)?$"
+)
+# V2 datatype to InferTensorContents field and struct format of raw contents
+V2_DATATYPES: dict[str, tuple[str, str]] = {
+    "BOOL": ("bool_contents", "?"),
+    "INT8": ("int_contents", "b"),
+    "INT16": ("int_contents", "h"),
+    "INT32": ("int_contents", "i"),
+    "INT64": ("int64_contents", "q"),
+    "UINT8": ("uint_contents", "B"),
+    "UINT16": ("uint_contents", "H"),
+    "UINT32": ("uint_contents", "I"),
+    "UINT64": ("uint64_contents", "Q"),
+    "FP32": ("fp32_contents", "f"),
+    "FP64": ("fp64_contents", "d"),
+    "BYTES": ("bytes_contents", ""),
+}
+HTTP_TO_GRPC_STATUS: dict[int, grpc.StatusCode] = {
+    HTTPStatus.BAD_REQUEST: grpc.StatusCode.INVALID_ARGUMENT,
+    HTTPStatus.NOT_FOUND: grpc.StatusCode.NOT_FOUND,
+    HTTPStatus.TOO_MANY_REQUESTS: grpc.StatusCode.RESOURCE_EXHAUSTED,
+    HTTPStatus.SERVICE_UNAVAILABLE: grpc.StatusCode.UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT: grpc.StatusCode.DEADLINE_EXCEEDED,
+}
+
+
+def identity_model(inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Model callable which returns its inputs as outputs, named `output-<index>`.
+
+    Args:
+        inputs (list[dict[str, Any]]): V2 input tensors.
+
+    Returns:
+        list[dict[str, Any]]: V2 output tensors.
+
+    """
+    return [{**tensor, "name": f"output-{index}"} for index, tensor in enumerate(inputs)]
+
+
+def flatten_tensor_data(data: Any) -> list[Any]:
+    """
+    Flatten V2 tensor data, which may be nested in row-major order.
+
+    Args:
+        data (Any): Tensor data.
+
+    Returns:
+        list[Any]: Flat tensor data.
+
+    """
+    if not isinstance(data, list):
+        return [data]
+
+    return [value for item in data for value in flatten_tensor_data(data=item)]
+
+
+def decode_raw_bytes_tensor(raw_contents: bytes) -> list[bytes]:
+    """
+    Decode BYTES tensor raw contents, where each element is prefixed with its 4 bytes little-endian length.
+
+    Args:
+        raw_contents (bytes): Tensor raw contents.
+
+    Returns:
+        list[bytes]: Tensor elements.
+
+    Raises:
+        KServeV2EmulatorError: If an element is truncated.
+
+    """
+    data = []
+    offset = 0
+    while offset < len(raw_contents):
+        if offset + 4 > len(raw_contents):
+            raise KServeV2EmulatorError(status=HTTPStatus.BAD_REQUEST, message="Truncated BYTES element length")
+
+        (length,) = struct.unpack_from("<I", raw_contents, offset)  # noqa: FCN001
+        start = offset + 4
+        offset = start + length
+        if offset > len(raw_contents):
+            raise KServeV2EmulatorError(status=HTTPStatus.BAD_REQUEST, message="Truncated BYTES element")
+
+        data.append(raw_contents[start:offset])
+
+    return data
+
+
+class KServeV2EmulatorError(Exception):
+    def __init__(self, status: int, message: str):
+        self.status = status
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class KServeV2Emulator(EmulatorHTTPServer):
+    """
+    Local KServe V2 (open inference protocol) server, REST and gRPC `GRPCInferenceService`,
+    serving pluggable model callables.
+
+    A model callable gets the request input tensors as dicts (`name`, `datatype`, `shape`, `data`)
+    and returns the output tensors in the same format.
+    """
+
+    def __init__(
+        self,
+        models: dict[str, ModelCallable] | None = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = HTTPStatus.INTERNAL_SERVER_ERROR,
+        grpc_port: int = 0,
+        grpc_max_workers: int = 10,
+        seed: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            models (dict[str, ModelCallable] | None): Model name to model callable; defaults to an identity model
+                named `emulated-model`.
+            latency (float): Delay added to each inference, in seconds.
+            error_rate (float): Fraction of inference requests, between 0 and 1, failed with `error_status`.
+            error_status (int): HTTP status of injected failures; mapped to the matching gRPC status code.
+            grpc_port (int): gRPC port to listen on; 0 selects a free port.
+            grpc_max_workers (int): Maximum number of concurrently handled gRPC requests.
+            seed (int): Random seed of the injected failures.
+            **kwargs: `EmulatorHTTPServer` arguments.
+        """
+        super().__init__(**kwargs)
+        self.models = models or {"emulated-model": identity_model}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.grpc_port = grpc_port
+        self.grpc_max_workers = grpc_max_workers
+        self.rng = random.Random(x=seed)
+        self._grpc_server: grpc.Server | None = None
+
+    @property
+    def grpc_url(self) -> str:
+        return f"{self.host}:{self.grpc_port}"
+
+    def start(self) -> None:
+        super().start()
+        self._grpc_server = grpc.server(thread_pool=ThreadPoolExecutor(max_workers=self.grpc_max_workers))
+        grpc_predict_v2_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(
+            servicer=KServeV2GRPCServicer(emulator=self), server=self._grpc_server
+        )
+        self.grpc_port = self._grpc_server.add_insecure_port(address=self.grpc_url)
+        self._grpc_server.start()
+
+    def stop(self) -> None:
+        if self._grpc_server:
+            self._grpc_server.stop(grace=None)
+            self._grpc_server = None
+
+        super().stop()
+
+    def infer(self, model_name: str, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Run a model callable, with injected failures.
+
+        Latency is added by the calling transport.
+
+        Args:
+            model_name (str): Model name.
+            inputs (list[dict[str, Any]]): V2 input tensors.
+
+        Returns:
+            list[dict[str, Any]]: V2 output tensors.
+
+        Raises:
+            KServeV2EmulatorError: If the model does not exist, the failure is injected or the model callable fails.
+
+        """
+        if model_name not in self.models:
+            raise KServeV2EmulatorError(status=HTTPStatus.NOT_FOUND, message=f"Model {model_name} not found")
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise KServeV2EmulatorError(status=self.error_status, message="Injected failure")
+
+        try:
+            return self.models[model_name](inputs)  # noqa: FCN001
+
+        except Exception as exc:
+            raise KServeV2EmulatorError(status=HTTPStatus.BAD_REQUEST, message=str(exc)) from exc
+
+    def model_metadata(self, model_name: str) -> dict[str, Any]:
+        return {"name": model_name, "versions": ["1"], "platform": "emulator", "inputs": [], "outputs": []}
+
+    async def handle_request(self, request: EmulatorRequest) -> EmulatorResponse:
+        if request.path in ("/v2/health/live", "/v2/health/ready"):
+            return EmulatorResponse(body={"live": True} if request.path.endswith("live") else {"ready": True})
+
+        if request.path == "/v2":
+            return EmulatorResponse(body={"name": "kserve-v2-emulator", "version": "1", "extensions": []})
+
+        if not (path_match := V2_MODEL_PATH_REGEX.match(request.path)):
+            return EmulatorResponse(status=HTTPStatus.NOT_FOUND, body={"error": f"{request.path} not found"})
+
+        model_name, action = path_match.group("name"), path_match.group("action")
+        if model_name not in self.models:
+            return EmulatorResponse(status=HTTPStatus.NOT_FOUND, body={"error": f"Model {model_name} not found"})
+
+        if action == "/ready":
+            return EmulatorResponse(body={"name": model_name, "ready": True})
+
+        if not action:
+            return EmulatorResponse(body=self.model_metadata(model_name=model_name))
+
+        request_data = request.json()
+        await asyncio.sleep(delay=self.latency)
+        try:
+            outputs = self.infer(model_name=model_name, inputs=request_data.get("inputs", []))
+
+        except KServeV2EmulatorError as exc:
+            return EmulatorResponse(status=exc.status, body={"error": exc.message})
+
+        return EmulatorResponse(
+            body={
+                "model_name": model_name,
+                "model_version": path_match.group("version") or "1",
+                "id": request_data.get("id", str(uuid.uuid4())),
+                "parameters": {},
+                "outputs": outputs,
+            }
+        )
+
+
+class KServeV2GRPCServicer(grpc_predict_v2_pb2_grpc.GRPCInferenceServiceServicer):
+    """
+    `GRPCInferenceService` servicer of `KServeV2Emulator`.
+    """
+
+    def __init__(self, emulator: KServeV2Emulator) -> None:
+        self.emulator = emulator
+
+    def count_request(self, method: str) -> None:
+        path = f"/inference.GRPCInferenceService/{method}"
+        self.emulator.requests_count[path] = self.emulator.requests_count.get(path, 0) + 1
+
+    def ServerLive(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ServerLive")
+        return grpc_predict_v2_pb2.ServerLiveResponse(live=True)  # type: ignore[attr-defined]
+
+    def ServerReady(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ServerReady")
+        return grpc_predict_v2_pb2.ServerReadyResponse(ready=True)  # type: ignore[attr-defined]
+
+    def ModelReady(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ModelReady")
+        return grpc_predict_v2_pb2.ModelReadyResponse(  # type: ignore[attr-defined]
+            ready=request.name in self.emulator.models
+        )
+
+    def ServerMetadata(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ServerMetadata")
+        return grpc_predict_v2_pb2.ServerMetadataResponse(  # type: ignore[attr-defined]
+            name="kserve-v2-emulator", version="1"
+        )
+
+    def ModelMetadata(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ModelMetadata")
+        if request.name not in self.emulator.models:
+            context.abort(code=grpc.StatusCode.NOT_FOUND, details=f"Model {request.name} not found")
+
+        metadata = self.emulator.model_metadata(model_name=request.name)
+        return grpc_predict_v2_pb2.ModelMetadataResponse(  # type: ignore[attr-defined]
+            name=metadata["name"], versions=metadata["versions"], platform=metadata["platform"]
+        )
+
+    def ModelInfer(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.count_request(method="ModelInfer")
+        time.sleep(self.emulator.latency)
+        try:
+            outputs = self.emulator.infer(model_name=request.model_name, inputs=self.decode_inputs(request=request))
+
+        except KServeV2EmulatorError as exc:
+            context.abort(
+                code=HTTP_TO_GRPC_STATUS.get(exc.status, grpc.StatusCode.INTERNAL),
+                details=exc.message,
+            )
+
+        response = grpc_predict_v2_pb2.ModelInferResponse(  # type: ignore[attr-defined]
+            model_name=request.model_name, model_version=request.model_version or "1", id=request.id
+        )
+        for tensor in outputs:
+            if tensor["datatype"] not in V2_DATATYPES:
+                context.abort(
+                    code=grpc.StatusCode.INVALID_ARGUMENT,
+                    details=f"Output {tensor['name']}: unsupported datatype {tensor['datatype']}",
+                )
+
+            output = response.outputs.add(name=tensor["name"], datatype=tensor["datatype"], shape=tensor["shape"])
+            contents_field, _ = V2_DATATYPES[tensor["datatype"]]
+            data = flatten_tensor_data(data=tensor["data"])
+            if tensor["datatype"] == "BYTES":
+                data = [value if isinstance(value, bytes) else str(value).encode() for value in data]
+            getattr(output.contents, contents_field).extend(data)
+
+        return response
+
+    @staticmethod
+    def decode_inputs(request: Any) -> list[dict[str, Any]]:
+        """
+        Decode gRPC input tensors, from `contents` or `raw_input_contents`, to V2 tensor dicts.
+
+        Args:
+            request (ModelInferRequest): gRPC inference request.
+
+        Returns:
+            list[dict[str, Any]]: V2 input tensors.
+
+        Raises:
+            KServeV2EmulatorError: If an input datatype is not supported or its raw contents are invalid.
+
+        """
+        inputs = []
+        for index, tensor in enumerate(request.inputs):
+            if tensor.datatype not in V2_DATATYPES:
+                raise KServeV2EmulatorError(
+                    status=HTTPStatus.BAD_REQUEST,
+                    message=f"Input {tensor.name}: unsupported datatype {tensor.datatype}",
+                )
+
+            contents_field, raw_format = V2_DATATYPES[tensor.datatype]
+            if index < len(request.raw_input_contents) and tensor.datatype == "BYTES":
+                data = decode_raw_bytes_tensor(raw_contents=request.raw_input_contents[index])
+            elif index < len(request.raw_input_contents):
+                raw_contents = request.raw_input_contents[index]
+                raw_count, remainder = divmod(len(raw_contents), struct.calcsize(raw_format))
+                if remainder:
+                    raise KServeV2EmulatorError(
+                        status=HTTPStatus.BAD_REQUEST,
+                        message=f"Input {tensor.name}: raw contents size {len(raw_contents)} is not a multiple "
+                        f"of {tensor.datatype} size {struct.calcsize(raw_format)}",
+                    )
+
+                try:
+                    data = list(struct.unpack(f"<{raw_count}{raw_format}", raw_contents))
+
+                except struct.error as exc:
+                    raise KServeV2EmulatorError(
+                        status=HTTPStatus.BAD_REQUEST, message=f"Input {tensor.name}: {exc}"
+                    ) from exc
+            else:
+                data = list(getattr(tensor.contents, contents_field, []))
+
+            inputs.append({"name": tensor.name, "datatype": tensor.datatype, "shape": list(tensor.shape), "data": data})
+
+        return inputs
@@ -0,0 +1,743 @@
+import asyncio
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from functools import partial
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Callable
+
+import kubernetes
+from kubernetes.dynamic import DynamicClient
+
+from utilities.emulators.http_server import EmulatorHTTPServer, EmulatorRequest, EmulatorResponse
+
+KubeObject = dict[str, Any]
+KubeController = Callable[["KubeAPIEmulator", KubeObject], None]
+
+# kind: (group, version, plural, namespaced, short names)
+KUBE_API_RESOURCES: dict[str, tuple[str, str, str, bool, list[str]]] = {
+    "Namespace": ("", "v1", "namespaces", False, ["ns"]),
+    "Pod": ("", "v1", "pods", True, ["po"]),
+    "Service": ("", "v1", "services", True, ["svc"]),
+    "Deployment": ("apps", "v1", "deployments", True, ["deploy"]),
+    "InferenceService": ("serving.kserve.io", "v1beta1", "inferenceservices", True, ["isvc"]),
+}
+KUBE_API_PATH_REGEX: re.Pattern[str] = re.compile(
+    r"^/(api|apis/(?P<group>[^/]+))/(?P<version>[^/]+)(/namespaces/(?P<namespace>[^/]+))?"
+    r"/(?P<plural>[^/]+)(/(?P<name>[^/]+))?(/(?P<subresource>[^/]+))?$"
+)
+LABEL_SELECTOR_REGEX: re.Pattern[str] = re.compile(
+    r"^(?P<exists>!)?(?P<key>[^=!\s]+)\s*((?P<operator>==|!=|=|\s+in\s+|\s+notin\s+)\s*(?P<value>.*))?$"
+)
+WATCH_HISTORY_SIZE: int = 10000
+DEFAULT_WATCH_TIMEOUT: int = 300
+
+
+def get_object_field(obj: KubeObject, path: str) -> Any:
+    """
+    Get a field of an object by its dotted path, e.g. `status.phase`.
+
+    Args:
+        obj (KubeObject): Object.
+        path (str): Dotted field path.
+
+    Returns:
+        Any: Field value, or None if missing.
+
+    """
+    value: Any = obj
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+
+    return value
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply a JSON merge patch (RFC 7386); a None value removes the field.
+
+    Args:
+        target (Any): Patched value.
+        patch (Any): Merge patch.
+
+    Returns:
+        Any: Patched copy of the value.
+
+    """
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+
+    result = copy.deepcopy(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(target=result.get(key), patch=value)
+
+    return result
+
+
+def json_patch(target: KubeObject, operations: list[dict[str, Any]]) -> KubeObject:
+    """
+    Apply `add`, `replace` and `remove` JSON patch (RFC 6902) operations.
+
+    Args:
+        target (KubeObject): Patched object.
+        operations (list[dict[str, Any]]): JSON patch operations.
+
+    Returns:
+        KubeObject: Patched copy of the object.
+
+    """
+    result = copy.deepcopy(target)
+    for operation in operations:
+        *parents, key = [part.replace("~1", "/").replace("~0", "~") for part in operation["path"].split("/")[1:]]
+        parent: Any = result
+        for part in parents:
+            parent = parent[int(part)] if isinstance(parent, list) else parent.setdefault(part, {})
+
+        if isinstance(parent, list):
+            index = len(parent) if key == "-" else int(key)
+            if operation["op"] == "remove":
+                parent.pop(index)
+            elif operation["op"] == "add":
+                parent.insert(index, operation["value"])
+            else:
+                parent[index] = operation["value"]
+        elif operation["op"] == "remove":
+            parent.pop(key, None)
+        else:
+            parent[key] = operation["value"]
+
+    return result
+
+
+def match_label_selector(labels: dict[str, str], selector: str) -> bool:
+    """
+    Check labels against a label selector, e.g. `app=model,tier!=web,env in (dev, qe),!deprecated`.
+
+    Args:
+        labels (dict[str, str]): Object labels.
+        selector (str): Label selector.
+
+    Returns:
+        bool: True if all the selector requirements match.
+
+    """
+    for requirement in re.split(r",(?![^()]*\))", selector):
+        if not (requirement := requirement.strip()):
+            continue
+
+        if not (requirement_match := LABEL_SELECTOR_REGEX.match(requirement)):
+            return False
+
+        key, operator = requirement_match.group("key"), (requirement_match.group("operator") or "").strip()
+        value = (requirement_match.group("value") or "").strip()
+        if requirement_match.group("exists"):
+            matched = key not in labels
+        elif not operator:
+            matched = key in labels
+        elif operator in ("in", "notin"):
+            values = {item.strip() for item in value.strip("()").split(",")}
+            matched = (labels.get(key) in values) == (operator == "in")
+        else:
+            matched = (labels.get(key) == value) == (operator != "!=")
+
+        if not matched:
+            return False
+
+    return True
+
+
+def match_field_selector(obj: KubeObject, selector: str) -> bool:
+    """
+    Check an object against a field selector, e.g. `metadata.name=my-pod,status.phase!=Running`.
+
+    Args:
+        obj (KubeObject): Object.
+        selector (str): Field selector.
+
+    Returns:
+        bool: True if all the selector requirements match.
+
+    """
+    for requirement in filter(None, selector.split(",")):
+        path, operator, value = re.split(r"(!=|==|=)", requirement, maxsplit=1)
+        field = get_object_field(obj=obj, path=path.strip())
+        if (str(field) if field is not None else "") == value.strip() and operator == "!=":
+            return False
+        if (str(field) if field is not None else "") != value.strip() and operator != "!=":
+            return False
+
+    return True
+
+
+def set_namespace_active(emulator: "KubeAPIEmulator", obj: KubeObject) -> None:
+    emulator.patch_object(kind="Namespace", name=obj["metadata"]["name"], patch={"status": {"phase": "Active"}})
+
+
+class KubeAPIEmulatorError(Exception):
+    def __init__(self, status: int, reason: str, message: str):
+        self.status = status
+        self.reason = reason
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class KubeAPIEmulator(EmulatorHTTPServer):
+    """
+    In-process fake Kubernetes API server, speaking enough of the discovery, list, watch and CRUD protocol for the
+    dynamic client and `ocp_resources`, for Pods, Deployments, Services, Namespaces and InferenceServices.
+
+    Objects are kept in memory; controllers run on object creation (e.g. namespaces become Active) and state
+    transitions are scripted with `schedule`, e.g. a pod becoming ready after 2 seconds.
+    API calls are counted by verb and kind in `api_calls`, to measure the poll frequency of wait helpers.
+
+    Eg:
+        with KubeAPIEmulator() as emulator:
+            emulator.create_object(body=pod)
+            emulator.schedule(delay=2, action=emulator.patch_object, kind="Pod", ..., patch={"status": ...})
+            wait_for_isvc_pods(client=emulator.dynamic_client(), isvc=isvc)
+    """
+
+    def __init__(
+        self,
+        resources: dict[str, tuple[str, str, str, bool, list[str]]] | None = None,
+        controllers: dict[str, KubeController] | None = None,
+        latency: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            resources (dict[str, tuple[str, str, str, bool, list[str]]] | None): Additional served resources, kind to
+                (group, version, plural, namespaced, short names), like `KUBE_API_RESOURCES`.
+            controllers (dict[str, KubeController] | None): Kind to callable run when an object of this kind is
+                created; replaces the default controller of the kind.
+            latency (float): Delay added to each API call, in seconds.
+            **kwargs: `EmulatorHTTPServer` arguments.
+        """
+        super().__init__(**kwargs)
+        self.resources = {**KUBE_API_RESOURCES, **(resources or {})}
+        self.controllers: dict[str, KubeController] = {"Namespace": set_namespace_active, **(controllers or {})}
+        self.latency = latency
+        self.api_calls: dict[tuple[str, str], int] = {}
+        self.objects: dict[tuple[str, str, str], KubeObject] = {}
+        self.resource_version = 0
+        self._kinds_by_path = {
+            (group, version, plural): kind for kind, (group, version, plural, *_) in self.resources.items()
+        }
+        self._history: deque[tuple[int, str, str, KubeObject]] = deque(maxlen=WATCH_HISTORY_SIZE)
+        self._watchers: set[tuple[asyncio.Queue[tuple[str, str, KubeObject]], asyncio.AbstractEventLoop]] = set()
+        self._lock = threading.RLock()
+
+    def dynamic_client(self) -> DynamicClient:
+        """
+        Get a dynamic client of the emulator, without changing the default kubernetes client configuration.
+
+        Returns:
+            DynamicClient: Dynamic client.
+
+        """
+        configuration = kubernetes.client.Configuration()
+        configuration.host = self.url
+        configuration.api_key = {"authorization": "Bearer emulated-token"}
+        return DynamicClient(client=kubernetes.client.ApiClient(configuration=configuration))
+
+    def count_api_call(self, verb: str, kind: str) -> None:
+        with self._lock:
+            self.api_calls[verb, kind] = self.api_calls.get((verb, kind), 0) + 1
+
+    def reset_api_calls(self) -> None:
+        with self._lock:
+            self.api_calls.clear()
+            self.requests_count.clear()
+
+    def schedule(self, delay: float, action: Callable[..., Any], **kwargs: Any) -> None:
+        """
+        Run a state transition after a delay, e.g. `schedule(delay=1, action=emulator.delete_object, kind=...)`.
+
+        Args:
+            delay (float): Delay, in seconds.
+            action (Callable[..., Any]): Transition, usually `create_object`, `patch_object` or `delete_object`.
+            **kwargs: Transition arguments.
+
+        """
+        assert self._loop, f"{type(self).__name__} is not started"
+        self._loop.call_soon_threadsafe(self._loop.call_later, delay, partial(action, **kwargs))  # noqa: FCN001
+
+    def get_object(self, kind: str, name: str, namespace: str | None = None) -> KubeObject:
+        """
+        Get a copy of an object.
+
+        Raises:
+            KubeAPIEmulatorError: If the object does not exist.
+
+        """
+        with self._lock:
+            if not (obj := self.objects.get((kind, namespace or "", name))):
+                raise KubeAPIEmulatorError(
+                    status=HTTPStatus.NOT_FOUND,
+                    reason="NotFound",
+                    message=f'{self.resources[kind][2]} "{name}" not found',
+                )
+
+            return copy.deepcopy(obj)
+
+    def list_objects(
+        self, kind: str, namespace: str | None = None, label_selector: str = "", field_selector: str = ""
+    ) -> list[KubeObject]:
+        with self._lock:
+            return [
+                copy.deepcopy(obj)
+                for (obj_kind, obj_namespace, _), obj in sorted(self.objects.items())
+                if obj_kind == kind
+                and (not namespace or obj_namespace == namespace)
+                and match_label_selector(labels=obj["metadata"].get("labels") or {}, selector=label_selector)
+                and match_field_selector(obj=obj, selector=field_selector)
+            ]
+
+    def create_object(self, body: KubeObject, namespace: str | None = None, dry_run: bool = False) -> KubeObject:
+        """
+        Create an object and run the controller of its kind.
+
+        Args:
+            body (KubeObject): Object, with `kind` and `metadata.name` or `metadata.generateName`.
+            namespace (str | None): Namespace; defaults to `metadata.namespace`.
+            dry_run (bool): Validate and return the object without storing it.
+
+        Returns:
+            KubeObject: Created object.
+
+        Raises:
+            KubeAPIEmulatorError: If the kind is not served or the object already exists.
+
+        """
+        kind = body.get("kind", "")
+        if kind not in self.resources:
+            raise KubeAPIEmulatorError(
+                status=HTTPStatus.NOT_FOUND, reason="NotFound", message=f"the server could not find kind {kind}"
+            )
+
+        group, version, plural, namespaced, _ = self.resources[kind]
+        obj = copy.deepcopy(body)
+        metadata = obj.setdefault("metadata", {})
+        if not metadata.get("name") and metadata.get("generateName"):
+            metadata["name"] = f"{metadata['generateName']}{uuid.uuid4().hex[:5]}"
+        if namespaced:
+            metadata["namespace"] = namespace or metadata.get("namespace") or "default"
+        else:
+            metadata.pop("namespace", None)
+
+        obj["apiVersion"] = f"{group}/{version}" if group else version
+        obj.setdefault("status", {})
+        metadata.update({
+            "uid": str(uuid.uuid4()),
+            "creationTimestamp": datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "generation": 1,
+        })
+        key = (kind, metadata.get("namespace", ""), metadata["name"])
+
+        with self._lock:
+            if key in self.objects:
+                raise KubeAPIEmulatorError(
+                    status=HTTPStatus.CONFLICT,
+                    reason="AlreadyExists",
+                    message=f'{plural} "{metadata["name"]}" already exists',
+                )
+
+            if dry_run:
+                return obj
+
+            self._store(key=key, obj=obj, event_type="ADDED")
+
+        if controller := self.controllers.get(kind):
+            controller(self, copy.deepcopy(obj))  # noqa: FCN001
+
+        return self.get_object(kind=kind, name=metadata["name"], namespace=metadata.get("namespace"))
+
+    def replace_object(self, body: KubeObject, namespace: str | None = None, subresource: str = "") -> KubeObject:
+        """
+        Replace an object, or only its status if `subresource` is `status`.
+
+        Raises:
+            KubeAPIEmulatorError: If the object does not exist.
+
+        """
+        metadata = body.get("metadata", {})
+        with self._lock:
+            current = self.get_object(kind=body["kind"], name=metadata["name"], namespace=namespace)
+            if subresource == "status":
+                obj = {**current, "status": copy.deepcopy(body.get("status", {}))}
+            else:
+                obj = {**copy.deepcopy(body), "status": body.get("status", current.get("status"))}
+                obj["metadata"] = {
+                    **obj["metadata"],
+                    **{
+                        key: current["metadata"][key]
+                        for key in ("uid", "creationTimestamp", "namespace")
+                        if key in current["metadata"]
+                    },
+                }
+
+            return self._update(current=current, obj=obj)
+
+    def patch_object(
+        self,
+        kind: str,
+        name: str,
+        patch: Any,
+        namespace: str | None = None,
+        patch_type: str = "application/merge-patch+json",
+    ) -> KubeObject:
+        """
+        Patch an object; strategic merge and apply patches are applied as merge patches.
+
+        Args:
+            kind (str): Object kind.
+            name (str): Object name.
+            patch (Any): Merge patch, or JSON patch operations.
+            namespace (str | None): Object namespace.
+            patch_type (str): Patch content type.
+
+        Returns:
+            KubeObject: Patched object.
+
+        Raises:
+            KubeAPIEmulatorError: If the object does not exist.
+
+        """
+        with self._lock:
+            current = self.get_object(kind=kind, name=name, namespace=namespace)
+            if patch_type == "application/json-patch+json":
+                obj = json_patch(target=current, operations=patch)
+            else:
+                obj = merge_patch(target=current, patch=patch)
+
+            return self._update(current=current, obj=obj)
+
+    def delete_object(self, kind: str, name: str, namespace: str | None = None) -> KubeObject:
+        """
+        Delete an object; objects with finalizers are only marked for deletion, and namespaces delete their objects.
+
+        Returns:
+            KubeObject: Deleted object.
+
+        Raises:
+            KubeAPIEmulatorError: If the object does not exist.
+
+        """
+        with self._lock:
+            obj = self.get_object(kind=kind, name=name, namespace=namespace)
+            if obj["metadata"].get("finalizers"):
+                deletion_timestamp = datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+                return self._update(
+                    current=obj,
+                    obj=merge_patch(target=obj, patch={"metadata": {"deletionTimestamp": deletion_timestamp}}),
+                )
+
+            if kind == "Namespace":
+                for obj_kind, obj_namespace, obj_name in list(self.objects):
+                    if obj_namespace == name:
+                        self.delete_object(kind=obj_kind, name=obj_name, namespace=obj_namespace)
+
+            self._store(key=(kind, namespace or "", name), obj=obj, event_type="DELETED")
+            return obj
+
+    def _update(self, current: KubeObject, obj: KubeObject) -> KubeObject:
+        metadata = obj["metadata"]
+        if current.get("spec") != obj.get("spec"):
+            metadata["generation"] = current["metadata"].get("generation", 1) + 1
+
+        key = (obj["kind"], metadata.get("namespace", ""), metadata["name"])
+        if metadata.get("deletionTimestamp") and not metadata.get("finalizers"):
+            self._store(key=key, obj=obj, event_type="DELETED")
+        else:
+            self._store(key=key, obj=obj, event_type="MODIFIED")
+
+        return copy.deepcopy(obj)
+
+    def _store(self, key: tuple[str, str, str], obj: KubeObject, event_type: str) -> None:
+        self.resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self.resource_version)
+        if event_type == "DELETED":
+            self.objects.pop(key, None)
+        else:
+            self.objects[key] = obj
+
+        event = (event_type, key[0], copy.deepcopy(obj))
+        self._history.append((self.resource_version, *event))
+        for queue, loop in self._watchers:
+            loop.call_soon_threadsafe(queue.put_nowait, event)  # noqa: FCN001
+
+    @staticmethod
+    def status_response(status: int, reason: str = "", message: str = "") -> EmulatorResponse:
+        return EmulatorResponse(
+            status=status,
+            body={
+                "kind": "Status",
+                "apiVersion": "v1",
+                "metadata": {},
+                "status": "Success" if status < HTTPStatus.BAD_REQUEST else "Failure",
+                "message": message,
+                "reason": reason,
+                "code": status,
+            },
+        )
+
+    def discovery_response(self, path: str) -> EmulatorResponse | None:
+        groups: dict[str, set[str]] = {}
+        for group, version, *_ in self.resources.values():
+            groups.setdefault(group, set()).add(version)
+
+        if path == "/version":
+            return EmulatorResponse(body={"major": "1", "minor": "30", "gitVersion": "v1.30.0", "platform": "emulator"})
+
+        if path == "/api":
+            return EmulatorResponse(body={"kind": "APIVersions", "versions": sorted(groups.get("", []))})
+
+        if path == "/apis":
+            return EmulatorResponse(
+                body={
+                    "kind": "APIGroupList",
+                    "apiVersion": "v1",
+                    "groups": [
+                        {
+                            "name": group,
+                            "versions": [
+                                {"groupVersion": f"{group}/{version}", "version": version}
+                                for version in sorted(versions)
+                            ],
+                            "preferredVersion": {
+                                "groupVersion": f"{group}/{sorted(versions)[0]}",
+                                "version": sorted(versions)[0],
+                            },
+                        }
+                        for group, versions in sorted(groups.items())
+                        if group
+                    ],
+                }
+            )
+
+        if not (path_match := re.match(r"^/(api|apis/(?P<group>[^/]+))/(?P<version>[^/]+)$", path)):
+            return None
+
+        group, version = path_match.group("group") or "", path_match.group("version")
+        resources = []
+        for kind, (resource_group, resource_version, plural, namespaced, short_names) in self.resources.items():
+            if (resource_group, resource_version) != (group, version):
+                continue
+
+            resources.append({
+                "name": plural,
+                "singularName": kind.lower(),
+                "namespaced": namespaced,
+                "kind": kind,
+                "verbs": ["create", "delete", "get", "list", "patch", "update", "watch"],
+                "shortNames": short_names,
+            })
+            resources.append({"name": f"{plural}/status", "namespaced": namespaced, "kind": kind, "verbs": ["get"]})
+
+        if not resources:
+            return None
+
+        return EmulatorResponse(
+            body={
+                "kind": "APIResourceList",
+                "apiVersion": "v1",
+                "groupVersion": f"{group}/{version}" if group else version,
+                "resources": resources,
+            }
+        )
+
+    async def handle_request(self, request: EmulatorRequest) -> EmulatorResponse:
+        await asyncio.sleep(delay=self.latency)
+        if discovery_response := self.discovery_response(path=request.path):
+            self.count_api_call(verb="discovery", kind="")
+            return discovery_response
+
+        path_match = KUBE_API_PATH_REGEX.match(request.path)
+        kind = path_match and self._kinds_by_path.get((
+            path_match.group("group") or "",
+            path_match.group("version"),
+            path_match.group("plural"),
+        ))
+        if not (path_match and kind):
+            return self.status_response(status=HTTPStatus.NOT_FOUND, reason="NotFound", message=request.path)
+
+        namespace, name = path_match.group("namespace"), path_match.group("name")
+        query = {key: values[-1] for key, values in request.query.items()}
+        verb = {"POST": "create", "PUT": "update", "PATCH": "patch", "DELETE": "delete"}.get(request.method, "get")
+        if verb == "get" and not name:
+            verb = "watch" if query.get("watch", "").lower() in ("true", "1") else "list"
+        self.count_api_call(verb=verb, kind=kind)
+
+        try:
+            if verb == "watch":
+                return self.watch_response(
+                    kind=kind,
+                    namespace=namespace,
+                    label_selector=query.get("labelSelector", ""),
+                    field_selector=query.get("fieldSelector", ""),
+                    resource_version=int(query.get("resourceVersion") or 0),
+                    timeout=int(query.get("timeoutSeconds") or DEFAULT_WATCH_TIMEOUT),
+                )
+
+            if verb == "list":
+                return self.list_response(
+                    kind=kind,
+                    namespace=namespace,
+                    label_selector=query.get("labelSelector", ""),
+                    field_selector=query.get("fieldSelector", ""),
+                    limit=int(query.get("limit") or 0),
+                    continue_token=query.get("continue", ""),
+                )
+
+            if verb == "get":
+                return EmulatorResponse(body=self.get_object(kind=kind, name=name, namespace=namespace))
+
+            if verb == "create":
+                return EmulatorResponse(
+                    status=HTTPStatus.CREATED,
+                    body=self.create_object(
+                        body={**request.json(), "kind": kind}, namespace=namespace, dry_run="dryRun" in query
+                    ),
+                )
+
+            if verb == "update":
+                return EmulatorResponse(
+                    body=self.replace_object(
+                        body={**request.json(), "kind": kind},
+                        namespace=namespace,
+                        subresource=path_match.group("subresource") or "",
+                    )
+                )
+
+            if verb == "patch":
+                return EmulatorResponse(
+                    body=self.patch_object(
+                        kind=kind,
+                        name=name,
+                        namespace=namespace,
+                        patch=request.json(),
+                        patch_type=request.headers.get("content-type", "").split(";")[0],
+                    )
+                )
+
+            return EmulatorResponse(body=self.delete_object(kind=kind, name=name, namespace=namespace))
+
+        except KubeAPIEmulatorError as exc:
+            return self.status_response(status=exc.status, reason=exc.reason, message=exc.message)
+
+    def list_response(
+        self,
+        kind: str,
+        namespace: str | None,
+        label_selector: str,
+        field_selector: str,
+        limit: int,
+        continue_token: str,
+    ) -> EmulatorResponse:
+        group, version, *_ = self.resources[kind]
+        with self._lock:
+            resource_version = self.resource_version
+            items = self.list_objects(
+                kind=kind, namespace=namespace, label_selector=label_selector, field_selector=field_selector
+            )
+
+        offset = int(continue_token or 0)
+        end = offset + limit if limit else len(items)
+        metadata: dict[str, Any] = {"resourceVersion": str(resource_version)}
+        if end < len(items):
+            metadata["continue"] = str(end)
+
+        return EmulatorResponse(
+            body={
+                "kind": f"{kind}List",
+                "apiVersion": f"{group}/{version}" if group else version,
+                "metadata": metadata,
+                "items": items[offset:end],
+            }
+        )
+
+    def watch_response(
+        self,
+        kind: str,
+        namespace: str | None,
+        label_selector: str,
+        field_selector: str,
+        resource_version: int,
+        timeout: int,
+    ) -> EmulatorResponse:
+        """
+        Build a watch events stream, one JSON event per line.
+
+        Without `resource_version`, existing objects are sent as ADDED events first; otherwise the events recorded
+        after this version are replayed. Like the API server, if events after this version are no longer recorded,
+        a single ERROR event with a 410 Gone (`Expired`) status is sent, and the client has to list again.
+
+        """
+        queue: asyncio.Queue[tuple[str, str, KubeObject]] = asyncio.Queue()
+        with self._lock:
+            oldest_resource_version = self._history[0][0] if self._history else self.resource_version + 1
+            if resource_version and resource_version + 1 < oldest_resource_version:
+                return self.expired_watch_response(
+                    resource_version=resource_version, oldest_resource_version=oldest_resource_version
+                )
+
+            if resource_version:
+                for event_version, *event in self._history:
+                    if event_version > resource_version:
+                        queue.put_nowait(tuple(event))  # type: ignore[arg-type]
+            else:
+                for obj in self.list_objects(kind=kind, namespace=namespace):
+                    queue.put_nowait(("ADDED", kind, obj))
+
+            watcher = (queue, asyncio.get_running_loop())
+            self._watchers.add(watcher)
+
+        def _matches(event_kind: str, obj: KubeObject) -> bool:
+            return (
+                event_kind == kind
+                and (not namespace or obj["metadata"].get("namespace") == namespace)
+                and match_label_selector(labels=obj["metadata"].get("labels") or {}, selector=label_selector)
+                and match_field_selector(obj=obj, selector=field_selector)
+            )
+
+        async def _events() -> AsyncIterator[bytes]:
+            deadline = time.monotonic() + timeout
+            try:
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        event_type, event_kind, obj = await asyncio.wait_for(fut=queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                    if _matches(event_kind=event_kind, obj=obj):
+                        yield f"{json.dumps({'type': event_type, 'object': obj})}\n".encode()
+
+            finally:
+                with self._lock:
+                    self._watchers.discard(watcher)
+
+        return EmulatorResponse(stream=_events())
+
+    def expired_watch_response(self, resource_version: int, oldest_resource_version: int) -> EmulatorResponse:
+        status = self.status_response(
+            status=HTTPStatus.GONE,
+            reason="Expired",
+            message=f"too old resource version: {resource_version} ({oldest_resource_version - 1})",
+        )
+
+        async def _events() -> AsyncIterator[bytes]:
+            yield f"{json.dumps({'type': 'ERROR', 'object': status.body})}\n".encode()
+
+        return EmulatorResponse(stream=_events())
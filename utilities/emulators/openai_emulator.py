@@ -0,0 +1,322 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from http import HTTPStatus
+from typing import Any, AsyncIterator
+
+from utilities.emulators.http_server import EmulatorHTTPServer, EmulatorRequest, EmulatorResponse
+from utilities.plugins.constant import OpenAIEnpoints
+
+DEFAULT_EMULATOR_RESPONSE: str = (
+    "This is an emulated response from a local OpenAI compatible server, "
+    "used to exercise inference clients without a model server."
+)
+DEFAULT_MAX_TOKENS: int = 16
+DEFAULT_EMBEDDING_SIZE: int = 16
+
+
+class OpenAIEmulator(EmulatorHTTPServer):
+    """
+    Local emulator of the vLLM OpenAI compatible API: completions, chat completions, embeddings and models,
+    with server-sent events streaming.
+
+    Generated tokens are the words of `response_text`, repeated up to `max_tokens`; `min_tokens` and `ignore_eos`
+    are honoured like vLLM does, so output lengths are deterministic.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "emulated-model",
+        response_text: str = DEFAULT_EMULATOR_RESPONSE,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = HTTPStatus.INTERNAL_SERVER_ERROR,
+        tool_calls: list[dict[str, Any]] | None = None,
+        embedding_size: int = DEFAULT_EMBEDDING_SIZE,
+        seed: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            model_name (str): Served model name.
+            response_text (str): Text the generated tokens are taken from.
+            first_token_delay (float): Delay before the first token, in seconds; emulates prefill.
+            token_delay (float): Delay between tokens, in seconds; emulates decoding.
+            error_rate (float): Fraction of requests, between 0 and 1, answered with `error_status`.
+            error_status (int): HTTP status of injected errors.
+            tool_calls (list[dict[str, Any]] | None): Tool calls returned to chat requests with `tools`,
+                e.g. `[{"name": "get_weather", "arguments": {"city": "Boston"}}]`.
+            embedding_size (int): Embedding vectors size.
+            seed (int): Random seed of the injected errors.
+            **kwargs: `EmulatorHTTPServer` arguments.
+        """
+        super().__init__(**kwargs)
+        self.model_name = model_name
+        self.response_tokens = [f" {word}" for word in response_text.split()]
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.tool_calls = tool_calls or []
+        self.embedding_size = embedding_size
+        self.rng = random.Random(x=seed)
+
+    async def handle_request(self, request: EmulatorRequest) -> EmulatorResponse:
+        if request.method == "GET" and request.path == OpenAIEnpoints.MODELS_INFO:
+            return EmulatorResponse(body=self.models_response())
+
+        handlers = {
+            OpenAIEnpoints.COMPLETIONS: self.completions_response,
+            OpenAIEnpoints.CHAT_COMPLETIONS: self.chat_completions_response,
+            OpenAIEnpoints.EMBEDDINGS: self.embeddings_response,
+        }
+        if request.method != "POST" or request.path not in handlers:
+            return self.error_response(status=HTTPStatus.NOT_FOUND, message=f"{request.method} {request.path}")
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self.error_response(status=self.error_status, message="Injected error")
+
+        request_data = request.json()
+        if request_data.get("model", self.model_name) != self.model_name:
+            return self.error_response(
+                status=HTTPStatus.NOT_FOUND, message=f"The model `{request_data['model']}` does not exist."
+            )
+
+        return await handlers[request.path](request_data=request_data)
+
+    @staticmethod
+    def error_response(status: int, message: str) -> EmulatorResponse:
+        return EmulatorResponse(
+            status=status,
+            body={"object": "error", "message": message, "type": HTTPStatus(value=status).phrase, "code": status},
+        )
+
+    def models_response(self) -> dict[str, Any]:
+        created = int(time.time())
+        return {
+            "object": "list",
+            "data": [
+                {
+                    "id": self.model_name,
+                    "object": "model",
+                    "created": created,
+                    "owned_by": "vllm",
+                    "root": self.model_name,
+                    "parent": None,
+                    "permission": [
+                        {"id": f"modelperm-{uuid.uuid4().hex}", "object": "model_permission", "created": created}
+                    ],
+                }
+            ],
+        }
+
+    def generate_tokens(self, request_data: dict[str, Any]) -> list[str]:
+        """
+        Get the tokens generated for a request.
+
+        Args:
+            request_data (dict[str, Any]): Request body.
+
+        Returns:
+            list[str]: Generated tokens.
+
+        """
+        # 0 is a valid limit, only missing limits fall back to the default
+        max_tokens = request_data.get("max_tokens")
+        if max_tokens is None:
+            max_tokens = request_data.get("max_completion_tokens")
+
+        if max_tokens is None:
+            max_tokens = DEFAULT_MAX_TOKENS
+
+        num_tokens = max_tokens
+        if not request_data.get("ignore_eos"):
+            num_tokens = min(max_tokens, max(len(self.response_tokens), request_data.get("min_tokens", 0)))
+
+        return [self.response_tokens[index % len(self.response_tokens)] for index in range(num_tokens)]
+
+    @staticmethod
+    def count_prompt_tokens(prompt: Any) -> int:
+        return len(json.dumps(prompt).split()) if not isinstance(prompt, str) else len(prompt.split())
+
+    @staticmethod
+    def usage(prompt_tokens: int, completion_tokens: int) -> dict[str, int]:
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def completions_response(self, request_data: dict[str, Any]) -> EmulatorResponse:
+        tokens = self.generate_tokens(request_data=request_data)
+        usage = self.usage(
+            prompt_tokens=self.count_prompt_tokens(prompt=request_data.get("prompt", "")), completion_tokens=len(tokens)
+        )
+        finish_reason = "length" if len(tokens) == request_data.get("max_tokens") else "stop"
+        base_response: dict[str, Any] = {
+            "id": f"cmpl-{uuid.uuid4().hex}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": self.model_name,
+        }
+
+        if request_data.get("stream"):
+            chunks: list[dict[str, Any]] = [
+                {**base_response, "choices": [{"index": 0, "text": token, "logprobs": None, "finish_reason": None}]}
+                for token in tokens
+            ]
+            chunks.append({
+                **base_response,
+                "choices": [{"index": 0, "text": "", "logprobs": None, "finish_reason": finish_reason}],
+            })
+            return self.streaming_response(
+                chunks=chunks, usage_chunk={**base_response, "choices": [], "usage": usage}, request_data=request_data
+            )
+
+        await asyncio.sleep(delay=self.first_token_delay + self.token_delay * max(len(tokens) - 1, 0))
+        return EmulatorResponse(
+            body={
+                **base_response,
+                "choices": [{"index": 0, "text": "".join(tokens), "logprobs": None, "finish_reason": finish_reason}],
+                "usage": usage,
+            }
+        )
+
+    async def chat_completions_response(self, request_data: dict[str, Any]) -> EmulatorResponse:
+        base_response: dict[str, Any] = {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion.chunk" if request_data.get("stream") else "chat.completion",
+            "created": int(time.time()),
+            "model": self.model_name,
+        }
+        prompt_tokens = self.count_prompt_tokens(prompt=request_data.get("messages", []))
+
+        if request_data.get("tools") and self.tool_calls:
+            tool_calls = [
+                {
+                    "id": f"chatcmpl-tool-{uuid.uuid4().hex}",
+                    "type": "function",
+                    "function": {"name": tool_call["name"], "arguments": json.dumps(tool_call.get("arguments", {}))},
+                }
+                for tool_call in self.tool_calls
+            ]
+            tokens = []
+            message: dict[str, Any] = {"role": "assistant", "content": None, "tool_calls": tool_calls}
+            finish_reason = "tool_calls"
+        else:
+            tokens = self.generate_tokens(request_data=request_data)
+            message = {"role": "assistant", "content": "".join(tokens), "tool_calls": []}
+            finish_reason = "length" if len(tokens) == request_data.get("max_tokens") else "stop"
+
+        usage = self.usage(prompt_tokens=prompt_tokens, completion_tokens=len(tokens) or len(self.tool_calls))
+
+        if request_data.get("stream"):
+            chunks = [
+                {
+                    **base_response,
+                    "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}],
+                }
+            ]
+            if message["tool_calls"]:
+                chunks.append({
+                    **base_response,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {
+                                "tool_calls": [
+                                    {"index": index, **tool_call}
+                                    for index, tool_call in enumerate(message["tool_calls"])
+                                ]
+                            },
+                            "finish_reason": None,
+                        }
+                    ],
+                })
+            chunks.extend(
+                {**base_response, "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                for token in tokens
+            )
+            chunks.append({**base_response, "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}]})
+            return self.streaming_response(
+                chunks=chunks, usage_chunk={**base_response, "choices": [], "usage": usage}, request_data=request_data
+            )
+
+        await asyncio.sleep(delay=self.first_token_delay + self.token_delay * max(len(tokens) - 1, 0))
+        return EmulatorResponse(
+            body={
+                **base_response,
+                "choices": [{"index": 0, "message": message, "logprobs": None, "finish_reason": finish_reason}],
+                "usage": usage,
+            }
+        )
+
+    async def embeddings_response(self, request_data: dict[str, Any]) -> EmulatorResponse:
+        inputs = request_data.get("input", "")
+        inputs = inputs if isinstance(inputs, list) else [inputs]
+        await asyncio.sleep(delay=self.first_token_delay)
+
+        return EmulatorResponse(
+            body={
+                "id": f"embd-{uuid.uuid4().hex}",
+                "object": "list",
+                "created": int(time.time()),
+                "model": self.model_name,
+                "data": [
+                    {"index": index, "object": "embedding", "embedding": self.embedding(text=str(text))}
+                    for index, text in enumerate(inputs)
+                ],
+                "usage": self.usage(
+                    prompt_tokens=sum(self.count_prompt_tokens(prompt=text) for text in inputs), completion_tokens=0
+                ),
+            }
+        )
+
+    def embedding(self, text: str) -> list[float]:
+        """
+        Get a deterministic, normalized embedding of a text.
+
+        Args:
+            text (str): Embedded text.
+
+        Returns:
+            list[float]: Embedding of `embedding_size` values.
+
+        """
+        digest = hashlib.sha256(string=text.encode()).digest()
+        values = [digest[index % len(digest)] / 255 - 0.5 for index in range(self.embedding_size)]
+        norm = sum(value**2 for value in values) ** 0.5 or 1.0
+        return [round(value / norm, 6) for value in values]
+
+    def streaming_response(
+        self, chunks: list[dict[str, Any]], usage_chunk: dict[str, Any], request_data: dict[str, Any]
+    ) -> EmulatorResponse:
+        """
+        Build a server-sent events response, sending the chunks with the configured token cadence.
+
+        Args:
+            chunks (list[dict[str, Any]]): Response chunks.
+            usage_chunk (dict[str, Any]): Usage chunk, sent last if `stream_options.include_usage` is set.
+            request_data (dict[str, Any]): Request body.
+
+        Returns:
+            EmulatorResponse: Streaming response.
+
+        """
+        if request_data.get("stream_options", {}).get("include_usage"):
+            chunks = [*chunks, usage_chunk]
+
+        async def _events() -> AsyncIterator[bytes]:
+            await asyncio.sleep(delay=self.first_token_delay)
+            for index, chunk in enumerate(chunks):
+                if index and self.token_delay:
+                    await asyncio.sleep(delay=self.token_delay)
+                yield f"data: {json.dumps(chunk)}\n\n".encode()
+
+            yield b"data: [DONE]\n\n"
+
+        return EmulatorResponse(stream=_events(), content_type="text/event-stream")
@@ -0,0 +1,290 @@
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+import grpc
+from simple_logger.logger import get_logger
+
+from utilities.emulators.openai_emulator import DEFAULT_EMULATOR_RESPONSE
+from utilities.plugins.tgis_grpc import generation_pb2, generation_pb2_grpc
+
+LOGGER = get_logger(name=__name__)
+
+# TGIS defaults, used when the request does not set stopping criteria
+DEFAULT_MAX_NEW_TOKENS: int = 20
+DEFAULT_MAX_SEQUENCE_LENGTH: int = 2048
+DEFAULT_MAX_BATCH_SIZE: int = 16
+TOKEN_REGEX: re.Pattern[str] = re.compile(r"\S+")
+
+
+class TGISGRPCEmulator:
+    """
+    Local stand-in of the TGIS gRPC `GenerationService` (Generate, GenerateStream, Tokenize and ModelInfo),
+    used to exercise `TGISGRPCPlugin` under load without a model server.
+
+    Generated tokens are the words of `response_text`, repeated up to `max_new_tokens`. Batched requests are
+    decoded together; each concurrently decoded sequence adds `batch_token_delay` to the token cadence, emulating
+    continuous batching. Distinct client connections are recorded in `peers`, to check channel reuse.
+
+    Eg:
+        with TGISGRPCEmulator(model_name="my-model", token_delay=0.01) as emulator:
+            TGISGRPCPlugin(host=emulator.url, model_name="my-model", streaming=True).request_func(query={"text": "Hi"})
+    """
+
+    def __init__(
+        self,
+        model_name: str = "emulated-model",
+        response_text: str = DEFAULT_EMULATOR_RESPONSE,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+        batch_token_delay: float = 0.0,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_concurrent_requests: int = 0,
+        max_sequence_length: int = DEFAULT_MAX_SEQUENCE_LENGTH,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_workers: int = 64,
+    ) -> None:
+        """
+        Args:
+            model_name (str): Served model name.
+            response_text (str): Text the generated tokens are taken from.
+            first_token_delay (float): Delay before the first token, in seconds; emulates prefill.
+            token_delay (float): Delay between tokens, in seconds; emulates decoding.
+            batch_token_delay (float): Delay added between tokens for each other sequence decoded at the same time.
+            max_batch_size (int): Maximum number of requests of a `Generate` batch; larger batches are rejected.
+            max_concurrent_requests (int): Maximum number of requests handled at the same time, others are rejected
+                with `RESOURCE_EXHAUSTED`; 0 for no limit.
+            max_sequence_length (int): Maximum input and generated tokens, reported by `ModelInfo`.
+            error_rate (float): Fraction of generation requests, between 0 and 1, failed with `INTERNAL`.
+            seed (int): Random seed of the injected failures.
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 selects a free port.
+            max_workers (int): Maximum number of concurrently handled gRPC requests.
+        """
+        self.model_name = model_name
+        self.response_tokens = [f" {word}" for word in response_text.split()]
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.batch_token_delay = batch_token_delay
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_sequence_length = max_sequence_length
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self.rng = random.Random(x=seed)
+        self.requests_count: dict[str, int] = {}
+        self.peers: set[str] = set()
+        self.active_sequences = 0
+        self.active_requests = 0
+        self.peak_active_sequences = 0
+        self._lock = threading.Lock()
+        self._server: grpc.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    def __enter__(self) -> "TGISGRPCEmulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._server = grpc.server(thread_pool=ThreadPoolExecutor(max_workers=self.max_workers))
+        generation_pb2_grpc.add_GenerationServiceServicer_to_server(
+            servicer=TGISGRPCServicer(emulator=self), server=self._server
+        )
+        self.port = self._server.add_insecure_port(address=self.url)
+        self._server.start()
+        LOGGER.info(f"{type(self).__name__} listening on {self.url}")
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.stop(grace=None)
+            self._server = None
+
+    def generate_tokens(self, params: Any) -> tuple[list[str], int]:
+        """
+        Get the tokens generated for a request and the TGIS stop reason.
+
+        Args:
+            params (Parameters): Request generation parameters.
+
+        Returns:
+            tuple[list[str], int]: Generated tokens and `StopReason` value.
+
+        """
+        max_new_tokens = params.stopping.max_new_tokens or DEFAULT_MAX_NEW_TOKENS
+        num_tokens = min(max_new_tokens, max(len(self.response_tokens), params.stopping.min_new_tokens))
+        stop_reason = (
+            generation_pb2.MAX_TOKENS  # type: ignore[attr-defined]
+            if num_tokens == max_new_tokens
+            else generation_pb2.EOS_TOKEN  # type: ignore[attr-defined]
+        )
+
+        return [self.response_tokens[index % len(self.response_tokens)] for index in range(num_tokens)], stop_reason
+
+    def next_token_delay(self) -> float:
+        return self.token_delay + self.batch_token_delay * max(self.active_sequences - 1, 0)
+
+
+class TGISGRPCServicer(generation_pb2_grpc.GenerationServiceServicer):
+    """
+    `GenerationService` servicer of `TGISGRPCEmulator`.
+    """
+
+    def __init__(self, emulator: TGISGRPCEmulator) -> None:
+        self.emulator = emulator
+
+    def start_request(self, method: str, context: grpc.ServicerContext, model_id: str = "") -> None:
+        """
+        Account a request and reject it if the model is unknown, the server is saturated or a failure is injected.
+
+        Args:
+            method (str): RPC method name.
+            context (grpc.ServicerContext): Request context.
+            model_id (str): Requested model; empty for the served model.
+
+        """
+        emulator = self.emulator
+        with emulator._lock:
+            path = f"/fmaas.GenerationService/{method}"
+            emulator.requests_count[path] = emulator.requests_count.get(path, 0) + 1
+            emulator.peers.add(context.peer())
+            saturated = 0 < emulator.max_concurrent_requests <= emulator.active_requests
+            injected_failure = method.startswith("Generate") and emulator.rng.random() < emulator.error_rate
+            if not saturated:
+                emulator.active_requests += 1
+
+        if saturated:
+            context.abort(code=grpc.StatusCode.RESOURCE_EXHAUSTED, details="Model is overloaded")
+
+        context.add_callback(self.end_request)  # noqa: FCN001
+        if model_id and model_id != emulator.model_name:
+            context.abort(code=grpc.StatusCode.NOT_FOUND, details=f"Model {model_id} not found")
+
+        if injected_failure:
+            context.abort(code=grpc.StatusCode.INTERNAL, details="Injected failure")
+
+    def end_request(self) -> None:
+        with self.emulator._lock:
+            self.emulator.active_requests -= 1
+
+    def update_active_sequences(self, count: int) -> None:
+        emulator = self.emulator
+        with emulator._lock:
+            emulator.active_sequences += count
+            emulator.peak_active_sequences = max(emulator.peak_active_sequences, emulator.active_sequences)
+
+    def Generate(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.start_request(method="Generate", context=context, model_id=request.model_id)
+        if len(request.requests) > self.emulator.max_batch_size:
+            context.abort(
+                code=grpc.StatusCode.INVALID_ARGUMENT,
+                details=f"Batch size {len(request.requests)} exceeds maximum of {self.emulator.max_batch_size}",
+            )
+
+        tokens, stop_reason = self.emulator.generate_tokens(params=request.params)
+        self.update_active_sequences(count=len(request.requests))
+        try:
+            time.sleep(self.emulator.first_token_delay)
+            for _ in tokens[1:]:
+                time.sleep(self.emulator.next_token_delay())
+
+        finally:
+            self.update_active_sequences(count=-len(request.requests))
+
+        return generation_pb2.BatchedGenerationResponse(  # type: ignore[attr-defined]
+            responses=[
+                self.generation_response(
+                    text=generation_request.text, tokens=tokens, stop_reason=stop_reason, params=request.params
+                )
+                for generation_request in request.requests
+            ]
+        )
+
+    def GenerateStream(self, request: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+        self.start_request(method="GenerateStream", context=context, model_id=request.model_id)
+        tokens, stop_reason = self.emulator.generate_tokens(params=request.params)
+        input_token_count = self.count_input_tokens(text=request.request.text, params=request.params)
+        generated_tokens = request.params.response.generated_tokens
+
+        self.update_active_sequences(count=1)
+        try:
+            # TGIS sends the input details first, then one message per generated token
+            yield generation_pb2.GenerationResponse(input_token_count=input_token_count)  # type: ignore[attr-defined]
+            time.sleep(self.emulator.first_token_delay)
+            for index, token in enumerate(tokens):
+                if index:
+                    time.sleep(self.emulator.next_token_delay())
+
+                is_last = index == len(tokens) - 1
+                token_info = []
+                if generated_tokens:
+                    token_info.append(generation_pb2.TokenInfo(text=token))  # type: ignore[attr-defined]
+                yield generation_pb2.GenerationResponse(  # type: ignore[attr-defined]
+                    input_token_count=input_token_count,
+                    generated_token_count=index + 1,
+                    text=token,
+                    stop_reason=stop_reason if is_last else generation_pb2.NOT_FINISHED,  # type: ignore[attr-defined]
+                    tokens=token_info,
+                )
+
+        finally:
+            self.update_active_sequences(count=-1)
+
+    def Tokenize(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.start_request(method="Tokenize", context=context, model_id=request.model_id)
+        response = generation_pb2.BatchedTokenizeResponse()  # type: ignore[attr-defined]
+        for tokenize_request in request.requests:
+            matches = list(TOKEN_REGEX.finditer(string=tokenize_request.text))
+            if request.truncate_input_tokens:
+                first_token = max(len(matches) - request.truncate_input_tokens, 0)
+                matches = matches[first_token:]
+
+            tokenize_response = response.responses.add(token_count=len(matches))
+            if request.return_tokens:
+                tokenize_response.tokens.extend([match.group() for match in matches])
+            if request.return_offsets:
+                for match in matches:
+                    tokenize_response.offsets.add(start=match.start(), end=match.end())
+
+        return response
+
+    def ModelInfo(self, request: Any, context: grpc.ServicerContext) -> Any:
+        self.start_request(method="ModelInfo", context=context, model_id=request.model_id)
+        return generation_pb2.ModelInfoResponse(  # type: ignore[attr-defined]
+            model_kind=generation_pb2.ModelInfoResponse.DECODER_ONLY,  # type: ignore[attr-defined]
+            max_sequence_length=self.emulator.max_sequence_length,
+            max_new_tokens=self.emulator.max_sequence_length,
+        )
+
+    @staticmethod
+    def count_input_tokens(text: str, params: Any) -> int:
+        input_tokens = len(TOKEN_REGEX.findall(string=text))
+        if params.truncate_input_tokens:
+            return min(input_tokens, params.truncate_input_tokens)
+
+        return input_tokens
+
+    def generation_response(self, text: str, tokens: list[str], stop_reason: int, params: Any) -> Any:
+        return generation_pb2.GenerationResponse(  # type: ignore[attr-defined]
+            input_token_count=self.count_input_tokens(text=text, params=params),
+            generated_token_count=len(tokens),
+            text=f"{text}{''.join(tokens)}" if params.response.input_text else "".join(tokens),
+            stop_reason=stop_reason,
+            seed=params.sampling.seed,
+            tokens=[generation_pb2.TokenInfo(text=token) for token in tokens]  # type: ignore[attr-defined]
+            if params.response.generated_tokens
+            else [],
+        )
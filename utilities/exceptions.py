@@ -136,3 +136,9 @@ class MissingParameter(Exception):
 
 class ExceptionUserLogin(Exception):
     pass
+
+
+class PrometheusQueryError(Exception):
+    """Raised when a Prometheus query does not return a successful status."""
+
+    pass
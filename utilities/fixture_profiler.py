@@ -0,0 +1,417 @@
+import functools
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Generator
+
+import pytest
+from kubernetes.client.rest import RESTClientObject
+from kubernetes.watch import Watch
+from pytest import FixtureDef, FixtureRequest, Item, Session
+from simple_logger.logger import get_logger
+
+from utilities.api_accounting import get_kube_api_call_type
+from utilities.benchmark_utils import BenchmarkReport
+
+LOGGER = get_logger(name=__name__)
+
+PROFILE_ACTIVITIES: tuple[str, ...] = ("wait", "api", "subprocess")
+FIXTURE_PROFILE_SORT_KEYS: tuple[str, ...] = (
+    "total_seconds",
+    "self_seconds",
+    "wait_seconds",
+    "api_seconds",
+    "subprocess_seconds",
+    "other_seconds",
+    "count",
+)
+FIXTURE_PROFILE_TRACE_FILE_NAME: str = "fixture-profile-trace.json"
+# Activities recorded in the trace; later activities are still attributed to their span
+FIXTURE_PROFILE_MAX_TRACE_ACTIVITIES: int = 200000
+
+
+def get_subprocess_name(process: subprocess.Popen[Any]) -> str:
+    """
+    Get the executable name of a subprocess, e.g. `oc` or `curl`.
+
+    Args:
+        process (subprocess.Popen): Subprocess.
+
+    Returns:
+        str: Executable base name.
+
+    """
+    args = process.args.split() if isinstance(process.args, str) else list(process.args)  # type: ignore[arg-type]
+    return os.path.basename(str(args[0])) if args else "subprocess"
+
+
+class FixtureProfiler:
+    """
+    Pytest plugin timing every fixture setup and teardown and every test phase.
+
+    The time of each span is attributed to waits (`time.sleep`, e.g. `TimeoutSampler` polling, and watch streams),
+    Kubernetes API calls and subprocesses (e.g. `run_command`, `oc`, `curl`); the rest is reported as `other`.
+    Only activities of the span thread are attributed to it; activities of other threads (e.g. concurrent requests
+    workers) overlap the span thread time and are only shown in the trace.
+    At session end, writes a per-span report, a per-class critical path report and a Chrome trace
+    (loadable in Perfetto or chrome://tracing) to the results directory.
+    """
+
+    def __init__(self, results_dir: str, sort_by: str = "total_seconds") -> None:
+        """
+        Args:
+            results_dir (str): Directory to write the reports and trace to.
+            sort_by (str): Per-span report sort key, one of `FIXTURE_PROFILE_SORT_KEYS`.
+        """
+        self.results_dir = results_dir
+        self.sort_by = sort_by
+        self.spans: list[dict[str, Any]] = []
+        self.activity_events: list[dict[str, Any]] = []
+        self.dropped_activity_events = 0
+        self.test = ""
+        self.group = ""
+        self._span_stack: list[dict[str, Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._originals: list[tuple[Any, str, Any]] = []
+        self._start_time = time.perf_counter()
+
+    def install(self) -> None:
+        """
+        Wrap the waits, Kubernetes API calls and subprocesses to attribute their time to the current span.
+        """
+        self._patch(owner=time, attribute="sleep", category="wait", get_name=lambda *args, **kwargs: "sleep")
+        self._patch(
+            owner=RESTClientObject,
+            attribute="request",
+            category="api",
+            get_name=lambda rest_client, method, url, **kwargs: " ".join(
+                get_kube_api_call_type(method=method, url=url, query_params=kwargs.get("query_params"))
+            ),
+        )
+        for attribute in ("communicate", "wait"):
+            self._patch(
+                owner=subprocess.Popen,
+                attribute=attribute,
+                category="subprocess",
+                get_name=lambda process, *args, **kwargs: get_subprocess_name(process=process),
+            )
+
+        original_stream = Watch.stream
+        profiler = self
+
+        @functools.wraps(original_stream)
+        def _profiled_stream(
+            watch: Watch, func: Callable[..., Any], *args: Any, **kwargs: Any
+        ) -> Generator[Any, Any, Any]:
+            events = original_stream(watch, func, *args, **kwargs)  # noqa: FCN001
+            try:
+                while True:
+                    with profiler.activity(category="wait", name="watch"):
+                        event = next(events, None)
+
+                    if event is None:
+                        return
+
+                    yield event
+
+            finally:
+                events.close()
+
+        Watch.stream = _profiled_stream
+        self._originals.append((Watch, "stream", original_stream))
+
+    def uninstall(self) -> None:
+        while self._originals:
+            owner, attribute, original = self._originals.pop()
+            setattr(owner, attribute, original)
+
+    def _patch(self, owner: Any, attribute: str, category: str, get_name: Callable[..., str]) -> None:
+        original = getattr(owner, attribute)
+        profiler = self
+
+        @functools.wraps(original)
+        def _profiled(*args: Any, **kwargs: Any) -> Any:
+            with profiler.activity(category=category, name=get_name(*args, **kwargs)):
+                return original(*args, **kwargs)
+
+        setattr(owner, attribute, _profiled)
+        self._originals.append((owner, attribute, original))
+
+    @contextmanager
+    def activity(self, category: str, name: str) -> Generator[None, Any, Any]:
+        """
+        Attribute the time spent in the context to the current span, in `category`.
+        Nested activities (e.g. API calls made by a watch stream) are attributed to the outermost activity only.
+
+        Args:
+            category (str): Activity category, one of `PROFILE_ACTIVITIES`.
+            name (str): Activity name in the trace, e.g. `list pods`.
+
+        """
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start_time = time.perf_counter()
+        try:
+            yield
+
+        finally:
+            end_time = time.perf_counter()
+            self._local.depth = depth
+            thread_id = threading.get_ident()
+            with self._lock:
+                if len(self.activity_events) < FIXTURE_PROFILE_MAX_TRACE_ACTIVITIES:
+                    self.activity_events.append({
+                        "name": name,
+                        "category": category,
+                        "start": start_time,
+                        "end": end_time,
+                        "tid": thread_id,
+                    })
+                else:
+                    self.dropped_activity_events += 1
+
+                if depth == 0 and self._span_stack and self._span_stack[-1]["tid"] == thread_id:
+                    self._span_stack[-1][category] += end_time - start_time
+
+    def start_span(self, kind: str, name: str, scope: str = "function") -> None:
+        with self._lock:
+            span = {
+                "kind": kind,
+                "name": name,
+                "scope": scope,
+                "test": self.test,
+                "group": self.group,
+                "start": time.perf_counter(),
+                "end": 0.0,
+                "tid": threading.get_ident(),
+                "children": [],
+                **dict.fromkeys(PROFILE_ACTIVITIES, 0.0),
+            }
+            if self._span_stack:
+                self._span_stack[-1]["children"].append(span)
+
+            self._span_stack.append(span)
+            self.spans.append(span)
+
+    def end_span(self, kind: str, name: str) -> None:
+        with self._lock:
+            for index in range(len(self._span_stack) - 1, -1, -1):
+                if (self._span_stack[index]["kind"], self._span_stack[index]["name"]) == (kind, name):
+                    self._span_stack.pop(index)["end"] = time.perf_counter()
+                    return
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef: FixtureDef[Any], request: FixtureRequest) -> Generator[None, Any, Any]:
+        self.start_span(kind="fixture setup", name=fixturedef.argname, scope=fixturedef.scope)
+        try:
+            return (yield)
+
+        finally:
+            self.end_span(kind="fixture setup", name=fixturedef.argname)
+            # Finalizers run last-in first-out, this runs before the fixture teardown
+            fixturedef.addfinalizer(
+                partial(self.start_span, kind="fixture teardown", name=fixturedef.argname, scope=fixturedef.scope)
+            )
+
+    def pytest_fixture_post_finalizer(self, fixturedef: FixtureDef[Any], request: FixtureRequest) -> None:
+        self.end_span(kind="fixture teardown", name=fixturedef.argname)
+
+    @contextmanager
+    def test_phase_span(self, item: Item, phase: str) -> Generator[None, Any, Any]:
+        group_node = item.getparent(cls=pytest.Class) or item.getparent(cls=pytest.Module)
+        self.test, self.group = item.nodeid, group_node.nodeid if group_node else item.nodeid
+        self.start_span(kind=f"test {phase}", name=item.nodeid)
+        try:
+            yield
+
+        finally:
+            self.end_span(kind=f"test {phase}", name=item.nodeid)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item: Item) -> Generator[None, Any, Any]:
+        with self.test_phase_span(item=item, phase="setup"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: Item) -> Generator[None, Any, Any]:
+        with self.test_phase_span(item=item, phase="call"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item: Item) -> Generator[None, Any, Any]:
+        with self.test_phase_span(item=item, phase="teardown"):
+            return (yield)
+
+    def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
+        self.uninstall()
+        if self.spans:
+            self.write_reports()
+
+    @staticmethod
+    def span_label(span: dict[str, Any]) -> str:
+        """
+        Get a short span label, e.g. `model_isvc setup` or `test_model_inference call`.
+
+        Args:
+            span (dict[str, Any]): Span.
+
+        Returns:
+            str: Fixture or test name, and the span phase.
+
+        """
+        return f"{span['name'].split('::')[-1]} {span['kind'].split()[-1]}"
+
+    @staticmethod
+    def span_times(span: dict[str, Any]) -> dict[str, float]:
+        """
+        Get the time breakdown of a span.
+
+        Args:
+            span (dict[str, Any]): Span.
+
+        Returns:
+            dict[str, float]: Total time, self time (excluding nested spans) and self time per activity, in seconds.
+
+        """
+        total = max(span["end"] - span["start"], 0.0)
+        self_time = max(total - sum(child["end"] - child["start"] for child in span["children"]), 0.0)
+        activities = {category: span[category] for category in PROFILE_ACTIVITIES}
+        return {
+            "total": total,
+            "self": self_time,
+            **activities,
+            "other": max(self_time - sum(activities.values()), 0.0),
+        }
+
+    def critical_path(self, spans: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Get the chain of heaviest spans: the heaviest span, then its heaviest nested span, and so on,
+        as long as the nested span takes most of its parent time.
+
+        Args:
+            spans (list[dict[str, Any]]): Top-level spans, e.g. the test phases of a class.
+
+        Returns:
+            list[dict[str, Any]]: Critical path spans, outermost first.
+
+        """
+        path: list[dict[str, Any]] = []
+        candidates = spans
+        while candidates:
+            heaviest = max(candidates, key=lambda span: span["end"] - span["start"])
+            if path and (heaviest["end"] - heaviest["start"]) * 2 < path[-1]["end"] - path[-1]["start"]:
+                break
+
+            path.append(heaviest)
+            candidates = heaviest["children"]
+
+        return path
+
+    def write_reports(self) -> None:
+        """
+        Write the per-span (`fixture-profile`) and per-class critical path (`fixture-profile-critical-path`) reports,
+        and the Chrome trace.
+        """
+        spans_report = BenchmarkReport(name="fixture-profile", results_dir=self.results_dir)
+        aggregated: dict[tuple[str, str, str], dict[str, float]] = {}
+        for span in self.spans:
+            entry = aggregated.setdefault(
+                (span["kind"], span["name"], span["scope"]),
+                {"count": 0, **{f"{time_type}_seconds": 0.0 for time_type in self.span_times(span=span)}},
+            )
+            entry["count"] += 1
+            for time_type, seconds in self.span_times(span=span).items():
+                entry[f"{time_type}_seconds"] += seconds
+
+        for (kind, name, scope), entry in sorted(
+            aggregated.items(), key=lambda item: item[1][self.sort_by], reverse=True
+        ):
+            spans_report.add_result(
+                kind=kind,
+                name=name,
+                scope=scope,
+                **{key: round(value, 3) if key != "count" else int(value) for key, value in entry.items()},
+            )
+        spans_report.write()
+
+        critical_path_report = BenchmarkReport(name="fixture-profile-critical-path", results_dir=self.results_dir)
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for span in self.spans:
+            if span["kind"].startswith("test "):
+                groups.setdefault(span["group"], []).append(span)
+
+        for group, group_spans in sorted(
+            groups.items(), key=lambda item: sum(span["end"] - span["start"] for span in item[1]), reverse=True
+        ):
+            group_times: dict[str, float] = {}
+            for span in self.spans:
+                if span["group"] == group:
+                    for time_type, seconds in self.span_times(span=span).items():
+                        group_times[time_type] = group_times.get(time_type, 0.0) + seconds
+
+            critical_path_report.add_result(
+                group=group,
+                tests=len({span["name"] for span in group_spans}),
+                wall_seconds=round(sum(span["end"] - span["start"] for span in group_spans), 3),
+                **{
+                    f"{time_type}_seconds": round(group_times.get(time_type, 0.0), 3)
+                    for time_type in (*PROFILE_ACTIVITIES, "other")
+                },
+                critical_path=" > ".join(
+                    f"{self.span_label(span=span)} ({span['end'] - span['start']:.1f}s)"
+                    for span in self.critical_path(spans=group_spans)
+                ),
+            )
+        critical_path_report.write()
+
+        trace_file = os.path.join(self.results_dir, FIXTURE_PROFILE_TRACE_FILE_NAME)
+        with open(trace_file, "w") as trace:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, trace)
+
+        LOGGER.info(f"Fixture profile trace written to {trace_file}, open it in https://ui.perfetto.dev")
+        if self.dropped_activity_events:
+            LOGGER.warning(
+                f"Fixture profile trace: {self.dropped_activity_events} activities not written, "
+                f"the trace is limited to {FIXTURE_PROFILE_MAX_TRACE_ACTIVITIES} activities"
+            )
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """
+        Get the spans and activities as Chrome trace complete (`X`) events.
+
+        Returns:
+            list[dict[str, Any]]: Trace events, with timestamps and durations in microseconds.
+
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": self.span_label(span=span),
+                "cat": span["kind"],
+                "ph": "X",
+                "ts": round((span["start"] - self._start_time) * 1e6),
+                "dur": round(max(span["end"] - span["start"], 0.0) * 1e6),
+                "pid": pid,
+                "tid": span["tid"],
+                "args": {"test": span["test"], "scope": span["scope"]},
+            }
+            for span in self.spans
+        ]
+        events.extend(
+            {
+                "name": activity["name"],
+                "cat": activity["category"],
+                "ph": "X",
+                "ts": round((activity["start"] - self._start_time) * 1e6),
+                "dur": round((activity["end"] - activity["start"]) * 1e6),
+                "pid": pid,
+                "tid": activity["tid"],
+            }
+            for activity in self.activity_events
+        )
+        return events
@@ -1,8 +1,12 @@
 import base64
+import datetime
+import inspect
+import json
 import re
-from typing import List, Tuple
+from typing import Any, List, Tuple
 import uuid
 
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import ResourceNotFoundError, NotFoundError
 from ocp_resources.inference_graph import InferenceGraph
@@ -11,16 +15,21 @@ from ocp_resources.pod import Pod
 from simple_logger.logger import get_logger
 
 import utilities.infra
+import utilities.model_staging
 from utilities.constants import Annotations, KServeDeploymentType, MODELMESH_SERVING, Timeout
-from utilities.exceptions import UnexpectedResourceCountError, ResourceValueMismatch
+from utilities.exceptions import UnexpectedFailureError, UnexpectedResourceCountError, ResourceValueMismatch
 from ocp_resources.resource import Resource
-from timeout_sampler import retry
+from timeout_sampler import TimeoutSampler, retry
 
 # Constants for image validation
 SHA256_DIGEST_PATTERN = r"@sha256:[a-f0-9]{64}$"
 
 LOGGER = get_logger(name=__name__)
 
+MODEL_STAGING_CONTAINER_NAME: str = "model-downloader"
+# Model staging manifests and partially downloaded objects, at the PVC root
+MODEL_STAGING_STATE_DIR_NAME: str = ".model-staging"
+
 
 def get_s3_secret_dict(
     aws_access_key: str,
@@ -79,10 +88,17 @@ def download_model_data(
     aws_default_region: str,
     model_path: str,
     use_sub_path: bool = False,
+    max_workers: int = utilities.model_staging.DEFAULT_MAX_WORKERS,
 ) -> str:
     """
     Downloads the model data from the bucket to the PVC
 
+    Objects are downloaded in parallel byte ranges by `utilities.model_staging` running in the storage initializer
+    image. A manifest of the downloaded objects ETags and sizes is kept in the PVC, so objects already in the PVC
+    are skipped and partially downloaded objects are resumed when the same PVC is used again. The manifest and
+    partially downloaded objects are kept under `MODEL_STAGING_STATE_DIR_NAME` at the PVC root, outside the served
+    model directory.
+
     Args:
         client (DynamicClient): Admin client
         aws_access_key_id (str): AWS access key
@@ -93,42 +109,51 @@ def download_model_data(
         aws_endpoint_url (str): AWS endpoint URL
         aws_default_region (str): AWS default region
         model_path (str): Path to the model
-        use_sub_path (bool): Whether to use a sub path
+        use_sub_path (bool): Whether to download the model under `<model_path>/<model_path>` in the PVC,
+            e.g. to serve `pvc://<pvc name>/<model_path>`
+        max_workers (int): Number of parallel objects and byte range downloads
 
     Returns:
         str: Path to the model path
 
     """
+    # The PVC root is mounted, without sub path, so that the staging state is kept outside the served directory
+    # and on the same mount as the model, objects are renamed into the model directory when downloaded
     volume_mount = {"mountPath": "/mnt/models/", "name": model_pvc_name}
-    if use_sub_path:
-        volume_mount["subPath"] = model_path
-
-    pvc_model_path = f"/mnt/models/{model_path}"
+    pvc_target_path = f"{model_path}/{model_path}" if use_sub_path else model_path
+    pvc_model_path = f"/mnt/models/{pvc_target_path}"
+    pvc_state_path = f"/mnt/models/{MODEL_STAGING_STATE_DIR_NAME}/{pvc_target_path}"
     init_containers = [
         {
             "name": "init-container",
             "image": "quay.io/quay/busybox@sha256:92f3298bf80a1ba949140d77987f5de081f010337880cd771f7e7fc928f8c74d",
             "command": ["sh"],
-            "args": ["-c", f"mkdir -p {pvc_model_path} && chmod -R 777 {pvc_model_path}"],
+            "args": [
+                "-c",
+                f"mkdir -p {pvc_model_path} {pvc_state_path} && "
+                f"chmod -R 777 {pvc_model_path} /mnt/models/{MODEL_STAGING_STATE_DIR_NAME}",
+            ],
             "volumeMounts": [volume_mount],
         }
     ]
     containers = [
         {
-            "name": "model-downloader",
+            "name": MODEL_STAGING_CONTAINER_NAME,
             "image": utilities.infra.get_kserve_storage_initialize_image(client=client),
-            "args": [
-                f"s3://{bucket_name}/{model_path}/",
-                pvc_model_path,
-            ],
+            "command": ["python3", "-c", inspect.getsource(utilities.model_staging)],
             "env": [
                 {"name": "AWS_ACCESS_KEY_ID", "value": aws_access_key_id},
                 {"name": "AWS_SECRET_ACCESS_KEY", "value": aws_secret_access_key},
-                {"name": "S3_USE_HTTPS", "value": "1"},
+                {"name": "S3_USE_HTTPS", "value": "1" if aws_endpoint_url.startswith("https://") else "0"},
                 {"name": "AWS_ENDPOINT_URL", "value": aws_endpoint_url},
                 {"name": "AWS_DEFAULT_REGION", "value": aws_default_region},
                 {"name": "S3_VERIFY_SSL", "value": "false"},
                 {"name": "awsAnonymousCredential", "value": "false"},
+                {"name": "MODEL_STAGING_BUCKET", "value": bucket_name},
+                {"name": "MODEL_STAGING_PREFIX", "value": model_path},
+                {"name": "MODEL_STAGING_TARGET_DIR", "value": pvc_model_path},
+                {"name": "MODEL_STAGING_STATE_DIR", "value": pvc_state_path},
+                {"name": "MODEL_STAGING_MAX_WORKERS", "value": str(max_workers)},
             ],
             "volumeMounts": [volume_mount],
         }
@@ -144,13 +169,66 @@ def download_model_data(
         volumes=volumes,
         restart_policy="Never",
     ) as pod:
-        pod.wait_for_status(status=Pod.Status.RUNNING)
         LOGGER.info("Waiting for model download to complete")
-        pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=25 * 60)
+        wait_for_model_staging(pod=pod, timeout=25 * 60)
 
     return model_path
 
 
+def get_model_staging_progress(pod: Pod) -> dict[str, Any]:
+    """
+    Get the last progress line of a model staging pod.
+
+    Args:
+        pod (Pod): Model staging pod
+
+    Returns:
+        dict[str, Any]: Last progress (`event`, `total_bytes`, `staged_bytes` and `downloaded_bytes`),
+            empty if the staging did not report progress yet
+
+    """
+    try:
+        return json.loads(pod.log(container=MODEL_STAGING_CONTAINER_NAME, tail_lines=1).strip() or "{}")
+
+    except (ApiException, ValueError):
+        return {}
+
+
+def wait_for_model_staging(pod: Pod, timeout: int) -> dict[str, Any]:
+    """
+    Wait for a model staging pod to succeed, logging its progress.
+
+    Args:
+        pod (Pod): Model staging pod
+        timeout (int): Timeout in seconds
+
+    Returns:
+        dict[str, Any]: Staging summary: number of objects, skipped objects, total and downloaded bytes and duration
+
+    Raises:
+        UnexpectedFailureError: If the staging pod failed
+        TimeoutExpiredError: If the staging did not complete within the timeout
+
+    """
+    for phase in TimeoutSampler(wait_timeout=timeout, sleep=10, func=lambda: pod.status):
+        if phase == Pod.Status.FAILED:
+            raise UnexpectedFailureError(
+                f"Model staging pod {pod.name} failed: {pod.log(container=MODEL_STAGING_CONTAINER_NAME)}"
+            )
+
+        if phase in (Pod.Status.RUNNING, Pod.Status.SUCCEEDED) and (progress := get_model_staging_progress(pod=pod)):
+            LOGGER.info(
+                f"Model staging {progress.get('event')}: {progress.get('staged_bytes', 0) / 1e6:.1f} / "
+                f"{progress.get('total_bytes', 0) / 1e6:.1f} MB staged, "
+                f"{progress.get('downloaded_bytes', 0) / 1e6:.1f} MB downloaded"
+            )
+
+        if phase == Pod.Status.SUCCEEDED:
+            break
+
+    return get_model_staging_progress(pod=pod)
+
+
 def create_isvc_label_selector_str(isvc: InferenceService, resource_type: str, runtime_name: str | None = None) -> str:
     """
     Creates a label selector string for the given InferenceService.
@@ -378,3 +456,20 @@ def wait_for_container_status(pod: Pod, container_name: str, expected_status: st
         LOGGER.info(f"Container {container_name} is in the expected status {expected_status}")
         return True
     raise ResourceValueMismatch(f"Container {container_name} is not in the expected status {container_status.state}")
+
+
+def get_kube_timestamp(timestamp: str | None) -> float | None:
+    """
+    Convert a Kubernetes timestamp, e.g. `2025-01-01T10:00:00Z`, to epoch seconds.
+
+    Args:
+        timestamp (str | None): RFC 3339 timestamp.
+
+    Returns:
+        float | None: Epoch seconds, None if there is no timestamp.
+
+    """
+    if not timestamp:
+        return None
+
+    return datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
@@ -481,6 +481,57 @@ class UserInference(Inference):
 
         return out
 
+    def run_timed_inference(
+        self,
+        model_name: str,
+        inference_input: Optional[str] = None,
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+    ) -> dict[str, float]:
+        """
+        Run inference command once over HTTP and measure the client-side timings of its phases
+
+        Args:
+            model_name (str): inference model name
+            inference_input (str): inference input
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+
+        Returns:
+            dict[str, float]: curl timings, seconds from the request start to the end of each phase:
+                `time_namelookup`, `time_connect`, `time_appconnect`, `time_pretransfer`, `time_starttransfer`
+                and `time_total`
+
+        Raises:
+            ValueError: If the protocol is not HTTP or the service is not exposed
+            InferenceResponseError: If the inference response status is not OK
+
+        """
+        if self.protocol not in Protocols.TCP_PROTOCOLS or not self.visibility_exposed:
+            raise ValueError("Timed inference requires an exposed service and an HTTP protocol")
+
+        cmd = self.generate_command(
+            model_name=model_name,
+            inference_input=inference_input,
+            use_default_query=use_default_query,
+            insecure=insecure,
+            token=token,
+        )
+        _, out, err = run_command(
+            command=shlex.split(f"{cmd} {HTTPRequest.CURL_TIMINGS}"), verify_stderr=False, check=False
+        )
+        try:
+            timings = json.loads(out)
+        except JSONDecodeError as exc:
+            raise ValueError(f"Inference failed with error: {err}\nOutput: {out}\nCommand: {cmd}") from exc
+
+        if timings.pop("http_code") != HTTPStatus.OK:
+            raise InferenceResponseError(f"Inference of {self.inference_service.name} failed: {timings}")
+
+        return timings
+
     def get_target_port(self, svc: Service) -> int:
         """
         Get target port for inference when using port forwarding
@@ -61,7 +61,8 @@ from ocp_resources.subscription import Subscription
 from utilities.constants import ApiGroups, Labels, Timeout, RHOAI_OPERATOR_NAMESPACE
 from utilities.constants import KServeDeploymentType
 from utilities.constants import Annotations
-from utilities.exceptions import ClusterLoginError, FailedPodsError, ResourceNotReadyError, UnexpectedResourceCountError
+from utilities.exceptions import FailedPodsError, ResourceNotReadyError, UnexpectedResourceCountError
+from utilities.oauth_utils import get_oauth_token_broker
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler, TimeoutWatch, retry
 import utilities.general
 from ocp_resources.utils.constants import DEFAULT_CLUSTER_RETRY_EXCEPTIONS
@@ -436,31 +437,26 @@ def create_inference_graph_view_role(
         yield role
 
 
-def login_with_user_password(api_address: str, user: str, password: str | None = None) -> bool:
+def get_user_token(api_address: str, user: str, password: str) -> str:
     """
-    Log in to an OpenShift cluster using a username and password.
+    Get a user token, logging in through the cluster OAuth server in process.
+
+    The kubeconfig current context is not changed, several users can log in concurrently,
+    and tokens are cached until they expire.
 
     Args:
         api_address (str): The API address of the OpenShift cluster.
         user (str): Cluster's username
-        password (str, optional): Cluster's password
+        password (str): Cluster's password
 
     Returns:
-        bool: True if login is successful otherwise False.
-    """
-    login_command: str = f"oc login  --insecure-skip-tls-verify=true {api_address} -u {user}"
-    if password:
-        login_command += f" -p '{password}'"
-
-    _, out, err = run_command(command=shlex.split(login_command), hide_log_command=True)
-
-    if err and err.lower().startswith("error"):
-        raise ClusterLoginError(user=user)
+        str: The user token.
 
-    if re.search(r"Login successful|Logged into", out):
-        return True
+    Raises:
+        ClusterLoginError: If the login fails.
 
-    return False
+    """
+    return get_oauth_token_broker(api_server_url=api_address).get_token(user=user, password=password)
 
 
 @cache
@@ -1,17 +1,30 @@
+import json
 import os
 import re
+import threading
+import time
 from functools import cache
+from typing import Any, Iterable
 
-from jira import JIRA
+from jira import JIRA, JIRAError
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.cluster_service_version import ClusterServiceVersion
 from ocp_resources.exceptions import MissingResourceError
 from packaging.version import Version
+from pytest import Config, Item, hookimpl
 from pytest_testconfig import config as py_config
+from requests import RequestException
 from simple_logger.logger import get_logger
 
 LOGGER = get_logger(name=__name__)
 
+JIRA_CACHE_TTL: int = 3600
+JIRA_CACHE_FILE: str = os.path.join(os.path.expanduser("~"), ".cache", "opendatahub-tests", "jira-issues.json")
+# Max issues per JQL search; Jira caps search results at 100 per page
+JIRA_SEARCH_BATCH_SIZE: int = 100
+JIRA_ISSUE_FIELDS: str = "status,resolution,fixVersions,versions,components"
+JIRA_PLUGIN_NAME: str = "jira_plugin"
+
 
 @cache
 def get_jira_connection() -> JIRA:
@@ -28,6 +41,217 @@ def get_jira_connection() -> JIRA:
     )
 
 
+def _get_issue_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "status": fields["status"]["name"].lower(),
+        "resolution": fields["resolution"]["name"].lower() if fields.get("resolution") else None,
+        "fixed_versions": [version["name"] for version in fields.get("fixVersions") or []],
+        "versions": [version["name"] for version in fields.get("versions") or []],
+        "components": [component["name"] for component in fields.get("components") or []],
+    }
+
+
+class JiraIssuesCache:
+    """
+    Jira issues status, resolution, versions and components, resolved with batched JQL searches
+    and cached on disk, to be shared between `is_jira_open`, pytest-jira markers and pytest sessions.
+
+    Issues cached more than `ttl` seconds ago are resolved again; a `ttl` of 0 disables the disk cache.
+
+    Eg:
+        issues = JiraIssuesCache(cache_file=JIRA_CACHE_FILE, ttl=JIRA_CACHE_TTL).get_issues(
+            jira_ids=["RHOAIENG-19275", "RHOAIENG-19645"]
+        )
+    """
+
+    def __init__(self, cache_file: str, ttl: int):
+        """
+        Args:
+            cache_file (str): Path of the JSON cache file.
+            ttl (int): Seconds a cached issue is valid for.
+
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.issues: dict[str, dict[str, Any]] = self._load()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if not self.ttl:
+            return {}
+
+        try:
+            with open(self.cache_file) as fd:
+                issues: dict[str, dict[str, Any]] = json.load(fd)
+
+        except (OSError, ValueError):
+            return {}
+
+        now = time.time()
+        return {jira_id: issue for jira_id, issue in issues.items() if now - issue.get("fetched_at", 0) < self.ttl}
+
+    def _save(self) -> None:
+        if not self.ttl:
+            return
+
+        # Write to a temporary file first, concurrent sessions must not read a partially written cache
+        tmp_cache_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_cache_file, "w") as fd:
+                json.dump(self.issues, fd)
+
+            os.replace(tmp_cache_file, self.cache_file)  # noqa: FCN001
+
+        except OSError as exc:
+            LOGGER.warning(f"Failed to write Jira cache {self.cache_file}: {exc}")
+
+    def get_issues(self, jira_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get Jira issues, resolving the ones not cached with one JQL search per `JIRA_SEARCH_BATCH_SIZE` issues.
+
+        Args:
+            jira_ids (Iterable[str]): Jira issues ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Jira issue id to its fields; issues not found are omitted.
+
+        """
+        jira_ids = set(jira_ids)
+        with self._lock:
+            if missing_jira_ids := sorted(jira_ids - self.issues.keys()):
+                LOGGER.info(f"Resolving Jira issues: {missing_jira_ids}")
+                fetched_at = time.time()
+                for index in range(0, len(missing_jira_ids), JIRA_SEARCH_BATCH_SIZE):
+                    batch_end = index + JIRA_SEARCH_BATCH_SIZE
+                    batch = missing_jira_ids[index:batch_end]
+                    # Without query validation, issues which do not exist are ignored instead of failing the search
+                    result = get_jira_connection().search_issues(
+                        jql_str=f"key in ({', '.join(batch)})",
+                        maxResults=len(batch),
+                        validate_query=False,
+                        fields=JIRA_ISSUE_FIELDS,
+                        json_result=True,
+                    )
+                    for issue in result["issues"]:
+                        self.issues[issue["key"]] = {
+                            "fetched_at": fetched_at,
+                            **_get_issue_fields(fields=issue["fields"]),
+                        }
+
+                self._save()
+
+            return {jira_id: self.issues[jira_id] for jira_id in jira_ids if jira_id in self.issues}
+
+
+@cache
+def get_jira_issues_cache() -> JiraIssuesCache:
+    """
+    Get the session Jira issues cache, configured with `--jira-cache-file` and `--jira-cache-ttl`.
+
+    Returns:
+        JiraIssuesCache: Jira issues cache.
+
+    """
+    return JiraIssuesCache(
+        cache_file=py_config.get("jira_cache_file", JIRA_CACHE_FILE),
+        ttl=py_config.get("jira_cache_ttl", JIRA_CACHE_TTL),
+    )
+
+
+def resolve_jira_markers(config: Config, items: list[Item]) -> None:
+    """
+    Resolve all Jira issues referenced by the collected items `jira` markers at once,
+    and fill pytest-jira issues cache, so the plugin does not get each issue separately.
+
+    Args:
+        config (Config): pytest config.
+        items (list[Item]): Collected items.
+
+    """
+    jira_plugin = config.pluginmanager.get_plugin(name=JIRA_PLUGIN_NAME)
+    # With `--jira-return-metadata`, pytest-jira caches the issues raw fields
+    if not jira_plugin or config.getoption(name="return_jira_metadata"):
+        return
+
+    try:
+        jira_ids = {jira_id for item in items for jira_id, _ in jira_plugin.mark.get_jira_issues(item=item)}
+    except (TypeError, ValueError):
+        # Invalid markers are reported by pytest-jira
+        return
+
+    if not jira_ids:
+        return
+
+    try:
+        issues = get_jira_issues_cache().get_issues(jira_ids=jira_ids)
+    except (JIRAError, RequestException) as exc:
+        # pytest-jira gets the issues, and handles errors according to `--jira-connection-error-strategy`
+        LOGGER.warning(f"Failed to resolve Jira issues {sorted(jira_ids)}: {exc}")
+        return
+
+    for jira_id, issue in issues.items():
+        jira_plugin.issue_cache.setdefault(
+            jira_id,
+            {
+                "status": issue["status"],
+                "resolution": issue["resolution"],
+                "fixed_versions": set(issue["fixed_versions"]),
+                "versions": set(issue["versions"]),
+                "components": set(issue["components"]),
+            },
+        )
+
+
+def defer_jira_plugin_checks(config: Config) -> None:
+    """
+    Make pytest-jira check the `jira` markers of the items remaining after `-m` / `-k` / `--deselect` deselection only,
+    after resolving their Jira issues at once with `resolve_jira_markers`.
+
+    pytest-jira registers its plugin in `pytest_configure`, after the builtin plugins, so its
+    `pytest_collection_modifyitems` runs before their deselection; the plugin is registered again with this hook last.
+
+    Args:
+        config (Config): pytest config.
+
+    """
+    if not (jira_plugin := config.pluginmanager.get_plugin(name=JIRA_PLUGIN_NAME)):
+        return
+
+    check_jira_markers = jira_plugin.pytest_collection_modifyitems
+
+    @hookimpl(trylast=True)
+    def _resolve_and_check_jira_markers(config: Config, items: list[Item]) -> None:
+        resolve_jira_markers(config=config, items=items)
+        check_jira_markers(config=config, items=items)
+
+    config.pluginmanager.unregister(plugin=jira_plugin)
+    jira_plugin.pytest_collection_modifyitems = _resolve_and_check_jira_markers
+    config.pluginmanager.register(plugin=jira_plugin, name=JIRA_PLUGIN_NAME)
+
+
+@cache
+def get_operator_version(admin_client: DynamicClient) -> Version:
+    """
+    Get the operator version from its ClusterServiceVersion, once per session.
+
+    Args:
+        admin_client (DynamicClient): DynamicClient object
+
+    Returns:
+        Version: Operator version.
+
+    Raises:
+        MissingResourceError: If operator ClusterServiceVersion not found.
+
+    """
+    for csv in ClusterServiceVersion.get(dyn_client=admin_client, namespace=py_config["applications_namespace"]):
+        if re.match("rhods|opendatahub", csv.name):
+            return Version(version=csv.instance.spec.version)
+
+    raise MissingResourceError("Operator ClusterServiceVersion not found")
+
+
 def is_jira_open(jira_id: str, admin_client: DynamicClient) -> bool:
     """
     Check if Jira issue is open.
@@ -40,9 +264,10 @@ def is_jira_open(jira_id: str, admin_client: DynamicClient) -> bool:
         bool: True if Jira issue is open.
 
     """
-    jira_fields = get_jira_connection().issue(id=jira_id, fields="status, fixVersions").fields
+    if not (jira_issue := get_jira_issues_cache().get_issues(jira_ids=[jira_id]).get(jira_id)):
+        raise ValueError(f"Jira {jira_id}: issue not found")
 
-    jira_status = jira_fields.status.name.lower()
+    jira_status = jira_issue["status"]
 
     if jira_status not in ("testing", "resolved", "closed"):
         LOGGER.info(f"Jira {jira_id}: status is {jira_status}")
@@ -51,24 +276,15 @@ def is_jira_open(jira_id: str, admin_client: DynamicClient) -> bool:
     else:
         # Check if the operator version in ClusterServiceVersion is greater than the jira fix version
         jira_fix_versions: list[Version] = []
-        for fix_version in jira_fields.fixVersions:
-            if _fix_version := re.search(r"\d.\d+.\d+", fix_version.name):
+        for fix_version in jira_issue["fixed_versions"]:
+            if _fix_version := re.search(r"\d.\d+.\d+", fix_version):
                 jira_fix_versions.append(Version(_fix_version.group()))
 
         if not jira_fix_versions:
             raise ValueError(f"Jira {jira_id}: status is {jira_status} but does not have fix version(s)")
 
-        operator_version: str = ""
-        for csv in ClusterServiceVersion.get(dyn_client=admin_client, namespace=py_config["applications_namespace"]):
-            if re.match("rhods|opendatahub", csv.name):
-                operator_version = csv.instance.spec.version
-                break
-
-        if not operator_version:
-            raise MissingResourceError("Operator ClusterServiceVersion not found")
-
-        csv_version = Version(version=operator_version)
-        if all([csv_version < fix_version for fix_version in jira_fix_versions]):
+        operator_version = get_operator_version(admin_client=admin_client)
+        if all([operator_version < fix_version for fix_version in jira_fix_versions]):
             LOGGER.info(
                 f"Bug is open: Jira {jira_id}: status is {jira_status}, "
                 f"fix versions {jira_fix_versions}, operator version is {operator_version}"
@@ -0,0 +1,45 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """
+    Module imported on first attribute access.
+
+    Heavy client libraries (e.g. `model_registry`, `llama_stack_client`) are only needed when tests run,
+    importing them lazily keeps them out of `--collect-only` / `--setup-plan` and of unrelated test subtrees.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        # pytest looks up private attributes (e.g. `_fixture_function_marker`) of every conftest and test module
+        # global when collecting, only public attributes import the module
+        if name.startswith("_"):
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r} before it is imported")
+
+        module = importlib.import_module(name=self.__name__)
+        # Later attributes are looked up directly, without going through `__getattr__`
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access.
+
+    Names only used in type annotations should be imported under `typing.TYPE_CHECKING` instead.
+
+    Eg:
+        model_registry = lazy_import(name="model_registry")
+
+        client = model_registry.ModelRegistry(server_address=server_address, port=443, author="opendatahub-test")
+
+    Args:
+        name (str): Module name, e.g. `mr_openapi.exceptions`.
+
+    Returns:
+        ModuleType: The module if already imported, else a module importing it on first attribute access.
+
+    """
+    return sys.modules.get(name) or LazyModule(name=name)
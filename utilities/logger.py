@@ -1,13 +1,24 @@
+import datetime
+import json
 import logging
+import queue
+import os
 import shutil
+import threading
+import time
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
-import multiprocessing
-from typing import Optional
+from typing import Any, Optional
 
 from simple_logger.logger import DuplicateFilter, WrapperLogFormatter
 
 LOGGER = logging.getLogger(__name__)
 
+LOG_BATCH_SIZE: int = 512
+DEFAULT_LOG_MAX_PAYLOAD_LENGTH: int = 10000
+TEST_LOG_FILE_NAME: str = "test.log"
+TEST_LOG_INDEX_FILE_NAME: str = "test-log-index.json"
+_LOG_CONTEXT: dict[str, str] = {}
+
 
 class RedactedString(str):
     """
@@ -21,22 +32,381 @@ class RedactedString(str):
         return "'***REDACTED***'"
 
 
-def setup_logging(log_level: int, log_file: str = "/tmp/pytest-tests.log") -> QueueListener:
+def set_log_context(**fields: str) -> None:
+    """
+    Set context fields (e.g. current test and phase) attached to every following log record.
+
+    Fields set to an empty value are removed from the context.
+
+    Args:
+        **fields: Context field names and values.
+
+    """
+    for name, value in fields.items():
+        if value:
+            _LOG_CONTEXT[name] = value
+        else:
+            _LOG_CONTEXT.pop(name, None)
+
+
+def truncate_log_payload(payload: Any, max_length: int = DEFAULT_LOG_MAX_PAYLOAD_LENGTH) -> str:
+    """
+    Truncate a large payload (e.g. an inference response) before it is logged.
+
+    The head and the tail of the payload are kept, as they usually hold the status and the end of the output.
+
+    Args:
+        payload (Any): Payload to log.
+        max_length (int): Maximum length of the returned string; 0 disables truncation.
+
+    Returns:
+        str: Payload string, truncated to `max_length` characters.
+
+    """
+    payload_str = str(payload)
+    if not max_length or len(payload_str) <= max_length:
+        return payload_str
+
+    head_length = max(max_length - len(f" ...[truncated {len(payload_str)} chars]... "), 0) // 2
+    truncated_length = len(payload_str) - 2 * head_length
+    return (
+        f"{payload_str[:head_length]} ...[truncated {truncated_length} chars]... "
+        f"{payload_str[len(payload_str) - head_length :]}"
+    )
+
+
+class LogRecordFilter(logging.Filter):
+    """
+    Freezes the record message on the logging thread, truncates large payloads and attaches the current log context.
+
+    Formatting is deferred to the listener thread, so the message must be resolved before the record is queued.
+    """
+
+    def __init__(self, max_payload_length: int) -> None:
+        """
+        Args:
+            max_payload_length (int): Maximum length of a log message; 0 disables truncation.
+        """
+        super().__init__()
+        self.max_payload_length = max_payload_length
+        self.truncated_records = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if self.max_payload_length and len(message) > self.max_payload_length:
+            message = truncate_log_payload(payload=message, max_length=self.max_payload_length)
+            self.truncated_records += 1
+
+        record.msg = message
+        record.args = None
+        record.log_context = dict(_LOG_CONTEXT)
+        return True
+
+
+class ThreadQueueHandler(QueueHandler):
     """
-    Setup basic/root logging using QueueHandler/QueueListener
+    QueueHandler for an in-process queue; records are queued as-is and formatted by the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class LoggerNameFormatter(logging.Formatter):
+    """
+    Dispatches formatting to a formatter by the record logger name, so a single handler can serve several loggers.
+    """
+
+    def __init__(self, formatters: dict[str, logging.Formatter], default_formatter: logging.Formatter) -> None:
+        """
+        Args:
+            formatters (dict[str, logging.Formatter]): Logger name to formatter.
+            default_formatter (logging.Formatter): Formatter for all other loggers.
+        """
+        super().__init__()
+        self.formatters = formatters
+        self.default_formatter = default_formatter
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.formatters.get(record.name, self.default_formatter).format(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as JSON lines, including the log context fields, for structured log processing.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry: dict[str, Any] = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, tz=datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            **getattr(record, "log_context", {}),
+        }
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(ei=record.exc_info)
+
+        return json.dumps(log_entry, default=str)
+
+
+class BatchStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """
+    StreamHandler which flushes its stream once per batch of records instead of after every record.
+    """
+
+    def flush(self) -> None:
+        """
+        Flushing is deferred to `flush_batch`.
+        """
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler which flushes its stream once per batch of records instead of after every record.
+    """
+
+    def flush(self) -> None:
+        """
+        Flushing is deferred to `flush_batch`.
+        """
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+
+class TestLogShardHandler(logging.Handler):
+    """
+    Writes each record of a test also to the test log file set in the `log_shard` context field,
+    and indexes the byte offsets of each test phase (setup / call / teardown) in that file.
+
+    The index is written next to the test log file, so a phase log can be read without scanning the session log.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.shard_path: str | None = None
+        self.shard_stream: Any = None
+        self.phase: str | None = None
+        self.phases_offsets: dict[str, list[int]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        log_context = getattr(record, "log_context", {})
+        if log_context.get("log_shard") != self.shard_path:
+            self.close_shard()
+            self.open_shard(shard_path=log_context.get("log_shard"))
+
+        if not self.shard_stream:
+            return
+
+        try:
+            phase = log_context.get("phase", "")
+            if phase != self.phase:
+                self.phase = phase
+                self.phases_offsets.setdefault(phase, [self.shard_stream.tell()] * 2)
+
+            self.shard_stream.write(f"{self.format(record)}\n".encode())
+            self.phases_offsets[phase][1] = self.shard_stream.tell()
+
+        except Exception:
+            self.handleError(record=record)
+
+    def open_shard(self, shard_path: str | None) -> None:
+        """
+        Open a test log file; appends to it if the test log file already exists.
+
+        Args:
+            shard_path (str | None): Test log file path, None if records are not logged to a test log file.
+
+        """
+        self.shard_path = shard_path
+        self.phase = None
+        self.phases_offsets = {}
+        if shard_path:
+            self.shard_stream = open(shard_path, "ab")
+            index_path = os.path.join(os.path.dirname(shard_path), TEST_LOG_INDEX_FILE_NAME)
+            if os.path.exists(index_path):
+                with open(index_path) as index_file:
+                    self.phases_offsets = json.load(index_file)
+
+    def close_shard(self) -> None:
+        """
+        Flush and close the current test log file.
+        """
+        if self.shard_stream:
+            self.flush_batch()
+            self.shard_stream.close()
+            self.shard_stream = None
+
+    def flush_batch(self) -> None:
+        if self.shard_stream and self.shard_path:
+            self.shard_stream.flush()
+            with open(os.path.join(os.path.dirname(self.shard_path), TEST_LOG_INDEX_FILE_NAME), "w") as index_file:
+                json.dump(self.phases_offsets, index_file)
+
+    def close(self) -> None:
+        self.close_shard()
+        super().close()
+
+
+def read_test_log(test_log_dir: str, phase: str | None = None) -> str:
+    """
+    Read a test log, or a single phase of it, using the test log index.
+
+    Args:
+        test_log_dir (str): Directory of the test log file and its index.
+        phase (str | None): Test phase to read (setup / call / teardown); the whole test log if not set.
+
+    Returns:
+        str: Test log, empty if nothing was logged.
+
+    """
+    test_log_path = os.path.join(test_log_dir, TEST_LOG_FILE_NAME)
+    index_path = os.path.join(test_log_dir, TEST_LOG_INDEX_FILE_NAME)
+    if not os.path.exists(test_log_path):
+        return ""
+
+    with open(test_log_path, "rb") as test_log_file:
+        if not phase:
+            return test_log_file.read().decode(errors="replace")
+
+        if not os.path.exists(index_path):
+            return ""
+
+        with open(index_path) as index_file:
+            start, end = json.load(index_file).get(phase, [0, 0])
+
+        test_log_file.seek(start)
+        return test_log_file.read(end - start).decode(errors="replace")
+
+
+class BatchQueueListener(QueueListener):
+    """
+    QueueListener which drains the queue in batches and flushes its handlers once per batch.
+
+    Keeps counters of the handled records and the time spent in the handlers, to make the logging cost measurable.
+    """
+
+    def __init__(
+        self,
+        queue_: "queue.SimpleQueue[logging.LogRecord | None]",
+        *handlers: BatchStreamHandler | BatchRotatingFileHandler | TestLogShardHandler,
+        record_filter: LogRecordFilter,
+        batch_size: int = LOG_BATCH_SIZE,
+    ) -> None:
+        """
+        Args:
+            queue_ (queue.SimpleQueue): Queue the records are put into.
+            *handlers: Handlers to emit the records to.
+            record_filter (LogRecordFilter): Filter applied to the queued records, used for its counters.
+            batch_size (int): Maximum number of records handled per batch.
+        """
+        super().__init__(queue_, *handlers)  # noqa: FCN001
+        self.record_filter = record_filter
+        self.batch_size = batch_size
+        self.records_count = 0
+        self.batches_count = 0
+        self.handle_seconds = 0.0
+
+    def flush(self, timeout: float = 10) -> bool:
+        """
+        Wait until all records queued so far are written and flushed.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            bool: True if the records were flushed before timeout.
+
+        """
+        flush_event = threading.Event()
+        self.queue.put_nowait(logging.makeLogRecord(dict={"flush_event": flush_event}))
+        return flush_event.wait(timeout=timeout)
+
+    def _monitor(self) -> None:
+        while True:
+            records = [self.dequeue(block=True)]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.dequeue(block=False))
+                except queue.Empty:
+                    break
+
+            stop = any(record is None for record in records)
+            self.handle_batch(records=[record for record in records if record is not None])
+            if stop:
+                return
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """
+        Emit a batch of records to all handlers and flush each handler once.
+
+        Args:
+            records (list[logging.LogRecord]): Records to emit.
+
+        """
+        start_time = time.perf_counter()
+        flush_events = [record.flush_event for record in records if hasattr(record, "flush_event")]
+        records = [record for record in records if not hasattr(record, "flush_event")]
+        for handler in self.handlers:
+            for record in records:
+                handler.handle(record)
+            handler.flush_batch()  # type: ignore[attr-defined]
+
+        self.handle_seconds += time.perf_counter() - start_time
+        self.records_count += len(records)
+        self.batches_count += 1
+        for flush_event in flush_events:
+            flush_event.set()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the logging cost counters.
+
+        Returns:
+            dict[str, Any]: Handled records, batches, truncated records and seconds spent in the handlers.
+
+        """
+        return {
+            "records": self.records_count,
+            "batches": self.batches_count,
+            "truncated_records": self.record_filter.truncated_records,
+            "handle_seconds": round(self.handle_seconds, 3),
+        }
+
+
+def setup_logging(
+    log_level: int,
+    log_file: str = "/tmp/pytest-tests.log",
+    json_log_file: str | None = None,
+    max_payload_length: int = DEFAULT_LOG_MAX_PAYLOAD_LENGTH,
+    log_per_test: bool = False,
+) -> BatchQueueListener:
+    """
+    Setup basic/root logging using ThreadQueueHandler/BatchQueueListener
     to consolidate log messages into a single stream to be written to multiple outputs.
 
+    Records are put into an in-process queue and formatted and written in batches by the listener thread.
+
     Args:
         log_level (int): log level
         log_file (str): logging output file
+        json_log_file (str | None): optional JSON lines logging output file, with per-test context fields
+        max_payload_length (int): maximum length of a log message, longer messages are truncated; 0 disables
+        log_per_test (bool): write each test records also to the test log file set by `set_log_context(log_shard=...)`
 
     Returns:
-        QueueListener: Process monitoring the log Queue
+        BatchQueueListener: Thread monitoring the log Queue
 
     Eg:
-       root QueueHandler ┐                         ┌> StreamHandler
-                         ├> Queue -> QueueListener ┤
-      basic QueueHandler ┘                         └> FileHandler
+       root ThreadQueueHandler ┐                              ┌> StreamHandler
+                               ├> Queue -> BatchQueueListener ┼> FileHandler
+      basic ThreadQueueHandler ┘                              ├> JSON lines FileHandler (optional)
+                                                              └> TestLogShardHandler (optional)
     """
     basic_log_formatter = logging.Formatter(fmt="%(message)s")
     root_log_formatter = WrapperLogFormatter(
@@ -50,28 +420,44 @@ def setup_logging(log_level: int, log_file: str = "/tmp/pytest-tests.log") -> Qu
         },
         secondary_log_colors={},
     )
+    log_formatter = LoggerNameFormatter(formatters={"basic": basic_log_formatter}, default_formatter=root_log_formatter)
 
-    console_handler = logging.StreamHandler()
-    log_file_handler = RotatingFileHandler(filename=log_file, maxBytes=100 * 1024 * 1024, backupCount=20)
-
-    log_queue = multiprocessing.Queue(maxsize=-1)  # type: ignore[var-annotated]
-    log_listener = QueueListener(
-        log_queue,
+    console_handler = BatchStreamHandler()
+    console_handler.setFormatter(fmt=log_formatter)
+    log_file_handler = BatchRotatingFileHandler(filename=log_file, maxBytes=100 * 1024 * 1024, backupCount=20)
+    log_file_handler.setFormatter(fmt=log_formatter)
+    handlers: list[BatchStreamHandler | BatchRotatingFileHandler | TestLogShardHandler] = [
         log_file_handler,
         console_handler,
-    )
+    ]
+
+    if json_log_file:
+        json_log_file_handler = BatchRotatingFileHandler(
+            filename=json_log_file, maxBytes=100 * 1024 * 1024, backupCount=20
+        )
+        json_log_file_handler.setFormatter(fmt=JsonLinesFormatter())
+        handlers.append(json_log_file_handler)
+
+    if log_per_test:
+        test_log_shard_handler = TestLogShardHandler()
+        test_log_shard_handler.setFormatter(fmt=log_formatter)
+        handlers.append(test_log_shard_handler)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord | None]" = queue.SimpleQueue()
+    record_filter = LogRecordFilter(max_payload_length=max_payload_length)
+    log_listener = BatchQueueListener(log_queue, *handlers, record_filter=record_filter)  # noqa: FCN001
 
-    basic_log_queue_handler = QueueHandler(queue=log_queue)
+    basic_log_queue_handler = ThreadQueueHandler(queue=log_queue)
     basic_log_queue_handler.set_name(name="basic")
-    basic_log_queue_handler.setFormatter(fmt=basic_log_formatter)
+    basic_log_queue_handler.addFilter(filter=record_filter)
 
     basic_logger = logging.getLogger(name="basic")
     basic_logger.setLevel(level=log_level)
     basic_logger.addHandler(hdlr=basic_log_queue_handler)
 
-    root_log_queue_handler = QueueHandler(queue=log_queue)
+    root_log_queue_handler = ThreadQueueHandler(queue=log_queue)
     root_log_queue_handler.set_name(name="root")
-    root_log_queue_handler.setFormatter(fmt=root_log_formatter)
+    root_log_queue_handler.addFilter(filter=record_filter)
 
     root_logger = logging.getLogger()
     root_logger.setLevel(level=log_level)
@@ -9,6 +9,19 @@ from utilities.constants import ApiGroups, Labels, MinIo, Protocols
 from utilities.general import get_s3_secret_dict
 
 
+def get_minio_service_endpoint(minio_service: Service) -> str:
+    """
+    Get the S3 endpoint of a minio service, reachable from any namespace.
+
+    Args:
+        minio_service (Service): The service for minio.
+
+    Returns:
+        str: The minio S3 endpoint URL.
+    """
+    return f"{Protocols.HTTP}://{minio_service.instance.spec.clusterIP}:{str(MinIo.Metadata.DEFAULT_PORT)}"
+
+
 @contextmanager
 def create_minio_data_connection_secret(
     minio_service: Service,
@@ -32,7 +45,7 @@ def create_minio_data_connection_secret(
         aws_access_key=MinIo.Credentials.ACCESS_KEY_VALUE,
         aws_secret_access_key=MinIo.Credentials.SECRET_KEY_VALUE,  # pragma: allowlist secret
         aws_s3_bucket=aws_s3_bucket,
-        aws_s3_endpoint=f"{Protocols.HTTP}://{minio_service.instance.spec.clusterIP}:{str(MinIo.Metadata.DEFAULT_PORT)}",  # noqa: E501
+        aws_s3_endpoint=get_minio_service_endpoint(minio_service=minio_service),
         aws_s3_region="us-south",
     )
     with Secret(
@@ -0,0 +1,186 @@
+import shlex
+from contextlib import contextmanager
+from typing import Any, Generator
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.deployment import Deployment
+from ocp_resources.namespace import Namespace
+from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
+from ocp_resources.pod import Pod
+from ocp_resources.service import Service
+from simple_logger.logger import get_logger
+
+from utilities.constants import Labels, MinIo, Protocols, Timeout
+from utilities.infra import create_ns
+from utilities.minio import get_minio_service_endpoint
+
+LOGGER = get_logger(name=__name__)
+
+MODEL_CACHE_NAMESPACE: str = "opendatahub-tests-model-cache"
+MODEL_CACHE_PVC_NAME: str = "model-cache"
+MODEL_CACHE_MINIO_REGION: str = "us-south"
+
+
+@contextmanager
+def create_model_cache(
+    admin_client: DynamicClient,
+    pvc_size: str,
+    storage_class: str | None = None,
+    teardown: bool = True,
+) -> Generator[Service, Any, Any]:
+    """
+    Create the cluster-wide model cache: a MinIO server, backed by a PVC, in its own namespace.
+
+    A cache kept from a previous session (`teardown=False`) is reused as is.
+
+    Args:
+        admin_client (DynamicClient): Admin client.
+        pvc_size (str): Size of the cache PVC, e.g. `100Gi`.
+        storage_class (str | None): Storage class of the cache PVC, the cluster default if not set.
+        teardown (bool): Whether to delete the cache at the end of the session.
+
+    Yields:
+        Service: The cache MinIO service.
+
+    """
+    minio_app_label = {Labels.Openshift.APP: MinIo.Metadata.NAME}
+    if Namespace(client=admin_client, name=MODEL_CACHE_NAMESPACE).exists:
+        LOGGER.info(f"Reusing model cache in namespace {MODEL_CACHE_NAMESPACE}")
+        Deployment(client=admin_client, name=MinIo.Metadata.NAME, namespace=MODEL_CACHE_NAMESPACE).wait_for_replicas(
+            timeout=Timeout.TIMEOUT_5MIN
+        )
+        yield Service(client=admin_client, name=MinIo.Metadata.NAME, namespace=MODEL_CACHE_NAMESPACE)
+        return
+
+    pvc_kwargs = {
+        "client": admin_client,
+        "name": MODEL_CACHE_PVC_NAME,
+        "namespace": MODEL_CACHE_NAMESPACE,
+        "size": pvc_size,
+        "accessmodes": PersistentVolumeClaim.AccessMode.RWO,
+        "teardown": teardown,
+    }
+    if storage_class:
+        pvc_kwargs["storage_class"] = storage_class
+
+    with (
+        create_ns(admin_client=admin_client, name=MODEL_CACHE_NAMESPACE, teardown=teardown),
+        PersistentVolumeClaim(**pvc_kwargs) as pvc,
+        Deployment(
+            client=admin_client,
+            name=MinIo.Metadata.NAME,
+            namespace=MODEL_CACHE_NAMESPACE,
+            replicas=1,
+            selector={"matchLabels": minio_app_label},
+            template={
+                "metadata": {"labels": minio_app_label},
+                "spec": {
+                    "volumes": [{"name": "minio-storage", "persistentVolumeClaim": {"claimName": pvc.name}}],
+                    "containers": [
+                        {
+                            "name": MinIo.Metadata.NAME,
+                            "image": MinIo.PodConfig.MINIO_IMAGE,
+                            "args": ["server", "/data"],
+                            "env": [
+                                {
+                                    "name": MinIo.Credentials.ACCESS_KEY_NAME,
+                                    "value": MinIo.Credentials.ACCESS_KEY_VALUE,
+                                },
+                                {
+                                    "name": MinIo.Credentials.SECRET_KEY_NAME,
+                                    "value": MinIo.Credentials.SECRET_KEY_VALUE,
+                                },
+                            ],
+                            "ports": [{"containerPort": MinIo.Metadata.DEFAULT_PORT}],
+                            "volumeMounts": [{"name": "minio-storage", "mountPath": "/data"}],
+                        }
+                    ],
+                },
+            },
+            label=minio_app_label,
+            teardown=teardown,
+        ) as deployment,
+        Service(
+            client=admin_client,
+            name=MinIo.Metadata.NAME,
+            namespace=MODEL_CACHE_NAMESPACE,
+            ports=[
+                {
+                    "name": f"{MinIo.Metadata.NAME}-client-port",
+                    "port": MinIo.Metadata.DEFAULT_PORT,
+                    "protocol": Protocols.TCP,
+                    "targetPort": MinIo.Metadata.DEFAULT_PORT,
+                }
+            ],
+            selector=minio_app_label,
+            teardown=teardown,
+        ) as service,
+    ):
+        deployment.wait_for_replicas(timeout=Timeout.TIMEOUT_10MIN)
+        yield service
+
+
+def mirror_models_to_cache(
+    admin_client: DynamicClient,
+    cache_service: Service,
+    bucket_name: str,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    aws_endpoint_url: str,
+    prefixes: list[str] | None = None,
+) -> None:
+    """
+    Mirror the models bucket (or some of its prefixes) into the model cache bucket of the same name.
+
+    `mc mirror` only copies objects missing from the cache or with a different size, so mirroring into a cache
+    kept from a previous session only transfers the bucket changes.
+
+    Args:
+        admin_client (DynamicClient): Admin client.
+        cache_service (Service): The cache MinIO service.
+        bucket_name (str): Models bucket name.
+        aws_access_key_id (str): AWS access key.
+        aws_secret_access_key (str): AWS secret key.
+        aws_endpoint_url (str): Models bucket endpoint URL.
+        prefixes (list[str] | None): Bucket prefixes (model directories) to mirror, the whole bucket if not set.
+
+    """
+    mirror_commands = []
+    for prefix in prefixes or [""]:
+        bucket_path = f"{bucket_name}/{prefix.strip('/')}".rstrip("/")
+        mirror_commands.append(
+            f"mc mirror --overwrite --insecure {shlex.quote(f's3/{bucket_path}')} {shlex.quote(f'cache/{bucket_path}')}"
+        )
+
+    LOGGER.info(f"Mirroring {bucket_name} {prefixes or 'bucket'} into the model cache")
+    with Pod(
+        client=admin_client,
+        name="model-cache-mirror",
+        namespace=MODEL_CACHE_NAMESPACE,
+        restart_policy="Never",
+        containers=[
+            {
+                "name": "model-cache-mirror",
+                "image": MinIo.PodConfig.MINIO_CLIENT_IMAGE,
+                "command": ["/bin/sh", "-c"],
+                "args": [
+                    " && ".join([
+                        'mc alias set s3 "$AWS_ENDPOINT_URL" "$AWS_ACCESS_KEY_ID" "$AWS_SECRET_ACCESS_KEY"',
+                        f"mc alias set cache {get_minio_service_endpoint(minio_service=cache_service)} "
+                        f"{MinIo.Credentials.ACCESS_KEY_VALUE} {MinIo.Credentials.SECRET_KEY_VALUE}",
+                        f"mc mb --ignore-existing cache/{bucket_name}",
+                        *mirror_commands,
+                    ])
+                ],
+                "env": [
+                    {"name": "AWS_ACCESS_KEY_ID", "value": aws_access_key_id},
+                    {"name": "AWS_SECRET_ACCESS_KEY", "value": aws_secret_access_key},
+                    {"name": "AWS_ENDPOINT_URL", "value": aws_endpoint_url},
+                    # mc writes its aliases to its config directory, the image home may not be writable
+                    {"name": "MC_CONFIG_DIR", "value": "/tmp/.mc"},
+                ],
+            }
+        ],
+        wait_for_resource=True,
+    ) as pod:
+        pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=Timeout.TIMEOUT_40MIN)
@@ -0,0 +1,485 @@
+import math
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Generator, Iterable
+
+import portforward
+import requests
+from ocp_resources.pod import Pod
+from simple_logger.logger import get_logger
+
+from utilities.constants import Ports
+from utilities.plugins.constant import OpenAIEnpoints
+
+LOGGER = get_logger(name=__name__)
+
+METRICS_SCRAPE_TIMEOUT: int = 30
+# Sorted (label name, label value) pairs of a series
+Labels = tuple[tuple[str, str], ...]
+
+# Metrics endpoint and metric families of each model server runtime.
+# `histograms` and `duration_counters` map a latency hop (`latency` is the end-to-end server latency) to a metric
+# family; `duration_counters` are cumulative durations, averaged over the `requests` counter.
+# Without a `requests` counter, requests are counted by the `latency` histogram.
+# Durations are converted to seconds with `scale`.
+MODEL_SERVER_METRICS: dict[str, dict[str, Any]] = {
+    "vllm": {
+        "port": Ports.REST_PORT,
+        "path": OpenAIEnpoints.METRICS,
+        "prefixes": ("vllm:",),
+        "requests": "vllm:request_success_total",
+        "tokens": "vllm:generation_tokens_total",
+        "histograms": {
+            "latency": "vllm:e2e_request_latency_seconds",
+            "queue": "vllm:request_queue_time_seconds",
+            "ttft": "vllm:time_to_first_token_seconds",
+            "tpot": "vllm:time_per_output_token_seconds",
+        },
+        "scale": 1,
+    },
+    "tgis": {
+        "port": 3000,
+        "path": "/metrics",
+        "prefixes": ("tgi_",),
+        "requests": "tgi_request_success",
+        "histograms": {
+            "latency": "tgi_request_duration",
+            "queue": "tgi_request_queue_duration",
+            "inference": "tgi_request_inference_duration",
+        },
+        "scale": 1,
+    },
+    "ovms": {
+        "port": 8888,
+        "path": "/metrics",
+        "prefixes": ("ovms_",),
+        "requests": "ovms_requests_success",
+        "histograms": {
+            "latency": "ovms_request_time_us",
+            "queue": "ovms_wait_for_infer_req_time_us",
+            "inference": "ovms_inference_time_us",
+        },
+        "scale": 1e-6,
+    },
+    "mlserver": {
+        "port": 8082,
+        "path": "/metrics",
+        "prefixes": ("model_infer_",),
+        "requests": "model_infer_request_success",
+        "histograms": {"latency": "model_infer_request_duration"},
+        "scale": 1,
+    },
+    "triton": {
+        "port": 8002,
+        "path": "/metrics",
+        "prefixes": ("nv_inference_",),
+        "requests": "nv_inference_request_success",
+        "duration_counters": {
+            "latency": "nv_inference_request_duration_us",
+            "queue": "nv_inference_queue_duration_us",
+            "inference": "nv_inference_compute_infer_duration_us",
+        },
+        "scale": 1e-6,
+    },
+    "modelmesh": {
+        "port": 2112,
+        "path": "/metrics",
+        "scheme": "https",
+        "prefixes": ("modelmesh_",),
+        "histograms": {
+            "latency": "modelmesh_api_request_milliseconds",
+            "queue": "modelmesh_req_queue_delay_milliseconds",
+            "inference": "modelmesh_invoke_model_milliseconds",
+        },
+        "scale": 1e-3,
+    },
+}
+
+_SAMPLE_PATTERN = re.compile(r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>.*)\})?\s+(?P<value>\S+)")
+_LABEL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_LABEL_ESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+_FAMILY_SUFFIXES = ("_bucket", "_count", "_sum", "_total", "_created")
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram of a series, as exposed by Prometheus clients."""
+
+    # upper bound -> number of observations lower or equal to it
+    buckets: dict[float, float] = field(default_factory=dict)
+    sum: float = 0.0
+    count: float = 0.0
+
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile from the buckets, interpolating linearly like PromQL `histogram_quantile`.
+
+        Args:
+            quantile (float): Quantile, between 0 and 1.
+
+        Returns:
+            float | None: The estimated quantile, None if there are no observations.
+
+        """
+        bounds = sorted(self.buckets)
+        if not bounds or not (total := self.buckets[bounds[-1]]):
+            return None
+
+        rank = quantile * total
+        previous_bound, previous_count = 0.0, 0.0
+        for bound in bounds:
+            count = self.buckets[bound]
+            if count >= rank:
+                if math.isinf(bound):
+                    return previous_bound
+
+                if count == previous_count:
+                    return bound
+
+                return previous_bound + (bound - previous_bound) * (rank - previous_count) / (count - previous_count)
+
+            previous_bound, previous_count = bound, count
+
+        return previous_bound
+
+    def delta(self, previous: "Histogram") -> "Histogram":
+        """
+        Get the observations made since a previous scrape of the same series.
+
+        Args:
+            previous (Histogram): The series histogram in the previous scrape.
+
+        Returns:
+            Histogram: Observations made between the scrapes; all of them if the server restarted in between.
+
+        """
+        if self.count < previous.count:
+            return Histogram(buckets=dict(self.buckets), sum=self.sum, count=self.count)
+
+        return Histogram(
+            buckets={bound: count - previous.buckets.get(bound, 0.0) for bound, count in self.buckets.items()},
+            sum=self.sum - previous.sum,
+            count=self.count - previous.count,
+        )
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        return Histogram(
+            buckets={
+                bound: self.buckets.get(bound, 0.0) + other.buckets.get(bound, 0.0)
+                for bound in self.buckets.keys() | other.buckets.keys()
+            },
+            sum=self.sum + other.sum,
+            count=self.count + other.count,
+        )
+
+
+@dataclass
+class MetricsSnapshot:
+    """Typed samples of a metrics endpoint scrape, keyed by sample (counters, gauges) or family (histograms) name."""
+
+    counters: dict[str, dict[Labels, float]] = field(default_factory=dict)
+    gauges: dict[str, dict[Labels, float]] = field(default_factory=dict)
+    histograms: dict[str, dict[Labels, Histogram]] = field(default_factory=dict)
+
+    def total(self, name: str, **labels: str) -> float:
+        """
+        Sum a counter (or gauge) over its series matching labels.
+
+        Args:
+            name (str): Sample name; a counter exposed with a `_total` suffix can be looked up without it.
+            **labels (str): Label values the series must have.
+
+        Returns:
+            float: Sum of the matching series values, 0 if there are none.
+
+        """
+        series = self.counters.get(name) or self.counters.get(f"{name}_total") or self.gauges.get(name, {})
+        return sum(
+            value for series_labels, value in series.items() if _match_labels(series_labels=series_labels, **labels)
+        )
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """
+        Merge the series of a histogram matching labels.
+
+        Args:
+            name (str): Histogram family name.
+            **labels (str): Label values the series must have.
+
+        Returns:
+            Histogram: Merged histogram, empty if there are no matching series.
+
+        """
+        merged = Histogram()
+        for series_labels, histogram in self.histograms.get(name, {}).items():
+            if _match_labels(series_labels=series_labels, **labels):
+                merged = merged.merge(other=histogram)
+
+        return merged
+
+    def delta(self, previous: "MetricsSnapshot") -> "MetricsSnapshot":
+        """
+        Get the counter increases and histogram observations since a previous scrape.
+
+        Gauges keep their current values. Counters which decreased were reset, their current value is their increase.
+
+        Args:
+            previous (MetricsSnapshot): The previous scrape of the same endpoint.
+
+        Returns:
+            MetricsSnapshot: The changes between the scrapes.
+
+        """
+        counters: dict[str, dict[Labels, float]] = {}
+        for name, series in self.counters.items():
+            previous_series = previous.counters.get(name, {})
+            counters[name] = {
+                labels: value - previous_series.get(labels, 0.0) if value >= previous_series.get(labels, 0.0) else value
+                for labels, value in series.items()
+            }
+
+        return MetricsSnapshot(
+            counters=counters,
+            gauges={name: dict(series) for name, series in self.gauges.items()},
+            histograms={
+                name: {
+                    labels: histogram.delta(previous=previous.histograms.get(name, {}).get(labels, Histogram()))
+                    for labels, histogram in series.items()
+                }
+                for name, series in self.histograms.items()
+            },
+        )
+
+
+def _match_labels(series_labels: Labels, **expected_labels: str) -> bool:
+    labels = dict(series_labels)
+    return all(labels.get(name) == value for name, value in expected_labels.items())
+
+
+def _parse_labels(labels: str) -> dict[str, str]:
+    return {
+        name: re.sub(pattern=r"\\[\\\"n]", repl=lambda match: _LABEL_ESCAPES[match.group()], string=value)
+        for name, value in _LABEL_PATTERN.findall(string=labels)
+    }
+
+
+def parse_metrics(lines: Iterable[str | bytes], prefixes: tuple[str, ...] | None = None) -> MetricsSnapshot:
+    """
+    Parse the Prometheus (or OpenMetrics) text exposition format, one line at a time.
+
+    Lines are consumed as they are read, so a streamed response is parsed without holding the whole body,
+    and samples of other families are skipped before their labels are parsed.
+
+    Args:
+        lines (Iterable[str | bytes]): Exposition lines, e.g. `response.iter_lines()`.
+        prefixes (tuple[str, ...] | None): Only parse metric families starting with one of these prefixes.
+
+    Returns:
+        MetricsSnapshot: Typed samples; untyped and summary quantile samples are gauges, summary `_sum` and
+            `_count` samples are counters.
+
+    """
+    snapshot = MetricsSnapshot()
+    family_types: dict[str, str] = {}
+
+    for raw_line in lines:
+        line = raw_line.decode() if isinstance(raw_line, bytes) else raw_line
+        if not (line := line.strip()):
+            continue
+
+        if line.startswith("#"):
+            parts = line.split(maxsplit=3)
+            if len(parts) == 4 and parts[1] == "TYPE":
+                family_types[parts[2]] = parts[3].lower()
+            continue
+
+        if prefixes and not line.startswith(prefixes):
+            continue
+
+        if not (match := _SAMPLE_PATTERN.match(string=line)):
+            LOGGER.warning(f"Skipping malformed metrics line: {line}")
+            continue
+
+        name = match.group("name")
+        labels = _parse_labels(labels=match.group("labels") or "")
+        # float() also parses the exposition format `NaN`, `+Inf` and `-Inf` values
+        value = float(match.group("value"))
+
+        family, family_type = name, family_types.get(name)
+        if family_type is None:
+            for suffix in _FAMILY_SUFFIXES:
+                if name.endswith(suffix) and name[: -len(suffix)] in family_types:
+                    family = name[: -len(suffix)]
+                    family_type = family_types[family]
+                    break
+
+        if name != family and name.endswith("_created"):
+            continue
+
+        if family_type == "histogram":
+            bucket_labels = {label: label_value for label, label_value in labels.items() if label != "le"}
+            histogram = snapshot.histograms.setdefault(family, {}).setdefault(
+                tuple(sorted(bucket_labels.items())), Histogram()
+            )
+            if name.endswith("_bucket"):
+                histogram.buckets[float(labels["le"])] = value
+            elif name.endswith("_sum"):
+                histogram.sum = value
+            elif name.endswith("_count"):
+                histogram.count = value
+
+        elif family_type == "counter" or (family_type == "summary" and name != family):
+            snapshot.counters.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+        else:
+            snapshot.gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    return snapshot
+
+
+class ModelServerMetricsScraper:
+    """
+    Scrapes a model server metrics endpoint directly, without waiting for Prometheus to scrape it.
+
+    Eg:
+        with forward_model_server_metrics(pod=pod, runtime="vllm") as scraper:
+            with scraper.measure() as delta:
+                run_inference()
+            summary = summarize_server_metrics(delta=delta, runtime="vllm")
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefixes: tuple[str, ...] | None = None,
+        headers: dict[str, str] | None = None,
+        verify: bool | str = False,
+    ) -> None:
+        """
+        Args:
+            url (str): Metrics endpoint URL, e.g. a port-forwarded pod or a route.
+            prefixes (tuple[str, ...] | None): Only parse metric families starting with one of these prefixes.
+            headers (dict[str, str] | None): Request headers, e.g. an `Authorization` header.
+            verify (bool | str): TLS verification, or the path of the CA bundle to verify the server with.
+        """
+        self.url = url
+        self.prefixes = prefixes
+        self.session = requests.Session()
+        self.session.verify = verify
+        self.session.headers.update(headers or {})
+
+    def scrape(self) -> MetricsSnapshot:
+        """
+        Scrape the metrics endpoint, parsing the response while it is streamed.
+
+        Returns:
+            MetricsSnapshot: The scraped samples.
+
+        Raises:
+            requests.exceptions.HTTPError: If the endpoint does not respond with a success status.
+
+        """
+        with self.session.get(url=self.url, stream=True, timeout=METRICS_SCRAPE_TIMEOUT) as response:
+            response.raise_for_status()
+            return parse_metrics(lines=response.iter_lines(), prefixes=self.prefixes)
+
+    @contextmanager
+    def measure(self) -> Generator[MetricsSnapshot, Any, Any]:
+        """
+        Measure the metrics changes around a workload.
+
+        Yields:
+            MetricsSnapshot: Empty until the block exits, then filled with the changes made during the block.
+
+        """
+        before = self.scrape()
+        delta = MetricsSnapshot()
+        yield delta
+
+        changes = self.scrape().delta(previous=before)
+        delta.counters, delta.gauges, delta.histograms = changes.counters, changes.gauges, changes.histograms
+
+
+@contextmanager
+def forward_model_server_metrics(pod: Pod, runtime: str) -> Generator[ModelServerMetricsScraper, Any, Any]:
+    """
+    Port-forward the metrics port of a model server pod.
+
+    Args:
+        pod (Pod): Model server pod.
+        runtime (str): `MODEL_SERVER_METRICS` runtime, e.g. `vllm`.
+
+    Yields:
+        ModelServerMetricsScraper: Scraper of the pod metrics endpoint.
+
+    Raises:
+        ValueError: If the pod has no name or namespace.
+
+    """
+    if not (pod.name and pod.namespace):
+        raise ValueError(
+            f"Cannot port-forward pod {pod.name} in namespace {pod.namespace}: name and namespace required"
+        )
+
+    config = MODEL_SERVER_METRICS[runtime]
+    with portforward.forward(
+        pod_or_service=pod.name,
+        namespace=pod.namespace,
+        from_port=config["port"],
+        to_port=config["port"],
+    ):
+        yield ModelServerMetricsScraper(
+            url=f"{config.get('scheme', 'http')}://localhost:{config['port']}{config['path']}",
+            prefixes=config["prefixes"],
+        )
+
+
+def summarize_server_metrics(
+    delta: MetricsSnapshot, runtime: str, duration: float | None = None, **labels: str
+) -> dict[str, Any]:
+    """
+    Summarize the server-side requests, latencies and throughput of a workload.
+
+    Args:
+        delta (MetricsSnapshot): Metrics changes during the workload, see `ModelServerMetricsScraper.measure`.
+        runtime (str): `MODEL_SERVER_METRICS` runtime, e.g. `vllm`.
+        duration (float | None): Workload duration in seconds, to compute throughputs.
+        **labels (str): Label values of the series to summarize, e.g. `model_name`.
+
+    Returns:
+        dict[str, Any]: `server_requests`, the mean (and for histograms p50, p90 and p99) of each latency hop in
+            seconds, e.g. `server_ttft_p50`, and with a duration `server_request_throughput` and
+            `server_output_token_throughput`.
+
+    """
+    config = MODEL_SERVER_METRICS[runtime]
+    num_requests = (
+        delta.total(name=config["requests"], **labels)
+        if "requests" in config
+        else delta.histogram(name=config["histograms"]["latency"], **labels).count
+    )
+    summary: dict[str, Any] = {"server_requests": num_requests}
+
+    for hop, family in config.get("histograms", {}).items():
+        histogram = delta.histogram(name=family, **labels)
+        mean = histogram.mean()
+        summary[f"server_{hop}_mean"] = round(mean * config["scale"], 4) if mean is not None else None
+        for quantile in (50, 90, 99):
+            value = histogram.quantile(quantile=quantile / 100)
+            summary[f"server_{hop}_p{quantile}"] = round(value * config["scale"], 4) if value is not None else None
+
+    for hop, family in config.get("duration_counters", {}).items():
+        summary[f"server_{hop}_mean"] = (
+            round(delta.total(name=family, **labels) * config["scale"] / num_requests, 4) if num_requests else None
+        )
+
+    if duration:
+        summary["server_request_throughput"] = round(num_requests / duration, 3)
+        if tokens_counter := config.get("tokens"):
+            summary["server_output_token_throughput"] = round(delta.total(name=tokens_counter, **labels) / duration, 2)
+
+    return summary
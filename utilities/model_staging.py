@@ -0,0 +1,289 @@
+"""
+Model data staging from S3 into a PVC.
+
+This module runs inside the `download_model_data` pod (its source is passed to `python3 -c`), on the KServe
+storage initializer image, so it must only depend on the standard library and boto3.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Manifest of the staged objects ETags and sizes, written to the staging state directory
+MANIFEST_FILE_NAME: str = "manifest.json"
+# Partially downloaded object and its completed ranges, to resume its download; written to the staging state directory
+PART_SUFFIX: str = ".part"
+PART_CHUNKS_SUFFIX: str = ".part-chunks"
+DEFAULT_CHUNK_SIZE: int = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS: int = 8
+PROGRESS_INTERVAL: int = 10
+
+
+class ModelStager:
+    """
+    Stages the objects under an S3 prefix into a directory, downloading objects in parallel byte ranges.
+
+    Objects whose ETag and size match the manifest of a previous staging are skipped, and the completed ranges
+    of partially downloaded objects are kept, so that an interrupted or repeated staging only downloads what is missing.
+    The manifest and partial objects are kept in `state_dir`, outside the served model directory; it must be on the
+    same filesystem mount as `target_dir`, completed objects are renamed into it.
+    Progress and the summary are printed as JSON lines.
+
+    Eg:
+        stager = ModelStager(
+            s3_client=boto3.client("s3"),
+            bucket="models",
+            prefix="mnist",
+            target_dir="/mnt/models/mnist",
+            state_dir="/mnt/models/.model-staging/mnist",
+        )
+        stager.stage()
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        prefix: str,
+        target_dir: str,
+        state_dir: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.target_dir = target_dir
+        self.state_dir = state_dir
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.manifest_path = os.path.join(state_dir, MANIFEST_FILE_NAME)
+        self.manifest: dict[str, dict[str, Any]] = {}
+        self.total_bytes = 0
+        self.staged_bytes = 0
+        self.downloaded_bytes = 0
+        self._lock = threading.Lock()
+
+    def list_objects(self) -> dict[str, dict[str, Any]]:
+        """
+        List the objects under the prefix.
+
+        Returns:
+            dict[str, dict[str, Any]]: Object path relative to the prefix to its key, ETag and size.
+
+        """
+        objects: dict[str, dict[str, Any]] = {}
+        for page in self.s3_client.get_paginator(operation_name="list_objects_v2").paginate(
+            Bucket=self.bucket, Prefix=f"{self.prefix}/" if self.prefix else ""
+        ):
+            for s3_object in page.get("Contents", []):
+                if s3_object["Key"].endswith("/"):
+                    continue
+
+                objects[s3_object["Key"].removeprefix(self.prefix).lstrip("/")] = {
+                    "key": s3_object["Key"],
+                    "etag": s3_object["ETag"].strip('"'),
+                    "size": s3_object["Size"],
+                }
+
+        return objects
+
+    def load_manifest(self) -> None:
+        try:
+            with open(self.manifest_path) as manifest_file:
+                self.manifest = json.load(manifest_file)
+
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def save_manifest(self) -> None:
+        # Written to a temporary file and renamed, so an interrupted staging never leaves a truncated manifest
+        manifest_tmp_path = f"{self.manifest_path}.tmp"
+        with open(manifest_tmp_path, "w") as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=2, sort_keys=True)
+
+        os.replace(manifest_tmp_path, self.manifest_path)
+
+    def is_staged(self, path: str, s3_object: dict[str, Any]) -> bool:
+        entry = self.manifest.get(path) or {}
+        local_path = os.path.join(self.target_dir, path)
+        return (
+            entry.get("etag") == s3_object["etag"]
+            and entry.get("size") == s3_object["size"]
+            and os.path.isfile(local_path)
+            and os.path.getsize(local_path) == s3_object["size"]
+        )
+
+    def get_part_paths(self, path: str) -> tuple[str, str]:
+        part_path = os.path.join(self.state_dir, path)
+        return f"{part_path}{PART_SUFFIX}", f"{part_path}{PART_CHUNKS_SUFFIX}"
+
+    def get_pending_chunks(self, path: str, s3_object: dict[str, Any]) -> list[int]:
+        """
+        Prepare the partial file of an object and get its chunks still to download.
+
+        Completed chunks of a previous staging are kept if the object did not change (same ETag).
+
+        Args:
+            path (str): Object path relative to the prefix.
+            s3_object (dict[str, Any]): Object key, ETag and size.
+
+        Returns:
+            list[int]: Start offsets of the chunks to download.
+
+        """
+        part_path, part_chunks_path = self.get_part_paths(path=path)
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+
+        completed_chunks: set[int] = set()
+        if os.path.isfile(part_path) and os.path.isfile(part_chunks_path):
+            with open(part_chunks_path) as part_chunks_file:
+                lines = part_chunks_file.read().splitlines()
+
+            if lines and lines[0] == s3_object["etag"]:
+                completed_chunks = {int(line) for line in lines[1:] if line.isdigit()}
+
+        if not completed_chunks:
+            with open(part_path, "wb") as part_file:
+                part_file.truncate(s3_object["size"])
+
+            with open(part_chunks_path, "w") as part_chunks_file:
+                part_chunks_file.write(f"{s3_object['etag']}\n")
+
+        with self._lock:
+            self.staged_bytes += sum(
+                min(self.chunk_size, s3_object["size"] - start)
+                for start in completed_chunks
+                if start < s3_object["size"]
+            )
+
+        return [start for start in range(0, s3_object["size"], self.chunk_size) if start not in completed_chunks]
+
+    def download_chunk(self, path: str, s3_object: dict[str, Any], start: int) -> None:
+        part_path, part_chunks_path = self.get_part_paths(path=path)
+        end = min(start + self.chunk_size, s3_object["size"]) - 1
+        body = self.s3_client.get_object(
+            Bucket=self.bucket, Key=s3_object["key"], Range=f"bytes={start}-{end}", IfMatch=s3_object["etag"]
+        )["Body"].read()
+
+        file_descriptor = os.open(part_path, os.O_WRONLY)
+        try:
+            os.pwrite(file_descriptor, body, start)
+        finally:
+            os.close(file_descriptor)
+
+        with self._lock:
+            with open(part_chunks_path, "a") as part_chunks_file:
+                part_chunks_file.write(f"{start}\n")
+
+            self.staged_bytes += len(body)
+            self.downloaded_bytes += len(body)
+
+    def complete_object(self, path: str, s3_object: dict[str, Any]) -> None:
+        local_path = os.path.join(self.target_dir, path)
+        part_path, part_chunks_path = self.get_part_paths(path=path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        os.replace(part_path, local_path)
+        os.remove(part_chunks_path)
+        with self._lock:
+            self.manifest[path] = {"etag": s3_object["etag"], "size": s3_object["size"]}
+            self.save_manifest()
+
+    def download_object(self, executor: ThreadPoolExecutor, path: str, s3_object: dict[str, Any]) -> None:
+        for future in [
+            executor.submit(self.download_chunk, path=path, s3_object=s3_object, start=start)
+            for start in self.get_pending_chunks(path=path, s3_object=s3_object)
+        ]:
+            future.result()
+
+        self.complete_object(path=path, s3_object=s3_object)
+
+    def print_progress(self, event: str, **kwargs: Any) -> None:
+        print(
+            json.dumps({
+                "event": event,
+                "total_bytes": self.total_bytes,
+                "staged_bytes": self.staged_bytes,
+                "downloaded_bytes": self.downloaded_bytes,
+                **kwargs,
+            }),
+            flush=True,
+        )
+
+    def stage(self) -> dict[str, Any]:
+        """
+        Stage the objects under the prefix, skipping unchanged objects and resuming partial downloads.
+
+        Returns:
+            dict[str, Any]: Summary with the number of objects, skipped objects, total, downloaded bytes and duration.
+
+        """
+        start_time = time.monotonic()
+        os.makedirs(self.target_dir, exist_ok=True)
+        os.makedirs(self.state_dir, exist_ok=True)
+        self.load_manifest()
+        objects = self.list_objects()
+        self.total_bytes = sum(s3_object["size"] for s3_object in objects.values())
+
+        pending_objects = {
+            path: s3_object for path, s3_object in objects.items() if not self.is_staged(path=path, s3_object=s3_object)
+        }
+        self.staged_bytes = self.total_bytes - sum(s3_object["size"] for s3_object in pending_objects.values())
+
+        # Objects are downloaded by their own threads, their chunks by the shared chunk pool
+        stop_progress = threading.Event()
+        progress_thread = threading.Thread(target=self.report_progress, kwargs={"stop": stop_progress}, daemon=True)
+        progress_thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as chunk_executor:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as object_executor:
+                    for future in [
+                        object_executor.submit(
+                            self.download_object, executor=chunk_executor, path=path, s3_object=s3_object
+                        )
+                        for path, s3_object in pending_objects.items()
+                    ]:
+                        future.result()
+
+        finally:
+            stop_progress.set()
+            progress_thread.join()
+
+        summary = {
+            "objects": len(objects),
+            "skipped_objects": len(objects) - len(pending_objects),
+            "seconds": round(time.monotonic() - start_time, 3),
+        }
+        self.print_progress(event="staged", **summary)
+        return {**summary, "total_bytes": self.total_bytes, "downloaded_bytes": self.downloaded_bytes}
+
+    def report_progress(self, stop: threading.Event) -> None:
+        while not stop.wait(timeout=PROGRESS_INTERVAL):
+            self.print_progress(event="progress")
+
+
+def main() -> None:
+    import boto3  # Only available in the staging pod image
+
+    s3_client = boto3.client(
+        service_name="s3",
+        endpoint_url=os.environ.get("AWS_ENDPOINT_URL") or None,
+        region_name=os.environ.get("AWS_DEFAULT_REGION") or None,
+        verify=os.environ.get("S3_VERIFY_SSL", "true").lower() not in ("false", "0"),
+    )
+    ModelStager(
+        s3_client=s3_client,
+        bucket=os.environ["MODEL_STAGING_BUCKET"],
+        prefix=os.environ["MODEL_STAGING_PREFIX"],
+        target_dir=os.environ["MODEL_STAGING_TARGET_DIR"],
+        state_dir=os.environ["MODEL_STAGING_STATE_DIR"],
+        chunk_size=int(os.environ.get("MODEL_STAGING_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)),
+        max_workers=int(os.environ.get("MODEL_STAGING_MAX_WORKERS", DEFAULT_MAX_WORKERS)),
+    ).stage()
+
+
+if __name__ == "__main__":
+    main()
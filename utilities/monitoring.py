@@ -1,11 +1,313 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any, Callable
 
-from ocp_resources.prometheus import Prometheus
+import requests
+from ocp_utilities.monitoring import Prometheus
 from simple_logger.logger import get_logger
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
+from utilities.exceptions import PrometheusQueryError
+
 LOGGER = get_logger(name=__name__)
 
+# Identical queries sent within this many seconds are answered from the cache
+PROMETHEUS_QUERY_CACHE_TTL: float = 5
+PROMETHEUS_REQUEST_TIMEOUT: int = 60
+PROMETHEUS_QUERY_CONCURRENCY: int = 8
+# Label added to each series of a batched query, to split the results back per query
+BATCH_QUERY_LABEL: str = "odh_batch_query"
+
+
+class PrometheusQueryClient:
+    """
+    Prometheus HTTP API client which batches instant queries, caches identical queries for a short TTL and
+    supports range queries.
+
+    Eg:
+        query_client = get_prometheus_query_client(prometheus=prometheus)
+        results = query_client.query_batch(queries=["tgi_request_count", "tgi_request_success"])
+        polled_results = query_client.query_sampler(queries=["tgi_request_count"], use_cache=False)
+        series = query_client.query_range(query="tgi_request_count", start=start_time, end=time.time())
+    """
+
+    def __init__(self, prometheus: Prometheus, cache_ttl: float = PROMETHEUS_QUERY_CACHE_TTL) -> None:
+        """
+        Args:
+            prometheus (Prometheus): Prometheus object, its route, token and TLS verification are used.
+            cache_ttl (float): Seconds a query result is reused for, 0 disables the cache.
+        """
+        self.prometheus = prometheus
+        self.api_url = f"{prometheus.api_url}{prometheus.api_v1}"
+        self.cache_ttl = cache_ttl
+        self.session = requests.Session()
+        self.session.verify = prometheus.verify_ssl
+        self.session.headers.update(prometheus.headers)
+        # (endpoint, params) -> (monotonic time of the response, result)
+        self._cache: dict[tuple[str, tuple[tuple[str, str], ...]], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _request(self, endpoint: str, params: dict[str, str], use_cache: bool = True) -> Any:
+        """
+        Send a query to the Prometheus HTTP API, or get its result from the cache.
+
+        Queries are sent as form data, so long (batched) queries are not limited by the URL length.
+
+        Args:
+            endpoint (str): API endpoint, e.g. `query` or `query_range`.
+            params (dict[str, str]): Query parameters.
+            use_cache (bool): Whether a cached result can be returned, the response is cached either way.
+
+        Returns:
+            Any: The `data.result` of the response.
+
+        Raises:
+            PrometheusQueryError: If the response status is not `success`.
+
+        """
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        with self._lock:
+            cached = self._cache.get(cache_key)
+
+        if use_cache and cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        response = self.session.post(url=f"{self.api_url}/{endpoint}", data=params, timeout=PROMETHEUS_REQUEST_TIMEOUT)
+        try:
+            response_json = response.json()
+        except requests.JSONDecodeError as exc:
+            raise PrometheusQueryError(f"{endpoint} {params}: {response.status_code} {response.text}") from exc
+
+        if response_json.get("status") != "success":
+            raise PrometheusQueryError(f"{endpoint} {params}: {response_json.get('error', response.text)}")
+
+        result = response_json.get("data", {}).get("result", [])
+        with self._lock:
+            self._cache[cache_key] = (time.monotonic(), result)
+
+        return result
+
+    def query(self, query: str, use_cache: bool = True) -> list[dict[str, Any]]:
+        """
+        Run an instant query.
+
+        Args:
+            query (str): PromQL query.
+            use_cache (bool): Whether a cached result can be returned.
+
+        Returns:
+            list[dict[str, Any]]: The query result series, with their `metric` labels and `value`.
+
+        Raises:
+            PrometheusQueryError: If the query fails.
+
+        """
+        return self._request(endpoint="query", params={"query": query}, use_cache=use_cache)
+
+    def query_sampler(
+        self, queries: list[str], timeout: int = 60 * 2, use_cache: bool = True
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Run instant queries in one round-trip with `query_batch`, retrying until they succeed.
+
+        Args:
+            queries (list[str]): PromQL queries, each returning an instant vector.
+            timeout (int): Time to retry the queries for.
+            use_cache (bool): Whether cached results can be returned, should be False when the caller polls.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: Each query to its result series.
+
+        Raises:
+            TimeoutExpiredError: If the queries do not succeed within the timeout.
+
+        """
+        for sample in TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=self.prometheus.scrape_interval,
+            func=self.query_batch,
+            exceptions_dict={PrometheusQueryError: []},
+            queries=queries,
+            use_cache=use_cache,
+        ):
+            return sample
+
+        return {}
+
+    def query_batch(self, queries: list[str], use_cache: bool = True) -> dict[str, list[dict[str, Any]]]:
+        """
+        Run several instant queries in one round-trip.
+
+        The queries are combined with `or`, each query series labeled with its index. Queries which cannot be
+        combined, e.g. scalar queries, are sent concurrently instead.
+
+        Args:
+            queries (list[str]): PromQL queries, each returning an instant vector.
+            use_cache (bool): Whether cached results can be returned.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: Each query to its result series.
+
+        Raises:
+            PrometheusQueryError: If a query fails.
+
+        """
+        queries = list(dict.fromkeys(queries))
+        if len(queries) <= 1:
+            return {query: self.query(query=query, use_cache=use_cache) for query in queries}
+
+        batched_query = " or ".join(
+            f'label_replace({query}, "{BATCH_QUERY_LABEL}", "{index}", "", "")' for index, query in enumerate(queries)
+        )
+        try:
+            batched_result = self.query(query=batched_query, use_cache=use_cache)
+
+        except PrometheusQueryError as exc:
+            LOGGER.warning(f"Queries cannot be batched, running them concurrently: {exc}")
+            with ThreadPoolExecutor(max_workers=PROMETHEUS_QUERY_CONCURRENCY) as executor:
+                futures = {
+                    query: executor.submit(self.query, query=query, use_cache=use_cache)  # noqa: FCN001
+                    for query in queries
+                }
+                return {query: future.result() for query, future in futures.items()}
+
+        results: dict[str, list[dict[str, Any]]] = {query: [] for query in queries}
+        for series in batched_result:
+            metric = {key: value for key, value in series["metric"].items() if key != BATCH_QUERY_LABEL}
+            results[queries[int(series["metric"][BATCH_QUERY_LABEL])]].append({**series, "metric": metric})
+
+        return results
+
+    def query_range(self, query: str, start: float, end: float, step: float | None = None) -> list[dict[str, Any]]:
+        """
+        Run a range query, to get the full time series of a query at once.
+
+        Args:
+            query (str): PromQL query.
+            start (float): Range start, unix timestamp.
+            end (float): Range end, unix timestamp.
+            step (float | None): Resolution in seconds, defaults to the Prometheus scrape interval.
+
+        Returns:
+            list[dict[str, Any]]: The query result series, with their `metric` labels and `values`.
+
+        Raises:
+            PrometheusQueryError: If the query fails.
+
+        """
+        return self._request(
+            endpoint="query_range",
+            params={
+                "query": query,
+                "start": str(start),
+                "end": str(end),
+                "step": str(step or self.prometheus.scrape_interval),
+            },
+        )
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+@cache
+def get_prometheus_query_client(prometheus: Prometheus) -> PrometheusQueryClient:
+    """
+    Get the query client shared by all the callers querying a Prometheus, so that they share its cache.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+
+    Returns:
+        PrometheusQueryClient: Query client of the Prometheus.
+
+    """
+    return PrometheusQueryClient(prometheus=prometheus)
+
+
+def get_series_samples(series: dict[str, Any]) -> list[tuple[float, float]]:
+    """
+    Get the samples of a range query series.
+
+    Args:
+        series (dict[str, Any]): `query_range` result series.
+
+    Returns:
+        list[tuple[float, float]]: (timestamp, value) samples.
+
+    """
+    return [(float(timestamp), float(value)) for timestamp, value in series.get("values", [])]
+
+
+def get_increase(samples: list[tuple[float, float]]) -> float:
+    """
+    Get the increase of a counter between its first and last samples, handling counter resets like PromQL `increase`.
+
+    Args:
+        samples (list[tuple[float, float]]): (timestamp, value) samples of a counter.
+
+    Returns:
+        float: Counter increase, 0 if there are less than 2 samples.
+
+    """
+    increase = 0.0
+    for (_, previous), (_, current) in zip(samples, samples[1:]):  # noqa: FCN001
+        # A lower value means the counter was reset, it restarted from 0
+        increase += current - previous if current >= previous else current
+
+    return increase
+
+
+def get_series_list_increase(series_list: list[dict[str, Any]], start: float) -> float:
+    """
+    Get the total increase of counter series since `start`.
+
+    A restarted pod exports a new series, with new labels, starting from 0; the first value of a series
+    which starts after `start` is counted as increase too.
+
+    Args:
+        series_list (list[dict[str, Any]]): `query_range` result series of a counter.
+        start (float): Range start, unix timestamp.
+
+    Returns:
+        float: Total counter increase.
+
+    """
+    increase = 0.0
+    for series in series_list:
+        if samples := get_series_samples(series=series):
+            increase += get_increase(samples=samples) + (samples[0][1] if samples[0][0] > start else 0)
+
+    return increase
+
+
+def get_metrics_values(prometheus: Prometheus, metrics_queries: list[str]) -> dict[str, Any]:
+    """
+    Get several metrics values from prometheus in one round-trip
+
+    Results are never taken from the query cache, callers poll the values until they change.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+        metrics_queries (list[str]): Metrics query strings
+
+    Returns:
+        dict[str, Any]: Each metrics query to its first series value, None if it has no series
+
+    """
+    metrics_values: dict[str, Any] = {}
+    for metrics_query, metric_results in (
+        get_prometheus_query_client(prometheus=prometheus)
+        .query_sampler(queries=metrics_queries, use_cache=False)
+        .items()
+    ):
+        metric_values_list = [value for metric_val in metric_results for value in metric_val.get("value", [])]
+        metrics_values[metrics_query] = metric_values_list[1] if metric_values_list else None
+
+    return metrics_values
+
 
 def get_metrics_value(prometheus: Prometheus, metrics_query: str) -> Any:
     """
@@ -19,9 +321,7 @@ def get_metrics_value(prometheus: Prometheus, metrics_query: str) -> Any:
         Any: Metrics value
 
     """
-    metric_results = prometheus.query_sampler(query=metrics_query)
-    if metric_values_list := [value for metric_val in metric_results for value in metric_val.get("value")]:
-        return metric_values_list[1]
+    return get_metrics_values(prometheus=prometheus, metrics_queries=[metrics_query]).get(metrics_query)
 
 
 def get_metric_label(
@@ -40,7 +340,11 @@ def get_metric_label(
     Returns:
         Any: Value of the requested label, or None if not found
     """
-    metric_results = prometheus.query_sampler(query=metrics_query)
+    metric_results = (
+        get_prometheus_query_client(prometheus=prometheus)
+        .query_sampler(queries=[metrics_query], use_cache=False)
+        .get(metrics_query, [])
+    )
     LOGGER.info(f"Fields: {metric_results}")
 
     if metric_results:
@@ -86,3 +390,77 @@ def validate_metrics_field(
     except TimeoutExpiredError:
         LOGGER.error(f"Timed out. Last value: {sample}, expected: {expected_value}")
         raise
+
+
+def validate_metrics_series(
+    prometheus: Prometheus,
+    metrics_query: str,
+    start: float,
+    end: float | None = None,
+    min_value: float | None = None,
+    max_value: float | None = None,
+    min_increase: float | None = None,
+    timeout: int = 60 * 4,
+) -> list[dict[str, Any]]:
+    """
+    Fetch the full time series of a query and validate them locally, instead of polling for a point value.
+
+    With `min_increase`, the series are fetched again until the counter increase since `start` reaches it,
+    e.g. until the requests sent by the test are scraped.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+        metrics_query (str): Metrics query string, one series per pod
+        start (float): Range start, unix timestamp
+        end (float | None): Range end, unix timestamp, defaults to now
+        min_value (float | None): Minimum allowed value of every sample
+        max_value (float | None): Maximum allowed value of every sample
+        min_increase (float | None): Minimum counter increase since `start`, counter resets (pod restarts)
+            included
+        timeout (int): Timeout in seconds to wait for `min_increase`
+
+    Returns:
+        list[dict[str, Any]]: `query_range` result series.
+
+    Raises:
+        AssertionError: If the series are missing or their samples are not as expected.
+    """
+    query_client = get_prometheus_query_client(prometheus=prometheus)
+
+    def _get_series_list() -> list[dict[str, Any]]:
+        return query_client.query_range(query=metrics_query, start=start, end=end or time.time())
+
+    series_list: list[dict[str, Any]] = []
+    try:
+        for series_list in TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=prometheus.scrape_interval,
+            func=_get_series_list,
+            exceptions_dict={PrometheusQueryError: []},
+        ):
+            if min_increase is None:
+                break
+
+            if get_series_list_increase(series_list=series_list, start=start) >= min_increase:
+                break
+
+    except TimeoutExpiredError:
+        LOGGER.error(f"Timed out waiting for {metrics_query} to increase by {min_increase}")
+
+    values = [value for series in series_list for _, value in get_series_samples(series=series)]
+    assert values, f"{metrics_query} has no samples"
+
+    if min_value is not None:
+        assert min(values) >= min_value, f"{metrics_query} values {values} are below {min_value}"
+
+    if max_value is not None:
+        assert max(values) <= max_value, f"{metrics_query} values {values} are above {max_value}"
+
+    if min_increase is not None:
+        increase = get_series_list_increase(series_list=series_list, start=start)
+        # Requests sent before `start` but scraped after it are counted too, the increase can only be a lower bound
+        assert increase >= min_increase, (
+            f"{metrics_query} increased by {increase} since {start}, expected at least {min_increase}"
+        )
+
+    return series_list
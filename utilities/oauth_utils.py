@@ -0,0 +1,199 @@
+import base64
+import os
+import threading
+import time
+from functools import cache, cached_property
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import kubernetes
+import requests
+from kubernetes.dynamic import DynamicClient
+from simple_logger.logger import get_logger
+
+from utilities.exceptions import ClusterLoginError
+
+LOGGER = get_logger(name=__name__)
+
+OAUTH_CHALLENGING_CLIENT_ID: str = "openshift-challenging-client"
+# Tokens are refreshed this many seconds before they expire, so a request never goes out with an expired token
+TOKEN_EXPIRY_MARGIN: int = 60
+OAUTH_REQUEST_TIMEOUT: int = 30
+
+
+class OAuthTokenBroker:
+    """
+    Logs users in through the cluster OAuth server, in process, and caches their tokens until they expire.
+
+    Unlike `oc login`, the kubeconfig file and its current context are never changed, so clients of several
+    identities can be used concurrently.
+
+    Eg:
+        broker = OAuthTokenBroker(api_server_url=admin_client.configuration.host)
+        unprivileged_client = broker.get_client(user="user1", password="password")
+    """
+
+    def __init__(self, api_server_url: str, verify: bool | str = False) -> None:
+        """
+        Args:
+            api_server_url (str): The API address of the OpenShift cluster.
+            verify (bool | str): TLS verification, or the path of the CA bundle to verify the servers with.
+        """
+        self.api_server_url = api_server_url.rstrip("/")
+        self.verify = verify
+        self.session = requests.Session()
+        self.session.verify = verify
+        # username -> (token, monotonic expiry time)
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._user_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @cached_property
+    def oauth_metadata(self) -> dict[str, Any]:
+        response = self.session.get(
+            url=f"{self.api_server_url}/.well-known/oauth-authorization-server", timeout=OAUTH_REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def request_token(self, user: str, password: str) -> tuple[str, int]:
+        """
+        Log a user in with the OAuth authorization code flow of the `openshift-challenging-client` client.
+
+        Each login has its own session, so that the OAuth server cookies of a user are never sent for another user.
+
+        Args:
+            user (str): Cluster's username
+            password (str): Cluster's password
+
+        Returns:
+            tuple[str, int]: The user token and its lifetime in seconds.
+
+        Raises:
+            ClusterLoginError: If the login fails, including connection errors to the OAuth server.
+
+        """
+        credentials = base64.b64encode(f"{user}:{password}".encode()).decode()
+        try:
+            with requests.Session() as session:
+                session.verify = self.verify
+                authorize_response = session.get(
+                    url=self.oauth_metadata["authorization_endpoint"],
+                    params={"client_id": OAUTH_CHALLENGING_CLIENT_ID, "response_type": "code"},
+                    headers={"Authorization": f"Basic {credentials}", "X-CSRF-Token": "1"},
+                    allow_redirects=False,
+                    timeout=OAUTH_REQUEST_TIMEOUT,
+                )
+                code = parse_qs(qs=urlparse(url=authorize_response.headers.get("Location", "")).query).get("code")
+                if authorize_response.status_code != 302 or not code:
+                    LOGGER.error(f"Failed to authorize {user}: {authorize_response.status_code}")
+                    raise ClusterLoginError(user=user)
+
+                token_response = session.post(
+                    url=self.oauth_metadata["token_endpoint"],
+                    data={
+                        "grant_type": "authorization_code",
+                        "code": code[0],
+                        "client_id": OAUTH_CHALLENGING_CLIENT_ID,
+                    },
+                    headers={
+                        "Authorization": (
+                            f"Basic {base64.b64encode(f'{OAUTH_CHALLENGING_CLIENT_ID}:'.encode()).decode()}"
+                        ),
+                        "Accept": "application/json",
+                    },
+                    timeout=OAUTH_REQUEST_TIMEOUT,
+                )
+                if token_response.status_code != 200:
+                    LOGGER.error(f"Failed to get {user} token: {token_response.status_code}")
+                    raise ClusterLoginError(user=user)
+
+                token_json = token_response.json()
+
+        except requests.RequestException as exc:
+            # e.g. the OAuth server is restarting after an identity provider change, the login is retried
+            LOGGER.error(f"Failed to log in as {user}: {exc}")
+            raise ClusterLoginError(user=user) from exc
+
+        return token_json["access_token"], int(token_json.get("expires_in", 0))
+
+    def get_token(self, user: str, password: str) -> str:
+        """
+        Get a user token, logging the user in only if it has no cached token or its token is about to expire.
+
+        Args:
+            user (str): Cluster's username
+            password (str): Cluster's password
+
+        Returns:
+            str: The user token.
+
+        Raises:
+            ClusterLoginError: If the login fails.
+
+        """
+        with self._lock:
+            user_lock = self._user_locks.setdefault(user, threading.Lock())
+
+        # Users are logged in concurrently, but each user only once at a time
+        with user_lock:
+            token, expiry = self._tokens.get(user, ("", 0.0))
+            if token and time.monotonic() < expiry - TOKEN_EXPIRY_MARGIN:
+                return token
+
+            LOGGER.info(f"Logging in as {user}")
+            token, expires_in = self.request_token(user=user, password=password)
+            # Tokens without a reported lifetime are kept for the whole session
+            self._tokens[user] = (token, time.monotonic() + expires_in if expires_in else float("inf"))
+            return token
+
+    def invalidate(self, user: str) -> None:
+        with self._lock:
+            self._tokens.pop(user, None)
+
+    def get_client(self, user: str, password: str) -> DynamicClient:
+        """
+        Get a client authenticated as a user, independent of the kubeconfig and of the default client configuration.
+
+        The client token is refreshed from the broker cache before it expires.
+
+        Args:
+            user (str): Cluster's username
+            password (str): Cluster's password
+
+        Returns:
+            DynamicClient: Client authenticated as the user.
+
+        Raises:
+            ClusterLoginError: If the login fails.
+
+        """
+        configuration = kubernetes.client.Configuration()
+        configuration.host = self.api_server_url
+        configuration.verify_ssl = bool(self.verify)
+        if isinstance(self.verify, str):
+            configuration.ssl_ca_cert = self.verify
+
+        if proxy := os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY"):
+            configuration.proxy = proxy
+
+        configuration.api_key = {"authorization": f"Bearer {self.get_token(user=user, password=password)}"}
+        configuration.refresh_api_key_hook = lambda _configuration: _configuration.api_key.update(
+            authorization=f"Bearer {self.get_token(user=user, password=password)}"
+        )
+        return DynamicClient(client=kubernetes.client.ApiClient(configuration=configuration))
+
+
+@cache
+def get_oauth_token_broker(api_server_url: str) -> OAuthTokenBroker:
+    """
+    Get the token broker shared by all the callers logging in to a cluster, so that each user logs in once.
+
+    Args:
+        api_server_url (str): The API address of the OpenShift cluster.
+
+    Returns:
+        OAuthTokenBroker: Token broker of the cluster.
+
+    """
+    return OAuthTokenBroker(api_server_url=api_server_url)
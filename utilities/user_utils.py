@@ -8,7 +8,8 @@ from pyhelper_utils.shell import run_command
 from timeout_sampler import retry
 
 from utilities.exceptions import ExceptionUserLogin
-from utilities.infra import login_with_user_password
+from utilities.exceptions import ClusterLoginError
+from utilities.infra import get_user_token
 import base64
 from pathlib import Path
 
@@ -26,15 +27,14 @@ class UserTestSession:
     secret_name: str
     username: str
     password: str
-    original_user: str
     api_server_url: str
 
     def __post_init__(self) -> None:
         """Validate the session data after initialization."""
         if not all([self.idp_name, self.secret_name, self.username, self.password]):
             raise ValueError("All session fields must be non-empty")
-        if not (self.api_server_url and self.original_user):
-            raise ValueError("Original user information and api url must be set")
+        if not self.api_server_url:
+            raise ValueError("API server URL must be set")
 
     def cleanup(self) -> None:
         """Clean up the user context."""
@@ -51,14 +51,30 @@ def create_htpasswd_file(username: str, password: str) -> tuple[Path, str]:
         username: The username to add to the htpasswd file
         password: The password for the user
 
+    Returns:
+        Tuple of (temp file path, base64 encoded content)
+    """
+    return create_users_htpasswd_file(users={username: password})
+
+
+def create_users_htpasswd_file(users: dict[str, str]) -> tuple[Path, str]:
+    """
+    Create an htpasswd file for several users.
+
+    Args:
+        users: Usernames to their passwords
+
     Returns:
         Tuple of (temp file path, base64 encoded content)
     """
     with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
         temp_path = Path(temp_file.name).resolve()  # Get absolute path
-        run_command(
-            command=shlex.split(f"htpasswd -c -b {str(temp_path.absolute())} {username} {password}"), check=True
-        )
+        for index, (username, password) in enumerate(users.items()):
+            create_flag = "-c " if index == 0 else ""
+            run_command(
+                command=shlex.split(f"htpasswd {create_flag}-b {str(temp_path.absolute())} {username} {password}"),
+                check=True,
+            )
 
         # Read the htpasswd file content and encode it
         temp_file.seek(0)  # noqa: FCN001 - TextIOWrapper.seek() doesn't accept keyword arguments
@@ -86,8 +102,9 @@ def wait_for_user_creation(username: str, password: str, cluster_url: str) -> bo
         True if login is successful
     """
     LOGGER.info(f"Attempting to login as {username}")
-    res = login_with_user_password(api_address=cluster_url, user=username, password=password)
+    try:
+        get_user_token(api_address=cluster_url, user=username, password=password)
+    except ClusterLoginError as exc:
+        raise ExceptionUserLogin(f"Could not login as user {username}.") from exc
 
-    if res:
-        return True
-    raise ExceptionUserLogin(f"Could not login as user {username}.")
+    return True